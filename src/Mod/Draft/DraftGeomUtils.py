@@ -112,7 +112,8 @@ from draftgeoutils.circle_inversion import (pointInversion,
 
 # Needs edges functions
 from draftgeoutils.sort_edges import (sortEdges,
-                                      sortEdgesOld)
+                                      sortEdgesOld,
+                                      sort_edges_into_chains)
 
 from draftgeoutils.intersections import (findIntersection,
                                          wiresIntersect,
@@ -120,6 +121,7 @@ from draftgeoutils.intersections import (findIntersection,
                                          angleBisection)
 
 from draftgeoutils.wires import (findWires,
+                                 find_wires_fast,
                                  findWiresOld,
                                  findWiresOld2,
                                  flattenWire,
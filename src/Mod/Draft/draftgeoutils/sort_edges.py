@@ -26,6 +26,8 @@
 # \ingroup draftgeoutils
 # \brief Provides various functions to sort lists of edges.
 
+import collections
+import math
 import lazy_loader.lazy_loader as lz
 
 from draftgeoutils.general import geomType
@@ -225,4 +227,116 @@ def sortEdgesOld(lEdges, aVertex=None):
         else:
             return []
 
+
+def _grid_cell(point, tolerance):
+    """Return the cell of the tolerance grid containing the point."""
+    return (math.floor(point[0] / tolerance),
+            math.floor(point[1] / tolerance),
+            math.floor(point[2] / tolerance))
+
+
+def _reversed_edge(edge):
+    """Return a new edge running on the reversed curve of the edge."""
+    curve = edge.Curve.copy()
+    first = curve.reversedParameter(edge.FirstParameter)
+    last = curve.reversedParameter(edge.LastParameter)
+    curve.reverse()
+    return Part.Edge(curve, last, first)
+
+
+def sort_edges_into_chains(edges, tolerance=1e-7):
+    """Sort edges into lists of connected edges.
+
+    This gives the same result as `Part.sortEdges`, but the end points
+    of the edges are stored in a grid of cells of the size of the
+    tolerance, so that the neighbours of a chain are found in constant
+    time and large lists of edges are sorted in near linear time.
+
+    Parameters
+    ----------
+    edges: list of Part.Edge
+        The edges to sort.
+    tolerance: float, optional
+        It defaults to `1e-7`, the tolerance used by `Part.sortEdges`.
+        The maximum distance between the end points of connected edges.
+
+    Returns
+    -------
+    list of lists of Part.Edge
+        Each list holds connected edges in the order they are traversed.
+        Edges are reversed where needed, and a list ends as soon as
+        it is closed.
+    """
+    ends = []
+    grid = {}
+    for i, edge in enumerate(edges):
+        vertexes = edge.Vertexes
+        v1 = tuple(vertexes[0].Point)
+        v2 = tuple(vertexes[-1].Point)
+        ends.append((v1, v2))
+        grid.setdefault(_grid_cell(v1, tolerance), []).append((i, 0))
+        grid.setdefault(_grid_cell(v2, tolerance), []).append((i, 1))
+
+    tol2 = tolerance * tolerance
+    used = [False] * len(edges)
+
+    def near(point):
+        """Return the unused edges with an end point close to point."""
+        found = {}
+        (cx, cy, cz) = _grid_cell(point, tolerance)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    cell = grid.get((cx + dx, cy + dy, cz + dz))
+                    if not cell:
+                        continue
+                    if any(used[i] for i, _ in cell):
+                        cell[:] = [(i, j) for i, j in cell if not used[i]]
+                    for i, j in cell:
+                        p = ends[i][j]
+                        d2 = ((p[0] - point[0]) ** 2
+                              + (p[1] - point[1]) ** 2
+                              + (p[2] - point[2]) ** 2)
+                        if d2 <= tol2:
+                            found.setdefault(i, set()).add(j)
+        return found
+
+    chains = []
+    start = 0
+    while start < len(edges):
+        if used[start]:
+            start += 1
+            continue
+        used[start] = True
+        (first, last) = ends[start]
+        chain = collections.deque([edges[start]])
+        while True:
+            near_last = near(last)
+            near_first = near(first)
+            if not near_last and not near_first:
+                break
+            # Part.sortEdges picks the first remaining edge in the list
+            i = min(set(near_last) | set(near_first))
+            used[i] = True
+            (v1, v2) = ends[i]
+            if 0 in near_last.get(i, ()):
+                last = v2
+                chain.append(edges[i])
+            elif 1 in near_first.get(i, ()):
+                first = v1
+                chain.appendleft(edges[i])
+            elif 1 in near_last.get(i, ()):
+                last = v1
+                chain.append(_reversed_edge(edges[i]))
+            else:
+                first = v2
+                chain.appendleft(_reversed_edge(edges[i]))
+            d2 = ((last[0] - first[0]) ** 2
+                  + (last[1] - first[1]) ** 2
+                  + (last[2] - first[2]) ** 2)
+            if d2 <= tol2:
+                break
+        chains.append(list(chain))
+    return chains
+
 ## @}
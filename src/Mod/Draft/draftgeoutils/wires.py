@@ -37,6 +37,7 @@ import FreeCAD as App
 from draftgeoutils.general import geomType, vec, precision
 from draftgeoutils.geometry import get_normal
 from draftgeoutils.edges import findMidpoint, isLine
+from draftgeoutils.sort_edges import sort_edges_into_chains
 
 # Delay import of module until first use because it is heavy
 Part = lz.LazyLoader("Part", globals(), "Part")
@@ -50,6 +51,15 @@ def findWires(edgeslist):
     return [Part.Wire(e) for e in Part.sortEdges(edgeslist)]
 
 
+def find_wires_fast(edges, tolerance=1e-7):
+    """Find wires in a list of edges.
+
+    It returns the same wires as `findWires`, but scales to large
+    lists of edges. See `sort_edges_into_chains`.
+    """
+    return [Part.Wire(e) for e in sort_edges_into_chains(edges, tolerance)]
+
+
 def findWiresOld2(edgeslist):
     """Find connected wires in the given list of edges."""
 
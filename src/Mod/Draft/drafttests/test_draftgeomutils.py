@@ -134,6 +134,41 @@ class TestDraftGeomUtils(unittest.TestCase):
                                                    DraftGeomUtils.precision(), "'{0}.{1}' failed".format(operation, subtest))
         _msg("  Test completed, {} subtests run".format(num_subtests))
 
+    def test_sort_edges_into_chains(self):
+        """Test the DraftGeomUtils.sort_edges_into_chains function."""
+        operation = "DraftGeomUtils.sort_edges_into_chains"
+        _msg("  Test '{}'".format(operation))
+
+        # A closed square with flipped edges, an open polyline with an arc
+        # and an isolated line, given in no particular order
+        p = [FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(10, 0, 0),
+             FreeCAD.Vector(10, 10, 0), FreeCAD.Vector(0, 10, 0)]
+        q = [FreeCAD.Vector(20, 0, 0), FreeCAD.Vector(30, 0, 0),
+             FreeCAD.Vector(40, 10, 0), FreeCAD.Vector(50, 0, 0)]
+        edges = [Part.makeLine(p[1], p[2]),
+                 Part.makeLine(q[1], q[0]),
+                 Part.makeLine(p[1], p[0]),
+                 Part.Arc(q[1], q[2], q[3]).toShape(),
+                 Part.makeLine(FreeCAD.Vector(0, 50, 0),
+                               FreeCAD.Vector(10, 50, 0)),
+                 Part.makeLine(p[3], p[0]),
+                 Part.makeLine(p[2], p[3])]
+
+        expected = Part.sortEdges(edges)
+        chains = DraftGeomUtils.sort_edges_into_chains(edges)
+        self.assertEqual(len(chains), len(expected))
+        for chain, other in zip(chains, expected):
+            self.assertEqual(len(chain), len(other))
+            for e1, e2 in zip(chain, other):
+                for v1, v2 in zip(e1.Vertexes, e2.Vertexes):
+                    self.assertTrue(v1.Point.isEqual(v2.Point, 1e-7),
+                                    "'{}' failed".format(operation))
+
+        wires = DraftGeomUtils.find_wires_fast(edges)
+        self.assertEqual([w.isClosed() for w in wires], [True, False, False])
+        self.assertAlmostEqual(sum(w.Length for w in wires),
+                               sum(e.Length for e in edges))
+
     def tearDown(self):
         """Finish the test. Nothing to do here, DraftGeomUtils doesn't need a document."""
         pass
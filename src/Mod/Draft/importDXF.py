@@ -81,6 +81,11 @@ else:
 dxfReader = None
 dxfColorMap = None
 dxfLibrary = None
+groupIndex = None
+linkBlocks = None
+layers = []
+layerIndex = {}
+layerObjects = {}
 
 # Save the native open function to avoid collisions
 # with the function declared here
@@ -336,9 +341,12 @@ def locateLayer(wantedLayer, color=None, drawstyle=None):
     """
     # layers is a global variable.
     # It should probably be passed as an argument.
+    if wantedLayer in layerIndex:
+        return layerIndex[wantedLayer]
     wantedLayerName = decodeName(wantedLayer)
     for l in layers:
         if wantedLayerName == l.Label:
+            layerIndex[wantedLayer] = l
             return l
     if dxfUseDraftVisGroups:
         newLayer = Draft.make_layer(name=wantedLayer,
@@ -348,6 +356,7 @@ def locateLayer(wantedLayer, color=None, drawstyle=None):
         newLayer = doc.addObject("App::DocumentObjectGroup", wantedLayer)
     newLayer.Label = wantedLayerName
     layers.append(newLayer)
+    layerIndex[wantedLayer] = newLayer
     return newLayer
 
 
@@ -450,6 +459,8 @@ def getGroup(ob):
     -----
     Use local variables, not global variables.
     """
+    if groupIndex is not None:
+        return groupIndex.get(ob.Name, "0")
     all_objs = FreeCAD.ActiveDocument.Objects
     if dxfUseDraftVisGroups:
         for layer in [o for o in all_objs if Draft.getType(o) == "Layer"]:
@@ -463,6 +474,34 @@ def getGroup(ob):
     return "0"
 
 
+def getGroupIndex():
+    """Return the labels of the groups or Draft layers of all objects.
+
+    It follows the same rules as `getGroup`, but for all the objects
+    of the active document at once. While the global variable
+    `groupIndex` holds this dictionary, `getGroup` uses it
+    instead of searching the whole document for every object.
+
+    Returns
+    -------
+    dict
+        A dictionary with the names of the objects contained
+        in a layer or group as keys, and the labels of those
+        layers or groups as values.
+    """
+    index = {}
+    all_objs = FreeCAD.ActiveDocument.Objects
+    if dxfUseDraftVisGroups:
+        for layer in [o for o in all_objs if Draft.getType(o) == "Layer"]:
+            for child in layer.Group:
+                index.setdefault(child.Name, layer.Label)
+    for i in all_objs:
+        if i.isDerivedFrom("App::DocumentObjectGroup"):
+            for j in i.Group:
+                index.setdefault(j.Name, i.Label)
+    return index
+
+
 def getACI(ob, text=False):
     """Get the AutoCAD color index (ACI) color closest to the object's color.
 
@@ -1739,6 +1778,7 @@ def drawBlock(blockref, num=None, createObject=False):
             if dxfImportLayouts or (not rawValue(text, 67)):
                 print("adding block text", text.value, " from ", blockref)
                 addText(text)
+    shape = None
     try:
         shape = Part.makeCompound(shapes)
     except Part.OCCError:
@@ -1754,13 +1794,13 @@ def drawBlock(blockref, num=None, createObject=False):
     return None
 
 
-def drawInsert(insert, num=None, clone=False):
-    """Return a Part Shape (Compound, Clone) from a DXF insert.
+def drawInsert(insert, num=None, clone=False, link=False):
+    """Return a Part Shape (Compound, Clone, Link) from a DXF insert.
 
     It searches for `insert.block` in `blockobjects`
-    or `blockshapes`, and returns a clone or a copy of the compound,
-    with transformations applied: rotation, translation (movement),
-    and scaling.
+    or `blockshapes`, and returns a clone, a link or a copy
+    of the compound, with transformations applied: rotation,
+    translation (movement), and scaling.
 
     If the global variable `dxfImportTexts` is available
     it will check the attributes of `insert` and add those text attributes
@@ -1785,10 +1825,17 @@ def drawInsert(insert, num=None, clone=False):
         `blockshapes`, or created from the `drawing.blocks.data`
         with `drawBlock()`.
 
+    link : bool, optional
+        It defaults to `False`. If it is `True` it will try to produce
+        and return an `App::Link` to the `'insert.block'` contained
+        in the global dictionary `blockobjects`. Unlike a clone or
+        a copy, the link doesn't hold a shape of its own.
+
     Returns
     -------
     Part::TopoShape ('Compound') or
-    Part::Part2DObject or Part::PartFeature (`Draft Clone`)
+    Part::Part2DObject or Part::PartFeature (`Draft Clone`) or
+    App::Link
         The returned object is normally a copy of the `Part.Compound`
         extracted from `blockshapes` or created with `drawBlock()`.
 
@@ -1796,8 +1843,9 @@ def drawInsert(insert, num=None, clone=False):
         a `Draft Clone` from the `'insert.block'` contained
         in the global dictionary `blockobjects`.
         It returns `None` if `insert.block` isn't in `blockobjects`.
+        The same goes for an `App::Link` if `link` is `True`.
 
-        In any of these two cases, it will try to apply the
+        In any of these three cases, it will try to apply the
         insert transformations: rotation, translation (movement),
         and scaling.
 
@@ -1813,7 +1861,19 @@ def drawInsert(insert, num=None, clone=False):
         attrs = attribs(insert)
         for a in attrs:
             addText(a, attrib=True)
-    if clone:
+    if link:
+        if insert.block in blockobjects:
+            newob = doc.addObject("App::Link", "Block." + insert.block)
+            newob.setLink(blockobjects[insert.block])
+            rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), insert.rotation)
+            newob.Placement = FreeCAD.Placement(vec(insert.loc), rot)
+            sc = insert.scale
+            if sc[0] != 1 or sc[1] != 1:
+                newob.ScaleVector = FreeCAD.Vector(sc[0], sc[1], 1)
+            return newob
+        else:
+            shape = None
+    elif clone:
         if insert.block in blockobjects:
             newob = Draft.clone(blockobjects[insert.block])
             tsf = FreeCAD.Matrix()
@@ -1829,7 +1889,7 @@ def drawInsert(insert, num=None, clone=False):
         else:
             shape = None
     else:
-        if insert in blockshapes:
+        if insert.block in blockshapes:
             shape = blockshapes[insert.block].copy()
         else:
             shape = None
@@ -1975,15 +2035,54 @@ def addObject(shape, name="Shape", layer=None):
     else:
         newob = shape
     if layer:
-        lay = locateLayer(layer)
+        addToLayer(newob, locateLayer(layer))
+    formatObject(newob)
+    return newob
+
+
+def addToLayer(obj, lay):
+    """Add the given object to the layer in the global dictionary.
+
+    The objects are only added to the layer itself by `addLayerObjects`,
+    as setting the group of a layer once per object gets slower
+    with every object that the layer already contains.
+
+    Parameters
+    ----------
+    obj : App::DocumentObject
+        Any object previously created from a DXF file.
+    lay : App::FeaturePython or App::DocumentObjectGroup
+        The `Draft Layer` or simple group returned by `locateLayer`.
+
+    To do
+    -----
+    Use local variables, not global variables.
+    """
+    if lay.Name in layerObjects:
+        layerObjects[lay.Name][1].append(obj)
+    else:
+        layerObjects[lay.Name] = (lay, [obj])
+
+
+def addLayerObjects():
+    """Add the objects collected by `addToLayer` to their layers.
+
+    Each layer gets all its objects in one step.
+
+    To do
+    -----
+    Use local variables, not global variables.
+    """
+    for lay, objs in layerObjects.values():
         # For old style layers, which are just groups
-        if hasattr(lay, "addObject"):
-            lay.addObject(newob)
+        if hasattr(lay, "addObjects"):
+            lay.addObjects(objs)
         # For new Draft Layers
         elif hasattr(lay, "Proxy") and hasattr(lay.Proxy, "addObject"):
-            lay.Proxy.addObject(lay, newob)
-    formatObject(newob)
-    return newob
+            group = lay.Group
+            known = set(o.Name for o in group)
+            lay.Group = group + [o for o in objs if o.Name not in known]
+    layerObjects.clear()
 
 
 def addText(text, attrib=False):
@@ -2051,10 +2150,7 @@ def addText(text, attrib=False):
         #    except Exception:
         #        pass
         newob = Draft.makeText(val.split("\n"))
-        if hasattr(lay, "addObject"):
-            lay.addObject(newob)
-        elif hasattr(lay, "Proxy") and hasattr(lay.Proxy, "addObject"):
-            lay.Proxy.addObject(lay, newob)
+        addToLayer(newob, lay)
         rx = rawValue(text, 11)
         ry = rawValue(text, 21)
         rz = rawValue(text, 31)
@@ -2173,9 +2269,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
     Returns
     -------
     list of `Part.Shapes`
-        It returns `None` if the edges (lines, polylines, arcs)
-        are above 100, and the user decides to interrupt (graphically)
-        the process of joining them.
+        The shapes read from the file, if `getShapes` is `True`.
 
     To do
     -----
@@ -2191,6 +2285,10 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
     drawing = dxfReader.readDXF(filename)
     global layers
     layers = []
+    global layerIndex
+    layerIndex = {}
+    global layerObjects
+    layerObjects = {}
     global doc
     doc = document
     global blockshapes
@@ -2348,24 +2446,8 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
         edges = []
         for s in shapes:
             edges.extend(s.Edges)
-        if len(edges) > (100):
-            FCC.PrintMessage(str(len(edges)) + " edges to join\n")
-            if FreeCAD.GuiUp:
-                d = QtGui.QMessageBox()
-                d.setText("Warning: High number of entities to join (>100)")
-                d.setInformativeText("This might take a long time "
-                                     "or even freeze your computer. "
-                                     "Are you sure? You can also disable "
-                                     "the 'join geometry' setting in DXF "
-                                     "import preferences")
-                d.setStandardButtons(QtGui.QMessageBox.Ok
-                                     | QtGui.QMessageBox.Cancel)
-                d.setDefaultButton(QtGui.QMessageBox.Cancel)
-                res = d.exec_()
-                if res == QtGui.QMessageBox.Cancel:
-                    FCC.PrintMessage("Aborted\n")
-                    return
-        shapes = DraftGeomUtils.findWires(edges)
+        FCC.PrintMessage(str(len(edges)) + " edges to join\n")
+        shapes = DraftGeomUtils.find_wires_fast(edges)
         for s in shapes:
             newob = addObject(s)
 
@@ -2501,13 +2583,15 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
         if me:
             newob = doc.addObject("Mesh::Feature", "Mesh")
             lay = locateLayer(rawValue(mesh, 8))
-            lay.addObject(newob)
+            addToLayer(newob, lay)
             newob.Mesh = me
             if gui:
                 formatObject(newob, mesh)
 
     # End of shape-based objects, return if we are just getting shapes
     if getShapes and shapes:
+        # the meshes are already in the document
+        addLayerObjects()
         return shapes
 
     # Draw dimensions
@@ -2571,7 +2655,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
                         elif angle in [90, 270]:
                             p2 = vec([x2, y3, z2])
                     newob = doc.addObject("App::FeaturePython", "Dimension")
-                    lay.addObject(newob)
+                    addToLayer(newob, lay)
                     _Dimension(newob)
                     if FreeCAD.GuiUp:
                         from Draft import _ViewProviderDimension
@@ -2609,7 +2693,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
                 else:
                     newob = Draft.makePoint(x, y, z)
                     lay = locateLayer(lay)
-                    lay.addObject(newob)
+                    addToLayer(newob, lay)
                     if gui:
                         formatObject(newob, point)
     else:
@@ -2625,7 +2709,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
                 points = getMultiplePoints(leader)
                 newob = Draft.makeWire(points)
                 lay = locateLayer(rawValue(leader, 8))
-                lay.addObject(newob)
+                addToLayer(newob, lay)
                 if gui:
                     newob.ViewObject.EndArrow = True
                     formatObject(newob, leader)
@@ -2674,14 +2758,18 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
     if inserts:
         FCC.PrintMessage("drawing " + str(len(inserts)) + " blocks...\n")
         blockrefs = drawing.blocks.data
+        # Links can't be put in the compound of a layer block
+        links = dxfBlocksAsLinks and not dxfMakeBlocks
         for ref in blockrefs:
-            if dxfCreateDraft or dxfCreateSketch:
+            if dxfCreateDraft or dxfCreateSketch or links:
                 drawBlock(ref, createObject=True)
             else:
                 drawBlock(ref, createObject=False)
         num = 0
         for insert in inserts:
-            if (dxfCreateDraft or dxfCreateSketch) and not dxfMakeBlocks:
+            if links:
+                shape = drawInsert(insert, num, link=True)
+            elif (dxfCreateDraft or dxfCreateSketch) and not dxfMakeBlocks:
                 shape = drawInsert(insert, num, clone=True)
             else:
                 shape = drawInsert(insert, num)
@@ -2703,6 +2791,7 @@ def processdxf(document, filename, getShapes=False, reComputeFlag=True):
             if shape:
                 newob = addObject(shape, k)
     del layerBlocks
+    addLayerObjects()
 
     # Hide block objects, if any
     for k, o in blockobjects.items():
@@ -2860,9 +2949,7 @@ def getShapes(filename):
     Returns
     -------
     list of `Part.Shapes`
-        It returns `None` if the edges (lines, polylines, arcs)
-        are above 100, and the user decides to interrupt (graphically)
-        the process of joining them.
+        The shapes read from the file.
 
     See also
     --------
@@ -3131,7 +3218,7 @@ def getWire(wire, nospline=False, lw=True, asis=False):
     return points
 
 
-def getBlock(sh, obj, lwPoly=False):
+def getBlock(sh, obj, lwPoly=False, color=None):
     """Return a DXF block with the contents of the object.
 
     It creates a `block` object using `dxfLibrary.Block`,
@@ -3151,16 +3238,173 @@ def getBlock(sh, obj, lwPoly=False):
         a `'lwpolyline'`.
         Otherwise, it will be a `'polyline'`.
 
+    color : int, optional
+        It defaults to `None`. The AutoCAD color index (ACI)
+        of the entities, by default `getACI(obj)`.
+
     Returns
     -------
     dxfLibrary.Block
         The block of data with the given `sh` shape and `obj` object.
     """
     block = dxfLibrary.Block(name=obj.Name, layer=getStrGroup(obj))
-    writeShape(sh, obj, block, lwPoly)
+    writeShape(sh, obj, block, lwPoly, color=color)
     return block
 
 
+def writeLink(ob, dxf, nospline=False, lwPoly=False):
+    """Write a link to a Part object as an insert of a shared block.
+
+    The shape of the linked object is written only once, in a block
+    recorded in the global dictionary `linkBlocks`. Every link
+    to the same object then only adds an insert of that block.
+
+    Inserts are only used for the plain top view of the export.
+    Links that are exported as meshes, projected in the camera view,
+    tessellated, or that can't be represented by an insert, because
+    they are link arrays, link to sub-elements, or are rotated out of
+    the XY plane, are written with their whole shape by `writeShapeObject`.
+
+    Parameters
+    ----------
+    ob : App::Link
+        The link to write.
+
+    dxf : dxfLibrary.Drawing
+        The drawing to which the block and the insert are added.
+
+    nospline : bool, optional
+        It defaults to `False`. See `writeShape`.
+
+    lwPoly : bool, optional
+        It defaults to `False`. See `writeShape`.
+
+    To do
+    -----
+    Use local variables, not global variables.
+    """
+    base = ob.LinkedObject
+    if isinstance(base, tuple):
+        base = base[0]
+        partial = True
+    else:
+        partial = False
+    if not base or not base.isDerivedFrom("Part::Feature"):
+        return
+    tess = None
+    if getattr(base, "Tessellation", False):
+        tess = [base.Tessellation, base.SegmentLength]
+    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    plain = not (tess or params.GetBool("dxfmesh")
+                 or (gui and params.GetBool("dxfproject")))
+    pl = ob.Placement
+    if getattr(ob, "LinkTransform", False):
+        pl = pl.multiply(base.Placement)
+    ypr = pl.Rotation.toEuler()
+    if (not plain or partial or getattr(ob, "ElementCount", 0)
+            or abs(ypr[1]) > 1e-6 or abs(ypr[2]) > 1e-6):
+        # links have no colors of their own
+        writeShapeObject(ob, Part.getShape(ob), dxf, nospline, lwPoly,
+                         tess, getACI(base))
+        return
+    name = ("LINK_" + base.Name).upper()
+    projected = base.Shape.Volume > 0
+    if base.Name not in linkBlocks:
+        sh = base.Shape.copy()
+        sh.Placement = FreeCAD.Placement()
+        if projected:
+            sh = projectShape(sh, Vector(0, 0, 1))
+        block = dxfLibrary.Block(name=name, layer=getStrGroup(base))
+        writeShape(sh, base, block, nospline, lwPoly)
+        dxf.blocks.append(block)
+        linkBlocks[base.Name] = name
+    pos = pl.Base
+    if projected:
+        pos = Vector(pos.x, pos.y, 0)
+    sc = getattr(ob, "ScaleVector", Vector(1, 1, 1))
+    dxf.append(dxfLibrary.Insert(name=name,
+                                 point=DraftVecUtils.tup(pos),
+                                 xscale=sc.x, yscale=sc.y, zscale=sc.z,
+                                 rotation=ypr[0],
+                                 color=getACI(base),
+                                 layer=getStrGroup(ob)))
+
+
+def writeShapeObject(ob, sh, dxf, nospline=False, lwPoly=False,
+                     tess=None, color=None):
+    """Write the shape of a Part object or link following the preferences.
+
+    Depending on the parameter `'dxfmesh'` the shape is written
+    as a polyface mesh, depending on `'dxfproject'` it is projected
+    in the camera view, otherwise solids are projected along Z
+    and all other shapes are written as they are.
+
+    Parameters
+    ----------
+    ob : App::DocumentObject
+        The object the shape belongs to, it gives the layer and the name
+        of the blocks.
+
+    sh : Part::TopoShape
+        The shape of `ob`.
+
+    dxf : dxfLibrary.Drawing
+        The drawing to which the entities are added.
+
+    nospline : bool, optional
+        It defaults to `False`. See `writeShape`.
+
+    lwPoly : bool, optional
+        It defaults to `False`. See `writeShape`.
+
+    tess : list, optional
+        It defaults to `None`. The tessellation and segment length
+        used to project the shape, see `projectShape`.
+
+    color : int, optional
+        It defaults to `None`. The AutoCAD color index (ACI),
+        by default `getACI(ob)`.
+    """
+    if color is None:
+        color = getACI(ob)
+    if FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("dxfmesh"):
+        if not sh.isNull():
+            writeMesh(ob, dxf, sh, color)
+        return
+    elif gui and FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("dxfproject"):
+        _view = FreeCADGui.ActiveDocument.ActiveView
+        direction = _view.getViewDirection().multiply(-1)
+        sh = projectShape(sh, direction, tess)
+    else:
+        if sh.Volume > 0:
+            sh = projectShape(sh, Vector(0, 0, 1), tess)
+    if sh:
+        if not sh.isNull():
+            if sh.ShapeType == 'Compound':
+                if len(sh.Wires) == 1:
+                    # only one wire in this compound,
+                    # no lone edge -> polyline
+                    if len(sh.Wires[0].Edges) == len(sh.Edges):
+                        writeShape(sh, ob, dxf,
+                                   nospline, lwPoly, color=color)
+                    else:
+                        # 1 wire + lone edges -> block
+                        block = getBlock(sh, ob, lwPoly, color)
+                        dxf.blocks.append(block)
+                        dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
+                                                     color=color,
+                                                     layer=getStrGroup(ob)))
+                else:
+                    # all other cases: block
+                    block = getBlock(sh, ob, lwPoly, color)
+                    dxf.blocks.append(block)
+                    dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
+                                                 color=color,
+                                                 layer=getStrGroup(ob)))
+            else:
+                writeShape(sh, ob, dxf, nospline, lwPoly, color=color)
+
+
 def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
                layer=None, color=None, asis=False):
     """Write the object's shape contents in the given DXF object.
@@ -3233,7 +3477,7 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
     dxfLibrary.LwPolyLine, dxfLibrary.PolyLine, dxfLibrary.Ellipse,
     dxfLibrary.Line
     """
-    processededges = []
+    processededges = set()
     if not layer:
         layer = getStrGroup(ob)
     if not color:
@@ -3244,7 +3488,7 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
         else:
             edges = Part.__sortEdges__(wire.Edges)
         for e in edges:
-            processededges.append(e.hashCode())
+            processededges.add(e.hashCode())
         if (len(wire.Edges) == 1) and (DraftGeomUtils.geomType(wire.Edges[0]) == "Circle"):
             center, radius, ang1, ang2 = getArcData(wire.Edges[0])
             if center is not None:
@@ -3362,10 +3606,10 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
                                                      layer=layer))
 
 
-def writeMesh(ob, dxf):
+def writeMesh(ob, dxf, shape=None, color=None):
     """Write an object's shape as a polyface mesh in the given DXF list.
 
-    It tessellates the `ob.Shape` with a tolerance of 0.5,
+    It tessellates the `ob.Shape`, or the given `shape`, with a tolerance of 0.5,
     to produce mesh data, that is, lists of vertices and face indices:
     ``([ point1, point2, ...], [(face1 indices), (face2 indices), ...])``
 
@@ -3382,11 +3626,23 @@ def writeMesh(ob, dxf):
         An object which will be populated with a DXF polyface mesh
         created from `ob.Shape`.
 
+    shape : Part::TopoShape, optional
+        It defaults to `None`. The shape to write instead of `ob.Shape`,
+        for objects without `Shape` like links.
+
+    color : int, optional
+        It defaults to `None`. The AutoCAD color index (ACI),
+        by default `getACI(ob)`.
+
     See also
     --------
     dxfLibrary.Drawing, dxfLibrary.PolyLine, Part.Shape.tessellate
     """
-    meshdata = ob.Shape.tessellate(0.5)
+    if shape is None:
+        shape = ob.Shape
+    if color is None:
+        color = getACI(ob)
+    meshdata = shape.tessellate(0.5)
     # print(meshdata)
     points = []
     faces = []
@@ -3397,7 +3653,7 @@ def writeMesh(ob, dxf):
     # print(len(points),len(faces))
     dxf.append(dxfLibrary.PolyLine([points, faces],
                                    [0.0, 0.0, 0.0],
-                                   64, color=getACI(ob),
+                                   64, color=color,
                                    layer=getGroup(ob)))
 
 
@@ -3626,7 +3882,7 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
         return
     getDXFlibs()
     if dxfLibrary:
-        global exportList
+        global exportList, groupIndex, linkBlocks
         exportList = objectslist
         exportList = Draft.get_group_contents(exportList)
 
@@ -3645,265 +3901,236 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
                 if ob not in nlist:
                     nlist.append(ob)
         exportList = nlist
+        try:
+            groupIndex = getGroupIndex()
+            linkBlocks = {}
 
-        if (len(exportList) == 1) and (Draft.getType(exportList[0]) == "ArchSectionView"):
-            # arch view: export it "as is"
-            dxf = exportList[0].Proxy.getDXF()
-            if dxf:
-                f = pythonopen(filename, "w")
-                f.write(dxf)
-                f.close()
+            if (len(exportList) == 1) and (Draft.getType(exportList[0]) == "ArchSectionView"):
+                # arch view: export it "as is"
+                dxf = exportList[0].Proxy.getDXF()
+                if dxf:
+                    f = pythonopen(filename, "w")
+                    f.write(dxf)
+                    f.close()
 
-        elif (len(exportList) == 1) and (exportList[0].isDerivedFrom("Drawing::FeaturePage")):
-            # page: special hack-export! (see below)
-            exportPage(exportList[0], filename)
+            elif (len(exportList) == 1) and (exportList[0].isDerivedFrom("Drawing::FeaturePage")):
+                # page: special hack-export! (see below)
+                exportPage(exportList[0], filename)
 
-        elif (len(exportList) == 1) and (exportList[0].isDerivedFrom("TechDraw::DrawPage")):
-            # page: special hack-export! (see below)
-            exportPage(exportList[0], filename)
+            elif (len(exportList) == 1) and (exportList[0].isDerivedFrom("TechDraw::DrawPage")):
+                # page: special hack-export! (see below)
+                exportPage(exportList[0], filename)
 
-        else:
-            # other cases, treat objects one by one
-            dxf = dxfLibrary.Drawing()
-            # add global variables
-            if hasattr(dxf,"header"): 
-                dxf.header.append("  9\n$DIMTXT\n 40\n"+str(Draft.getParam("textheight", 20))+"\n")
-            for ob in exportLayers:
-                if ob.Label != "0":  # dxflibrary already creates it
-                    ltype = 'continuous'
-                    if ob.ViewObject:
-                        if ob.ViewObject.DrawStyle == "Dashed":
-                            ltype = 'DASHED'
-                        elif ob.ViewObject.DrawStyle == "Dotted":
-                            ltype = 'HIDDEN'
-                        elif ob.ViewObject.DrawStyle == "Dashdot":
-                            ltype = 'DASHDOT'
-                    # print("exporting layer:", getStr(ob.Label),
-                    #       getACI(ob), ltype)
-                    dxf.layers.append(dxfLibrary.Layer(name=getStr(ob.Label),
-                                                       color=getACI(ob),
-                                                       lineType=ltype))
-
-            for ob in exportList:
-                obtype = Draft.getType(ob)
-                # print("processing " + str(ob.Name))
-                if obtype == "PanelSheet":
-                    if not hasattr(ob.Proxy, "sheetborder"):
-                        ob.Proxy.execute(ob)
-                    sb = ob.Proxy.sheetborder
-                    if sb:
-                        sb.Placement = ob.Placement
-                        writeShape(sb, ob, dxf, nospline, lwPoly,
-                                   layer="Sheets", color=1)
-                    ss = ob.Proxy.sheettag
-                    if ss:
-                        ss.Placement = ob.Placement.multiply(ss.Placement)
-                        writeShape(ss, ob, dxf, nospline, lwPoly,
-                                   layer="SheetTags", color=1)
-                    for subob in ob.Group:
-                        if Draft.getType(subob) == "PanelCut":
-                            writePanelCut(subob, dxf, nospline, lwPoly,
-                                          parent=ob)
-                        elif subob.isDerivedFrom("Part::Feature"):
-                            shp = subob.Shape.copy()
-                            shp.Placement = ob.Placement.multiply(shp.Placement)
-                            writeShape(shp, ob, dxf, nospline, lwPoly,
-                                       layer="Outlines", color=5)
-
-                elif obtype == "PanelCut":
-                    writePanelCut(ob, dxf, nospline, lwPoly)
-
-                elif obtype == "Space":
-                    vobj = ob.ViewObject
-                    c = utils.get_rgb(vobj.TextColor)
-                    n = vobj.FontName
-                    a = 0
-                    if rotation != 0:
-                        a = math.radians(rotation)
-                    t1 = "".join(vobj.Proxy.text1.string.getValues())
-                    t2 = "".join(vobj.Proxy.text2.string.getValues())
-                    scale = vobj.FirstLine.Value/vobj.FontSize.Value
-                    f1 = fontsize * scale
-                    if round(FreeCAD.DraftWorkingPlane.axis.getAngle(App.Vector(0,0,1)),2) not in [0,3.14]:
-                        # if not in XY view, place the label at center
-                        p2 = obj.Shape.CenterOfMass
-                    else:
-                        _v = vobj.Proxy.coords.translation.getValue().getValue()
-                        p2 = obj.Placement.multVec(App.Vector(_v))
-                    _h = vobj.Proxy.header.translation.getValue().getValue()
-                    lspc = FreeCAD.Vector(_h)
-                    p1 = p2 + lspc                    
-                    dxf.append(dxfLibrary.Text(t1, p1, height=f1,
-                                               color=getACI(ob, text=True),
-                                               style='STANDARD',
-                                               layer=getStrGroup(ob)))
-                    if t2:
-                        ofs = FreeCAD.Vector(0, -lspc.Length, 0)
-                        if a:
-                            Z = FreeCAD.Vector(0, 0, 1)
-                            ofs = FreeCAD.Rotation(Z, -rotation).multVec(ofs)
-                        dxf.append(dxfLibrary.Text(t2, p1.add(ofs), height=f1,
+            else:
+                # other cases, treat objects one by one
+                dxf = dxfLibrary.Drawing()
+                # add global variables
+                if hasattr(dxf,"header"): 
+                    dxf.header.append("  9\n$DIMTXT\n 40\n"+str(Draft.getParam("textheight", 20))+"\n")
+                for ob in exportLayers:
+                    if ob.Label != "0":  # dxflibrary already creates it
+                        ltype = 'continuous'
+                        if ob.ViewObject:
+                            if ob.ViewObject.DrawStyle == "Dashed":
+                                ltype = 'DASHED'
+                            elif ob.ViewObject.DrawStyle == "Dotted":
+                                ltype = 'HIDDEN'
+                            elif ob.ViewObject.DrawStyle == "Dashdot":
+                                ltype = 'DASHDOT'
+                        # print("exporting layer:", getStr(ob.Label),
+                        #       getACI(ob), ltype)
+                        dxf.layers.append(dxfLibrary.Layer(name=getStr(ob.Label),
+                                                           color=getACI(ob),
+                                                           lineType=ltype))
+
+                for ob in exportList:
+                    obtype = Draft.getType(ob)
+                    # print("processing " + str(ob.Name))
+                    if obtype == "PanelSheet":
+                        if not hasattr(ob.Proxy, "sheetborder"):
+                            ob.Proxy.execute(ob)
+                        sb = ob.Proxy.sheetborder
+                        if sb:
+                            sb.Placement = ob.Placement
+                            writeShape(sb, ob, dxf, nospline, lwPoly,
+                                       layer="Sheets", color=1)
+                        ss = ob.Proxy.sheettag
+                        if ss:
+                            ss.Placement = ob.Placement.multiply(ss.Placement)
+                            writeShape(ss, ob, dxf, nospline, lwPoly,
+                                       layer="SheetTags", color=1)
+                        for subob in ob.Group:
+                            if Draft.getType(subob) == "PanelCut":
+                                writePanelCut(subob, dxf, nospline, lwPoly,
+                                              parent=ob)
+                            elif subob.isDerivedFrom("Part::Feature"):
+                                shp = subob.Shape.copy()
+                                shp.Placement = ob.Placement.multiply(shp.Placement)
+                                writeShape(shp, ob, dxf, nospline, lwPoly,
+                                           layer="Outlines", color=5)
+
+                    elif obtype == "PanelCut":
+                        writePanelCut(ob, dxf, nospline, lwPoly)
+
+                    elif obtype == "Space":
+                        vobj = ob.ViewObject
+                        c = utils.get_rgb(vobj.TextColor)
+                        n = vobj.FontName
+                        a = 0
+                        if rotation != 0:
+                            a = math.radians(rotation)
+                        t1 = "".join(vobj.Proxy.text1.string.getValues())
+                        t2 = "".join(vobj.Proxy.text2.string.getValues())
+                        scale = vobj.FirstLine.Value/vobj.FontSize.Value
+                        f1 = fontsize * scale
+                        if round(FreeCAD.DraftWorkingPlane.axis.getAngle(App.Vector(0,0,1)),2) not in [0,3.14]:
+                            # if not in XY view, place the label at center
+                            p2 = obj.Shape.CenterOfMass
+                        else:
+                            _v = vobj.Proxy.coords.translation.getValue().getValue()
+                            p2 = obj.Placement.multVec(App.Vector(_v))
+                        _h = vobj.Proxy.header.translation.getValue().getValue()
+                        lspc = FreeCAD.Vector(_h)
+                        p1 = p2 + lspc                    
+                        dxf.append(dxfLibrary.Text(t1, p1, height=f1,
                                                    color=getACI(ob, text=True),
                                                    style='STANDARD',
                                                    layer=getStrGroup(ob)))
+                        if t2:
+                            ofs = FreeCAD.Vector(0, -lspc.Length, 0)
+                            if a:
+                                Z = FreeCAD.Vector(0, 0, 1)
+                                ofs = FreeCAD.Rotation(Z, -rotation).multVec(ofs)
+                            dxf.append(dxfLibrary.Text(t2, p1.add(ofs), height=f1,
+                                                       color=getACI(ob, text=True),
+                                                       style='STANDARD',
+                                                       layer=getStrGroup(ob)))
 
-                elif obtype == "Axis":
-                    axes = ob.Proxy.getAxisData(ob)
-                    if not axes:
-                        continue
-                    for ax in axes:
-                        dxf.append(dxfLibrary.Line([tuple(ax[0]),
-                                                    tuple(ax[1])],
-                                                   color=getACI(ob),
-                                                   layer=getStrGroup(ob)))
-                        p = ax[1]
-                        h = 1
-                        if FreeCAD.GuiUp:
-                            vobj = ob.ViewObject
-                            rad = vobj.BubbleSize.Value/2
-                            n = 0
-                            pos = ["Start"]
-                            if hasattr(vobj, "BubblePosition"):
-                                if vobj.BubblePosition == "Both":
-                                    pos = ["Start", "End"]
-                                else:
-                                    pos = [vobj.BubblePosition]
-                            for p in pos:
-                                if p == "Start":
-                                    p1 = ax[0]
-                                    p2 = ax[1]
-                                else:
-                                    p1 = ax[1]
-                                    p2 = ax[0]
-                                dv = p2.sub(p1)
-                                dv.normalize()
-                                center = p2.add(dv.scale(rad, rad, rad))
-                                h = float(ob.ViewObject.FontSize)
-                                dxf.append(dxfLibrary.Circle(center,
-                                                             rad,
-                                                             color=getACI(ob),
-                                                             layer=getStrGroup(ob)))
+                    elif obtype == "Axis":
+                        axes = ob.Proxy.getAxisData(ob)
+                        if not axes:
+                            continue
+                        for ax in axes:
+                            dxf.append(dxfLibrary.Line([tuple(ax[0]),
+                                                        tuple(ax[1])],
+                                                       color=getACI(ob),
+                                                       layer=getStrGroup(ob)))
+                            p = ax[1]
+                            h = 1
+                            if FreeCAD.GuiUp:
+                                vobj = ob.ViewObject
+                                rad = vobj.BubbleSize.Value/2
+                                n = 0
+                                pos = ["Start"]
+                                if hasattr(vobj, "BubblePosition"):
+                                    if vobj.BubblePosition == "Both":
+                                        pos = ["Start", "End"]
+                                    else:
+                                        pos = [vobj.BubblePosition]
+                                for p in pos:
+                                    if p == "Start":
+                                        p1 = ax[0]
+                                        p2 = ax[1]
+                                    else:
+                                        p1 = ax[1]
+                                        p2 = ax[0]
+                                    dv = p2.sub(p1)
+                                    dv.normalize()
+                                    center = p2.add(dv.scale(rad, rad, rad))
+                                    h = float(ob.ViewObject.FontSize)
+                                    dxf.append(dxfLibrary.Circle(center,
+                                                                 rad,
+                                                                 color=getACI(ob),
+                                                                 layer=getStrGroup(ob)))
+                                    dxf.append(dxfLibrary.Text(ax[2],
+                                                               center,
+                                                               alignment=center,
+                                                               height=h,
+                                                               justifyhor=1,
+                                                               justifyver=2,
+                                                               color=getACI(ob),
+                                                               style='STANDARD',
+                                                               layer=getStrGroup(ob)))
+                            else:
                                 dxf.append(dxfLibrary.Text(ax[2],
-                                                           center,
-                                                           alignment=center,
+                                                           p,
+                                                           alignment=p,
                                                            height=h,
                                                            justifyhor=1,
                                                            justifyver=2,
                                                            color=getACI(ob),
                                                            style='STANDARD',
                                                            layer=getStrGroup(ob)))
-                        else:
-                            dxf.append(dxfLibrary.Text(ax[2],
-                                                       p,
-                                                       alignment=p,
-                                                       height=h,
-                                                       justifyhor=1,
-                                                       justifyver=2,
-                                                       color=getACI(ob),
+
+                    elif ob.isDerivedFrom("App::Link"):
+                        writeLink(ob, dxf, nospline, lwPoly)
+
+                    elif ob.isDerivedFrom("Part::Feature"):
+                        tess = None
+                        if hasattr(ob, "Tessellation"):
+                            if ob.Tessellation:
+                                tess = [ob.Tessellation, ob.SegmentLength]
+                        writeShapeObject(ob, ob.Shape, dxf, nospline, lwPoly, tess)
+
+                    elif obtype == "Annotation":
+                        # old-style texts
+                        # temporary - as dxfLibrary doesn't support mtexts well,
+                        # we use several single-line texts
+                        # well, anyway, at the moment, Draft only writes
+                        # single-line texts, so...
+                        for text in ob.LabelText:
+                            point = DraftVecUtils.tup(Vector(ob.Position.x,
+                                                             ob.Position.y - ob.LabelText.index(text),
+                                                             ob.Position.z))
+                            if gui:
+                                height = float(ob.ViewObject.FontSize)
+                            else:
+                                height = 1
+                            dxf.append(dxfLibrary.Text(text, point, height=height,
+                                                       color=getACI(ob, text=True),
                                                        style='STANDARD',
                                                        layer=getStrGroup(ob)))
 
-                elif ob.isDerivedFrom("Part::Feature"):
-                    tess = None
-                    if hasattr(ob, "Tessellation"):
-                        if ob.Tessellation:
-                            tess = [ob.Tessellation, ob.SegmentLength]
-                    if FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("dxfmesh"):
-                        sh = None
-                        if not ob.Shape.isNull():
-                            writeMesh(ob, dxf)
-                    elif gui and FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("dxfproject"):
-                        _view = FreeCADGui.ActiveDocument.ActiveView
-                        direction = _view.getViewDirection().multiply(-1)
-                        sh = projectShape(ob.Shape, direction, tess)
-                    else:
-                        if ob.Shape.Volume > 0:
-                            sh = projectShape(ob.Shape, Vector(0, 0, 1), tess)
-                        else:
-                            sh = ob.Shape
-                    if sh:
-                        if not sh.isNull():
-                            if sh.ShapeType == 'Compound':
-                                if len(sh.Wires) == 1:
-                                    # only one wire in this compound,
-                                    # no lone edge -> polyline
-                                    if len(sh.Wires[0].Edges) == len(sh.Edges):
-                                        writeShape(sh, ob, dxf,
-                                                   nospline, lwPoly)
-                                    else:
-                                        # 1 wire + lone edges -> block
-                                        block = getBlock(sh, ob, lwPoly)
-                                        dxf.blocks.append(block)
-                                        dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
-                                                                     color=getACI(ob),
-                                                                     layer=getStrGroup(ob)))
-                                else:
-                                    # all other cases: block
-                                    block = getBlock(sh, ob, lwPoly)
-                                    dxf.blocks.append(block)
-                                    dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
-                                                                 color=getACI(ob),
-                                                                 layer=getStrGroup(ob)))
-                            else:
-                                writeShape(sh, ob, dxf, nospline, lwPoly)
-
-                elif obtype == "Annotation":
-                    # old-style texts
-                    # temporary - as dxfLibrary doesn't support mtexts well,
-                    # we use several single-line texts
-                    # well, anyway, at the moment, Draft only writes
-                    # single-line texts, so...
-                    for text in ob.LabelText:
-                        point = DraftVecUtils.tup(Vector(ob.Position.x,
-                                                         ob.Position.y - ob.LabelText.index(text),
-                                                         ob.Position.z))
+                    elif obtype in ("DraftText","Text"):
+                        # texts
                         if gui:
                             height = float(ob.ViewObject.FontSize)
                         else:
                             height = 1
-                        dxf.append(dxfLibrary.Text(text, point, height=height,
-                                                   color=getACI(ob, text=True),
-                                                   style='STANDARD',
-                                                   layer=getStrGroup(ob)))
-
-                elif obtype in ("DraftText","Text"):
-                    # texts
-                    if gui:
-                        height = float(ob.ViewObject.FontSize)
-                    else:
-                        height = 1
-                    for text in ob.Text:
-                        point = DraftVecUtils.tup(Vector(ob.Placement.Base.x,
-                                                         ob.Placement.Base.y - (height * 1.2 * ob.Text.index(text)),
-                                                         ob.Placement.Base.z))
-                        rotation = math.degrees(ob.Placement.Rotation.Angle)
-                        dxf.append(dxfLibrary.Text(text,
-                                                   point,
-                                                   height=height * 0.8,
-                                                   rotation=rotation,
-                                                   color=getACI(ob, text=True),
-                                                   style='STANDARD',
-                                                   layer=getStrGroup(ob)))
-
-                elif obtype in ["Dimension","LinearDimension"]:
-                    p1 = DraftVecUtils.tup(ob.Start)
-                    p2 = DraftVecUtils.tup(ob.End)
-                    base = Part.LineSegment(ob.Start, ob.End).toShape()
-                    proj = DraftGeomUtils.findDistance(ob.Dimline, base)
-                    if not proj:
-                        pbase = DraftVecUtils.tup(ob.End)
-                    else:
-                        pbase = DraftVecUtils.tup(ob.End.add(proj.negative()))
-                    dxf.append(dxfLibrary.Dimension(pbase,
-                                                    p1, p2,
-                                                    color=getACI(ob),
-                                                    layer=getStrGroup(ob)))
-
-            if six.PY2:
-                if isinstance(filename, six.text_type):
-                    filename = filename.encode("utf8")
-            dxf.saveas(filename)
+                        for text in ob.Text:
+                            point = DraftVecUtils.tup(Vector(ob.Placement.Base.x,
+                                                             ob.Placement.Base.y - (height * 1.2 * ob.Text.index(text)),
+                                                             ob.Placement.Base.z))
+                            rotation = math.degrees(ob.Placement.Rotation.Angle)
+                            dxf.append(dxfLibrary.Text(text,
+                                                       point,
+                                                       height=height * 0.8,
+                                                       rotation=rotation,
+                                                       color=getACI(ob, text=True),
+                                                       style='STANDARD',
+                                                       layer=getStrGroup(ob)))
 
+                    elif obtype in ["Dimension","LinearDimension"]:
+                        p1 = DraftVecUtils.tup(ob.Start)
+                        p2 = DraftVecUtils.tup(ob.End)
+                        base = Part.LineSegment(ob.Start, ob.End).toShape()
+                        proj = DraftGeomUtils.findDistance(ob.Dimline, base)
+                        if not proj:
+                            pbase = DraftVecUtils.tup(ob.End)
+                        else:
+                            pbase = DraftVecUtils.tup(ob.End.add(proj.negative()))
+                        dxf.append(dxfLibrary.Dimension(pbase,
+                                                        p1, p2,
+                                                        color=getACI(ob),
+                                                        layer=getStrGroup(ob)))
+
+                if six.PY2:
+                    if isinstance(filename, six.text_type):
+                        filename = filename.encode("utf8")
+                dxf.saveas(filename)
+        finally:
+            groupIndex = None
+            linkBlocks = None
         FCC.PrintMessage("successfully exported" + " " + filename + "\n")
 
     else:
@@ -3979,8 +4206,8 @@ def exportPage(page, filename):
         template += "0\nSECTION\n2\nBLOCKS\n999\n$blocks\n0\nENDSEC\n"
         template += "0\nSECTION\n2\nENTITIES\n999\n$entities\n0\nENDSEC\n"
         template += "0\nEOF"
-    blocks = ""
-    entities = ""
+    blocks = []
+    entities = []
     r12 = False
     ver = re.findall("\$ACADVER\n.*?\n(.*?)\n", template)
     if ver:
@@ -3989,19 +4216,29 @@ def exportPage(page, filename):
         if ver[0].upper() in ["AC1009", "AC1010", "AC1011",
                               "AC1012", "AC1013"]:
             r12 = True
+    shared = {}
     for view in views:
-        b, e = getViewDXF(view)
-        blocks += b
-        entities += e
-    if blocks:
-        template = template.replace("999\n$blocks", blocks[:-1])
-    if entities:
-        template = template.replace("999\n$entities", entities[:-1])
+        b, e = getViewDXF(view, shared=shared)
+        if b:
+            blocks.append(b)
+        if e:
+            entities.append(e)
+    # write the template piece by piece, numbering the handles
+    # in the order they appear in the file
     c = dxfcounter()
     pat = re.compile("(_handle_)")
-    template = pat.sub(c.incr, template)
     f = pythonopen(filename, "w")
-    f.write(template)
+    for part in re.split("(999\n\\$blocks|999\n\\$entities)", template):
+        if part == "999\n$blocks" and blocks:
+            blocks[-1] = blocks[-1][:-1]
+            for b in blocks:
+                f.write(pat.sub(c.incr, b))
+        elif part == "999\n$entities" and entities:
+            entities[-1] = entities[-1][:-1]
+            for e in entities:
+                f.write(pat.sub(c.incr, e))
+        else:
+            f.write(pat.sub(c.incr, part))
     f.close()
 
 
@@ -4073,7 +4310,7 @@ def getViewBlock(geom, view, blockcount):
     return block, insert, blockcount
 
 
-def getViewDXF(view, blocks=True):
+def getViewDXF(view, blocks=True, shared=None):
     """Return a DXF fragment from a Drawing view.
 
     Depending on the type of page view, it will try
@@ -4106,6 +4343,13 @@ def getViewDXF(view, blocks=True):
     blocks : bool, optional
         It defaults to `True`. Not used?
 
+    shared : dict, optional
+        It defaults to `None`. A dictionary of the blocks already
+        written for `'Drawing::FeatureViewPart'` views, by source object
+        and direction. If the global variable `dxfExportBlocks` exists,
+        views of a source already in it only add an insert of its block.
+        New blocks are added to it.
+
     Returns
     -------
     str, str
@@ -4121,7 +4365,7 @@ def getViewDXF(view, blocks=True):
 
     if view.isDerivedFrom("App::DocumentObjectGroup"):
         for child in view.Group:
-            b, e = getViewDXF(child)
+            b, e = getViewDXF(child, shared=shared)
             block += b
             insert += e
 
@@ -4143,20 +4387,30 @@ def getViewDXF(view, blocks=True):
         r = view.Rotation
         if r != 0:
             r = -r  # fix rotation direction
-        import Drawing
-        proj = Drawing.projectToDXF(view.Source.Shape, view.Direction)
+        key = (view.Source.Name, tuple(view.Direction))
+        proj = None
+        if dxfExportBlocks and (shared is not None) and (key in shared):
+            # same projection as an earlier view, only insert its block
+            name = shared[key]
+        else:
+            import Drawing
+            proj = Drawing.projectToDXF(view.Source.Shape, view.Direction)
+            name = view.Name + str(blockcount)
         if dxfExportBlocks:
-            # change layer and set color and ltype to BYBLOCK (0)
-            proj = proj.replace("sheet_layer\n",
-                                "0\n6\nBYBLOCK\n62\n0\n5\n_handle_\n")
-            block = "0\nBLOCK\n5\n_handle_\n100\nAcDbEntity\n8\n0\n100\nAcDbBlockBegin\n2\n"
-            block += view.Name + str(blockcount)
-            block += "\n70\n0\n10\n0\n20\n0\n3\n" + view.Name + str(blockcount)
-            block += "\n1\n\n"
-            block += proj
-            block += "0\nENDBLK\n5\n_handle_\n100\nAcDbEntity\n8\n0\n100\nAcDbBlockEnd\n"
+            if proj is not None:
+                # change layer and set color and ltype to BYBLOCK (0)
+                proj = proj.replace("sheet_layer\n",
+                                    "0\n6\nBYBLOCK\n62\n0\n5\n_handle_\n")
+                block = "0\nBLOCK\n5\n_handle_\n100\nAcDbEntity\n8\n0\n100\nAcDbBlockBegin\n2\n"
+                block += name
+                block += "\n70\n0\n10\n0\n20\n0\n3\n" + name
+                block += "\n1\n\n"
+                block += proj
+                block += "0\nENDBLK\n5\n_handle_\n100\nAcDbEntity\n8\n0\n100\nAcDbBlockEnd\n"
+                if shared is not None:
+                    shared[key] = name
             insert += "0\nINSERT\n5\n_handle_\n8\n0\n6\nBYLAYER\n62\n256\n2\n"
-            insert += view.Name + str(blockcount)
+            insert += name
             insert += "\n10\n" + str(view.X) + "\n20\n" + str(-view.Y)
             insert += "\n30\n0\n41\n" + str(view.Scale)
             insert += "\n42\n" + str(view.Scale) + "\n43\n" + str(view.Scale)
@@ -4217,7 +4471,8 @@ def readPreferences():
 
     It creates and sets the global variables:
     `dxfCreatePart`, `dxfCreateDraft`, `dxfCreateSketch`,
-    `dxfDiscretizeCurves`, `dxfStarBlocks`, `dxfMakeBlocks`, `dxfJoin`,
+    `dxfDiscretizeCurves`, `dxfStarBlocks`, `dxfMakeBlocks`,
+    `dxfBlocksAsLinks`, `dxfJoin`,
     `dxfRenderPolylineWidth`, `dxfImportTexts`, `dxfImportLayouts`,
     `dxfImportPoints`, `dxfImportHatches`, `dxfUseStandardSize`,
     `dxfGetColors`, `dxfUseDraftVisGroups`, `dxfFillMode`,
@@ -4240,7 +4495,7 @@ def readPreferences():
         FreeCADGui.showPreferences("Import-Export", 3)
     global dxfCreatePart, dxfCreateDraft, dxfCreateSketch
     global dxfDiscretizeCurves, dxfStarBlocks
-    global dxfMakeBlocks, dxfJoin, dxfRenderPolylineWidth
+    global dxfMakeBlocks, dxfBlocksAsLinks, dxfJoin, dxfRenderPolylineWidth
     global dxfImportTexts, dxfImportLayouts
     global dxfImportPoints, dxfImportHatches, dxfUseStandardSize
     global dxfGetColors, dxfUseDraftVisGroups
@@ -4253,6 +4508,7 @@ def readPreferences():
     dxfDiscretizeCurves = p.GetBool("DiscretizeEllipses", True)
     dxfStarBlocks = p.GetBool("dxfstarblocks", False)
     dxfMakeBlocks = p.GetBool("groupLayers", False)
+    dxfBlocksAsLinks = p.GetBool("dxfBlocksAsLinks", False)
     dxfJoin = p.GetBool("joingeometry", False)
     dxfRenderPolylineWidth = p.GetBool("renderPolylineWidth", False)
     dxfImportTexts = p.GetBool("dxftext", False)
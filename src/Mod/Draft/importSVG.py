@@ -58,7 +58,7 @@ import Draft
 import DraftVecUtils
 from FreeCAD import Vector
 from draftutils.translate import translate
-from draftutils.messages import _msg, _wrn, _err
+from draftutils.messages import _msg, _wrn, _err, _log
 
 if FreeCAD.GuiUp:
     from PySide import QtGui
@@ -422,6 +422,50 @@ def getsize(length, mode='discard', base=1):
             return float(number) * base
 
 
+# Path data of SVG paths: the command letters, the numbers,
+# and strings of arguments that float() reads as the numbers do
+_pathcommand = re.compile('([mMlLhHvVaAcCqQsStTzZ])')
+_pathnumber = re.compile(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?')
+_pathplain = re.compile(r'[0-9eE.+\- ,\t\r\n]*')
+
+
+def getpathcommands(pathdata):
+    """Split the path data of an SVG path into commands.
+
+    The arguments of most commands are plain lists of numbers,
+    which are converted directly by `float`. Only the other ones,
+    like `'1.5.5'` or `'10-5'`, are searched for numbers.
+
+    Parameters
+    ----------
+    pathdata : str
+        The `d` attribute of an SVG path, for example `'M 0,0 L 10,5 z'`.
+
+    Returns
+    -------
+    list of tuples
+        A list of `(command, arguments)` tuples, where `command`
+        is the letter of the command and `arguments` is the list
+        of the numbers that follow it, as floats.
+        Numbers before the first command are ignored.
+    """
+    parts = _pathcommand.split(pathdata)
+    commands = []
+    for i in range(1, len(parts), 2):
+        args = parts[i + 1]
+        arguments = None
+        if (_pathplain.fullmatch(args)
+                and ".e" not in args and ".E" not in args):
+            try:
+                arguments = [float(n) for n in args.replace(",", " ").split()]
+            except ValueError:
+                pass
+        if arguments is None:
+            arguments = [float(n) for n in _pathnumber.findall(args)]
+        commands.append((parts[i], arguments))
+    return commands
+
+
 def makewire(path, checkclosed=False, donttry=False):
     '''Try to make a wire out of the list of edges.
 
@@ -580,7 +624,7 @@ def arcend2center(lastvec, currentvec, rx, ry,
         try:
             scalefacpos = math.sqrt(numer/denom)
         except ValueError:
-            _msg("sqrt({0}/{1})".format(numer, denom))
+            _log("sqrt({0}/{1})".format(numer, denom))
             scalefacpos = 0
 
     # Calculate two values because the square root may be positive or negative
@@ -650,9 +694,13 @@ class svgHandler(xml.sax.ContentHandler):
         self.style = params.GetInt("svgstyle")
         self.disableUnitScaling = params.GetBool("svgDisableUnitScaling",
                                                  False)
+        self.mergeShapes = params.GetBool("svgMergeShapes", False)
         self.count = 0
         self.transform = None
         self.grouptransform = []
+        self.groupmatrix = []
+        self.grouplayer = []
+        self.merged = {}
         self.lastdim = None
         self.viewbox = None
         self.symbols = {}
@@ -686,6 +734,91 @@ class svgHandler(xml.sax.ContentHandler):
             if self.fill:
                 v.ShapeColor = self.fill
 
+    def addGroup(self, m, layer=None):
+        """Add a group transformation and layer to the group stacks.
+
+        Besides the transformation of the group itself, it keeps
+        the product of the transformations of all the open groups,
+        so that `applyTrans` needs a single transformation per shape.
+
+        Parameters
+        ----------
+        m : Base::Matrix4D
+            The transformation of the group.
+        layer : str, optional
+            The label of the group if it is an Inkscape layer.
+            Otherwise the group is in the layer of its parent.
+        """
+        self.grouptransform.append(m)
+        if self.groupmatrix:
+            self.groupmatrix.append(self.groupmatrix[-1].multiply(m))
+        else:
+            self.groupmatrix.append(FreeCAD.Matrix().multiply(m))
+        if not layer and self.grouplayer:
+            layer = self.grouplayer[-1]
+        self.grouplayer.append(layer)
+
+    def getTransform(self):
+        """Return the transformation of the current element.
+
+        Returns
+        -------
+        Base::Matrix4D
+            The product of the transformations of the open groups
+            and of the element itself, or `None` if there are none.
+        """
+        if self.groupmatrix:
+            m = self.groupmatrix[-1]
+            if self.transform:
+                m = m.multiply(self.transform)
+            return m
+        return self.transform
+
+    def addShape(self, sh, name):
+        """Add a shape to the document as a new Part::Feature.
+
+        If the `svgMergeShapes` parameter is set, the shape is kept
+        instead, and `endDocument` adds one object with all the shapes
+        of the same layer and style. Shapes of symbols are always
+        added, as they are used by later elements.
+
+        Parameters
+        ----------
+        sh : Part.Shape
+            The shape to add, already transformed.
+        name : str
+            The name of the new object.
+
+        Returns
+        -------
+        Part::Feature
+            The new object, or `None` if the shape is kept.
+        """
+        if self.mergeShapes and not self.currentsymbol:
+            layer = self.grouplayer[-1] if self.grouplayer else None
+            key = (layer, self.color, self.width, self.fill)
+            self.merged.setdefault(key, []).append(sh)
+            return None
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = sh
+        self.format(obj)
+        if self.currentsymbol:
+            self.symbols[self.currentsymbol].append(obj)
+        return obj
+
+    def endDocument(self):
+        """Add the shapes kept by `addShape` as one object per style."""
+        for (layer, color, width, fill), shapes in self.merged.items():
+            obj = self.doc.addObject("Part::Feature", layer or "Shapes")
+            if layer:
+                obj.Label = layer
+            obj.Shape = Part.makeCompound(shapes)
+            self.color = color
+            self.width = width
+            self.fill = fill
+            self.format(obj)
+        self.merged = {}
+
     def startElement(self, name, attrs):
         """Re-organize data into a nice clean dictionary.
 
@@ -698,8 +831,8 @@ class svgHandler(xml.sax.ContentHandler):
             Dictionary of content of the elements
         """
         self.count += 1
-        _msg('processing element {0}: {1}'.format(self.count, name))
-        _msg('existing group transform: {}'.format(self.grouptransform))
+        _log('processing element {0}: {1}'.format(self.count, name))
+        _log('existing group transform: {}'.format(self.grouptransform))
 
         data = {}
         for (keyword, content) in list(attrs.items()):
@@ -832,7 +965,7 @@ class svgHandler(xml.sax.ContentHandler):
                 elif len(self.grouptransform) == 0:
                     # fallback to current dpi
                     m.scale(Vector(25.4/self.svgdpi, 25.4/self.svgdpi, 1))
-            self.grouptransform.append(m)
+            self.addGroup(m)
         if 'fill' in data:
             if data['fill'][0] != 'none':
                 self.fill = getcolor(data['fill'])
@@ -843,15 +976,18 @@ class svgHandler(xml.sax.ContentHandler):
             if data['stroke-width'] != 'none':
                 self.width = getsize(data['stroke-width'],
                                      'css' + str(self.svgdpi))
+        layer = None
+        if data.get('inkscape:groupmode') == ['layer']:
+            layer = attrs.get('inkscape:label', attrs.get('id'))
         if 'transform' in data:
             m = self.getMatrix(attrs.getValue('transform'))
             if name == "g":
-                self.grouptransform.append(m)
+                self.addGroup(m, layer)
             else:
                 self.transform = m
         else:
             if name == "g":
-                self.grouptransform.append(FreeCAD.Matrix())
+                self.addGroup(FreeCAD.Matrix(), layer)
 
         if self.style == 1:
             self.color = self.col
@@ -860,11 +996,11 @@ class svgHandler(xml.sax.ContentHandler):
         pathname = None
         if 'id' in data:
             pathname = data['id'][0]
-            _msg('name: {}'.format(pathname))
+            _log('name: {}'.format(pathname))
 
         # Process paths
         if name == "path":
-            _msg('data: {}'.format(data))
+            _log('data: {}'.format(data))
 
             if not pathname:
                 pathname = 'Path'
@@ -890,20 +1026,8 @@ class svgHandler(xml.sax.ContentHandler):
                 self.lastdim = obj
                 data['d'] = []
 
-            _op = '([mMlLhHvVaAcCqQsStTzZ])'
-            _op2 = '([^mMlLhHvVaAcCqQsStTzZ]*)'
-            _command = '\s*?' + _op + '\s*?' + _op2 + '\s*?'
-            pathcommandsre = re.compile(_command, re.DOTALL)
-
-            _num = '[-+]?[0-9]*\.?[0-9]+'
-            _exp = '([eE][-+]?[0-9]+)?'
-            _point = '(' + _num + _exp + ')'
-            pointsre = re.compile(_point, re.DOTALL)
-            _commands = pathcommandsre.findall(' '.join(data['d']))
-            for d, pointsstr in _commands:
+            for d, pointlist in getpathcommands(' '.join(data['d'])):
                 relative = d.islower()
-                _points = pointsre.findall(pointsstr.replace(',', ' '))
-                pointlist = [float(number) for number, exponent in _points]
 
                 if (d == "M" or d == "m"):
                     x = pointlist.pop(0)
@@ -914,11 +1038,7 @@ class svgHandler(xml.sax.ContentHandler):
                         if self.fill and sh.isClosed():
                             sh = Part.Face(sh)
                         sh = self.applyTrans(sh)
-                        obj = self.doc.addObject("Part::Feature", pathname)
-                        obj.Shape = sh
-                        self.format(obj)
-                        if self.currentsymbol:
-                            self.symbols[self.currentsymbol].append(obj)
+                        self.addShape(sh, pathname)
                         path = []
                         # if firstvec:
                         #    Move relative to last move command
@@ -929,7 +1049,7 @@ class svgHandler(xml.sax.ContentHandler):
                     else:
                         lastvec = Vector(x, -y, 0)
                     firstvec = lastvec
-                    _msg('move {}'.format(lastvec))
+                    _log('move {}'.format(lastvec))
                     lastpole = None
 
                 if (d == "L" or d == "l") \
@@ -942,7 +1062,7 @@ class svgHandler(xml.sax.ContentHandler):
                         if not DraftVecUtils.equals(lastvec, currentvec):
                             _seg = Part.LineSegment(lastvec, currentvec)
                             seg = _seg.toShape()
-                            _msg("line {} {}".format(lastvec, currentvec))
+                            _log("line {} {}".format(lastvec, currentvec))
                             lastvec = currentvec
                             path.append(seg)
                         lastpole = None
@@ -1193,28 +1313,20 @@ class svgHandler(xml.sax.ContentHandler):
                                 and sh.Wires[0].isClosed():
                             sh = Part.Face(sh)
                         sh = self.applyTrans(sh)
-                        obj = self.doc.addObject("Part::Feature", pathname)
-                        obj.Shape = sh
-                        self.format(obj)
+                        self.addShape(sh, pathname)
                         path = []
                         if firstvec:
                             # Move relative to recent draw command
                             lastvec = firstvec
                         point = []
                         # command = None
-                        if self.currentsymbol:
-                            self.symbols[self.currentsymbol].append(obj)
             if path:
                 sh = makewire(path, checkclosed=False)
                 # sh = Part.Wire(path)
                 if self.fill and sh.isClosed():
                     sh = Part.Face(sh)
                 sh = self.applyTrans(sh)
-                obj = self.doc.addObject("Part::Feature", pathname)
-                obj.Shape = sh
-                self.format(obj)
-                if self.currentsymbol:
-                    self.symbols[self.currentsymbol].append(obj)
+                self.addShape(sh, pathname)
         # end process paths
 
         # Process rects
@@ -1309,11 +1421,7 @@ class svgHandler(xml.sax.ContentHandler):
             if self.fill:
                 sh = Part.Face(sh)
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process lines
         if name == "line":
@@ -1323,11 +1431,7 @@ class svgHandler(xml.sax.ContentHandler):
             p2 = Vector(data['x2'], -data['y2'], 0)
             sh = Part.LineSegment(p1, p2).toShape()
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process polylines and polygons
         if name == "polyline" or name == "polygon":
@@ -1342,7 +1446,7 @@ class svgHandler(xml.sax.ContentHandler):
             if not pathname:
                 pathname = 'Polyline'
             points = [float(d) for d in data['points']]
-            _msg('points {}'.format(points))
+            _log('points {}'.format(points))
             lenpoints = len(points)
             if lenpoints >= 4 and lenpoints % 2 == 0:
                 lastvec = Vector(points[0], -points[1], 0)
@@ -1361,10 +1465,7 @@ class svgHandler(xml.sax.ContentHandler):
                     if self.fill and sh.isClosed():
                         sh = Part.Face(sh)
                     sh = self.applyTrans(sh)
-                    obj = self.doc.addObject("Part::Feature", pathname)
-                    obj.Shape = sh
-                    if self.currentsymbol:
-                        self.symbols[self.currentsymbol].append(obj)
+                    self.addShape(sh, pathname)
 
         # Process ellipses
         if name == "ellipse":
@@ -1393,11 +1494,7 @@ class svgHandler(xml.sax.ContentHandler):
                 sh = Part.Wire([sh])
                 sh = Part.Face(sh)
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process circles
         if name == "circle" and "freecad:skip" not in data:
@@ -1411,11 +1508,7 @@ class svgHandler(xml.sax.ContentHandler):
                 sh = Part.Face(sh)
             sh.translate(c)
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process texts
         if name in ["text", "tspan"]:
@@ -1465,7 +1558,7 @@ class svgHandler(xml.sax.ContentHandler):
                 else:
                     _msg("no symbol data")
 
-        _msg("done processing element {}".format(self.count))
+        _log("done processing element {}".format(self.count))
     # startElement()
 
     def characters(self, content):
@@ -1481,9 +1574,8 @@ class svgHandler(xml.sax.ContentHandler):
             if self.transform:
                 vec = self.translateVec(vec, self.transform)
                 # print("own transform: ", self.transform, vec)
-            for transform in self.grouptransform[::-1]:
-                # vec = self.translateVec(vec, transform)
-                vec = transform.multiply(vec)
+            if self.groupmatrix:
+                vec = self.groupmatrix[-1].multiply(vec)
             # print("applying vector: ", vec)
             obj.Position = vec
             if FreeCAD.GuiUp:
@@ -1505,8 +1597,10 @@ class svgHandler(xml.sax.ContentHandler):
             self.transform = None
             self.text = None
         if name == "g" or name == "svg":
-            _msg("closing group")
+            _log("closing group")
             self.grouptransform.pop()
+            self.groupmatrix.pop()
+            self.grouplayer.pop()
         if name == "symbol":
             if self.doc.getObject("svgsymbols"):
                 group = self.doc.getObject("svgsymbols")
@@ -1525,29 +1619,21 @@ class svgHandler(xml.sax.ContentHandler):
         sh : Part.Shape or Draft.Dimension
             Object to be transformed
         """
+        m = self.getTransform()
         if isinstance(sh, Part.Shape):
-            if self.transform:
-                _msg("applying object transform: {}".format(self.transform))
-                # sh = transformCopyShape(sh, self.transform)
-                # see issue #2062
-                sh = sh.transformGeometry(self.transform)
-            for transform in self.grouptransform[::-1]:
-                _msg("applying group transform: {}".format(transform))
-                # sh = transformCopyShape(sh, transform)
+            if m:
+                _log("applying transform: {}".format(m))
+                # sh = transformCopyShape(sh, m)
                 # see issue #2062
-                sh = sh.transformGeometry(transform)
+                sh = sh.transformGeometry(m)
             return sh
         elif Draft.getType(sh) in ["Dimension","LinearDimension"]:
             pts = []
             for p in [sh.Start, sh.End, sh.Dimline]:
                 cp = Vector(p)
-                if self.transform:
-                    _msg("applying object transform: "
-                         "{}".format(self.transform))
-                    cp = self.transform.multiply(cp)
-                for transform in self.grouptransform[::-1]:
-                    _msg("applying group transform: {}".format(transform))
-                    cp = transform.multiply(cp)
+                if m:
+                    _log("applying transform: {}".format(m))
+                    cp = m.multiply(cp)
                 pts.append(cp)
             sh.Start = pts[0]
             sh.End = pts[1]
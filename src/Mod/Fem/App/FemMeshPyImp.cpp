@@ -26,10 +26,13 @@
 #ifndef _PreComp_
 # include <Python.h>
 # include <algorithm>
+# include <cstdint>
+# include <cstring>
 # include <stdexcept>
 # include <SMESH_Gen.hxx>
 # include <SMESH_Group.hxx>
 # include <SMESH_Mesh.hxx>
+# include <SMESH_MeshEditor.hxx>
 # include <SMESHDS_Group.hxx>
 # include <SMDSAbs_ElementType.hxx>
 # include <SMDS_MeshElement.hxx>
@@ -62,6 +65,82 @@
 
 using namespace Fem;
 
+namespace {
+
+// Returns the item type of a buffer in native byte order, 0 for all other buffers
+char getBufferType(const Py_buffer& view)
+{
+    const char* format = view.format ? view.format : "B";
+    if (*format == '@' || *format == '=')
+        ++format;
+    if (format[0] == 0 || format[1] != 0)
+        return 0;
+    return format[0];
+}
+
+// Objects with a contiguous buffer of doubles (numpy arrays, array.array) are
+// copied as a whole, any other sequence is converted item by item.
+void getDoubleValues(PyObject* obj, std::vector<double>& values)
+{
+    Py_buffer view;
+    if (PyObject_CheckBuffer(obj) && PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0) {
+        bool copied = false;
+        if (getBufferType(view) == 'd' && view.itemsize == sizeof(double)) {
+            const double* data = static_cast<const double*>(view.buf);
+            values.assign(data, data + view.len / view.itemsize);
+            copied = true;
+        }
+        PyBuffer_Release(&view);
+        if (copied)
+            return;
+    }
+    PyErr_Clear();
+
+    Py::Sequence sequence(obj);
+    values.reserve(sequence.size());
+    for (Py::Sequence::iterator it = sequence.begin(); it != sequence.end(); ++it)
+        values.push_back(static_cast<double>(Py::Float(*it)));
+}
+
+template <typename T>
+void assignBufferValues(const Py_buffer& view, std::vector<int>& values)
+{
+    const T* data = static_cast<const T*>(view.buf);
+    values.assign(data, data + view.len / view.itemsize);
+}
+
+// Objects with a contiguous buffer of 32 or 64 bit integers are copied as a
+// whole, any other sequence is converted item by item.
+void getIntValues(PyObject* obj, std::vector<int>& values)
+{
+    Py_buffer view;
+    if (PyObject_CheckBuffer(obj) && PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0) {
+        bool copied = false;
+        char type = getBufferType(view);
+        if (type != 0 && std::strchr("ilqn", type)) {
+            if (view.itemsize == sizeof(int32_t)) {
+                assignBufferValues<int32_t>(view, values);
+                copied = true;
+            }
+            else if (view.itemsize == sizeof(int64_t)) {
+                assignBufferValues<int64_t>(view, values);
+                copied = true;
+            }
+        }
+        PyBuffer_Release(&view);
+        if (copied)
+            return;
+    }
+    PyErr_Clear();
+
+    Py::Sequence sequence(obj);
+    values.reserve(sequence.size());
+    for (Py::Sequence::iterator it = sequence.begin(); it != sequence.end(); ++it)
+        values.push_back(static_cast<int>(Py::Long(*it)));
+}
+
+}
+
 // returns a string which represents the object e.g. when printed in python
 std::string FemMeshPy::representation(void) const
 {
@@ -580,6 +659,114 @@ PyObject* FemMeshPy::addVolume(PyObject *args)
     return 0;
 }
 
+PyObject* FemMeshPy::addNodes(PyObject *args)
+{
+    PyObject *coordsObj;
+    PyObject *idsObj = Py_None;
+    if (!PyArg_ParseTuple(args, "O|O", &coordsObj, &idsObj))
+        return 0;
+
+    try {
+        std::vector<double> coords;
+        getDoubleValues(coordsObj, coords);
+        if (coords.size() % 3 != 0)
+            throw std::runtime_error("Number of coordinates is not a multiple of three");
+        std::size_t count = coords.size() / 3;
+
+        std::vector<int> ids;
+        if (idsObj != Py_None) {
+            getIntValues(idsObj, ids);
+            if (ids.size() != count)
+                throw std::runtime_error("Number of ids does not match the number of nodes");
+        }
+
+        SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+        for (std::size_t i = 0; i < count; ++i) {
+            const double* xyz = &coords[3 * i];
+            SMDS_MeshNode* node = 0;
+            if (ids.empty())
+                node = meshDS->AddNode(xyz[0], xyz[1], xyz[2]);
+            else
+                node = meshDS->AddNodeWithID(xyz[0], xyz[1], xyz[2], ids[i]);
+            if (!node)
+                throw std::runtime_error("Failed to add node");
+        }
+    }
+    catch (const Py::Exception&) {
+        return 0;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::BaseExceptionFreeCADError, e.what());
+        return 0;
+    }
+    Py_Return;
+}
+
+PyObject* FemMeshPy::addElements(PyObject *args)
+{
+    char* typeString;
+    int nodeCount;
+    PyObject *nodesObj;
+    PyObject *idsObj = Py_None;
+    if (!PyArg_ParseTuple(args, "siO|O", &typeString, &nodeCount, &nodesObj, &idsObj))
+        return 0;
+
+    SMDSAbs_ElementType elementType;
+    if (std::strcmp(typeString, "Edge") == 0)
+        elementType = SMDSAbs_Edge;
+    else if (std::strcmp(typeString, "Face") == 0)
+        elementType = SMDSAbs_Face;
+    else if (std::strcmp(typeString, "Volume") == 0)
+        elementType = SMDSAbs_Volume;
+    else {
+        PyErr_SetString(PyExc_ValueError, "Element type must be Edge, Face or Volume");
+        return 0;
+    }
+    if (nodeCount < 2) {
+        PyErr_SetString(PyExc_ValueError, "Node count of the elements must be at least two");
+        return 0;
+    }
+
+    try {
+        std::vector<int> nodeIds;
+        getIntValues(nodesObj, nodeIds);
+        if (nodeIds.size() % nodeCount != 0)
+            throw std::runtime_error("Number of node ids is not a multiple of the node count");
+        std::size_t count = nodeIds.size() / nodeCount;
+
+        std::vector<int> ids;
+        if (idsObj != Py_None) {
+            getIntValues(idsObj, ids);
+            if (ids.size() != count)
+                throw std::runtime_error("Number of ids does not match the number of elements");
+        }
+
+        SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
+        SMESHDS_Mesh* meshDS = mesh->GetMeshDS();
+        SMESH_MeshEditor editor(mesh);
+        SMESH_MeshEditor::ElemFeatures elemFeat(elementType);
+        std::vector<const SMDS_MeshNode*> nodes(nodeCount);
+        for (std::size_t i = 0; i < count; ++i) {
+            for (int j = 0; j < nodeCount; ++j) {
+                nodes[j] = meshDS->FindNode(nodeIds[i * nodeCount + j]);
+                if (!nodes[j])
+                    throw std::runtime_error("Failed to get node of the given indices");
+            }
+            elemFeat.SetID(ids.empty() ? -1 : ids[i]);
+            if (!editor.AddElement(nodes, elemFeat))
+                throw std::runtime_error("Failed to add element, unsupported node count or element id");
+        }
+    }
+    catch (const Py::Exception&) {
+        return 0;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::BaseExceptionFreeCADError, e.what());
+        return 0;
+    }
+    Py_Return;
+}
+
 PyObject* FemMeshPy::copy(PyObject *args)
 {
     if (!PyArg_ParseTuple(args, ""))
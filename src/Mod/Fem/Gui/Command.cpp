@@ -1683,6 +1683,10 @@ void CmdFemPostPipelineFromResult::activated(int)
     if (results.size() == 1) {
         std::string FeatName = getUniqueObjectName("ResultPipeline");
         openCommand(QT_TRANSLATE_NOOP("Command", "Create pipeline from result"));
+        // lazy imported results are read from their result file on first use
+        doCommand(Doc,"from feminout.importCcxFrdResults import load_result_set");
+        doCommand(Doc,"load_result_set(App.activeDocument().getObject(\"%s\"))",
+                  results[0]->getNameInDocument());
         doCommand(Doc,"App.activeDocument().addObject('Fem::FemPostPipeline','%s')",FeatName.c_str());
         doCommand(Doc,"App.activeDocument().ActiveObject.load("
                       "App.activeDocument().getObject(\"%s\"))", results[0]->getNameInDocument());
@@ -73,6 +73,7 @@ void DlgSettingsFemCcxImp::saveSettings()
     ui->cb_ccx_binary_std->onSave();
     ui->fc_ccx_binary_path->onSave();
     ui->cb_split_inp_writer->onSave();
+    ui->cb_lazy_results->onSave();
 }
 
 void DlgSettingsFemCcxImp::loadSettings()
@@ -98,6 +99,7 @@ void DlgSettingsFemCcxImp::loadSettings()
     ui->cb_ccx_binary_std->onRestore();
     ui->fc_ccx_binary_path->onRestore();
     ui->cb_split_inp_writer->onRestore();
+    ui->cb_lazy_results->onRestore();
 
     ParameterGrp::handle hGrp = App::GetApplication().GetParameterGroupByPath
         ("User parameter:BaseApp/Preferences/Mod/Fem/Ccx");
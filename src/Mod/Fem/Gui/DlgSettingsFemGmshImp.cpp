@@ -48,12 +48,14 @@ void DlgSettingsFemGmshImp::saveSettings()
 {
     ui->cb_gmsh_binary_std->onSave();
     ui->fc_gmsh_binary_path->onSave();
+    ui->cb_gmsh_mesh_cache->onSave();
 }
 
 void DlgSettingsFemGmshImp::loadSettings()
 {
     ui->cb_gmsh_binary_std->onRestore();
     ui->fc_gmsh_binary_path->onRestore();
+    ui->cb_gmsh_mesh_cache->onRestore();
 }
 
 /**
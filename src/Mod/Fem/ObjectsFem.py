@@ -683,6 +683,9 @@ def makePostVtkResult(
     """makePostVtkResult(document, base_result, [name]):
     creates a FEM post processing result object (vtk based) to hold FEM results"""
     obj = doc.addObject("Fem::FemPostPipeline", name)
+    # lazy imported results are read from their result file on first use
+    from feminout.importCcxFrdResults import load_result_set
+    load_result_set(base_result)
     obj.load(base_result)
     return obj
 
@@ -62,12 +62,12 @@ def setup_boxanalysisbase(doc=None, solvertype="ccxtools"):
     analysis.addObject(material_obj)
 
     # mesh
-    from .meshes.mesh_boxanalysis_tetra10 import create_nodes, create_elements
+    from .meshes.meshdata import create_nodes, create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_boxanalysis_tetra10")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_boxanalysis_tetra10")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
@@ -147,12 +147,12 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_force)
 
     # mesh
-    from .meshes.mesh_buckling_plate_tria6 import create_nodes, create_elements
+    from .meshes.meshdata import create_nodes, create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_buckling_plate_tria6")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_buckling_plate_tria6")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
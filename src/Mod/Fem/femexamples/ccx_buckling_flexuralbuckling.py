@@ -127,12 +127,12 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_force)
 
     # mesh
-    from .meshes.mesh_flexural_buckling import create_nodes, create_elements
+    from .meshes.meshdata import create_nodes, create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_flexural_buckling")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_flexural_buckling")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
@@ -121,12 +121,12 @@ def setup_cantilever_base_edge(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_force)
 
     # mesh
-    from .meshes.mesh_canticcx_seg3 import create_nodes, create_elements
+    from .meshes.meshdata import create_nodes, create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_canticcx_seg3")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_canticcx_seg3")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
@@ -75,12 +75,12 @@ def setup(doc=None, solvertype="ccxtools"):
     geom_obj = doc.getObject("CanileverPlate")
 
     # load the tria3 mesh
-    from .meshes.mesh_canticcx_tria3 import create_nodes, create_elements
+    from .meshes.meshdata import create_nodes, create_elements
     new_fem_mesh = Fem.FemMesh()
-    control = create_nodes(new_fem_mesh)
+    control = create_nodes(new_fem_mesh, "mesh_canticcx_tria3")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(new_fem_mesh)
+    control = create_elements(new_fem_mesh, "mesh_canticcx_tria3")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
 
@@ -179,12 +179,12 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_centrif)
 
     # mesh
-    from .meshes.mesh_constraint_centrif_tetra10 import create_nodes, create_elements
+    from .meshes.meshdata import create_nodes, create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_constraint_centrif_tetra10")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_constraint_centrif_tetra10")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
@@ -1,117 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(0.0, 500.0, 500.0, 1)
-    femmesh.addNode(8000.0, 500.0, 500.0, 2)
-    femmesh.addNode(148.14814814814792, 500.0, 500.0, 3)
-    femmesh.addNode(296.29629629629585, 500.0, 500.0, 4)
-    femmesh.addNode(444.4444444444438, 500.0, 500.0, 5)
-    femmesh.addNode(592.5925925925918, 500.0, 500.0, 6)
-    femmesh.addNode(740.7407407407396, 500.0, 500.0, 7)
-    femmesh.addNode(888.8888888888874, 500.0, 500.0, 8)
-    femmesh.addNode(1037.0370370370354, 500.0, 500.0, 9)
-    femmesh.addNode(1185.1851851851832, 500.0, 500.0, 10)
-    femmesh.addNode(1333.333333333331, 500.0, 500.0, 11)
-    femmesh.addNode(1481.4814814814792, 500.0, 500.0, 12)
-    femmesh.addNode(1629.6296296296275, 500.0, 500.0, 13)
-    femmesh.addNode(1777.7777777777753, 500.0, 500.0, 14)
-    femmesh.addNode(1925.9259259259236, 500.0, 500.0, 15)
-    femmesh.addNode(2074.0740740740716, 500.0, 500.0, 16)
-    femmesh.addNode(2222.22222222222, 500.0, 500.0, 17)
-    femmesh.addNode(2370.370370370368, 500.0, 500.0, 18)
-    femmesh.addNode(2518.5185185185155, 500.0, 500.0, 19)
-    femmesh.addNode(2666.666666666663, 500.0, 500.0, 20)
-    femmesh.addNode(2814.8148148148107, 500.0, 500.0, 21)
-    femmesh.addNode(2962.962962962958, 500.0, 500.0, 22)
-    femmesh.addNode(3111.1111111111054, 500.0, 500.0, 23)
-    femmesh.addNode(3259.259259259253, 500.0, 500.0, 24)
-    femmesh.addNode(3407.4074074074006, 500.0, 500.0, 25)
-    femmesh.addNode(3555.555555555548, 500.0, 500.0, 26)
-    femmesh.addNode(3703.7037037036957, 500.0, 500.0, 27)
-    femmesh.addNode(3851.851851851843, 500.0, 500.0, 28)
-    femmesh.addNode(3999.9999999999905, 500.0, 500.0, 29)
-    femmesh.addNode(4148.148148148138, 500.0, 500.0, 30)
-    femmesh.addNode(4296.296296296286, 500.0, 500.0, 31)
-    femmesh.addNode(4444.4444444444325, 500.0, 500.0, 32)
-    femmesh.addNode(4592.59259259258, 500.0, 500.0, 33)
-    femmesh.addNode(4740.740740740728, 500.0, 500.0, 34)
-    femmesh.addNode(4888.888888888877, 500.0, 500.0, 35)
-    femmesh.addNode(5037.037037037026, 500.0, 500.0, 36)
-    femmesh.addNode(5185.185185185173, 500.0, 500.0, 37)
-    femmesh.addNode(5333.333333333322, 500.0, 500.0, 38)
-    femmesh.addNode(5481.481481481471, 500.0, 500.0, 39)
-    femmesh.addNode(5629.6296296296205, 500.0, 500.0, 40)
-    femmesh.addNode(5777.777777777769, 500.0, 500.0, 41)
-    femmesh.addNode(5925.925925925918, 500.0, 500.0, 42)
-    femmesh.addNode(6074.074074074067, 500.0, 500.0, 43)
-    femmesh.addNode(6222.222222222214, 500.0, 500.0, 44)
-    femmesh.addNode(6370.370370370363, 500.0, 500.0, 45)
-    femmesh.addNode(6518.518518518513, 500.0, 500.0, 46)
-    femmesh.addNode(6666.6666666666615, 500.0, 500.0, 47)
-    femmesh.addNode(6814.81481481481, 500.0, 500.0, 48)
-    femmesh.addNode(6962.962962962959, 500.0, 500.0, 49)
-    femmesh.addNode(7111.111111111108, 500.0, 500.0, 50)
-    femmesh.addNode(7259.259259259256, 500.0, 500.0, 51)
-    femmesh.addNode(7407.407407407406, 500.0, 500.0, 52)
-    femmesh.addNode(7555.555555555554, 500.0, 500.0, 53)
-    femmesh.addNode(7703.703703703703, 500.0, 500.0, 54)
-    femmesh.addNode(7851.851851851851, 500.0, 500.0, 55)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addEdge([1, 3], 1)
-    femmesh.addEdge([3, 4], 2)
-    femmesh.addEdge([4, 5], 3)
-    femmesh.addEdge([5, 6], 4)
-    femmesh.addEdge([6, 7], 5)
-    femmesh.addEdge([7, 8], 6)
-    femmesh.addEdge([8, 9], 7)
-    femmesh.addEdge([9, 10], 8)
-    femmesh.addEdge([10, 11], 9)
-    femmesh.addEdge([11, 12], 10)
-    femmesh.addEdge([12, 13], 11)
-    femmesh.addEdge([13, 14], 12)
-    femmesh.addEdge([14, 15], 13)
-    femmesh.addEdge([15, 16], 14)
-    femmesh.addEdge([16, 17], 15)
-    femmesh.addEdge([17, 18], 16)
-    femmesh.addEdge([18, 19], 17)
-    femmesh.addEdge([19, 20], 18)
-    femmesh.addEdge([20, 21], 19)
-    femmesh.addEdge([21, 22], 20)
-    femmesh.addEdge([22, 23], 21)
-    femmesh.addEdge([23, 24], 22)
-    femmesh.addEdge([24, 25], 23)
-    femmesh.addEdge([25, 26], 24)
-    femmesh.addEdge([26, 27], 25)
-    femmesh.addEdge([27, 28], 26)
-    femmesh.addEdge([28, 29], 27)
-    femmesh.addEdge([29, 30], 28)
-    femmesh.addEdge([30, 31], 29)
-    femmesh.addEdge([31, 32], 30)
-    femmesh.addEdge([32, 33], 31)
-    femmesh.addEdge([33, 34], 32)
-    femmesh.addEdge([34, 35], 33)
-    femmesh.addEdge([35, 36], 34)
-    femmesh.addEdge([36, 37], 35)
-    femmesh.addEdge([37, 38], 36)
-    femmesh.addEdge([38, 39], 37)
-    femmesh.addEdge([39, 40], 38)
-    femmesh.addEdge([40, 41], 39)
-    femmesh.addEdge([41, 42], 40)
-    femmesh.addEdge([42, 43], 41)
-    femmesh.addEdge([43, 44], 42)
-    femmesh.addEdge([44, 45], 43)
-    femmesh.addEdge([45, 46], 44)
-    femmesh.addEdge([46, 47], 45)
-    femmesh.addEdge([47, 48], 46)
-    femmesh.addEdge([48, 49], 47)
-    femmesh.addEdge([49, 50], 48)
-    femmesh.addEdge([50, 51], 49)
-    femmesh.addEdge([51, 52], 50)
-    femmesh.addEdge([52, 53], 51)
-    femmesh.addEdge([53, 54], 52)
-    femmesh.addEdge([54, 55], 53)
-    femmesh.addEdge([55, 2], 54)
-    return True
@@ -1,3244 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(200.0, 0.0, 0.0, 1)
-    femmesh.addNode(200.0, 10.0, 0.0, 2)
-    femmesh.addNode(0.0, 0.0, 0.0, 3)
-    femmesh.addNode(184.0, 0.0, 10.0, 4)
-    femmesh.addNode(16.0, 0.0, 10.0, 5)
-    femmesh.addNode(0.0, 10.0, 0.0, 6)
-    femmesh.addNode(184.0, 10.0, 10.0, 7)
-    femmesh.addNode(16.0, 10.0, 10.0, 8)
-    femmesh.addNode(200.0, 4.999999999999987, 0.0, 9)
-    femmesh.addNode(200.0, 2.4999999999999933, 0.0, 10)
-    femmesh.addNode(200.0, 7.499999999999993, 0.0, 11)
-    femmesh.addNode(6.8965517241379235, 0.0, 0.0, 12)
-    femmesh.addNode(13.79310344827585, 0.0, 0.0, 13)
-    femmesh.addNode(20.689655172413776, 0.0, 0.0, 14)
-    femmesh.addNode(27.5862068965517, 0.0, 0.0, 15)
-    femmesh.addNode(34.48275862068963, 0.0, 0.0, 16)
-    femmesh.addNode(41.37931034482755, 0.0, 0.0, 17)
-    femmesh.addNode(48.27586206896548, 0.0, 0.0, 18)
-    femmesh.addNode(55.1724137931034, 0.0, 0.0, 19)
-    femmesh.addNode(62.06896551724131, 0.0, 0.0, 20)
-    femmesh.addNode(68.9655172413792, 0.0, 0.0, 21)
-    femmesh.addNode(75.8620689655171, 0.0, 0.0, 22)
-    femmesh.addNode(82.758620689655, 0.0, 0.0, 23)
-    femmesh.addNode(89.65517241379291, 0.0, 0.0, 24)
-    femmesh.addNode(96.5517241379308, 0.0, 0.0, 25)
-    femmesh.addNode(103.4482758620687, 0.0, 0.0, 26)
-    femmesh.addNode(110.34482758620659, 0.0, 0.0, 27)
-    femmesh.addNode(117.24137931034456, 0.0, 0.0, 28)
-    femmesh.addNode(124.1379310344825, 0.0, 0.0, 29)
-    femmesh.addNode(131.03448275862044, 0.0, 0.0, 30)
-    femmesh.addNode(137.9310344827584, 0.0, 0.0, 31)
-    femmesh.addNode(144.82758620689637, 0.0, 0.0, 32)
-    femmesh.addNode(151.7241379310343, 0.0, 0.0, 33)
-    femmesh.addNode(158.62068965517227, 0.0, 0.0, 34)
-    femmesh.addNode(165.51724137931024, 0.0, 0.0, 35)
-    femmesh.addNode(172.41379310344817, 0.0, 0.0, 36)
-    femmesh.addNode(179.31034482758614, 0.0, 0.0, 37)
-    femmesh.addNode(186.20689655172407, 0.0, 0.0, 38)
-    femmesh.addNode(193.10344827586204, 0.0, 0.0, 39)
-    femmesh.addNode(3.4482758620689618, 0.0, 0.0, 40)
-    femmesh.addNode(10.344827586206888, 0.0, 0.0, 41)
-    femmesh.addNode(17.24137931034481, 0.0, 0.0, 42)
-    femmesh.addNode(24.137931034482737, 0.0, 0.0, 43)
-    femmesh.addNode(31.034482758620666, 0.0, 0.0, 44)
-    femmesh.addNode(37.93103448275859, 0.0, 0.0, 45)
-    femmesh.addNode(44.82758620689652, 0.0, 0.0, 46)
-    femmesh.addNode(51.72413793103444, 0.0, 0.0, 47)
-    femmesh.addNode(58.620689655172356, 0.0, 0.0, 48)
-    femmesh.addNode(65.51724137931026, 0.0, 0.0, 49)
-    femmesh.addNode(72.41379310344814, 0.0, 0.0, 50)
-    femmesh.addNode(79.31034482758605, 0.0, 0.0, 51)
-    femmesh.addNode(86.20689655172396, 0.0, 0.0, 52)
-    femmesh.addNode(93.10344827586187, 0.0, 0.0, 53)
-    femmesh.addNode(99.99999999999974, 0.0, 0.0, 54)
-    femmesh.addNode(106.89655172413765, 0.0, 0.0, 55)
-    femmesh.addNode(113.79310344827557, 0.0, 0.0, 56)
-    femmesh.addNode(120.68965517241352, 0.0, 0.0, 57)
-    femmesh.addNode(127.58620689655147, 0.0, 0.0, 58)
-    femmesh.addNode(134.48275862068942, 0.0, 0.0, 59)
-    femmesh.addNode(141.3793103448274, 0.0, 0.0, 60)
-    femmesh.addNode(148.27586206896532, 0.0, 0.0, 61)
-    femmesh.addNode(155.1724137931033, 0.0, 0.0, 62)
-    femmesh.addNode(162.06896551724125, 0.0, 0.0, 63)
-    femmesh.addNode(168.9655172413792, 0.0, 0.0, 64)
-    femmesh.addNode(175.86206896551715, 0.0, 0.0, 65)
-    femmesh.addNode(182.7586206896551, 0.0, 0.0, 66)
-    femmesh.addNode(189.65517241379305, 0.0, 0.0, 67)
-    femmesh.addNode(196.55172413793102, 0.0, 0.0, 68)
-    femmesh.addNode(186.2590611888476, 1.0320175568578004e-15, 14.690988894808186, 69)
-    femmesh.addNode(191.33512560373788, 1.286904844080007e-15, 15.849567473090943, 70)
-    femmesh.addNode(195.40581320741452, 5.727265356351736e-16, 12.603302434705338, 71)
-    femmesh.addNode(195.4058132074145, -5.727265356351851e-16, 7.396697565294617, 72)
-    femmesh.addNode(191.33512560373782, -1.28690484408001e-15, 4.150432526909048, 73)
-    femmesh.addNode(186.25906118884757, -1.0320175568577923e-15, 5.309011105191857, 74)
-    femmesh.addNode(184.59418679258548, 5.727265356351775e-16, 12.603302434705355, 75)
-    femmesh.addNode(188.66487439626212, 1.2869048440800075e-15, 15.849567473090946, 76)
-    femmesh.addNode(193.7409388111524, 1.0320175568577982e-15, 14.690988894808177, 77)
-    femmesh.addNode(196.0, -6.286527288318355e-30, 9.999999999999975, 78)
-    femmesh.addNode(193.74093881115235, -1.0320175568578065e-15, 5.309011105191792, 79)
-    femmesh.addNode(188.66487439626206, -1.2869048440800044e-15, 4.150432526909075, 80)
-    femmesh.addNode(184.59418679258548, -5.727265356351696e-16, 7.396697565294687, 81)
-    femmesh.addNode(13.740938811152397, 1.0320175568578004e-15, 14.690988894808186, 82)
-    femmesh.addNode(8.664874396262107, 1.286904844080007e-15, 15.849567473090943, 83)
-    femmesh.addNode(4.594186792585479, 5.727265356351736e-16, 12.603302434705338, 84)
-    femmesh.addNode(4.5941867925855036, -5.727265356351851e-16, 7.396697565294617, 85)
-    femmesh.addNode(8.664874396262174, -1.28690484408001e-15, 4.150432526909048, 86)
-    femmesh.addNode(13.740938811152441, -1.0320175568577923e-15, 5.309011105191857, 87)
-    femmesh.addNode(15.405813207414514, 5.727265356351775e-16, 12.603302434705355, 88)
-    femmesh.addNode(11.33512560373788, 1.2869048440800075e-15, 15.849567473090946, 89)
-    femmesh.addNode(6.259061188847591, 1.0320175568577982e-15, 14.690988894808177, 90)
-    femmesh.addNode(4.0, -6.286527288318355e-30, 9.999999999999975, 91)
-    femmesh.addNode(6.25906118884764, -1.0320175568578065e-15, 5.309011105191792, 92)
-    femmesh.addNode(11.335125603737943, -1.2869048440800044e-15, 4.150432526909075, 93)
-    femmesh.addNode(15.40581320741453, -5.727265356351696e-16, 7.396697565294687, 94)
-    femmesh.addNode(0.0, 4.999999999999987, 0.0, 95)
-    femmesh.addNode(0.0, 2.4999999999999933, 0.0, 96)
-    femmesh.addNode(0.0, 7.499999999999993, 0.0, 97)
-    femmesh.addNode(184.0, 5.000000000000013, 9.999999999999998, 98)
-    femmesh.addNode(184.0, 7.500000000000007, 9.999999999999998, 99)
-    femmesh.addNode(184.0, 2.500000000000007, 9.999999999999998, 100)
-    femmesh.addNode(186.2590611888476, 10.000000000000002, 14.690988894808182, 101)
-    femmesh.addNode(191.33512560373788, 10.000000000000002, 15.84956747309094, 102)
-    femmesh.addNode(195.40581320741452, 10.0, 12.603302434705334, 103)
-    femmesh.addNode(195.4058132074145, 10.0, 7.396697565294613, 104)
-    femmesh.addNode(191.33512560373782, 9.999999999999998, 4.150432526909045, 105)
-    femmesh.addNode(186.25906118884757, 9.999999999999998, 5.309011105191853, 106)
-    femmesh.addNode(184.59418679258548, 10.0, 12.603302434705352, 107)
-    femmesh.addNode(188.66487439626212, 10.000000000000002, 15.849567473090943, 108)
-    femmesh.addNode(193.7409388111524, 10.000000000000002, 14.690988894808173, 109)
-    femmesh.addNode(196.0, 10.0, 9.999999999999972, 110)
-    femmesh.addNode(193.74093881115235, 9.999999999999998, 5.3090111051917885, 111)
-    femmesh.addNode(188.66487439626206, 9.999999999999998, 4.150432526909071, 112)
-    femmesh.addNode(184.59418679258548, 10.0, 7.396697565294684, 113)
-    femmesh.addNode(16.0, 5.000000000000013, 9.999999999999998, 114)
-    femmesh.addNode(16.0, 7.500000000000007, 9.999999999999998, 115)
-    femmesh.addNode(16.0, 2.500000000000007, 9.999999999999998, 116)
-    femmesh.addNode(13.740938811152397, 10.000000000000002, 14.690988894808182, 117)
-    femmesh.addNode(8.664874396262107, 10.000000000000002, 15.84956747309094, 118)
-    femmesh.addNode(4.594186792585479, 10.0, 12.603302434705334, 119)
-    femmesh.addNode(4.5941867925855036, 10.0, 7.396697565294613, 120)
-    femmesh.addNode(8.664874396262174, 9.999999999999998, 4.150432526909045, 121)
-    femmesh.addNode(13.740938811152441, 9.999999999999998, 5.309011105191853, 122)
-    femmesh.addNode(15.405813207414514, 10.0, 12.603302434705352, 123)
-    femmesh.addNode(11.33512560373788, 10.000000000000002, 15.849567473090943, 124)
-    femmesh.addNode(6.259061188847591, 10.000000000000002, 14.690988894808173, 125)
-    femmesh.addNode(4.0, 10.0, 9.999999999999972, 126)
-    femmesh.addNode(6.25906118884764, 9.999999999999998, 5.3090111051917885, 127)
-    femmesh.addNode(11.335125603737943, 9.999999999999998, 4.150432526909071, 128)
-    femmesh.addNode(15.40581320741453, 10.0, 7.396697565294684, 129)
-    femmesh.addNode(193.10344827586206, 10.0, 0.0, 130)
-    femmesh.addNode(186.20689655172416, 10.0, 0.0, 131)
-    femmesh.addNode(179.31034482758622, 10.0, 0.0, 132)
-    femmesh.addNode(172.4137931034483, 10.0, 0.0, 133)
-    femmesh.addNode(165.51724137931038, 10.0, 0.0, 134)
-    femmesh.addNode(158.62068965517244, 10.0, 0.0, 135)
-    femmesh.addNode(151.72413793103453, 10.0, 0.0, 136)
-    femmesh.addNode(144.8275862068966, 10.0, 0.0, 137)
-    femmesh.addNode(137.9310344827587, 10.0, 0.0, 138)
-    femmesh.addNode(131.0344827586208, 10.0, 0.0, 139)
-    femmesh.addNode(124.1379310344829, 10.0, 0.0, 140)
-    femmesh.addNode(117.241379310345, 10.0, 0.0, 141)
-    femmesh.addNode(110.34482758620709, 10.0, 0.0, 142)
-    femmesh.addNode(103.4482758620692, 10.0, 0.0, 143)
-    femmesh.addNode(96.5517241379313, 10.0, 0.0, 144)
-    femmesh.addNode(89.65517241379341, 10.0, 0.0, 145)
-    femmesh.addNode(82.75862068965544, 10.0, 0.0, 146)
-    femmesh.addNode(75.8620689655175, 10.0, 0.0, 147)
-    femmesh.addNode(68.96551724137956, 10.0, 0.0, 148)
-    femmesh.addNode(62.068965517241594, 10.0, 0.0, 149)
-    femmesh.addNode(55.17241379310363, 10.0, 0.0, 150)
-    femmesh.addNode(48.275862068965694, 10.0, 0.0, 151)
-    femmesh.addNode(41.37931034482773, 10.0, 0.0, 152)
-    femmesh.addNode(34.482758620689765, 10.0, 0.0, 153)
-    femmesh.addNode(27.58620689655183, 10.0, 0.0, 154)
-    femmesh.addNode(20.689655172413865, 10.0, 0.0, 155)
-    femmesh.addNode(13.793103448275929, 10.0, 0.0, 156)
-    femmesh.addNode(6.896551724137964, 10.0, 0.0, 157)
-    femmesh.addNode(196.55172413793105, 10.0, 0.0, 158)
-    femmesh.addNode(189.6551724137931, 10.0, 0.0, 159)
-    femmesh.addNode(182.75862068965517, 10.0, 0.0, 160)
-    femmesh.addNode(175.86206896551727, 10.0, 0.0, 161)
-    femmesh.addNode(168.96551724137933, 10.0, 0.0, 162)
-    femmesh.addNode(162.0689655172414, 10.0, 0.0, 163)
-    femmesh.addNode(155.1724137931035, 10.0, 0.0, 164)
-    femmesh.addNode(148.27586206896555, 10.0, 0.0, 165)
-    femmesh.addNode(141.37931034482764, 10.0, 0.0, 166)
-    femmesh.addNode(134.48275862068974, 10.0, 0.0, 167)
-    femmesh.addNode(127.58620689655186, 10.0, 0.0, 168)
-    femmesh.addNode(120.68965517241395, 10.0, 0.0, 169)
-    femmesh.addNode(113.79310344827604, 10.0, 0.0, 170)
-    femmesh.addNode(106.89655172413813, 10.0, 0.0, 171)
-    femmesh.addNode(100.00000000000026, 10.0, 0.0, 172)
-    femmesh.addNode(93.10344827586235, 10.0, 0.0, 173)
-    femmesh.addNode(86.20689655172443, 10.0, 0.0, 174)
-    femmesh.addNode(79.31034482758648, 10.0, 0.0, 175)
-    femmesh.addNode(72.41379310344853, 10.0, 0.0, 176)
-    femmesh.addNode(65.51724137931058, 10.0, 0.0, 177)
-    femmesh.addNode(58.62068965517261, 10.0, 0.0, 178)
-    femmesh.addNode(51.724137931034676, 10.0, 0.0, 179)
-    femmesh.addNode(44.82758620689671, 10.0, 0.0, 180)
-    femmesh.addNode(37.93103448275875, 10.0, 0.0, 181)
-    femmesh.addNode(31.03448275862081, 10.0, 0.0, 182)
-    femmesh.addNode(24.137931034482847, 10.0, 0.0, 183)
-    femmesh.addNode(17.24137931034491, 10.0, 0.0, 184)
-    femmesh.addNode(10.344827586206947, 10.0, 0.0, 185)
-    femmesh.addNode(3.448275862068982, 10.0, 0.0, 186)
-    femmesh.addNode(185.38021615936006, 4.216374436274095, 6.171475837119218, 187)
-    femmesh.addNode(189.78581296417428, 4.651746099662885, 4.003824225918307, 188)
-    femmesh.addNode(184.59418679258548, 7.500000000000007, 12.603302434705352, 189)
-    femmesh.addNode(184.59418679258548, 7.500000000000007, 7.396697565294674, 190)
-    femmesh.addNode(190.1729284330676, 4.651591325948378, 15.997507462024268, 191)
-    femmesh.addNode(185.45089714093675, 4.2371279240816415, 13.912245285978699, 192)
-    femmesh.addNode(194.91055623716488, 5.0, 6.5523286929231475, 193)
-    femmesh.addNode(195.99996018406995, 2.4971581452414426, 10.0218583982756, 194)
-    femmesh.addNode(195.09250038173843, 4.9345742393888, 13.172765333584262, 195)
-    femmesh.addNode(195.99996018406995, 7.497158145241442, 10.0218583982756, 196)
-    femmesh.addNode(185.83673107695995, 2.1185639620408203, 14.320554579501204, 197)
-    femmesh.addNode(184.3744059356198, 2.1185639620408203, 12.086310480923254, 198)
-    femmesh.addNode(185.7974552746576, 2.108187218137047, 5.7176387551379, 199)
-    femmesh.addNode(184.3555911273261, 2.108187218137047, 7.965141656507711, 200)
-    femmesh.addNode(184.3555911273261, 4.608187218137054, 7.965141656507711, 201)
-    femmesh.addNode(184.3744059356198, 4.618563962040827, 12.086310480923254, 202)
-    femmesh.addNode(184.15043252690907, 6.250000000000011, 11.335125603737882, 203)
-    femmesh.addNode(184.15043252690907, 8.750000000000004, 11.335125603737884, 204)
-    femmesh.addNode(184.15043252690904, 6.250000000000011, 8.664874396262128, 205)
-    femmesh.addNode(184.15043252690904, 8.750000000000004, 8.664874396262128, 206)
-    femmesh.addNode(185.30901110519181, 8.750000000000004, 13.7409388111524, 207)
-    femmesh.addNode(185.3090111051918, 8.750000000000004, 6.259061188847631, 208)
-    femmesh.addNode(190.757646556491, 2.3257956629741905, 15.951972084564687, 209)
-    femmesh.addNode(188.10015205709763, 2.3257956629741905, 15.691272071676918, 210)
-    femmesh.addNode(187.57620024808233, 4.44435962501501, 15.48864234238339, 211)
-    femmesh.addNode(195.2568735054544, 2.467287119694401, 12.892279541754519, 212)
-    femmesh.addNode(193.48136630876579, 2.467287119694401, 14.886725757006477, 213)
-    femmesh.addNode(192.98763738997778, 4.79308278266859, 15.203270397164339, 214)
-    femmesh.addNode(195.8519897483017, 1.2485790726207213, 8.67553181020761, 215)
-    femmesh.addNode(195.84712578903333, 1.2485790726207213, 11.345778587740757, 216)
-    femmesh.addNode(195.7656503518465, 3.715866192315122, 11.660504748638939, 217)
-    femmesh.addNode(195.17543325021396, 2.5, 6.964396160138851, 218)
-    femmesh.addNode(193.34580509183124, 2.5, 5.019479114843889, 219)
-    femmesh.addNode(195.72444331254923, 3.7485790726207213, 8.202571625513155, 220)
-    femmesh.addNode(190.56524270604586, 2.3258730498314417, 4.026684280630904, 221)
-    femmesh.addNode(187.9175415217067, 2.3258730498314417, 4.372978879888188, 222)
-    femmesh.addNode(192.67164549920227, 4.825873049831443, 4.6276345687777045, 223)
-    femmesh.addNode(187.35113288639937, 4.434060267968491, 4.616367117411787, 224)
-    femmesh.addNode(184.94990682132618, 5.858187218137051, 6.760160669614608, 225)
-    femmesh.addNode(184.97969908076925, 5.868563962040824, 13.28581476659455, 226)
-    femmesh.addNode(188.10015205709763, 7.3257956629741905, 15.691272071676918, 227)
-    femmesh.addNode(190.757646556491, 7.3257956629741905, 15.951972084564687, 228)
-    femmesh.addNode(185.83673107695995, 7.118563962040822, 14.320554579501204, 229)
-    femmesh.addNode(193.48136630876579, 7.467287119694401, 14.886725757006477, 230)
-    femmesh.addNode(195.2568735054544, 7.4672871196944, 12.892279541754519, 231)
-    femmesh.addNode(195.8519897483017, 8.748579072620721, 8.675531810207607, 232)
-    femmesh.addNode(195.84712578903333, 8.748579072620721, 11.345778587740755, 233)
-    femmesh.addNode(195.7656503518465, 6.21586619231512, 11.660504748638939, 234)
-    femmesh.addNode(193.34580509183124, 7.499999999999999, 5.019479114843889, 235)
-    femmesh.addNode(195.17543325021396, 7.5, 6.964396160138851, 236)
-    femmesh.addNode(195.72444331254923, 6.248579072620721, 8.202571625513155, 237)
-    femmesh.addNode(187.9175415217067, 7.325873049831442, 4.372978879888188, 238)
-    femmesh.addNode(190.56524270604586, 7.325873049831442, 4.026684280630904, 239)
-    femmesh.addNode(185.7974552746576, 7.108187218137047, 5.7176387551379, 240)
-    femmesh.addNode(195.99773546919988, 4.9672871196944, 9.835169051748085, 241)
-    femmesh.addNode(14.619783840639947, 4.216374436274096, 6.171475837119214, 242)
-    femmesh.addNode(10.214187035825706, 4.651746099662886, 4.003824225918306, 243)
-    femmesh.addNode(15.405813207414514, 7.500000000000007, 12.603302434705352, 244)
-    femmesh.addNode(15.405813207414525, 7.500000000000007, 7.396697565294674, 245)
-    femmesh.addNode(9.827071566932418, 4.651591325948377, 15.99750746202427, 246)
-    femmesh.addNode(14.549102859063256, 4.237127924081637, 13.912245285978694, 247)
-    femmesh.addNode(5.089443762835112, 5.0, 6.5523286929231475, 248)
-    femmesh.addNode(4.9074996182615855, 4.934574239388802, 13.17276533358427, 249)
-    femmesh.addNode(4.00003981593004, 2.497158145241441, 10.021858398275613, 250)
-    femmesh.addNode(4.00003981593004, 7.497158145241441, 10.021858398275613, 251)
-    femmesh.addNode(15.625594064380202, 2.1185639620408185, 12.086310480923256, 252)
-    femmesh.addNode(14.163268923040064, 2.1185639620408185, 14.320554579501204, 253)
-    femmesh.addNode(15.6444088726739, 2.108187218137047, 7.965141656507716, 254)
-    femmesh.addNode(14.202544725342399, 2.108187218137047, 5.71763875513791, 255)
-    femmesh.addNode(15.6444088726739, 4.608187218137054, 7.965141656507716, 256)
-    femmesh.addNode(15.625594064380202, 4.618563962040826, 12.086310480923256, 257)
-    femmesh.addNode(15.849567473090941, 8.750000000000004, 11.335125603737888, 258)
-    femmesh.addNode(15.849567473090943, 6.250000000000011, 11.335125603737886, 259)
-    femmesh.addNode(15.849567473090943, 8.750000000000004, 8.664874396262123, 260)
-    femmesh.addNode(15.849567473090943, 6.250000000000011, 8.664874396262123, 261)
-    femmesh.addNode(14.690988894808175, 8.750000000000004, 13.740938811152404, 262)
-    femmesh.addNode(14.690988894808202, 8.750000000000004, 6.259061188847627, 263)
-    femmesh.addNode(11.89984794290236, 2.3257956629741887, 15.691272071676917, 264)
-    femmesh.addNode(9.242353443508966, 2.3257956629741887, 15.951972084564684, 265)
-    femmesh.addNode(12.42379975191768, 4.444359625015007, 15.488642342383386, 266)
-    femmesh.addNode(6.518633691234224, 2.467287119694401, 14.88672575700648, 267)
-    femmesh.addNode(4.743126494545622, 2.467287119694401, 12.892279541754531, 268)
-    femmesh.addNode(7.012362610022217, 4.79308278266859, 15.203270397164339, 269)
-    femmesh.addNode(4.152874210966684, 1.2485790726207213, 11.34577858774076, 270)
-    femmesh.addNode(4.148010251698309, 1.2485790726207195, 8.675531810207618, 271)
-    femmesh.addNode(4.234349648153515, 3.715866192315122, 11.660504748638948, 272)
-    femmesh.addNode(6.654194908168766, 2.5, 5.019479114843891, 273)
-    femmesh.addNode(4.824566749786037, 2.5, 6.964396160138854, 274)
-    femmesh.addNode(4.27555668745077, 3.7485790726207213, 8.202571625513164, 275)
-    femmesh.addNode(12.08245847829329, 2.3258730498314435, 4.372978879888188, 276)
-    femmesh.addNode(9.434757293954117, 2.3258730498314435, 4.0266842806309056, 277)
-    femmesh.addNode(7.3283545007977375, 4.8258730498314435, 4.627634568777707, 278)
-    femmesh.addNode(12.648867113600637, 4.434060267968491, 4.616367117411792, 279)
-    femmesh.addNode(15.05009317867383, 5.858187218137052, 6.760160669614608, 280)
-    femmesh.addNode(15.02030091923076, 5.868563962040822, 13.28581476659455, 281)
-    femmesh.addNode(9.242353443508966, 7.32579566297419, 15.951972084564684, 282)
-    femmesh.addNode(11.89984794290236, 7.32579566297419, 15.691272071676917, 283)
-    femmesh.addNode(14.163268923040064, 7.118563962040819, 14.320554579501204, 284)
-    femmesh.addNode(4.743126494545622, 7.467287119694401, 12.892279541754531, 285)
-    femmesh.addNode(6.518633691234224, 7.467287119694402, 14.88672575700648, 286)
-    femmesh.addNode(4.152874210966683, 8.748579072620721, 11.345778587740757, 287)
-    femmesh.addNode(4.1480102516983095, 8.748579072620721, 8.675531810207616, 288)
-    femmesh.addNode(4.234349648153515, 6.215866192315121, 11.660504748638948, 289)
-    femmesh.addNode(4.8245667497860385, 7.5, 6.964396160138851, 290)
-    femmesh.addNode(6.654194908168766, 7.499999999999999, 5.019479114843891, 291)
-    femmesh.addNode(4.27555668745077, 6.24857907262072, 8.202571625513164, 292)
-    femmesh.addNode(9.434757293954117, 7.325873049831442, 4.0266842806309056, 293)
-    femmesh.addNode(12.08245847829329, 7.325873049831442, 4.372978879888188, 294)
-    femmesh.addNode(14.202544725342396, 7.108187218137047, 5.717638755137908, 295)
-    femmesh.addNode(4.0022645308001135, 4.967287119694401, 9.835169051748089, 296)
-    femmesh.addNode(24.13793103448276, 4.999999999999987, 0.0, 297)
-    femmesh.addNode(189.5803712054843, 4.994712328378187, 0.0, 298)
-    femmesh.addNode(182.75862068965517, 5.0000000000000675, 0.0, 299)
-    femmesh.addNode(175.8620689655172, 4.999999999999985, 0.0, 300)
-    femmesh.addNode(10.419628794515688, 4.994712328378108, 0.0, 301)
-    femmesh.addNode(17.24137931034481, 4.999999999999927, 0.0, 302)
-    femmesh.addNode(162.06896551724134, 5.000000000000004, 0.0, 303)
-    femmesh.addNode(31.034482758620697, 4.999999999999974, 0.0, 304)
-    femmesh.addNode(168.96551724137927, 4.999999999999998, 0.0, 305)
-    femmesh.addNode(37.931034482758655, 4.9999999999999885, 0.0, 306)
-    femmesh.addNode(148.27586206896555, 5.0000000000000595, 0.0, 307)
-    femmesh.addNode(141.3793103448275, 4.999999999999989, 0.0, 308)
-    femmesh.addNode(155.1724137931034, 5.000000000000011, 0.0, 309)
-    femmesh.addNode(44.82758620689659, 4.999999999999988, 0.0, 310)
-    femmesh.addNode(51.72413793103453, 4.999999999999984, 0.0, 311)
-    femmesh.addNode(58.62068965517246, 4.9999999999999805, 0.0, 312)
-    femmesh.addNode(134.4827586206896, 5.000000000000019, 0.0, 313)
-    femmesh.addNode(65.51724137931039, 4.999999999999976, 0.0, 314)
-    femmesh.addNode(72.4137931034483, 4.9999999999999725, 0.0, 315)
-    femmesh.addNode(127.5862068965517, 5.000000000000026, 0.0, 316)
-    femmesh.addNode(79.31034482758622, 4.99999999999997, 0.0, 317)
-    femmesh.addNode(113.79310344827589, 5.0000000000000515, 0.0, 318)
-    femmesh.addNode(120.68965517241375, 5.000000000000013, 0.0, 319)
-    femmesh.addNode(86.20689655172414, 4.999999999999966, 0.0, 320)
-    femmesh.addNode(93.10344827586214, 5.000000000000023, 0.0, 321)
-    femmesh.addNode(100.00000000000017, 5.000000000000121, 0.0, 322)
-    femmesh.addNode(106.89655172413799, 5.000000000000069, 0.0, 323)
-    femmesh.addNode(4.876454187911648, 4.909617909865095, 0.0, 324)
-    femmesh.addNode(195.12354581208837, 4.9096179098651715, 0.0, 325)
-    femmesh.addNode(197.56177290604418, 2.4548089549325858, 0.0, 326)
-    femmesh.addNode(197.56177290604418, 4.954808954932579, 0.0, 327)
-    femmesh.addNode(194.1134970439752, 2.4548089549325858, 0.0, 328)
-    femmesh.addNode(197.56177290604418, 7.454808954932586, 0.0, 329)
-    femmesh.addNode(194.1134970439752, 7.454808954932586, 0.0, 330)
-    femmesh.addNode(2.438227093955817, 2.4548089549325476, 0.0, 331)
-    femmesh.addNode(5.886502956024785, 2.4548089549325476, 0.0, 332)
-    femmesh.addNode(2.438227093955817, 4.954808954932541, 0.0, 333)
-    femmesh.addNode(2.438227093955817, 7.454808954932547, 0.0, 334)
-    femmesh.addNode(5.886502956024799, 7.454808954932547, 0.0, 335)
-    femmesh.addNode(8.658090259326798, 2.497356164189054, 0.0, 336)
-    femmesh.addNode(12.106366121395766, 2.497356164189054, 0.0, 337)
-    femmesh.addNode(7.648041491213661, 4.952165119121601, 0.0, 338)
-    femmesh.addNode(15.517241379310335, 2.4999999999999636, 0.0, 339)
-    femmesh.addNode(18.965517241379303, 2.4999999999999636, 0.0, 340)
-    femmesh.addNode(13.830504052430257, 4.997356164189018, 0.0, 341)
-    femmesh.addNode(22.41379310344827, 2.4999999999999933, 0.0, 342)
-    femmesh.addNode(25.86206896551724, 2.4999999999999933, 0.0, 343)
-    femmesh.addNode(20.68965517241378, 4.999999999999957, 0.0, 344)
-    femmesh.addNode(29.310344827586192, 2.499999999999987, 0.0, 345)
-    femmesh.addNode(32.75862068965516, 2.499999999999987, 0.0, 346)
-    femmesh.addNode(27.58620689655173, 4.9999999999999805, 0.0, 347)
-    femmesh.addNode(36.20689655172414, 2.4999999999999942, 0.0, 348)
-    femmesh.addNode(39.6551724137931, 2.4999999999999942, 0.0, 349)
-    femmesh.addNode(34.48275862068968, 4.999999999999981, 0.0, 350)
-    femmesh.addNode(43.10344827586207, 2.499999999999994, 0.0, 351)
-    femmesh.addNode(46.55172413793103, 2.499999999999994, 0.0, 352)
-    femmesh.addNode(41.37931034482762, 4.999999999999988, 0.0, 353)
-    femmesh.addNode(50.0, 2.499999999999992, 0.0, 354)
-    femmesh.addNode(53.44827586206897, 2.499999999999992, 0.0, 355)
-    femmesh.addNode(48.27586206896556, 4.999999999999986, 0.0, 356)
-    femmesh.addNode(56.896551724137936, 2.4999999999999902, 0.0, 357)
-    femmesh.addNode(60.34482758620689, 2.4999999999999902, 0.0, 358)
-    femmesh.addNode(55.172413793103495, 4.999999999999982, 0.0, 359)
-    femmesh.addNode(63.79310344827585, 2.499999999999988, 0.0, 360)
-    femmesh.addNode(67.2413793103448, 2.499999999999988, 0.0, 361)
-    femmesh.addNode(62.06896551724142, 4.999999999999979, 0.0, 362)
-    femmesh.addNode(70.68965517241375, 2.4999999999999862, 0.0, 363)
-    femmesh.addNode(74.1379310344827, 2.4999999999999862, 0.0, 364)
-    femmesh.addNode(68.96551724137935, 4.999999999999974, 0.0, 365)
-    femmesh.addNode(77.58620689655166, 2.499999999999985, 0.0, 366)
-    femmesh.addNode(81.03448275862061, 2.499999999999985, 0.0, 367)
-    femmesh.addNode(75.86206896551727, 4.999999999999972, 0.0, 368)
-    femmesh.addNode(84.48275862068957, 2.499999999999983, 0.0, 369)
-    femmesh.addNode(87.93103448275852, 2.499999999999983, 0.0, 370)
-    femmesh.addNode(82.75862068965517, 4.999999999999968, 0.0, 371)
-    femmesh.addNode(91.37931034482753, 2.5000000000000115, 0.0, 372)
-    femmesh.addNode(94.82758620689647, 2.5000000000000115, 0.0, 373)
-    femmesh.addNode(89.65517241379314, 4.999999999999995, 0.0, 374)
-    femmesh.addNode(98.2758620689655, 2.5000000000000604, 0.0, 375)
-    femmesh.addNode(101.72413793103443, 2.5000000000000604, 0.0, 376)
-    femmesh.addNode(96.55172413793116, 5.000000000000072, 0.0, 377)
-    femmesh.addNode(105.17241379310335, 2.5000000000000346, 0.0, 378)
-    femmesh.addNode(108.6206896551723, 2.5000000000000346, 0.0, 379)
-    femmesh.addNode(103.44827586206908, 5.000000000000095, 0.0, 380)
-    femmesh.addNode(112.06896551724124, 2.5000000000000258, 0.0, 381)
-    femmesh.addNode(115.51724137931022, 2.5000000000000258, 0.0, 382)
-    femmesh.addNode(110.34482758620695, 5.00000000000006, 0.0, 383)
-    femmesh.addNode(118.96551724137916, 2.5000000000000067, 0.0, 384)
-    femmesh.addNode(122.41379310344813, 2.5000000000000067, 0.0, 385)
-    femmesh.addNode(117.24137931034483, 5.000000000000032, 0.0, 386)
-    femmesh.addNode(125.8620689655171, 2.500000000000013, 0.0, 387)
-    femmesh.addNode(129.31034482758608, 2.500000000000013, 0.0, 388)
-    femmesh.addNode(124.13793103448273, 5.0000000000000195, 0.0, 389)
-    femmesh.addNode(132.758620689655, 2.5000000000000093, 0.0, 390)
-    femmesh.addNode(136.20689655172401, 2.5000000000000093, 0.0, 391)
-    femmesh.addNode(131.03448275862064, 5.000000000000022, 0.0, 392)
-    femmesh.addNode(139.65517241379297, 2.4999999999999947, 0.0, 393)
-    femmesh.addNode(143.10344827586192, 2.4999999999999947, 0.0, 394)
-    femmesh.addNode(137.93103448275855, 5.0000000000000036, 0.0, 395)
-    femmesh.addNode(146.55172413793096, 2.5000000000000298, 0.0, 396)
-    femmesh.addNode(149.99999999999994, 2.5000000000000298, 0.0, 397)
-    femmesh.addNode(144.8275862068965, 5.000000000000025, 0.0, 398)
-    femmesh.addNode(153.44827586206884, 2.5000000000000053, 0.0, 399)
-    femmesh.addNode(156.89655172413785, 2.5000000000000053, 0.0, 400)
-    femmesh.addNode(151.72413793103448, 5.0000000000000355, 0.0, 401)
-    femmesh.addNode(160.3448275862068, 2.500000000000002, 0.0, 402)
-    femmesh.addNode(163.7931034482758, 2.500000000000002, 0.0, 403)
-    femmesh.addNode(158.62068965517238, 5.000000000000007, 0.0, 404)
-    femmesh.addNode(167.24137931034477, 2.499999999999999, 0.0, 405)
-    femmesh.addNode(170.68965517241372, 2.499999999999999, 0.0, 406)
-    femmesh.addNode(165.5172413793103, 5.000000000000002, 0.0, 407)
-    femmesh.addNode(174.13793103448268, 2.4999999999999925, 0.0, 408)
-    femmesh.addNode(177.5862068965517, 2.4999999999999925, 0.0, 409)
-    femmesh.addNode(172.41379310344826, 4.999999999999991, 0.0, 410)
-    femmesh.addNode(181.03448275862064, 2.5000000000000338, 0.0, 411)
-    femmesh.addNode(184.48275862068962, 2.5000000000000338, 0.0, 412)
-    femmesh.addNode(179.3103448275862, 5.000000000000027, 0.0, 413)
-    femmesh.addNode(187.8936338786042, 2.4973561641890933, 0.0, 414)
-    femmesh.addNode(191.34190974067317, 2.4973561641890933, 0.0, 415)
-    femmesh.addNode(186.16949594756974, 4.997356164189127, 0.0, 416)
-    femmesh.addNode(192.35195850878634, 4.952165119121679, 0.0, 417)
-    femmesh.addNode(191.3419097406732, 7.497356164189093, 0.0, 418)
-    femmesh.addNode(187.89363387860425, 7.497356164189093, 0.0, 419)
-    femmesh.addNode(184.48275862068965, 7.500000000000034, 0.0, 420)
-    femmesh.addNode(181.0344827586207, 7.500000000000034, 0.0, 421)
-    femmesh.addNode(177.58620689655172, 7.499999999999993, 0.0, 422)
-    femmesh.addNode(174.13793103448276, 7.499999999999993, 0.0, 423)
-    femmesh.addNode(170.68965517241378, 7.499999999999999, 0.0, 424)
-    femmesh.addNode(167.24137931034483, 7.499999999999999, 0.0, 425)
-    femmesh.addNode(163.79310344827587, 7.500000000000002, 0.0, 426)
-    femmesh.addNode(160.3448275862069, 7.500000000000002, 0.0, 427)
-    femmesh.addNode(156.8965517241379, 7.500000000000005, 0.0, 428)
-    femmesh.addNode(153.44827586206895, 7.500000000000005, 0.0, 429)
-    femmesh.addNode(150.00000000000006, 7.50000000000003, 0.0, 430)
-    femmesh.addNode(146.55172413793107, 7.50000000000003, 0.0, 431)
-    femmesh.addNode(143.10344827586204, 7.499999999999995, 0.0, 432)
-    femmesh.addNode(139.65517241379308, 7.499999999999995, 0.0, 433)
-    femmesh.addNode(136.20689655172413, 7.500000000000009, 0.0, 434)
-    femmesh.addNode(132.7586206896552, 7.500000000000009, 0.0, 435)
-    femmesh.addNode(129.31034482758625, 7.500000000000012, 0.0, 436)
-    femmesh.addNode(125.8620689655173, 7.500000000000012, 0.0, 437)
-    femmesh.addNode(122.41379310344833, 7.500000000000007, 0.0, 438)
-    femmesh.addNode(118.96551724137937, 7.500000000000007, 0.0, 439)
-    femmesh.addNode(115.51724137931043, 7.500000000000026, 0.0, 440)
-    femmesh.addNode(112.06896551724148, 7.500000000000026, 0.0, 441)
-    femmesh.addNode(108.62068965517254, 7.500000000000035, 0.0, 442)
-    femmesh.addNode(105.1724137931036, 7.500000000000035, 0.0, 443)
-    femmesh.addNode(101.72413793103468, 7.50000000000006, 0.0, 444)
-    femmesh.addNode(98.27586206896574, 7.50000000000006, 0.0, 445)
-    femmesh.addNode(94.82758620689671, 7.5000000000000115, 0.0, 446)
-    femmesh.addNode(91.37931034482777, 7.5000000000000115, 0.0, 447)
-    femmesh.addNode(87.93103448275878, 7.499999999999983, 0.0, 448)
-    femmesh.addNode(84.4827586206898, 7.499999999999983, 0.0, 449)
-    femmesh.addNode(81.03448275862084, 7.499999999999985, 0.0, 450)
-    femmesh.addNode(77.58620689655186, 7.499999999999985, 0.0, 451)
-    femmesh.addNode(74.1379310344829, 7.499999999999986, 0.0, 452)
-    femmesh.addNode(70.68965517241392, 7.499999999999986, 0.0, 453)
-    femmesh.addNode(67.24137931034497, 7.499999999999988, 0.0, 454)
-    femmesh.addNode(63.79310344827599, 7.499999999999988, 0.0, 455)
-    femmesh.addNode(60.34482758620703, 7.49999999999999, 0.0, 456)
-    femmesh.addNode(56.89655172413805, 7.49999999999999, 0.0, 457)
-    femmesh.addNode(53.44827586206908, 7.499999999999992, 0.0, 458)
-    femmesh.addNode(50.000000000000114, 7.499999999999992, 0.0, 459)
-    femmesh.addNode(46.551724137931146, 7.499999999999994, 0.0, 460)
-    femmesh.addNode(43.10344827586216, 7.499999999999994, 0.0, 461)
-    femmesh.addNode(39.655172413793196, 7.499999999999995, 0.0, 462)
-    femmesh.addNode(36.20689655172421, 7.499999999999995, 0.0, 463)
-    femmesh.addNode(32.75862068965523, 7.499999999999988, 0.0, 464)
-    femmesh.addNode(29.310344827586263, 7.499999999999988, 0.0, 465)
-    femmesh.addNode(25.862068965517295, 7.499999999999993, 0.0, 466)
-    femmesh.addNode(22.413793103448313, 7.499999999999993, 0.0, 467)
-    femmesh.addNode(18.96551724137933, 7.499999999999964, 0.0, 468)
-    femmesh.addNode(15.517241379310377, 7.499999999999964, 0.0, 469)
-    femmesh.addNode(12.106366121395808, 7.497356164189053, 0.0, 470)
-    femmesh.addNode(8.658090259326826, 7.497356164189053, 0.0, 471)
-    femmesh.addNode(200.0, 0.0, 20.0, 472)
-    femmesh.addNode(200.0, 10.0, 20.0, 473)
-    femmesh.addNode(0.0, 0.0, 20.0, 474)
-    femmesh.addNode(0.0, 10.0, 20.0, 475)
-    femmesh.addNode(200.0, 0.0, 6.666666666666651, 476)
-    femmesh.addNode(200.0, 0.0, 13.333333333333295, 477)
-    femmesh.addNode(200.0, 0.0, 3.3333333333333255, 478)
-    femmesh.addNode(200.0, 0.0, 9.999999999999973, 479)
-    femmesh.addNode(200.0, 0.0, 16.666666666666647, 480)
-    femmesh.addNode(200.0, 4.999999999999987, 20.0, 481)
-    femmesh.addNode(200.0, 2.4999999999999933, 20.0, 482)
-    femmesh.addNode(200.0, 7.499999999999993, 20.0, 483)
-    femmesh.addNode(200.0, 10.0, 6.666666666666651, 484)
-    femmesh.addNode(200.0, 10.0, 13.333333333333295, 485)
-    femmesh.addNode(200.0, 10.0, 3.3333333333333255, 486)
-    femmesh.addNode(200.0, 10.0, 9.999999999999973, 487)
-    femmesh.addNode(200.0, 10.0, 16.666666666666647, 488)
-    femmesh.addNode(193.10344827586206, 0.0, 20.0, 489)
-    femmesh.addNode(186.20689655172416, 0.0, 20.0, 490)
-    femmesh.addNode(179.31034482758622, 0.0, 20.0, 491)
-    femmesh.addNode(172.4137931034483, 0.0, 20.0, 492)
-    femmesh.addNode(165.51724137931038, 0.0, 20.0, 493)
-    femmesh.addNode(158.62068965517244, 0.0, 20.0, 494)
-    femmesh.addNode(151.72413793103453, 0.0, 20.0, 495)
-    femmesh.addNode(144.8275862068966, 0.0, 20.0, 496)
-    femmesh.addNode(137.9310344827587, 0.0, 20.0, 497)
-    femmesh.addNode(131.0344827586208, 0.0, 20.0, 498)
-    femmesh.addNode(124.1379310344829, 0.0, 20.0, 499)
-    femmesh.addNode(117.241379310345, 0.0, 20.0, 500)
-    femmesh.addNode(110.34482758620709, 0.0, 20.0, 501)
-    femmesh.addNode(103.4482758620692, 0.0, 20.0, 502)
-    femmesh.addNode(96.5517241379313, 0.0, 20.0, 503)
-    femmesh.addNode(89.65517241379341, 0.0, 20.0, 504)
-    femmesh.addNode(82.75862068965544, 0.0, 20.0, 505)
-    femmesh.addNode(75.8620689655175, 0.0, 20.0, 506)
-    femmesh.addNode(68.96551724137956, 0.0, 20.0, 507)
-    femmesh.addNode(62.068965517241594, 0.0, 20.0, 508)
-    femmesh.addNode(55.17241379310363, 0.0, 20.0, 509)
-    femmesh.addNode(48.275862068965694, 0.0, 20.0, 510)
-    femmesh.addNode(41.37931034482773, 0.0, 20.0, 511)
-    femmesh.addNode(34.482758620689765, 0.0, 20.0, 512)
-    femmesh.addNode(27.58620689655183, 0.0, 20.0, 513)
-    femmesh.addNode(20.689655172413865, 0.0, 20.0, 514)
-    femmesh.addNode(13.793103448275929, 0.0, 20.0, 515)
-    femmesh.addNode(6.896551724137964, 0.0, 20.0, 516)
-    femmesh.addNode(196.55172413793105, 0.0, 20.0, 517)
-    femmesh.addNode(189.6551724137931, 0.0, 20.0, 518)
-    femmesh.addNode(182.75862068965517, 0.0, 20.0, 519)
-    femmesh.addNode(175.86206896551727, 0.0, 20.0, 520)
-    femmesh.addNode(168.96551724137933, 0.0, 20.0, 521)
-    femmesh.addNode(162.0689655172414, 0.0, 20.0, 522)
-    femmesh.addNode(155.1724137931035, 0.0, 20.0, 523)
-    femmesh.addNode(148.27586206896555, 0.0, 20.0, 524)
-    femmesh.addNode(141.37931034482764, 0.0, 20.0, 525)
-    femmesh.addNode(134.48275862068974, 0.0, 20.0, 526)
-    femmesh.addNode(127.58620689655186, 0.0, 20.0, 527)
-    femmesh.addNode(120.68965517241395, 0.0, 20.0, 528)
-    femmesh.addNode(113.79310344827604, 0.0, 20.0, 529)
-    femmesh.addNode(106.89655172413813, 0.0, 20.0, 530)
-    femmesh.addNode(100.00000000000026, 0.0, 20.0, 531)
-    femmesh.addNode(93.10344827586235, 0.0, 20.0, 532)
-    femmesh.addNode(86.20689655172443, 0.0, 20.0, 533)
-    femmesh.addNode(79.31034482758648, 0.0, 20.0, 534)
-    femmesh.addNode(72.41379310344853, 0.0, 20.0, 535)
-    femmesh.addNode(65.51724137931058, 0.0, 20.0, 536)
-    femmesh.addNode(58.62068965517261, 0.0, 20.0, 537)
-    femmesh.addNode(51.724137931034676, 0.0, 20.0, 538)
-    femmesh.addNode(44.82758620689671, 0.0, 20.0, 539)
-    femmesh.addNode(37.93103448275875, 0.0, 20.0, 540)
-    femmesh.addNode(31.03448275862081, 0.0, 20.0, 541)
-    femmesh.addNode(24.137931034482847, 0.0, 20.0, 542)
-    femmesh.addNode(17.24137931034491, 0.0, 20.0, 543)
-    femmesh.addNode(10.344827586206947, 0.0, 20.0, 544)
-    femmesh.addNode(3.448275862068982, 0.0, 20.0, 545)
-    femmesh.addNode(0.0, 0.0, 6.666666666666651, 546)
-    femmesh.addNode(0.0, 0.0, 13.333333333333295, 547)
-    femmesh.addNode(0.0, 0.0, 3.3333333333333255, 548)
-    femmesh.addNode(0.0, 0.0, 9.999999999999973, 549)
-    femmesh.addNode(0.0, 0.0, 16.666666666666647, 550)
-    femmesh.addNode(0.0, 4.999999999999987, 20.0, 551)
-    femmesh.addNode(0.0, 2.4999999999999933, 20.0, 552)
-    femmesh.addNode(0.0, 7.499999999999993, 20.0, 553)
-    femmesh.addNode(0.0, 10.0, 6.666666666666651, 554)
-    femmesh.addNode(0.0, 10.0, 13.333333333333295, 555)
-    femmesh.addNode(0.0, 10.0, 3.3333333333333255, 556)
-    femmesh.addNode(0.0, 10.0, 9.999999999999973, 557)
-    femmesh.addNode(0.0, 10.0, 16.666666666666647, 558)
-    femmesh.addNode(193.10344827586206, 10.0, 20.0, 559)
-    femmesh.addNode(186.20689655172416, 10.0, 20.0, 560)
-    femmesh.addNode(179.31034482758622, 10.0, 20.0, 561)
-    femmesh.addNode(172.4137931034483, 10.0, 20.0, 562)
-    femmesh.addNode(165.51724137931038, 10.0, 20.0, 563)
-    femmesh.addNode(158.62068965517244, 10.0, 20.0, 564)
-    femmesh.addNode(151.72413793103453, 10.0, 20.0, 565)
-    femmesh.addNode(144.8275862068966, 10.0, 20.0, 566)
-    femmesh.addNode(137.9310344827587, 10.0, 20.0, 567)
-    femmesh.addNode(131.0344827586208, 10.0, 20.0, 568)
-    femmesh.addNode(124.1379310344829, 10.0, 20.0, 569)
-    femmesh.addNode(117.241379310345, 10.0, 20.0, 570)
-    femmesh.addNode(110.34482758620709, 10.0, 20.0, 571)
-    femmesh.addNode(103.4482758620692, 10.0, 20.0, 572)
-    femmesh.addNode(96.5517241379313, 10.0, 20.0, 573)
-    femmesh.addNode(89.65517241379341, 10.0, 20.0, 574)
-    femmesh.addNode(82.75862068965544, 10.0, 20.0, 575)
-    femmesh.addNode(75.8620689655175, 10.0, 20.0, 576)
-    femmesh.addNode(68.96551724137956, 10.0, 20.0, 577)
-    femmesh.addNode(62.068965517241594, 10.0, 20.0, 578)
-    femmesh.addNode(55.17241379310363, 10.0, 20.0, 579)
-    femmesh.addNode(48.275862068965694, 10.0, 20.0, 580)
-    femmesh.addNode(41.37931034482773, 10.0, 20.0, 581)
-    femmesh.addNode(34.482758620689765, 10.0, 20.0, 582)
-    femmesh.addNode(27.58620689655183, 10.0, 20.0, 583)
-    femmesh.addNode(20.689655172413865, 10.0, 20.0, 584)
-    femmesh.addNode(13.793103448275929, 10.0, 20.0, 585)
-    femmesh.addNode(6.896551724137964, 10.0, 20.0, 586)
-    femmesh.addNode(196.55172413793105, 10.0, 20.0, 587)
-    femmesh.addNode(189.6551724137931, 10.0, 20.0, 588)
-    femmesh.addNode(182.75862068965517, 10.0, 20.0, 589)
-    femmesh.addNode(175.86206896551727, 10.0, 20.0, 590)
-    femmesh.addNode(168.96551724137933, 10.0, 20.0, 591)
-    femmesh.addNode(162.0689655172414, 10.0, 20.0, 592)
-    femmesh.addNode(155.1724137931035, 10.0, 20.0, 593)
-    femmesh.addNode(148.27586206896555, 10.0, 20.0, 594)
-    femmesh.addNode(141.37931034482764, 10.0, 20.0, 595)
-    femmesh.addNode(134.48275862068974, 10.0, 20.0, 596)
-    femmesh.addNode(127.58620689655186, 10.0, 20.0, 597)
-    femmesh.addNode(120.68965517241395, 10.0, 20.0, 598)
-    femmesh.addNode(113.79310344827604, 10.0, 20.0, 599)
-    femmesh.addNode(106.89655172413813, 10.0, 20.0, 600)
-    femmesh.addNode(100.00000000000026, 10.0, 20.0, 601)
-    femmesh.addNode(93.10344827586235, 10.0, 20.0, 602)
-    femmesh.addNode(86.20689655172443, 10.0, 20.0, 603)
-    femmesh.addNode(79.31034482758648, 10.0, 20.0, 604)
-    femmesh.addNode(72.41379310344853, 10.0, 20.0, 605)
-    femmesh.addNode(65.51724137931058, 10.0, 20.0, 606)
-    femmesh.addNode(58.62068965517261, 10.0, 20.0, 607)
-    femmesh.addNode(51.724137931034676, 10.0, 20.0, 608)
-    femmesh.addNode(44.82758620689671, 10.0, 20.0, 609)
-    femmesh.addNode(37.93103448275875, 10.0, 20.0, 610)
-    femmesh.addNode(31.03448275862081, 10.0, 20.0, 611)
-    femmesh.addNode(24.137931034482847, 10.0, 20.0, 612)
-    femmesh.addNode(17.24137931034491, 10.0, 20.0, 613)
-    femmesh.addNode(10.344827586206947, 10.0, 20.0, 614)
-    femmesh.addNode(3.448275862068982, 10.0, 20.0, 615)
-    femmesh.addNode(200.0, 4.999999999999999, 9.999999999999973, 616)
-    femmesh.addNode(200.0, 4.722222222222228, 14.999999999999986, 617)
-    femmesh.addNode(200.0, 4.722222222222209, 4.999999999999987, 618)
-    femmesh.addNode(200.0, 2.361111111111114, 14.16666666666664, 619)
-    femmesh.addNode(200.0, 2.361111111111114, 17.499999999999993, 620)
-    femmesh.addNode(200.0, 4.861111111111107, 17.499999999999993, 621)
-    femmesh.addNode(200.0, 2.3611111111111045, 2.4999999999999933, 622)
-    femmesh.addNode(200.0, 2.3611111111111045, 5.833333333333319, 623)
-    femmesh.addNode(200.0, 4.861111111111098, 2.4999999999999933, 624)
-    femmesh.addNode(200.0, 7.361111111111114, 17.499999999999993, 625)
-    femmesh.addNode(200.0, 7.361111111111114, 14.16666666666664, 626)
-    femmesh.addNode(200.0, 7.3611111111111045, 5.833333333333319, 627)
-    femmesh.addNode(200.0, 7.3611111111111045, 2.4999999999999933, 628)
-    femmesh.addNode(200.0, 2.4999999999999996, 8.333333333333313, 629)
-    femmesh.addNode(200.0, 2.4999999999999996, 11.666666666666634, 630)
-    femmesh.addNode(200.0, 4.861111111111104, 7.4999999999999805, 631)
-    femmesh.addNode(200.0, 4.861111111111113, 12.499999999999979, 632)
-    femmesh.addNode(200.0, 7.5, 11.666666666666634, 633)
-    femmesh.addNode(200.0, 7.5, 8.333333333333313, 634)
-    femmesh.addNode(173.64579940589218, 0.0, 9.999999999999998, 635)
-    femmesh.addNode(26.354200594107823, 0.0, 10.000000000000004, 636)
-    femmesh.addNode(140.8611111111111, 0.0, 9.89579516669761, 637)
-    femmesh.addNode(59.33854656085988, 0.0, 10.104204833302392, 638)
-    femmesh.addNode(37.74127668308704, 0.0, 10.000000000000005, 639)
-    femmesh.addNode(162.45838098888396, 0.0, 10.000000000000002, 640)
-    femmesh.addNode(71.89559386973188, 0.0, 10.104204833302362, 641)
-    femmesh.addNode(106.17869481845034, 0.0, 10.104204833302305, 642)
-    femmesh.addNode(93.82130518154973, 0.0, 10.10420483330243, 643)
-    femmesh.addNode(128.10440613026813, 0.0, 9.895795166697637, 644)
-    femmesh.addNode(116.90229885057443, 0.0, 10.000000000000007, 645)
-    femmesh.addNode(83.09770114942557, 0.0, 9.999999999999993, 646)
-    femmesh.addNode(152.0632183908046, 0.0, 9.999999999999991, 647)
-    femmesh.addNode(48.614942528735575, 0.0, 10.000000000000002, 648)
-    femmesh.addNode(134.48275862068965, 0.0, 13.877001848401825, 649)
-    femmesh.addNode(65.58289141189803, 0.0, 6.135800740570728, 650)
-    femmesh.addNode(99.99999999999997, 0.0, 6.148603329543295, 651)
-    femmesh.addNode(100.00000000000024, 0.0, 13.841638036675205, 652)
-    femmesh.addNode(65.57083324264738, 0.0, 13.897983615219495, 653)
-    femmesh.addNode(134.48275862068942, 0.0, 6.15836196332474, 654)
-    femmesh.addNode(168.33653728399588, 0.0, 6.132050307619636, 655)
-    femmesh.addNode(31.729112748591817, 0.0, 13.880752281352924, 656)
-    femmesh.addNode(168.3874436189604, 0.0, 13.823410598839882, 657)
-    femmesh.addNode(31.687584989711254, 0.0, 6.165615753469362, 658)
-    femmesh.addNode(179.84729019863045, 0.0, 13.342843065546274, 659)
-    femmesh.addNode(20.152709801369568, 0.0, 6.657156934453729, 660)
-    femmesh.addNode(20.023912655940094, 0.0, 13.398059147950482, 661)
-    femmesh.addNode(179.97608734405992, 0.0, 6.601940852049522, 662)
-    femmesh.addNode(77.75574712643689, 0.0, 6.24752279032902, 663)
-    femmesh.addNode(122.24425287356313, 0.0, 13.75247720967098, 664)
-    femmesh.addNode(77.75574712643684, 0.0, 13.752477209670872, 665)
-    femmesh.addNode(122.24425287356316, 0.0, 6.247522790329127, 666)
-    femmesh.addNode(146.7212643678161, 0.0, 6.247522790328935, 667)
-    femmesh.addNode(146.72126436781616, 0.0, 13.752477209671044, 668)
-    femmesh.addNode(43.27298850574708, 0.0, 6.247522790328966, 669)
-    femmesh.addNode(43.27298850574709, 0.0, 13.752477209671012, 670)
-    femmesh.addNode(53.14727620358004, 0.0, 13.818435280672972, 671)
-    femmesh.addNode(156.54863186078543, 0.0, 13.803548875915483, 672)
-    femmesh.addNode(87.63003482426988, 0.0, 13.818435280672993, 673)
-    femmesh.addNode(112.36996517573013, 0.0, 6.211337528841968, 674)
-    femmesh.addNode(53.08005621952654, 0.0, 6.204056639489069, 675)
-    femmesh.addNode(156.47470899032285, 0.0, 6.18704360548052, 676)
-    femmesh.addNode(112.4371851597837, 0.0, 13.829969428527992, 677)
-    femmesh.addNode(87.56281484021632, 0.0, 6.204056639489107, 678)
-    femmesh.addNode(4.031122582597106, 0.0, 16.357240648225915, 679)
-    femmesh.addNode(195.9688774174029, 0.0, 16.357240648225915, 680)
-    femmesh.addNode(195.9688774174029, 0.0, 3.642759351774063, 681)
-    femmesh.addNode(4.031122582597106, 0.0, 3.642759351774063, 682)
-    femmesh.addNode(72.00995208914263, 0.0, 15.550933131638546, 683)
-    femmesh.addNode(128.00076628352474, 0.0, 4.4603359840703005, 684)
-    femmesh.addNode(140.96475095785428, 0.0, 4.460335984070257, 685)
-    femmesh.addNode(140.96475095785445, 0.0, 15.505054844954095, 686)
-    femmesh.addNode(37.93103448275876, 0.0, 15.594530321046374, 687)
-    femmesh.addNode(37.931034482758605, 0.0, 4.40546967895364, 688)
-    femmesh.addNode(72.01236372299262, 0.0, 4.497505672840422, 689)
-    femmesh.addNode(128.0007662835249, 0.0, 15.505054844954088, 690)
-    femmesh.addNode(59.05960706348651, 0.0, 15.564124745838972, 691)
-    femmesh.addNode(162.30647750062252, 0.0, 15.525391894951074, 692)
-    femmesh.addNode(93.53164731150892, 0.0, 15.552855630130125, 693)
-    femmesh.addNode(106.59284761043978, 0.0, 4.494499853140045, 694)
-    femmesh.addNode(58.941803963942974, 0.0, 4.492800863317955, 695)
-    femmesh.addNode(162.28151165953705, 0.0, 4.463818782620031, 696)
-    femmesh.addNode(106.48179668530211, 0.0, 15.555162459701101, 697)
-    femmesh.addNode(93.40365280688353, 0.0, 4.49412079809272, 698)
-    femmesh.addNode(174.27571422870753, 0.0, 4.754177934224915, 699)
-    femmesh.addNode(25.80319479997661, 0.0, 15.212514195350385, 700)
-    femmesh.addNode(174.27003705593313, 0.0, 15.23855128035639, 701)
-    femmesh.addNode(25.80773818744791, 0.0, 4.792774440490222, 702)
-    femmesh.addNode(182.93809747805443, 0.0, 2.977737989310344, 703)
-    femmesh.addNode(17.06190252194557, 0.0, 17.022262010689666, 704)
-    femmesh.addNode(17.1361810946006, 0.0, 2.9049995726879736, 705)
-    femmesh.addNode(182.8638189053994, 0.0, 17.095000427312023, 706)
-    femmesh.addNode(82.75424104555236, 0.0, 14.563186213079506, 707)
-    femmesh.addNode(117.2859624558009, 0.0, 5.3188555602305865, 708)
-    femmesh.addNode(117.29453643335877, 0.0, 14.686413184331924, 709)
-    femmesh.addNode(82.70546356664123, 0.0, 5.317926875364134, 710)
-    femmesh.addNode(151.67357006557023, 0.0, 14.683043215886457, 711)
-    femmesh.addNode(48.222704945951435, 0.0, 5.317926875364117, 712)
-    femmesh.addNode(48.27148242486256, 0.0, 14.563186213079538, 713)
-    femmesh.addNode(151.66414112801118, 0.0, 5.315756845516082, 714)
-    femmesh.addNode(197.98443870870145, 0.0, 18.178620324112956, 715)
-    femmesh.addNode(197.98443870870145, 0.0, 14.845286990779606, 716)
-    femmesh.addNode(194.53616284663246, 0.0, 18.178620324112956, 717)
-    femmesh.addNode(197.98443870870145, 0.0, 5.154713009220357, 718)
-    femmesh.addNode(197.98443870870145, 0.0, 1.821379675887032, 719)
-    femmesh.addNode(194.53616284663246, 0.0, 1.821379675887032, 720)
-    femmesh.addNode(2.015561291298553, 0.0, 18.178620324112956, 721)
-    femmesh.addNode(5.463837153367535, 0.0, 18.178620324112956, 722)
-    femmesh.addNode(2.015561291298553, 0.0, 14.845286990779606, 723)
-    femmesh.addNode(2.015561291298553, 0.0, 1.821379675887032, 724)
-    femmesh.addNode(2.015561291298553, 0.0, 5.154713009220357, 725)
-    femmesh.addNode(5.463837153367521, 0.0, 1.821379675887032, 726)
-    femmesh.addNode(183.05317569373904, 0.0, 14.016915980177231, 727)
-    femmesh.addNode(181.92364509931522, 0.0, 11.671421532773138, 728)
-    femmesh.addNode(181.98804367202996, 0.0, 8.300970426024762, 729)
-    femmesh.addNode(183.11757426645374, 0.0, 5.95547597862069, 730)
-    femmesh.addNode(179.91168877134518, 0.0, 9.972391958797898, 731)
-    femmesh.addNode(18.01195632797004, 0.0, 11.699029573975242, 732)
-    femmesh.addNode(16.882425733546242, 0.0, 14.044524021379335, 733)
-    femmesh.addNode(16.946824306261007, 0.0, 5.983084019822793, 734)
-    femmesh.addNode(18.076354900684777, 0.0, 8.328578467226865, 735)
-    femmesh.addNode(20.08831122865483, 0.0, 10.027608041202106, 736)
-    femmesh.addNode(197.70290660370728, 0.0, 12.968317884019317, 737)
-    femmesh.addNode(197.70290660370728, 0.0, 9.634984550685994, 738)
-    femmesh.addNode(197.70290660370725, 0.0, 7.031682115980634, 739)
-    femmesh.addNode(195.6873453124087, 0.0, 5.51972845853434, 740)
-    femmesh.addNode(195.6873453124087, 0.0, 14.480271541465626, 741)
-    femmesh.addNode(188.77101107773103, 0.0, 17.92478373654547, 742)
-    femmesh.addNode(192.21928693979999, 0.0, 17.92478373654547, 743)
-    femmesh.addNode(193.6520015105704, 0.0, 16.103404060658427, 744)
-    femmesh.addNode(181.0870818664928, 0.0, 18.54750021365601, 745)
-    femmesh.addNode(184.5353577285618, 0.0, 18.54750021365601, 746)
-    femmesh.addNode(186.23297887028588, 0.0, 17.345494447404093, 747)
-    femmesh.addNode(184.56144004712348, 0.0, 15.892994661060104, 748)
-    femmesh.addNode(173.34191507969072, 0.0, 17.619275640178195, 749)
-    femmesh.addNode(176.79019094175968, 0.0, 17.619275640178195, 750)
-    femmesh.addNode(177.0586636272818, 0.0, 14.290697172951333, 751)
-    femmesh.addNode(179.57881751310833, 0.0, 16.671421532773138, 752)
-    femmesh.addNode(181.35555455201492, 0.0, 15.21892174642915, 753)
-    femmesh.addNode(166.9523424991354, 0.0, 16.911705299419943, 754)
-    femmesh.addNode(170.40061836120435, 0.0, 16.911705299419943, 755)
-    femmesh.addNode(171.32874033744676, 0.0, 14.530980939598136, 756)
-    femmesh.addNode(160.46358357789748, 0.0, 17.762695947475535, 757)
-    femmesh.addNode(163.91185943996646, 0.0, 17.762695947475535, 758)
-    femmesh.addNode(165.34696055979146, 0.0, 14.674401246895478, 759)
-    femmesh.addNode(154.13638489591, 0.0, 16.90177443795774, 760)
-    femmesh.addNode(157.58466075797895, 0.0, 16.90177443795774, 761)
-    femmesh.addNode(159.42755468070396, 0.0, 14.66447038543328, 762)
-    femmesh.addNode(145.7744252873564, 0.0, 16.87623860483552, 763)
-    femmesh.addNode(149.22270114942535, 0.0, 16.87623860483552, 764)
-    femmesh.addNode(149.1974172166932, 0.0, 14.21776021277875, 765)
-    femmesh.addNode(151.69885399830238, 0.0, 17.34152160794323, 766)
-    femmesh.addNode(154.11110096317782, 0.0, 14.24329604590097, 767)
-    femmesh.addNode(139.44789272030658, 0.0, 17.752527422477048, 768)
-    femmesh.addNode(142.89616858237554, 0.0, 17.752527422477048, 769)
-    femmesh.addNode(143.8430076628353, 0.0, 14.628766027312569, 770)
-    femmesh.addNode(132.75862068965523, 0.0, 16.938500924200913, 771)
-    femmesh.addNode(136.20689655172418, 0.0, 16.938500924200913, 772)
-    femmesh.addNode(137.72375478927205, 0.0, 14.69102834667796, 773)
-    femmesh.addNode(126.06934865900391, 0.0, 17.752527422477044, 774)
-    femmesh.addNode(129.51762452107286, 0.0, 17.752527422477044, 775)
-    femmesh.addNode(131.24176245210728, 0.0, 14.691028346677957, 776)
-    femmesh.addNode(119.74281609195407, 0.0, 16.87623860483549, 777)
-    femmesh.addNode(123.19109195402302, 0.0, 16.87623860483549, 778)
-    femmesh.addNode(125.12250957854403, 0.0, 14.628766027312533, 779)
-    femmesh.addNode(111.39100637299539, 0.0, 16.914984714263994, 780)
-    femmesh.addNode(114.83928223506435, 0.0, 16.914984714263994, 781)
-    femmesh.addNode(117.26795787185188, 0.0, 17.343206592165963, 782)
-    femmesh.addNode(119.76939465346095, 0.0, 14.219445197001452, 783)
-    femmesh.addNode(114.86586079657124, 0.0, 14.258191306429957, 784)
-    femmesh.addNode(104.96503627368566, 0.0, 17.77758122985055, 785)
-    femmesh.addNode(108.41331213575461, 0.0, 17.77758122985055, 786)
-    femmesh.addNode(109.4594909225429, 0.0, 14.692565944114547, 787)
-    femmesh.addNode(98.27586206896578, 0.0, 16.920819018337603, 788)
-    femmesh.addNode(101.72413793103472, 0.0, 16.920819018337603, 789)
-    femmesh.addNode(103.24089834265118, 0.0, 14.698400248188154, 790)
-    femmesh.addNode(91.59340986265116, 0.0, 17.776427815065063, 791)
-    femmesh.addNode(95.04168572472011, 0.0, 17.776427815065063, 792)
-    femmesh.addNode(96.76582365575459, 0.0, 14.697246833402666, 793)
-    femmesh.addNode(85.19432775696266, 0.0, 16.909217640336497, 794)
-    femmesh.addNode(88.64260361903165, 0.0, 16.909217640336497, 795)
-    femmesh.addNode(90.5808410678894, 0.0, 14.68564545540156, 796)
-    femmesh.addNode(76.80890804597718, 0.0, 16.876238604835436, 797)
-    femmesh.addNode(80.25718390804614, 0.0, 16.876238604835436, 798)
-    femmesh.addNode(80.25499408599461, 0.0, 14.157831711375188, 799)
-    femmesh.addNode(82.75643086760391, 0.0, 17.281593106539752, 800)
-    femmesh.addNode(85.19213793491113, 0.0, 14.190810746876249, 801)
-    femmesh.addNode(70.48773466526109, 0.0, 17.775466565819272, 802)
-    femmesh.addNode(73.93601052733007, 0.0, 17.775466565819272, 803)
-    femmesh.addNode(74.88284960778974, 0.0, 14.651705170654708, 804)
-    femmesh.addNode(63.81989937994449, 0.0, 16.948991807609747, 805)
-    femmesh.addNode(67.26817524201347, 0.0, 16.948991807609747, 806)
-    femmesh.addNode(68.79039266589501, 0.0, 14.72445837342902, 807)
-    femmesh.addNode(57.11601042829507, 0.0, 17.782062372919487, 808)
-    femmesh.addNode(60.56428629036405, 0.0, 17.782062372919487, 809)
-    femmesh.addNode(62.315220153066946, 0.0, 14.731054180529235, 810)
-    femmesh.addNode(50.71156913627287, 0.0, 16.909217640336486, 811)
-    femmesh.addNode(54.15984499834184, 0.0, 16.909217640336486, 812)
-    femmesh.addNode(56.10344163353328, 0.0, 14.691280013255973, 813)
-    femmesh.addNode(42.32614942528741, 0.0, 16.876238604835507, 814)
-    femmesh.addNode(45.774425287356394, 0.0, 16.876238604835507, 815)
-    femmesh.addNode(45.772235465304824, 0.0, 14.157831711375275, 816)
-    femmesh.addNode(48.27367224691413, 0.0, 17.28159310653977, 817)
-    femmesh.addNode(50.7093793142213, 0.0, 14.190810746876256, 818)
-    femmesh.addNode(36.20689655172426, 0.0, 17.79726516052319, 819)
-    femmesh.addNode(39.655172413793245, 0.0, 17.79726516052319, 820)
-    femmesh.addNode(40.60201149425292, 0.0, 14.673503765358692, 821)
-    femmesh.addNode(29.657659822571816, 0.0, 16.940376140676463, 822)
-    femmesh.addNode(33.1059356846408, 0.0, 16.940376140676463, 823)
-    femmesh.addNode(34.83007361567529, 0.0, 14.737641301199648, 824)
-    femmesh.addNode(23.246424986195237, 0.0, 17.606257097675194, 825)
-    femmesh.addNode(26.69470084826422, 0.0, 17.606257097675194, 826)
-    femmesh.addNode(28.76615377428422, 0.0, 14.546633238351655, 827)
-    femmesh.addNode(15.427502985110749, 0.0, 18.511131005344833, 828)
-    femmesh.addNode(18.875778847179717, 0.0, 18.511131005344833, 829)
-    femmesh.addNode(22.913553727958345, 0.0, 14.305286671650434, 830)
-    femmesh.addNode(20.356783914176987, 0.0, 16.699029573975242, 831)
-    femmesh.addNode(18.542907588942825, 0.0, 15.210160579320075, 832)
-    femmesh.addNode(7.780713060200043, 0.0, 17.92478373654547, 833)
-    femmesh.addNode(11.228988922269025, 0.0, 17.92478373654547, 834)
-    femmesh.addNode(13.767021129714166, 0.0, 17.345494447404093, 835)
-    femmesh.addNode(15.401420666548987, 0.0, 15.856625452748926, 836)
-    femmesh.addNode(6.347998489429614, 0.0, 16.103404060658427, 837)
-    femmesh.addNode(2.2970933962927518, 0.0, 7.031682115980634, 838)
-    femmesh.addNode(2.2970933962927518, 0.0, 10.365015449313956, 839)
-    femmesh.addNode(4.312654687591305, 0.0, 5.51972845853434, 840)
-    femmesh.addNode(2.2970933962927376, 0.0, 12.968317884019317, 841)
-    femmesh.addNode(4.312654687591291, 0.0, 14.480271541465626, 842)
-    femmesh.addNode(7.780713060200043, 0.0, 2.075216263454524, 843)
-    femmesh.addNode(11.22898892226901, 0.0, 2.075216263454524, 844)
-    femmesh.addNode(6.347998489429642, 0.0, 3.8965959393415552, 845)
-    femmesh.addNode(18.91291813350719, 0.0, 1.4524997863439868, 846)
-    femmesh.addNode(15.464642271438223, 0.0, 1.4524997863439868, 847)
-    femmesh.addNode(13.767021129714152, 0.0, 2.6545055525959285, 848)
-    femmesh.addNode(15.438559952876517, 0.0, 4.107005338939915, 849)
-    femmesh.addNode(26.6969725419998, 0.0, 2.396387220245111, 850)
-    femmesh.addNode(23.248696679930845, 0.0, 2.396387220245111, 851)
-    femmesh.addNode(22.980223994408732, 0.0, 5.724965687471975, 852)
-    femmesh.addNode(20.421182486891666, 0.0, 3.3285784672268646, 853)
-    femmesh.addNode(18.644445447985078, 0.0, 4.781078253570851, 854)
-    femmesh.addNode(33.085171805200446, 0.0, 3.082807876734681, 855)
-    femmesh.addNode(29.636895943131478, 0.0, 3.082807876734681, 856)
-    femmesh.addNode(28.747661588579575, 0.0, 5.479195096979792, 857)
-    femmesh.addNode(39.65517241379308, 0.0, 2.20273483947682, 858)
-    femmesh.addNode(36.206896551724114, 0.0, 2.20273483947682, 859)
-    femmesh.addNode(34.80930973623492, 0.0, 5.285542716211501, 860)
-    femmesh.addNode(45.77442528735628, 0.0, 3.1237613951644825, 861)
-    femmesh.addNode(42.32614942528731, 0.0, 3.1237613951644825, 862)
-    femmesh.addNode(40.60201149425284, 0.0, 5.3264962346413025, 863)
-    femmesh.addNode(54.12623500631497, 0.0, 3.1020283197445346, 864)
-    femmesh.addNode(50.67795914424601, 0.0, 3.1020283197445346, 865)
-    femmesh.addNode(48.24928350745846, 0.0, 2.6589634376820586, 866)
-    femmesh.addNode(45.74784672584926, 0.0, 5.782724832846542, 867)
-    femmesh.addNode(50.65138058273899, 0.0, 5.760991757426593, 868)
-    femmesh.addNode(60.50538474059214, 0.0, 2.2464004316589774, 869)
-    femmesh.addNode(57.05710887852319, 0.0, 2.2464004316589774, 870)
-    femmesh.addNode(56.01093009173476, 0.0, 5.348428751403512, 871)
-    femmesh.addNode(67.27420432663862, 0.0, 3.067900370285364, 872)
-    femmesh.addNode(63.82592846456967, 0.0, 3.067900370285364, 873)
-    femmesh.addNode(62.2623476879205, 0.0, 5.314300801944341, 874)
-    femmesh.addNode(73.93721634425486, 0.0, 2.248752836420211, 875)
-    femmesh.addNode(70.48894048218591, 0.0, 2.248752836420211, 876)
-    femmesh.addNode(68.79762756744532, 0.0, 5.316653206705575, 877)
-    femmesh.addNode(80.25718390804595, 0.0, 3.12376139516451, 878)
-    femmesh.addNode(76.80890804597699, 0.0, 3.12376139516451, 879)
-    femmesh.addNode(74.88405542471475, 0.0, 5.372514231584721, 880)
-    femmesh.addNode(88.60899362700462, 0.0, 3.1020283197445533, 881)
-    femmesh.addNode(85.16071776493567, 0.0, 3.1020283197445533, 882)
-    femmesh.addNode(82.73204212814812, 0.0, 2.6589634376820666, 883)
-    femmesh.addNode(80.23060534653905, 0.0, 5.7827248328465775, 884)
-    femmesh.addNode(85.13413920342877, 0.0, 5.76099175742662, 885)
-    femmesh.addNode(94.97768847240717, 0.0, 2.24706039904636, 886)
-    femmesh.addNode(91.52941261033823, 0.0, 2.24706039904636, 887)
-    femmesh.addNode(90.48323382354992, 0.0, 5.349088718790913, 888)
-    femmesh.addNode(101.72413793103433, 0.0, 3.0743016647716477, 889)
-    femmesh.addNode(98.27586206896538, 0.0, 3.0743016647716477, 890)
-    femmesh.addNode(96.70182640344174, 0.0, 5.3213620638180075, 891)
-    femmesh.addNode(108.46883759832318, 0.0, 2.2472499265700225, 892)
-    femmesh.addNode(105.02056173625424, 0.0, 2.2472499265700225, 893)
-    femmesh.addNode(103.29642380521987, 0.0, 5.32155159134167, 894)
-    femmesh.addNode(114.80567224303735, 0.0, 3.105668764420984, 895)
-    femmesh.addNode(111.35739638096837, 0.0, 3.105668764420984, 896)
-    femmesh.addNode(109.48140639308495, 0.0, 5.3529186909910065, 897)
-    femmesh.addNode(123.19109195402282, 0.0, 3.1237613951645633, 898)
-    femmesh.addNode(119.74281609195386, 0.0, 3.1237613951645633, 899)
-    femmesh.addNode(119.76510766468203, 0.0, 5.7831891752798565, 900)
-    femmesh.addNode(117.26367088307273, 0.0, 2.6594277801152932, 901)
-    femmesh.addNode(114.82796381576551, 0.0, 5.765096544536277, 902)
-    femmesh.addNode(129.5176245210726, 0.0, 2.2301679920351507, 903)
-    femmesh.addNode(126.06934865900362, 0.0, 2.2301679920351507, 904)
-    femmesh.addNode(125.12250957854394, 0.0, 5.353929387199713, 905)
-    femmesh.addNode(136.2068965517239, 0.0, 3.07918098166237, 906)
-    femmesh.addNode(132.75862068965495, 0.0, 3.07918098166237, 907)
-    femmesh.addNode(131.24176245210708, 0.0, 5.309348973697521, 908)
-    femmesh.addNode(142.8961685823753, 0.0, 2.2301679920351285, 909)
-    femmesh.addNode(139.44789272030636, 0.0, 2.2301679920351285, 910)
-    femmesh.addNode(137.72375478927185, 0.0, 5.309348973697499, 911)
-    femmesh.addNode(149.2227011494252, 0.0, 3.1237613951644674, 912)
-    femmesh.addNode(145.77442528735622, 0.0, 3.1237613951644674, 913)
-    femmesh.addNode(143.8430076628352, 0.0, 5.353929387199596, 914)
-    femmesh.addNode(157.54769932274758, 0.0, 3.09352180274026, 915)
-    femmesh.addNode(154.09942346067857, 0.0, 3.09352180274026, 916)
-    femmesh.addNode(151.69413952952274, 0.0, 2.657878422758041, 917)
-    femmesh.addNode(149.19270274791364, 0.0, 5.781639817922509, 918)
-    femmesh.addNode(154.06942505916703, 0.0, 5.751400225498301, 919)
-    femmesh.addNode(163.89937651942364, 0.0, 2.2319093913100154, 920)
-    femmesh.addNode(160.45110065735466, 0.0, 2.2319093913100154, 921)
-    femmesh.addNode(159.37811032492993, 0.0, 5.325431194050275, 922)
-    femmesh.addNode(170.375165193722, 0.0, 3.066025153809818, 923)
-    femmesh.addNode(166.92688933165306, 0.0, 3.066025153809818, 924)
-    femmesh.addNode(165.30902447176646, 0.0, 5.297934545119833, 925)
-    femmesh.addNode(176.79302952814683, 0.0, 2.3770889671124573, 926)
-    femmesh.addNode(173.34475366607785, 0.0, 2.3770889671124573, 927)
-    femmesh.addNode(171.30612575635172, 0.0, 5.443114120922275, 928)
-    femmesh.addNode(184.57249701488925, 0.0, 1.4888689946551725, 929)
-    femmesh.addNode(181.12422115282027, 0.0, 1.4888689946551725, 930)
-    femmesh.addNode(177.12590078638374, 0.0, 5.678059393137218, 931)
-    femmesh.addNode(179.64321608582304, 0.0, 3.3009704260247617, 932)
-    femmesh.addNode(181.45709241105718, 0.0, 4.789839420679933, 933)
-    femmesh.addNode(188.77101107773095, 0.0, 2.075216263454524, 934)
-    femmesh.addNode(192.21928693979993, 0.0, 2.075216263454524, 935)
-    femmesh.addNode(186.23297887028582, 0.0, 2.6545055525959285, 936)
-    femmesh.addNode(184.598579333451, 0.0, 4.143374547251101, 937)
-    femmesh.addNode(193.65200151057036, 0.0, 3.8965959393415552, 938)
-    femmesh.addNode(171.0166215124263, 0.0, 11.911705299419939, 939)
-    femmesh.addNode(168.36199045147814, 0.0, 9.977730453229759, 940)
-    femmesh.addNode(170.99116834494401, 0.0, 8.066025153809818, 941)
-    femmesh.addNode(173.96075681729985, 0.0, 7.377088967112456, 942)
-    femmesh.addNode(173.95791823091264, 0.0, 12.619275640178195, 943)
-    femmesh.addNode(176.81094337497603, 0.0, 8.30097042602476, 944)
-    femmesh.addNode(176.74654480226133, 0.0, 11.671421532773136, 945)
-    femmesh.addNode(29.020892791909546, 0.0, 8.082807876734684, 946)
-    femmesh.addNode(31.708348869151536, 0.0, 10.023184017411143, 947)
-    femmesh.addNode(29.041656671349813, 0.0, 11.940376140676463, 948)
-    femmesh.addNode(26.078697697042216, 0.0, 12.606257097675194, 949)
-    femmesh.addNode(26.080969390777867, 0.0, 7.396387220245113, 950)
-    femmesh.addNode(23.189056625023966, 0.0, 11.699029573975242, 951)
-    femmesh.addNode(23.253455197738703, 0.0, 8.328578467226865, 952)
-    femmesh.addNode(134.48275862068954, 0.0, 10.017681905863283, 953)
-    femmesh.addNode(137.67193486590025, 0.0, 8.027078565011175, 954)
-    femmesh.addNode(137.67193486590037, 0.0, 11.886398507549718, 955)
-    femmesh.addNode(140.91293103448277, 0.0, 12.700425005825853, 956)
-    femmesh.addNode(140.91293103448268, 0.0, 7.1780655753839335, 957)
-    femmesh.addNode(146.72126436781613, 0.0, 9.99999999999999, 958)
-    femmesh.addNode(143.79118773946362, 0.0, 11.824136188184326, 959)
-    femmesh.addNode(143.7911877394636, 0.0, 8.071658978513273, 960)
-    femmesh.addNode(65.5768623272727, 0.0, 10.016892177895112, 961)
-    femmesh.addNode(62.45468990175363, 0.0, 12.001094224260942, 962)
-    femmesh.addNode(62.46071898637896, 0.0, 8.12000278693656, 963)
-    femmesh.addNode(59.14017526240143, 0.0, 7.298502848310173, 964)
-    femmesh.addNode(59.199076812173196, 0.0, 12.834164789570682, 965)
-    femmesh.addNode(53.113666211553294, 0.0, 10.01124596008102, 966)
-    femmesh.addNode(56.20930139019321, 0.0, 8.15413073639573, 967)
-    femmesh.addNode(56.24291138221996, 0.0, 11.961320056987681, 968)
-    femmesh.addNode(34.714430836399146, 0.0, 8.082807876734684, 969)
-    femmesh.addNode(34.73519471583943, 0.0, 11.940376140676465, 970)
-    femmesh.addNode(37.8361555829229, 0.0, 12.797265160523189, 971)
-    femmesh.addNode(37.83615558292282, 0.0, 7.202734839476823, 972)
-    femmesh.addNode(43.27298850574708, 0.0, 9.99999999999999, 973)
-    femmesh.addNode(40.50713259441706, 0.0, 11.876238604835509, 974)
-    femmesh.addNode(40.50713259441706, 0.0, 8.123761395164486, 975)
-    femmesh.addNode(165.42291230392217, 0.0, 11.911705299419943, 976)
-    femmesh.addNode(165.39745913643992, 0.0, 8.066025153809818, 977)
-    femmesh.addNode(162.3699463242105, 0.0, 7.231909391310016, 978)
-    femmesh.addNode(162.38242924475324, 0.0, 12.762695947475539, 979)
-    femmesh.addNode(156.51167042555414, 0.0, 9.995296240698002, 980)
-    femmesh.addNode(159.4665449896034, 0.0, 8.093521802740261, 981)
-    femmesh.addNode(159.5035064248347, 0.0, 11.901774437957743, 982)
-    femmesh.addNode(68.73321355618964, 0.0, 12.001094224260928, 983)
-    femmesh.addNode(68.73924264081495, 0.0, 8.120002786936546, 984)
-    femmesh.addNode(71.95397879636225, 0.0, 7.300855253071392, 985)
-    femmesh.addNode(71.95277297943726, 0.0, 12.827568982470453, 986)
-    femmesh.addNode(77.75574712643686, 0.0, 9.999999999999947, 987)
-    femmesh.addNode(74.82567049808436, 0.0, 11.928341021486617, 988)
-    femmesh.addNode(74.82567049808438, 0.0, 8.175863811815692, 989)
-    femmesh.addNode(103.0893474092253, 0.0, 11.972921434988756, 990)
-    femmesh.addNode(100.00000000000011, 0.0, 9.99512068310925, 991)
-    femmesh.addNode(103.08934740922516, 0.0, 8.1264040814228, 992)
-    femmesh.addNode(106.38577121444506, 0.0, 7.299352343221175, 993)
-    femmesh.addNode(106.33024575187622, 0.0, 12.829683646501703, 994)
-    femmesh.addNode(112.40357516775691, 0.0, 10.02065347868498, 995)
-    femmesh.addNode(109.30793998911702, 0.0, 11.967087130915148, 996)
-    femmesh.addNode(109.27432999709023, 0.0, 8.157771181072135, 997)
-    femmesh.addNode(96.91065259077499, 0.0, 11.972921434988818, 998)
-    femmesh.addNode(96.91065259077484, 0.0, 8.126404081422862, 999)
-    femmesh.addNode(93.61247899421663, 0.0, 7.299162815697575, 1000)
-    femmesh.addNode(93.67647624652932, 0.0, 12.828530231716279, 1001)
-    femmesh.addNode(87.5964248322431, 0.0, 10.01124596008105, 1002)
-    femmesh.addNode(90.69206001088303, 0.0, 8.154130736395768, 1003)
-    femmesh.addNode(90.72567000290981, 0.0, 11.961320056987713, 1004)
-    femmesh.addNode(131.29358237547876, 0.0, 8.027078565011188, 1005)
-    femmesh.addNode(131.29358237547888, 0.0, 11.886398507549732, 1006)
-    femmesh.addNode(128.05258620689654, 0.0, 12.700425005825863, 1007)
-    femmesh.addNode(128.05258620689642, 0.0, 7.178065575383968, 1008)
-    femmesh.addNode(122.24425287356314, 0.0, 10.000000000000053, 1009)
-    femmesh.addNode(125.17432950191565, 0.0, 8.071658978513382, 1010)
-    femmesh.addNode(125.17432950191562, 0.0, 11.824136188184308, 1011)
-    femmesh.addNode(119.57327586206878, 0.0, 8.123761395164568, 1012)
-    femmesh.addNode(119.57327586206878, 0.0, 11.876238604835493, 1013)
-    femmesh.addNode(117.09841764196659, 0.0, 12.343206592165966, 1014)
-    femmesh.addNode(117.09413065318766, 0.0, 7.659427780115297, 1015)
-    femmesh.addNode(114.66974200517906, 0.0, 11.914984714264, 1016)
-    femmesh.addNode(114.63613201315228, 0.0, 8.105668764420987, 1017)
-    femmesh.addNode(80.42672413793122, 0.0, 11.876238604835432, 1018)
-    femmesh.addNode(80.42672413793123, 0.0, 8.123761395164507, 1019)
-    femmesh.addNode(82.90158235803341, 0.0, 7.658963437682063, 1020)
-    femmesh.addNode(82.92597109748897, 0.0, 12.281593106539749, 1021)
-    femmesh.addNode(85.33025799482095, 0.0, 8.10202831974455, 1022)
-    femmesh.addNode(85.36386798684774, 0.0, 11.909217640336493, 1023)
-    femmesh.addNode(149.39224137931038, 0.0, 11.876238604835518, 1024)
-    femmesh.addNode(149.39224137931035, 0.0, 8.123761395164463, 1025)
-    femmesh.addNode(151.8636797594079, 0.0, 7.657878422758037, 1026)
-    femmesh.addNode(151.8683942281874, 0.0, 12.341521607943225, 1027)
-    femmesh.addNode(154.26896369056374, 0.0, 8.093521802740256, 1028)
-    femmesh.addNode(154.305925125795, 0.0, 11.901774437957737, 1029)
-    femmesh.addNode(45.94396551724133, 0.0, 11.876238604835507, 1030)
-    femmesh.addNode(45.943965517241324, 0.0, 8.123761395164484, 1031)
-    femmesh.addNode(48.4188237373435, 0.0, 7.6589634376820594, 1032)
-    femmesh.addNode(48.44321247679907, 0.0, 12.28159310653977, 1033)
-    femmesh.addNode(50.84749937413106, 0.0, 8.102028319744536, 1034)
-    femmesh.addNode(50.88110936615781, 0.0, 11.909217640336486, 1035)
-    femmesh.addNode(0.0, 4.999999999999999, 9.999999999999973, 1036)
-    femmesh.addNode(0.0, 4.722222222222228, 14.999999999999986, 1037)
-    femmesh.addNode(0.0, 4.722222222222209, 4.999999999999987, 1038)
-    femmesh.addNode(0.0, 2.361111111111114, 17.499999999999993, 1039)
-    femmesh.addNode(0.0, 2.361111111111114, 14.16666666666664, 1040)
-    femmesh.addNode(0.0, 4.861111111111107, 17.499999999999993, 1041)
-    femmesh.addNode(0.0, 2.3611111111111045, 5.833333333333319, 1042)
-    femmesh.addNode(0.0, 2.3611111111111045, 2.4999999999999933, 1043)
-    femmesh.addNode(0.0, 4.861111111111098, 2.4999999999999933, 1044)
-    femmesh.addNode(0.0, 7.361111111111114, 17.499999999999993, 1045)
-    femmesh.addNode(0.0, 7.361111111111114, 14.16666666666664, 1046)
-    femmesh.addNode(0.0, 7.3611111111111045, 2.4999999999999933, 1047)
-    femmesh.addNode(0.0, 7.3611111111111045, 5.833333333333319, 1048)
-    femmesh.addNode(0.0, 2.4999999999999996, 11.666666666666634, 1049)
-    femmesh.addNode(0.0, 2.4999999999999996, 8.333333333333313, 1050)
-    femmesh.addNode(0.0, 4.861111111111104, 7.4999999999999805, 1051)
-    femmesh.addNode(0.0, 4.861111111111113, 12.499999999999979, 1052)
-    femmesh.addNode(0.0, 7.5, 8.333333333333313, 1053)
-    femmesh.addNode(0.0, 7.5, 11.666666666666634, 1054)
-    femmesh.addNode(134.48275862068974, 5.0, 20.0, 1055)
-    femmesh.addNode(148.27586206896555, 5.0, 20.0, 1056)
-    femmesh.addNode(141.37931034482764, 5.0, 20.0, 1057)
-    femmesh.addNode(127.58620689655184, 5.0, 20.0, 1058)
-    femmesh.addNode(106.89655172413815, 5.0, 20.0, 1059)
-    femmesh.addNode(93.10344827586235, 5.0, 20.0, 1060)
-    femmesh.addNode(86.20689655172443, 5.0, 20.0, 1061)
-    femmesh.addNode(113.79310344827604, 5.0, 20.0, 1062)
-    femmesh.addNode(168.96551724137933, 5.0, 20.0, 1063)
-    femmesh.addNode(100.00000000000024, 5.0, 20.0, 1064)
-    femmesh.addNode(189.5803712054843, 5.00528767162183, 20.0, 1065)
-    femmesh.addNode(182.75862068965517, 5.0, 20.0, 1066)
-    femmesh.addNode(175.86206896551727, 5.0, 20.0, 1067)
-    femmesh.addNode(155.1724137931035, 5.0, 20.0, 1068)
-    femmesh.addNode(120.68965517241395, 5.0, 20.0, 1069)
-    femmesh.addNode(24.137931034482833, 5.0, 20.0, 1070)
-    femmesh.addNode(162.0689655172414, 5.0, 20.0, 1071)
-    femmesh.addNode(65.51724137931058, 5.0, 20.0, 1072)
-    femmesh.addNode(58.62068965517261, 5.0, 20.0, 1073)
-    femmesh.addNode(44.82758620689671, 5.0, 20.0, 1074)
-    femmesh.addNode(37.93103448275876, 5.0, 20.0, 1075)
-    femmesh.addNode(10.419628794515774, 4.994712328378176, 20.0, 1076)
-    femmesh.addNode(79.31034482758648, 5.0, 20.0, 1077)
-    femmesh.addNode(72.41379310344853, 5.0, 20.0, 1078)
-    femmesh.addNode(51.724137931034655, 5.0, 20.0, 1079)
-    femmesh.addNode(31.034482758620825, 5.0, 20.0, 1080)
-    femmesh.addNode(17.24137931034494, 5.0, 20.0, 1081)
-    femmesh.addNode(4.876454187911662, 4.9096179098652035, 20.0, 1082)
-    femmesh.addNode(195.12354581208837, 5.0903820901348995, 20.0, 1083)
-    femmesh.addNode(197.56177290604418, 5.045191045067443, 20.0, 1084)
-    femmesh.addNode(197.56177290604418, 2.5451910450674498, 20.0, 1085)
-    femmesh.addNode(194.1134970439752, 2.5451910450674498, 20.0, 1086)
-    femmesh.addNode(197.56177290604418, 7.545191045067449, 20.0, 1087)
-    femmesh.addNode(194.1134970439752, 7.545191045067449, 20.0, 1088)
-    femmesh.addNode(5.886502956024813, 2.4548089549326018, 20.0, 1089)
-    femmesh.addNode(2.438227093955831, 2.4548089549326018, 20.0, 1090)
-    femmesh.addNode(2.438227093955831, 4.954808954932595, 20.0, 1091)
-    femmesh.addNode(2.438227093955831, 7.454808954932602, 20.0, 1092)
-    femmesh.addNode(5.886502956024813, 7.454808954932602, 20.0, 1093)
-    femmesh.addNode(191.3419097406732, 2.502643835810915, 20.0, 1094)
-    femmesh.addNode(187.89363387860425, 2.502643835810915, 20.0, 1095)
-    femmesh.addNode(192.35195850878634, 5.047834880878365, 20.0, 1096)
-    femmesh.addNode(184.48275862068965, 2.5, 20.0, 1097)
-    femmesh.addNode(181.0344827586207, 2.5, 20.0, 1098)
-    femmesh.addNode(186.16949594756974, 5.002643835810915, 20.0, 1099)
-    femmesh.addNode(177.58620689655174, 2.5, 20.0, 1100)
-    femmesh.addNode(174.1379310344828, 2.5, 20.0, 1101)
-    femmesh.addNode(179.31034482758622, 5.0, 20.0, 1102)
-    femmesh.addNode(170.68965517241384, 2.5, 20.0, 1103)
-    femmesh.addNode(167.24137931034485, 2.5, 20.0, 1104)
-    femmesh.addNode(172.4137931034483, 5.0, 20.0, 1105)
-    femmesh.addNode(163.79310344827587, 2.5, 20.0, 1106)
-    femmesh.addNode(160.34482758620692, 2.5, 20.0, 1107)
-    femmesh.addNode(165.51724137931035, 5.0, 20.0, 1108)
-    femmesh.addNode(156.89655172413796, 2.5, 20.0, 1109)
-    femmesh.addNode(153.448275862069, 2.5, 20.0, 1110)
-    femmesh.addNode(158.62068965517244, 5.0, 20.0, 1111)
-    femmesh.addNode(150.00000000000006, 2.5, 20.0, 1112)
-    femmesh.addNode(146.55172413793107, 2.5, 20.0, 1113)
-    femmesh.addNode(151.72413793103453, 5.0, 20.0, 1114)
-    femmesh.addNode(143.10344827586212, 2.5, 20.0, 1115)
-    femmesh.addNode(139.65517241379317, 2.5, 20.0, 1116)
-    femmesh.addNode(144.8275862068966, 5.0, 20.0, 1117)
-    femmesh.addNode(136.2068965517242, 2.5, 20.0, 1118)
-    femmesh.addNode(132.7586206896553, 2.5, 20.0, 1119)
-    femmesh.addNode(137.9310344827587, 5.0, 20.0, 1120)
-    femmesh.addNode(129.31034482758633, 2.5, 20.0, 1121)
-    femmesh.addNode(125.86206896551738, 2.5, 20.0, 1122)
-    femmesh.addNode(131.03448275862078, 5.0, 20.0, 1123)
-    femmesh.addNode(122.41379310344843, 2.5, 20.0, 1124)
-    femmesh.addNode(118.96551724137947, 2.5, 20.0, 1125)
-    femmesh.addNode(124.1379310344829, 5.0, 20.0, 1126)
-    femmesh.addNode(115.51724137931052, 2.5, 20.0, 1127)
-    femmesh.addNode(112.06896551724157, 2.5, 20.0, 1128)
-    femmesh.addNode(117.241379310345, 5.0, 20.0, 1129)
-    femmesh.addNode(108.62068965517261, 2.5, 20.0, 1130)
-    femmesh.addNode(105.17241379310367, 2.5, 20.0, 1131)
-    femmesh.addNode(110.34482758620709, 5.0, 20.0, 1132)
-    femmesh.addNode(101.72413793103472, 2.5, 20.0, 1133)
-    femmesh.addNode(98.27586206896578, 2.5, 20.0, 1134)
-    femmesh.addNode(103.4482758620692, 5.0, 20.0, 1135)
-    femmesh.addNode(94.82758620689683, 2.5, 20.0, 1136)
-    femmesh.addNode(91.37931034482787, 2.5, 20.0, 1137)
-    femmesh.addNode(96.5517241379313, 5.0, 20.0, 1138)
-    femmesh.addNode(87.93103448275892, 2.5, 20.0, 1139)
-    femmesh.addNode(84.48275862068994, 2.5, 20.0, 1140)
-    femmesh.addNode(89.6551724137934, 5.0, 20.0, 1141)
-    femmesh.addNode(81.03448275862095, 2.5, 20.0, 1142)
-    femmesh.addNode(77.58620689655199, 2.5, 20.0, 1143)
-    femmesh.addNode(82.75862068965546, 5.0, 20.0, 1144)
-    femmesh.addNode(74.13793103448302, 2.5, 20.0, 1145)
-    femmesh.addNode(70.68965517241404, 2.5, 20.0, 1146)
-    femmesh.addNode(75.8620689655175, 5.0, 20.0, 1147)
-    femmesh.addNode(67.24137931034507, 2.5, 20.0, 1148)
-    femmesh.addNode(63.793103448276085, 2.5, 20.0, 1149)
-    femmesh.addNode(68.96551724137956, 5.0, 20.0, 1150)
-    femmesh.addNode(60.3448275862071, 2.5, 20.0, 1151)
-    femmesh.addNode(56.89655172413812, 2.5, 20.0, 1152)
-    femmesh.addNode(62.068965517241594, 5.0, 20.0, 1153)
-    femmesh.addNode(53.44827586206914, 2.5, 20.0, 1154)
-    femmesh.addNode(50.00000000000017, 2.5, 20.0, 1155)
-    femmesh.addNode(55.17241379310363, 5.0, 20.0, 1156)
-    femmesh.addNode(46.5517241379312, 2.5, 20.0, 1157)
-    femmesh.addNode(43.10344827586222, 2.5, 20.0, 1158)
-    femmesh.addNode(48.27586206896568, 5.0, 20.0, 1159)
-    femmesh.addNode(39.655172413793245, 2.5, 20.0, 1160)
-    femmesh.addNode(36.20689655172426, 2.5, 20.0, 1161)
-    femmesh.addNode(41.379310344827736, 5.0, 20.0, 1162)
-    femmesh.addNode(32.75862068965529, 2.5, 20.0, 1163)
-    femmesh.addNode(29.310344827586334, 2.5, 20.0, 1164)
-    femmesh.addNode(34.48275862068979, 5.0, 20.0, 1165)
-    femmesh.addNode(25.862068965517324, 2.5, 20.0, 1166)
-    femmesh.addNode(22.41379310344834, 2.5, 20.0, 1167)
-    femmesh.addNode(27.58620689655183, 5.0, 20.0, 1168)
-    femmesh.addNode(18.965517241379402, 2.5, 20.0, 1169)
-    femmesh.addNode(15.517241379310434, 2.5, 20.0, 1170)
-    femmesh.addNode(20.689655172413893, 5.0, 20.0, 1171)
-    femmesh.addNode(12.106366121395851, 2.497356164189088, 20.0, 1172)
-    femmesh.addNode(8.658090259326869, 2.497356164189088, 20.0, 1173)
-    femmesh.addNode(13.830504052430356, 4.997356164189088, 20.0, 1174)
-    femmesh.addNode(7.648041491213718, 4.952165119121689, 20.0, 1175)
-    femmesh.addNode(187.89363387860425, 7.502643835810915, 20.0, 1176)
-    femmesh.addNode(191.3419097406732, 7.502643835810915, 20.0, 1177)
-    femmesh.addNode(181.0344827586207, 7.5, 20.0, 1178)
-    femmesh.addNode(184.48275862068965, 7.5, 20.0, 1179)
-    femmesh.addNode(174.1379310344828, 7.5, 20.0, 1180)
-    femmesh.addNode(177.58620689655174, 7.5, 20.0, 1181)
-    femmesh.addNode(167.24137931034485, 7.5, 20.0, 1182)
-    femmesh.addNode(170.68965517241384, 7.5, 20.0, 1183)
-    femmesh.addNode(160.34482758620692, 7.5, 20.0, 1184)
-    femmesh.addNode(163.79310344827587, 7.5, 20.0, 1185)
-    femmesh.addNode(153.448275862069, 7.5, 20.0, 1186)
-    femmesh.addNode(156.89655172413796, 7.5, 20.0, 1187)
-    femmesh.addNode(146.55172413793107, 7.5, 20.0, 1188)
-    femmesh.addNode(150.00000000000006, 7.5, 20.0, 1189)
-    femmesh.addNode(139.65517241379317, 7.5, 20.0, 1190)
-    femmesh.addNode(143.10344827586212, 7.5, 20.0, 1191)
-    femmesh.addNode(132.7586206896553, 7.5, 20.0, 1192)
-    femmesh.addNode(136.2068965517242, 7.5, 20.0, 1193)
-    femmesh.addNode(125.86206896551738, 7.5, 20.0, 1194)
-    femmesh.addNode(129.31034482758633, 7.5, 20.0, 1195)
-    femmesh.addNode(118.96551724137947, 7.5, 20.0, 1196)
-    femmesh.addNode(122.41379310344843, 7.5, 20.0, 1197)
-    femmesh.addNode(112.06896551724157, 7.5, 20.0, 1198)
-    femmesh.addNode(115.51724137931052, 7.5, 20.0, 1199)
-    femmesh.addNode(105.17241379310367, 7.5, 20.0, 1200)
-    femmesh.addNode(108.62068965517261, 7.5, 20.0, 1201)
-    femmesh.addNode(98.27586206896578, 7.5, 20.0, 1202)
-    femmesh.addNode(101.72413793103472, 7.5, 20.0, 1203)
-    femmesh.addNode(91.37931034482787, 7.5, 20.0, 1204)
-    femmesh.addNode(94.82758620689683, 7.5, 20.0, 1205)
-    femmesh.addNode(84.48275862068994, 7.5, 20.0, 1206)
-    femmesh.addNode(87.93103448275892, 7.5, 20.0, 1207)
-    femmesh.addNode(77.58620689655199, 7.5, 20.0, 1208)
-    femmesh.addNode(81.03448275862095, 7.5, 20.0, 1209)
-    femmesh.addNode(70.68965517241404, 7.5, 20.0, 1210)
-    femmesh.addNode(74.13793103448302, 7.5, 20.0, 1211)
-    femmesh.addNode(63.793103448276085, 7.5, 20.0, 1212)
-    femmesh.addNode(67.24137931034507, 7.5, 20.0, 1213)
-    femmesh.addNode(56.89655172413812, 7.5, 20.0, 1214)
-    femmesh.addNode(60.3448275862071, 7.5, 20.0, 1215)
-    femmesh.addNode(50.00000000000017, 7.5, 20.0, 1216)
-    femmesh.addNode(53.44827586206914, 7.5, 20.0, 1217)
-    femmesh.addNode(43.10344827586222, 7.5, 20.0, 1218)
-    femmesh.addNode(46.5517241379312, 7.5, 20.0, 1219)
-    femmesh.addNode(36.20689655172426, 7.5, 20.0, 1220)
-    femmesh.addNode(39.655172413793245, 7.5, 20.0, 1221)
-    femmesh.addNode(29.310344827586334, 7.5, 20.0, 1222)
-    femmesh.addNode(32.75862068965529, 7.5, 20.0, 1223)
-    femmesh.addNode(22.41379310344834, 7.5, 20.0, 1224)
-    femmesh.addNode(25.862068965517324, 7.5, 20.0, 1225)
-    femmesh.addNode(15.517241379310434, 7.5, 20.0, 1226)
-    femmesh.addNode(18.965517241379402, 7.5, 20.0, 1227)
-    femmesh.addNode(8.658090259326869, 7.497356164189088, 20.0, 1228)
-    femmesh.addNode(12.106366121395851, 7.497356164189088, 20.0, 1229)
-    femmesh.addNode(173.64579940589215, 10.0, 10.000000000000002, 1230)
-    femmesh.addNode(26.354200594107837, 10.0, 10.0, 1231)
-    femmesh.addNode(134.48275862068974, 10.0, 10.0, 1232)
-    femmesh.addNode(106.89655172413815, 10.0, 10.000000000000002, 1233)
-    femmesh.addNode(93.8213051815498, 10.0, 9.895795166697607, 1234)
-    femmesh.addNode(148.27586206896555, 10.0, 10.0, 1235)
-    femmesh.addNode(120.68965517241395, 10.0, 10.0, 1236)
-    femmesh.addNode(161.7405240831965, 10.0, 10.104204833302399, 1237)
-    femmesh.addNode(72.41379310344853, 10.0, 10.0, 1238)
-    femmesh.addNode(51.00628102534718, 10.0, 9.895795166697601, 1239)
-    femmesh.addNode(38.25947591680363, 10.0, 9.8957951666976, 1240)
-    femmesh.addNode(83.09770114942557, 10.0, 10.0, 1241)
-    femmesh.addNode(61.729885057471414, 10.0, 10.0, 1242)
-    femmesh.addNode(141.37931034482764, 10.0, 13.216409036860888, 1243)
-    femmesh.addNode(155.1724137931035, 10.0, 6.783590963139118, 1244)
-    femmesh.addNode(100.09977035324823, 10.0, 13.689749484950788, 1245)
-    femmesh.addNode(113.79310344827604, 10.0, 6.783590963139108, 1246)
-    femmesh.addNode(127.58620689655184, 10.0, 6.783590963139092, 1247)
-    femmesh.addNode(44.73482791721308, 10.0, 13.864199259429254, 1248)
-    femmesh.addNode(127.58620689655184, 10.0, 13.841638036675254, 1249)
-    femmesh.addNode(100.15393140215429, 10.0, 6.069443161766219, 1250)
-    femmesh.addNode(141.37931034482767, 10.0, 6.158361963324734, 1251)
-    femmesh.addNode(113.79310344827604, 10.0, 13.841638036675263, 1252)
-    femmesh.addNode(155.1602000788012, 10.0, 13.885719006725225, 1253)
-    femmesh.addNode(44.721576732972565, 10.0, 6.079478153362798, 1254)
-    femmesh.addNode(31.803141210551345, 10.0, 6.104361313889587, 1255)
-    femmesh.addNode(31.77218894623647, 10.0, 13.817371212522087, 1256)
-    femmesh.addNode(168.19685878944875, 10.0, 6.134134123404565, 1257)
-    femmesh.addNode(168.22781105376362, 10.0, 13.851397280539194, 1258)
-    femmesh.addNode(179.84729019863045, 10.0, 13.34284306554627, 1259)
-    femmesh.addNode(179.97608734405992, 10.0, 6.601940852049501, 1260)
-    femmesh.addNode(20.15270980136961, 10.0, 6.657156934453747, 1261)
-    femmesh.addNode(20.023912655940123, 10.0, 13.398059147950482, 1262)
-    femmesh.addNode(67.07183908045997, 10.0, 13.752477209671008, 1263)
-    femmesh.addNode(67.07183908045997, 10.0, 6.247522790328993, 1264)
-    femmesh.addNode(77.75574712643706, 10.0, 6.247522790328981, 1265)
-    femmesh.addNode(77.75574712643706, 10.0, 13.752477209671019, 1266)
-    femmesh.addNode(87.63003482426994, 10.0, 13.788662471157998, 1267)
-    femmesh.addNode(87.5628148402165, 10.0, 6.170030571471964, 1268)
-    femmesh.addNode(57.19755138262706, 10.0, 13.788662471157997, 1269)
-    femmesh.addNode(57.264771366680506, 10.0, 6.170030571471964, 1270)
-    femmesh.addNode(4.031122582597106, 10.0, 16.357240648225915, 1271)
-    femmesh.addNode(195.9688774174029, 10.0, 16.35724064822591, 1272)
-    femmesh.addNode(4.031122582597121, 10.0, 3.642759351774063, 1273)
-    femmesh.addNode(195.9688774174029, 10.0, 3.6427593517740613, 1274)
-    femmesh.addNode(134.48275862068974, 10.0, 4.405469678953629, 1275)
-    femmesh.addNode(106.89655172413815, 10.0, 15.594530321046367, 1276)
-    femmesh.addNode(148.27586206896555, 10.0, 4.405469678953632, 1277)
-    femmesh.addNode(106.89655172413815, 10.0, 4.405469678953634, 1278)
-    femmesh.addNode(134.48275862068974, 10.0, 15.59453032104637, 1279)
-    femmesh.addNode(161.85329325004884, 10.0, 15.568264224113364, 1280)
-    femmesh.addNode(120.68965517241395, 10.0, 15.594530321046369, 1281)
-    femmesh.addNode(120.68965517241395, 10.0, 4.40546967895363, 1282)
-    femmesh.addNode(148.27586206896555, 10.0, 15.59453032104637, 1283)
-    femmesh.addNode(161.8495455400463, 10.0, 4.604385983969216, 1284)
-    femmesh.addNode(72.41379310344853, 10.0, 15.500990883868404, 1285)
-    femmesh.addNode(72.41379310344853, 10.0, 4.499009116131594, 1286)
-    femmesh.addNode(37.93103448275877, 10.0, 15.594530321046388, 1287)
-    femmesh.addNode(38.129252565169004, 10.0, 4.4159269267899965, 1288)
-    femmesh.addNode(93.36334083200518, 10.0, 15.504912198238497, 1289)
-    femmesh.addNode(93.54898959512906, 10.0, 4.427053779987158, 1290)
-    femmesh.addNode(51.39614838602864, 10.0, 15.506668459615485, 1291)
-    femmesh.addNode(51.28818099741392, 10.0, 4.4290607783064715, 1292)
-    femmesh.addNode(25.805437417513303, 10.0, 15.209214472899802, 1293)
-    femmesh.addNode(25.813754233930638, 10.0, 4.789585433848215, 1294)
-    femmesh.addNode(174.18785719174173, 10.0, 15.208111285978362, 1295)
-    femmesh.addNode(174.19295115681433, 10.0, 4.78826081530962, 1296)
-    femmesh.addNode(17.061902521945584, 10.0, 17.022262010689666, 1297)
-    femmesh.addNode(17.136181094600673, 10.0, 2.9049995726880136, 1298)
-    femmesh.addNode(182.8638189053994, 10.0, 17.095000427312023, 1299)
-    femmesh.addNode(182.93809747805446, 10.0, 2.9777379893103397, 1300)
-    femmesh.addNode(82.70546356664141, 10.0, 5.313586815668062, 1301)
-    femmesh.addNode(82.71403754419924, 10.0, 14.681144439769433, 1302)
-    femmesh.addNode(62.11354866269777, 10.0, 14.681144439769431, 1303)
-    femmesh.addNode(62.12212264025561, 10.0, 5.3135868156680655, 1304)
-    femmesh.addNode(197.98443870870145, 10.0, 14.845286990779602, 1305)
-    femmesh.addNode(197.98443870870145, 10.0, 18.178620324112956, 1306)
-    femmesh.addNode(194.53616284663246, 10.0, 18.178620324112956, 1307)
-    femmesh.addNode(197.98443870870145, 10.0, 1.8213796758870302, 1308)
-    femmesh.addNode(197.98443870870145, 10.0, 5.154713009220356, 1309)
-    femmesh.addNode(194.53616284663246, 10.0, 1.8213796758870302, 1310)
-    femmesh.addNode(2.015561291298553, 10.0, 18.178620324112956, 1311)
-    femmesh.addNode(2.015561291298553, 10.0, 14.845286990779606, 1312)
-    femmesh.addNode(5.463837153367535, 10.0, 18.178620324112956, 1313)
-    femmesh.addNode(2.015561291298553, 10.0, 5.154713009220357, 1314)
-    femmesh.addNode(2.015561291298553, 10.0, 1.821379675887032, 1315)
-    femmesh.addNode(5.463837153367535, 10.0, 1.821379675887032, 1316)
-    femmesh.addNode(181.92364509931522, 10.0, 11.671421532773135, 1317)
-    femmesh.addNode(183.05317569373904, 10.0, 14.016915980177227, 1318)
-    femmesh.addNode(183.11757426645374, 10.0, 5.955475978620678, 1319)
-    femmesh.addNode(181.98804367202996, 10.0, 8.300970426024751, 1320)
-    femmesh.addNode(179.91168877134518, 10.0, 9.972391958797886, 1321)
-    femmesh.addNode(16.882425733546256, 10.0, 14.044524021379331, 1322)
-    femmesh.addNode(18.01195632797007, 10.0, 11.699029573975242, 1323)
-    femmesh.addNode(18.076354900684805, 10.0, 8.328578467226873, 1324)
-    femmesh.addNode(16.94682430626102, 10.0, 5.9830840198228, 1325)
-    femmesh.addNode(20.088311228654874, 10.0, 10.027608041202114, 1326)
-    femmesh.addNode(197.70290660370728, 10.0, 9.634984550685992, 1327)
-    femmesh.addNode(197.70290660370728, 10.0, 12.968317884019314, 1328)
-    femmesh.addNode(197.70290660370725, 10.0, 7.031682115980632, 1329)
-    femmesh.addNode(195.6873453124087, 10.0, 5.519728458534337, 1330)
-    femmesh.addNode(195.6873453124087, 10.0, 14.480271541465623, 1331)
-    femmesh.addNode(2.2970933962927518, 10.0, 10.365015449313955, 1332)
-    femmesh.addNode(2.2970933962927518, 10.0, 7.031682115980632, 1333)
-    femmesh.addNode(4.312654687591305, 10.0, 5.519728458534338, 1334)
-    femmesh.addNode(2.2970933962927376, 10.0, 12.968317884019314, 1335)
-    femmesh.addNode(4.312654687591291, 10.0, 14.480271541465624, 1336)
-    femmesh.addNode(186.23297887028588, 10.0, 17.345494447404093, 1337)
-    femmesh.addNode(188.77101107773103, 10.0, 17.92478373654547, 1338)
-    femmesh.addNode(184.56144004712348, 10.0, 15.892994661060103, 1339)
-    femmesh.addNode(184.5353577285618, 10.0, 18.54750021365601, 1340)
-    femmesh.addNode(181.35555455201492, 10.0, 15.218921746429146, 1341)
-    femmesh.addNode(193.6520015105704, 10.0, 16.103404060658427, 1342)
-    femmesh.addNode(192.21928693979999, 10.0, 17.92478373654547, 1343)
-    femmesh.addNode(193.65200151057036, 10.0, 3.8965959393415535, 1344)
-    femmesh.addNode(186.23297887028588, 10.0, 2.6545055525959267, 1345)
-    femmesh.addNode(188.77101107773098, 10.0, 2.0752162634545224, 1346)
-    femmesh.addNode(192.21928693979993, 10.0, 2.0752162634545224, 1347)
-    femmesh.addNode(184.5724970148893, 10.0, 1.4888689946551708, 1348)
-    femmesh.addNode(184.59857933345103, 10.0, 4.1433745472510966, 1349)
-    femmesh.addNode(181.4570924110572, 10.0, 4.78983942067992, 1350)
-    femmesh.addNode(11.228988922269025, 10.0, 17.92478373654547, 1351)
-    femmesh.addNode(13.767021129714166, 10.0, 17.345494447404093, 1352)
-    femmesh.addNode(15.427502985110749, 10.0, 18.511131005344833, 1353)
-    femmesh.addNode(15.401420666548987, 10.0, 15.856625452748924, 1354)
-    femmesh.addNode(18.542907588942853, 10.0, 15.210160579320075, 1355)
-    femmesh.addNode(6.347998489429614, 10.0, 16.103404060658427, 1356)
-    femmesh.addNode(7.780713060200043, 10.0, 17.92478373654547, 1357)
-    femmesh.addNode(6.347998489429642, 10.0, 3.8965959393415535, 1358)
-    femmesh.addNode(11.228988922269053, 10.0, 2.0752162634545224, 1359)
-    femmesh.addNode(13.76702112971418, 10.0, 2.6545055525959267, 1360)
-    femmesh.addNode(7.780713060200071, 10.0, 2.0752162634545224, 1361)
-    femmesh.addNode(15.43855995287656, 10.0, 4.107005338939933, 1362)
-    femmesh.addNode(15.464642271438294, 10.0, 1.4524997863440063, 1363)
-    femmesh.addNode(18.644445447985134, 10.0, 4.781078253570881, 1364)
-    femmesh.addNode(181.0870818664928, 10.0, 18.54750021365601, 1365)
-    femmesh.addNode(176.74910100966397, 10.0, 17.60405564298918, 1366)
-    femmesh.addNode(173.30082514759502, 10.0, 17.60405564298918, 1367)
-    femmesh.addNode(177.0175736951861, 10.0, 14.275477175762315, 1368)
-    femmesh.addNode(179.57881751310833, 10.0, 16.671421532773135, 1369)
-    femmesh.addNode(170.32080207860596, 10.0, 16.925698640269598, 1370)
-    femmesh.addNode(166.87252621653698, 10.0, 16.925698640269598, 1371)
-    femmesh.addNode(171.20783412275267, 10.0, 14.529754283258779, 1372)
-    femmesh.addNode(163.6852673146796, 10.0, 17.78413211205668, 1373)
-    femmesh.addNode(160.23699145261065, 10.0, 17.78413211205668, 1374)
-    femmesh.addNode(165.04055215190624, 10.0, 14.70983075232628, 1375)
-    femmesh.addNode(156.89044486698683, 10.0, 16.942859503362612, 1376)
-    femmesh.addNode(153.44216900491787, 10.0, 16.942859503362612, 1377)
-    femmesh.addNode(158.506746664425, 10.0, 14.726991615419294, 1378)
-    femmesh.addNode(150.00000000000006, 10.0, 17.797265160523185, 1379)
-    femmesh.addNode(146.55172413793107, 10.0, 17.797265160523185, 1380)
-    femmesh.addNode(151.71803107388337, 10.0, 14.740124663885798, 1381)
-    femmesh.addNode(143.10344827586212, 10.0, 16.608204518430444, 1382)
-    femmesh.addNode(139.65517241379317, 10.0, 16.608204518430444, 1383)
-    femmesh.addNode(144.8275862068966, 10.0, 14.40546967895363, 1384)
-    femmesh.addNode(136.2068965517242, 10.0, 17.797265160523185, 1385)
-    femmesh.addNode(132.7586206896553, 10.0, 17.797265160523185, 1386)
-    femmesh.addNode(137.9310344827587, 10.0, 14.40546967895363, 1387)
-    femmesh.addNode(129.31034482758633, 10.0, 16.920819018337628, 1388)
-    femmesh.addNode(125.86206896551738, 10.0, 16.920819018337628, 1389)
-    femmesh.addNode(131.03448275862078, 10.0, 14.718084178860813, 1390)
-    femmesh.addNode(122.41379310344843, 10.0, 17.797265160523185, 1391)
-    femmesh.addNode(118.96551724137947, 10.0, 17.797265160523185, 1392)
-    femmesh.addNode(124.1379310344829, 10.0, 14.718084178860812, 1393)
-    femmesh.addNode(115.51724137931052, 10.0, 16.92081901833763, 1394)
-    femmesh.addNode(112.06896551724157, 10.0, 16.92081901833763, 1395)
-    femmesh.addNode(117.241379310345, 10.0, 14.718084178860817, 1396)
-    femmesh.addNode(108.62068965517261, 10.0, 17.79726516052318, 1397)
-    femmesh.addNode(105.17241379310367, 10.0, 17.79726516052318, 1398)
-    femmesh.addNode(110.34482758620709, 10.0, 14.718084178860815, 1399)
-    femmesh.addNode(101.7740231076587, 10.0, 16.844874742475394, 1400)
-    femmesh.addNode(98.32574724558977, 10.0, 16.844874742475394, 1401)
-    femmesh.addNode(103.49816103869318, 10.0, 14.642139902998577, 1402)
-    femmesh.addNode(94.95753248496824, 10.0, 17.75245609911925, 1403)
-    femmesh.addNode(91.5092566228993, 10.0, 17.75245609911925, 1404)
-    femmesh.addNode(96.7315555926267, 10.0, 14.597330841594642, 1405)
-    femmesh.addNode(88.64260361903168, 10.0, 16.894331235579, 1406)
-    femmesh.addNode(85.19432775696269, 10.0, 16.894331235579, 1407)
-    femmesh.addNode(90.49668782813757, 10.0, 14.646787334698248, 1408)
-    femmesh.addNode(80.25718390804624, 10.0, 16.87623860483551, 1409)
-    femmesh.addNode(76.80890804597728, 10.0, 16.87623860483551, 1410)
-    femmesh.addNode(82.73632911692735, 10.0, 17.340572219884717, 1411)
-    femmesh.addNode(80.23489233531815, 10.0, 14.216810824720227, 1412)
-    femmesh.addNode(85.1720361842346, 10.0, 14.234903455463716, 1413)
-    femmesh.addNode(74.13793103448302, 10.0, 17.750495441934202, 1414)
-    femmesh.addNode(70.68965517241404, 10.0, 17.750495441934202, 1415)
-    femmesh.addNode(75.08477011494278, 10.0, 14.626734046769712, 1416)
-    femmesh.addNode(68.01867816091976, 10.0, 16.876238604835503, 1417)
-    femmesh.addNode(64.57040229885078, 10.0, 16.876238604835503, 1418)
-    femmesh.addNode(69.74281609195424, 10.0, 14.626734046769705, 1419)
-    femmesh.addNode(59.63325844993433, 10.0, 16.894331235579, 1420)
-    femmesh.addNode(56.18498258786535, 10.0, 16.894331235579, 1421)
-    femmesh.addNode(64.59269387157886, 10.0, 14.21681082472022, 1422)
-    femmesh.addNode(62.09125708996968, 10.0, 17.340572219884717, 1423)
-    femmesh.addNode(59.65555002266241, 10.0, 14.234903455463714, 1424)
-    femmesh.addNode(53.284281089566136, 10.0, 17.75333422980774, 1425)
-    femmesh.addNode(49.83600522749717, 10.0, 17.75333422980774, 1426)
-    femmesh.addNode(54.296849884327855, 10.0, 14.64766546538674, 1427)
-    femmesh.addNode(46.50534499308939, 10.0, 16.932099629714628, 1428)
-    femmesh.addNode(43.057069131020405, 10.0, 16.932099629714628, 1429)
-    femmesh.addNode(48.06548815162086, 10.0, 14.68543385952237, 1430)
-    femmesh.addNode(39.65517241379325, 10.0, 17.797265160523196, 1431)
-    femmesh.addNode(36.20689655172427, 10.0, 17.797265160523196, 1432)
-    femmesh.addNode(41.33293119998592, 10.0, 14.72936479023782, 1433)
-    femmesh.addNode(33.12747378346312, 10.0, 16.908685606261045, 1434)
-    femmesh.addNode(29.67919792139415, 10.0, 16.908685606261045, 1435)
-    femmesh.addNode(34.85161171449762, 10.0, 14.705950766784238, 1436)
-    femmesh.addNode(26.695822157032566, 10.0, 17.6046072364499, 1437)
-    femmesh.addNode(23.247546294963584, 10.0, 17.6046072364499, 1438)
-    femmesh.addNode(28.788813181874886, 10.0, 14.513292842710944, 1439)
-    femmesh.addNode(18.87577884717973, 10.0, 18.511131005344833, 1440)
-    femmesh.addNode(22.91467503672672, 10.0, 14.303636810425143, 1441)
-    femmesh.addNode(20.356783914176987, 10.0, 16.699029573975242, 1442)
-    femmesh.addNode(181.12422115282033, 10.0, 1.4888689946551708, 1443)
-    femmesh.addNode(173.30337213013132, 10.0, 2.39413040765481, 1444)
-    femmesh.addNode(176.75164799220028, 10.0, 2.39413040765481, 1445)
-    femmesh.addNode(177.08451925043713, 10.0, 5.695100833679561, 1446)
-    femmesh.addNode(179.64321608582307, 10.0, 3.300970426024751, 1447)
-    femmesh.addNode(166.85705008437958, 10.0, 3.067067061702282, 1448)
-    femmesh.addNode(170.30532594644853, 10.0, 3.067067061702282, 1449)
-    femmesh.addNode(171.19490497313154, 10.0, 5.461197469357092, 1450)
-    femmesh.addNode(160.23511759760936, 10.0, 2.302192991984608, 1451)
-    femmesh.addNode(163.68339345967834, 10.0, 2.302192991984608, 1452)
-    femmesh.addNode(165.02320216474754, 10.0, 5.36926005368689, 1453)
-    femmesh.addNode(153.448275862069, 10.0, 3.3917954815695595, 1454)
-    femmesh.addNode(156.89655172413796, 10.0, 3.3917954815695595, 1455)
-    femmesh.addNode(158.51097966657488, 10.0, 5.6939884735541675, 1456)
-    femmesh.addNode(146.55172413793107, 10.0, 2.2027348394768165, 1457)
-    femmesh.addNode(150.00000000000006, 10.0, 2.2027348394768165, 1458)
-    femmesh.addNode(151.72413793103453, 10.0, 5.594530321046375, 1459)
-    femmesh.addNode(139.6551724137932, 10.0, 3.0791809816623665, 1460)
-    femmesh.addNode(143.10344827586215, 10.0, 3.0791809816623665, 1461)
-    femmesh.addNode(144.82758620689663, 10.0, 5.281915821139183, 1462)
-    femmesh.addNode(132.7586206896553, 10.0, 2.2027348394768147, 1463)
-    femmesh.addNode(136.2068965517242, 10.0, 2.2027348394768147, 1464)
-    femmesh.addNode(137.93103448275872, 10.0, 5.281915821139181, 1465)
-    femmesh.addNode(125.86206896551738, 10.0, 3.391795481569546, 1466)
-    femmesh.addNode(129.31034482758633, 10.0, 3.391795481569546, 1467)
-    femmesh.addNode(131.03448275862078, 10.0, 5.594530321046361, 1468)
-    femmesh.addNode(118.96551724137947, 10.0, 2.2027348394768147, 1469)
-    femmesh.addNode(122.41379310344843, 10.0, 2.2027348394768147, 1470)
-    femmesh.addNode(124.1379310344829, 10.0, 5.594530321046362, 1471)
-    femmesh.addNode(112.06896551724157, 10.0, 3.391795481569554, 1472)
-    femmesh.addNode(115.51724137931052, 10.0, 3.391795481569554, 1473)
-    femmesh.addNode(117.241379310345, 10.0, 5.594530321046369, 1474)
-    femmesh.addNode(105.17241379310367, 10.0, 2.2027348394768165, 1475)
-    femmesh.addNode(108.62068965517261, 10.0, 2.2027348394768165, 1476)
-    femmesh.addNode(110.34482758620709, 10.0, 5.594530321046371, 1477)
-    femmesh.addNode(98.3528277700428, 10.0, 3.03472158088311, 1478)
-    femmesh.addNode(101.80110363211173, 10.0, 3.03472158088311, 1479)
-    femmesh.addNode(103.52524156314621, 10.0, 5.237456420359926, 1480)
-    femmesh.addNode(91.60208100446124, 10.0, 2.213526889993579, 1481)
-    femmesh.addNode(95.05035686653018, 10.0, 2.213526889993579, 1482)
-    femmesh.addNode(96.85146049864167, 10.0, 5.248248470876689, 1483)
-    femmesh.addNode(85.16071776493598, 10.0, 3.085015285735982, 1484)
-    femmesh.addNode(88.60899362700496, 10.0, 3.085015285735982, 1485)
-    femmesh.addNode(90.55590221767278, 10.0, 5.298542175729561, 1486)
-    femmesh.addNode(76.80890804597728, 10.0, 3.1237613951644905, 1487)
-    femmesh.addNode(80.25718390804624, 10.0, 3.1237613951644905, 1488)
-    femmesh.addNode(80.23060534653924, 10.0, 5.780554802998521, 1489)
-    femmesh.addNode(82.73204212814844, 10.0, 2.656793407834031, 1490)
-    femmesh.addNode(85.13413920342896, 10.0, 5.741808693570013, 1491)
-    femmesh.addNode(70.68965517241404, 10.0, 2.249504558065797, 1492)
-    femmesh.addNode(74.13793103448302, 10.0, 2.249504558065797, 1493)
-    femmesh.addNode(75.08477011494278, 10.0, 5.3732659532302876, 1494)
-    femmesh.addNode(64.57040229885078, 10.0, 3.1237613951644967, 1495)
-    femmesh.addNode(68.01867816091976, 10.0, 3.1237613951644967, 1496)
-    femmesh.addNode(69.74281609195424, 10.0, 5.373265953230294, 1497)
-    femmesh.addNode(56.21859257989207, 10.0, 3.085015285735982, 1498)
-    femmesh.addNode(59.66686844196105, 10.0, 3.085015285735982, 1499)
-    femmesh.addNode(62.0955440787486, 10.0, 2.6567934078340327, 1500)
-    femmesh.addNode(64.59698086035779, 10.0, 5.780554802998529, 1501)
-    femmesh.addNode(59.69344700346806, 10.0, 5.7418086935700146, 1502)
-    femmesh.addNode(49.782021533189805, 10.0, 2.2145303891532357, 1503)
-    femmesh.addNode(53.23029739525877, 10.0, 2.2145303891532357, 1504)
-    femmesh.addNode(54.27647618204721, 10.0, 5.299545674889218, 1505)
-    femmesh.addNode(43.05044353890015, 10.0, 3.039739076681399, 1506)
-    femmesh.addNode(46.49871940096913, 10.0, 3.039739076681399, 1507)
-    femmesh.addNode(48.00487886519324, 10.0, 5.254269465834635, 1508)
-    femmesh.addNode(36.30600559292938, 10.0, 2.2079634633949983, 1509)
-    femmesh.addNode(39.75428145499836, 10.0, 2.2079634633949983, 1510)
-    femmesh.addNode(41.42541464907079, 10.0, 5.247702540076397, 1511)
-    femmesh.addNode(29.69467405355158, 10.0, 3.0521806569447936, 1512)
-    femmesh.addNode(33.14294991562056, 10.0, 3.0521806569447936, 1513)
-    femmesh.addNode(34.96619688786018, 10.0, 5.260144120339792, 1514)
-    femmesh.addNode(23.25170470317225, 10.0, 2.3947927169241074, 1515)
-    femmesh.addNode(26.699980565241233, 10.0, 2.3947927169241074, 1516)
-    femmesh.addNode(28.808447722241, 10.0, 5.446973373868901, 1517)
-    femmesh.addNode(18.912918133507276, 10.0, 1.4524997863440063, 1518)
-    femmesh.addNode(22.983232017650124, 10.0, 5.723371184150981, 1519)
-    femmesh.addNode(20.421182486891738, 10.0, 3.3285784672268734, 1520)
-    femmesh.addNode(168.21233492160619, 10.0, 9.99276570197188, 1521)
-    femmesh.addNode(170.93680522982788, 10.0, 11.925698640269598, 1522)
-    femmesh.addNode(170.92132909767045, 10.0, 8.067067061702284, 1523)
-    femmesh.addNode(173.91937528135324, 10.0, 7.394130407654811, 1524)
-    femmesh.addNode(173.91682829881694, 10.0, 12.60405564298918, 1525)
-    femmesh.addNode(176.81094337497603, 10.0, 8.300970426024751, 1526)
-    femmesh.addNode(176.7465448022613, 10.0, 11.671421532773136, 1527)
-    femmesh.addNode(29.063194770172146, 10.0, 11.908685606261043, 1528)
-    femmesh.addNode(31.7876650783939, 10.0, 9.960866263205837, 1529)
-    femmesh.addNode(29.07867090232959, 10.0, 8.052180656944794, 1530)
-    femmesh.addNode(26.083977414019245, 10.0, 7.3947927169241074, 1531)
-    femmesh.addNode(26.079819005810577, 10.0, 12.604607236449901, 1532)
-    femmesh.addNode(23.18905662502398, 10.0, 11.699029573975242, 1533)
-    femmesh.addNode(23.25345519773873, 10.0, 8.328578467226873, 1534)
-    femmesh.addNode(141.37931034482767, 10.0, 9.68738550009281, 1535)
-    femmesh.addNode(137.93103448275872, 10.0, 8.079180981662367, 1536)
-    femmesh.addNode(137.9310344827587, 10.0, 11.608204518430444, 1537)
-    femmesh.addNode(134.48275862068974, 10.0, 12.797265160523185, 1538)
-    femmesh.addNode(127.58620689655184, 10.0, 10.312614499907173, 1539)
-    femmesh.addNode(131.03448275862078, 10.0, 11.920819018337628, 1540)
-    femmesh.addNode(131.03448275862078, 10.0, 8.391795481569545, 1541)
-    femmesh.addNode(134.48275862068974, 10.0, 7.202734839476815, 1542)
-    femmesh.addNode(103.52524156314621, 10.0, 8.03472158088311, 1543)
-    femmesh.addNode(100.12685087770126, 10.0, 9.879596323358504, 1544)
-    femmesh.addNode(103.49816103869318, 10.0, 11.844874742475394, 1545)
-    femmesh.addNode(106.89655172413815, 10.0, 12.797265160523185, 1546)
-    femmesh.addNode(110.34482758620709, 10.0, 11.920819018337632, 1547)
-    femmesh.addNode(113.79310344827604, 10.0, 10.312614499907186, 1548)
-    femmesh.addNode(110.34482758620709, 10.0, 8.391795481569556, 1549)
-    femmesh.addNode(106.89655172413815, 10.0, 7.202734839476818, 1550)
-    femmesh.addNode(96.98761829185204, 10.0, 7.982619164231913, 1551)
-    femmesh.addNode(96.96053776739902, 10.0, 11.792772325824197, 1552)
-    femmesh.addNode(93.59232300677749, 10.0, 12.700353682468052, 1553)
-    femmesh.addNode(93.68514738833943, 10.0, 7.161424473342382, 1554)
-    femmesh.addNode(90.69206001088315, 10.0, 8.032912869084786, 1555)
-    femmesh.addNode(87.59642483224323, 10.0, 9.97934652131498, 1556)
-    femmesh.addNode(90.72567000290988, 10.0, 11.842228818927802, 1557)
-    femmesh.addNode(144.82758620689663, 10.0, 8.079180981662367, 1558)
-    femmesh.addNode(144.8275862068966, 10.0, 11.608204518430444, 1559)
-    femmesh.addNode(148.27586206896555, 10.0, 12.797265160523185, 1560)
-    femmesh.addNode(151.71803107388337, 10.0, 11.942859503362612, 1561)
-    femmesh.addNode(155.16630693595235, 10.0, 10.334654984932172, 1562)
-    femmesh.addNode(151.72413793103453, 10.0, 8.39179548156956, 1563)
-    femmesh.addNode(148.27586206896555, 10.0, 7.2027348394768165, 1564)
-    femmesh.addNode(117.241379310345, 10.0, 11.920819018337632, 1565)
-    femmesh.addNode(117.241379310345, 10.0, 8.391795481569554, 1566)
-    femmesh.addNode(120.68965517241395, 10.0, 7.202734839476815, 1567)
-    femmesh.addNode(124.1379310344829, 10.0, 11.920819018337628, 1568)
-    femmesh.addNode(124.1379310344829, 10.0, 8.391795481569545, 1569)
-    femmesh.addNode(120.68965517241395, 10.0, 12.797265160523185, 1570)
-    femmesh.addNode(158.45036208099884, 10.0, 11.994961920013811, 1571)
-    femmesh.addNode(158.45646893815, 10.0, 8.443897898220758, 1572)
-    femmesh.addNode(161.7950348116214, 10.0, 7.354295408635807, 1573)
-    femmesh.addNode(161.79690866662267, 10.0, 12.83623452870788, 1574)
-    femmesh.addNode(164.98416756848007, 10.0, 11.977801056920796, 1575)
-    femmesh.addNode(164.96869143632262, 10.0, 8.119169478353482, 1576)
-    femmesh.addNode(69.74281609195424, 10.0, 8.123761395164497, 1577)
-    femmesh.addNode(67.07183908045997, 10.0, 10.0, 1578)
-    femmesh.addNode(69.74281609195424, 10.0, 11.876238604835503, 1579)
-    femmesh.addNode(72.41379310344853, 10.0, 12.750495441934202, 1580)
-    femmesh.addNode(72.41379310344853, 10.0, 7.249504558065797, 1581)
-    femmesh.addNode(75.08477011494278, 10.0, 11.87623860483551, 1582)
-    femmesh.addNode(77.75574712643706, 10.0, 10.0, 1583)
-    femmesh.addNode(75.08477011494278, 10.0, 8.12376139516449, 1584)
-    femmesh.addNode(47.86392887915987, 10.0, 7.9876366600302, 1585)
-    femmesh.addNode(44.72820232509282, 10.0, 9.971838706396026, 1586)
-    femmesh.addNode(47.87055447128013, 10.0, 11.879997213063428, 1587)
-    femmesh.addNode(51.20121470568791, 10.0, 12.701231813156543, 1588)
-    femmesh.addNode(51.14723101138055, 10.0, 7.162427972502036, 1589)
-    femmesh.addNode(57.23116137465378, 10.0, 9.97934652131498, 1590)
-    femmesh.addNode(54.13552619601384, 10.0, 8.032912869084782, 1591)
-    femmesh.addNode(54.101916203987116, 10.0, 11.842228818927799, 1592)
-    femmesh.addNode(41.490526324888094, 10.0, 7.987636660030199, 1593)
-    femmesh.addNode(41.49715191700835, 10.0, 11.879997213063426, 1594)
-    femmesh.addNode(38.0952551997812, 10.0, 12.745162743871994, 1595)
-    femmesh.addNode(38.19436424098632, 10.0, 7.155861046743798, 1596)
-    femmesh.addNode(35.01583243152005, 10.0, 11.856583189609843, 1597)
-    femmesh.addNode(35.031308563677484, 10.0, 8.000078240293593, 1598)
-    femmesh.addNode(80.42672413793132, 10.0, 11.87623860483551, 1599)
-    femmesh.addNode(80.42672413793132, 10.0, 8.12376139516449, 1600)
-    femmesh.addNode(82.9015823580335, 10.0, 7.656793407834031, 1601)
-    femmesh.addNode(82.90586934681241, 10.0, 12.340572219884717, 1602)
-    femmesh.addNode(85.33025799482104, 10.0, 8.085015285735981, 1603)
-    femmesh.addNode(85.36386798684777, 10.0, 11.894331235579, 1604)
-    femmesh.addNode(64.4008620689657, 10.0, 8.123761395164497, 1605)
-    femmesh.addNode(64.4008620689657, 10.0, 11.876238604835503, 1606)
-    femmesh.addNode(61.92171686008459, 10.0, 12.340572219884717, 1607)
-    femmesh.addNode(61.926003848863516, 10.0, 7.656793407834033, 1608)
-    femmesh.addNode(59.497328212075956, 10.0, 8.085015285735981, 1609)
-    femmesh.addNode(59.46371822004924, 10.0, 11.894331235579, 1610)
-    femmesh.addNode(23.253455197738717, 5.0, 8.328578467226876, 1611)
-    femmesh.addNode(20.15270980136959, 5.0, 6.657156934453738, 1612)
-    femmesh.addNode(18.076354900684784, 2.5000000000000067, 8.328578467226864, 1613)
-    femmesh.addNode(18.076354900684805, 7.500000000000007, 8.328578467226873, 1614)
-    femmesh.addNode(21.17710029705391, 2.5000000000000067, 10.0, 1615)
-    femmesh.addNode(176.74654480226133, 5.0, 11.671421532773135, 1616)
-    femmesh.addNode(178.82289970294607, 2.5000000000000067, 9.999999999999998, 1617)
-    femmesh.addNode(181.92364509931522, 7.500000000000007, 11.671421532773135, 1618)
-    femmesh.addNode(179.84729019863045, 5.0, 13.342843065546273, 1619)
-    femmesh.addNode(181.92364509931522, 2.5000000000000067, 11.671421532773136, 1620)
-    femmesh.addNode(26.35420059410783, 5.0, 10.000000000000002, 1621)
-    femmesh.addNode(21.17710029705392, 7.500000000000007, 10.0, 1622)
-    femmesh.addNode(173.64579940589215, 5.0, 10.0, 1623)
-    femmesh.addNode(178.82289970294607, 7.500000000000007, 10.0, 1624)
-    femmesh.addNode(18.01195632797006, 7.500000000000007, 11.69902957397524, 1625)
-    femmesh.addNode(20.02391265594011, 5.0, 13.398059147950482, 1626)
-    femmesh.addNode(23.189056625023966, 5.0, 11.699029573975242, 1627)
-    femmesh.addNode(18.011956327970047, 2.5000000000000067, 11.69902957397524, 1628)
-    femmesh.addNode(181.98804367202996, 7.500000000000007, 8.30097042602475, 1629)
-    femmesh.addNode(176.81094337497603, 5.0, 8.30097042602475, 1630)
-    femmesh.addNode(179.97608734405992, 5.0, 6.601940852049512, 1631)
-    femmesh.addNode(181.98804367202996, 2.5000000000000067, 8.30097042602476, 1632)
-    femmesh.addNode(80.23060534653914, 5.0, 5.782724832846558, 1633)
-    femmesh.addNode(82.70546356664133, 5.0, 5.315756845516098, 1634)
-    femmesh.addNode(82.90158235803341, 5.0, 7.6589634376820666, 1635)
-    femmesh.addNode(82.92597109748897, 5.0, 12.281593106539752, 1636)
-    femmesh.addNode(80.25499408599471, 5.0, 14.157831711375263, 1637)
-    femmesh.addNode(82.7341392948758, 5.0, 14.622165326424469, 1638)
-    femmesh.addNode(85.13413920342887, 5.0, 5.758821727578584, 1639)
-    femmesh.addNode(85.33025799482095, 5.0, 8.102028319744553, 1640)
-    femmesh.addNode(85.19213793491116, 5.0, 14.175924342118751, 1641)
-    femmesh.addNode(15.87798246762031, 7.108187218137048, 4.538237704903613, 1642)
-    femmesh.addNode(17.38624682100478, 7.108187218137048, 6.4143163857864804, 1643)
-    femmesh.addNode(16.2709971510076, 8.750000000000004, 5.150848568991344, 1644)
-    femmesh.addNode(17.779261504392068, 8.750000000000004, 7.026927249874211, 1645)
-    femmesh.addNode(72.21307841322057, 5.0, 4.498257394486008, 1646)
-    femmesh.addNode(75.0847701149427, 5.0, 5.373265953230307, 1647)
-    femmesh.addNode(75.0847701149427, 5.0, 8.123761395164511, 1648)
-    femmesh.addNode(72.21307841322057, 5.0, 7.248752836420211, 1649)
-    femmesh.addNode(83.09770114942557, 5.0, 9.999999999999996, 1650)
-    femmesh.addNode(80.42672413793132, 5.0, 8.123761395164486, 1651)
-    femmesh.addNode(182.28513706832268, 8.750000000000004, 6.9993192086720875, 1652)
-    femmesh.addNode(183.76614213531997, 8.750000000000004, 5.187217777302507, 1653)
-    femmesh.addNode(184.15915681870726, 7.108187218137047, 4.5746069132147795, 1654)
-    femmesh.addNode(182.67815175171, 7.108187218137047, 6.38670834458436, 1655)
-    femmesh.addNode(80.42672413793132, 5.0, 11.876238604835507, 1656)
-    femmesh.addNode(182.6490936697836, 2.1185639620408208, 13.627544175762488, 1657)
-    femmesh.addNode(182.22073849560797, 3.7500000000000036, 12.973072750125812, 1658)
-    femmesh.addNode(69.54210140172628, 5.0, 5.372514231584708, 1659)
-    femmesh.addNode(85.36386798684777, 5.0, 11.894331235578996, 1660)
-    femmesh.addNode(162.07988537533566, 5.0, 15.546828059532219, 1661)
-    femmesh.addNode(165.26714427719307, 5.0, 14.688394587745133, 1662)
-    femmesh.addNode(165.3430960213238, 5.0, 11.925698640269598, 1663)
-    femmesh.addNode(162.1558371194664, 5.0, 12.784132112056682, 1664)
-    femmesh.addNode(182.22073849560797, 8.750000000000004, 12.973072750125812, 1665)
-    femmesh.addNode(165.32761988916636, 5.0, 8.067067061702284, 1666)
-    femmesh.addNode(162.15396326446512, 5.0, 7.302192991984609, 1667)
-    femmesh.addNode(162.06552859979166, 5.0, 4.5341023832946235, 1668)
-    femmesh.addNode(165.2391852244929, 5.0, 5.298976453012298, 1669)
-    femmesh.addNode(84.45618005918277, 7.499999999999983, 2.656793407834031, 1670)
-    femmesh.addNode(86.88485569597023, 2.499999999999983, 3.1020283197445533, 1671)
-    femmesh.addNode(84.45618005918269, 2.499999999999983, 2.658963437682067, 1672)
-    femmesh.addNode(72.1546934865902, 5.0, 10.05210241665118, 1673)
-    femmesh.addNode(72.1546934865902, 5.0, 12.802597858585383, 1674)
-    femmesh.addNode(75.08477011494269, 5.0, 14.626734046769638, 1675)
-    femmesh.addNode(75.08477011494269, 5.0, 11.876238604835436, 1676)
-    femmesh.addNode(81.00790419711373, 2.499999999999985, 2.658963437682067, 1677)
-    femmesh.addNode(78.53304597701164, 7.499999999999985, 3.1237613951644905, 1678)
-    femmesh.addNode(81.00790419711382, 7.499999999999985, 2.656793407834031, 1679)
-    femmesh.addNode(87.59642483224313, 5.0, 9.996359555323552, 1680)
-    femmesh.addNode(173.91937528135327, 5.0, 7.394130407654809, 1681)
-    femmesh.addNode(177.12590078638374, 5.0, 5.678059393137207, 1682)
-    femmesh.addNode(174.23433269276092, 5.0, 4.771219374767267, 1683)
-    femmesh.addNode(63.85250702607682, 5.0, 5.724693778119397, 1684)
-    femmesh.addNode(63.65638823468473, 5.0, 8.067900370285365, 1685)
-    femmesh.addNode(60.73033460055775, 5.0, 7.708895824485229, 1686)
-    femmesh.addNode(60.534215809165644, 5.0, 10.052102416651195, 1687)
-    femmesh.addNode(93.59232300677746, 5.0, 12.804558515770463, 1688)
-    femmesh.addNode(93.44749407175705, 5.0, 15.528883914184311, 1689)
-    femmesh.addNode(96.96053776739899, 5.0, 11.89697715912661, 1690)
-    femmesh.addNode(96.81570883237858, 5.0, 14.621302557540456, 1691)
-    femmesh.addNode(93.4763212010063, 5.0, 4.460587289039939, 1692)
-    femmesh.addNode(96.77449479756451, 5.0, 5.287828554765227, 1693)
-    femmesh.addNode(96.91065259077489, 5.0, 8.022199248120451, 1694)
-    femmesh.addNode(93.61247899421667, 5.0, 7.194957982395163, 1695)
-    femmesh.addNode(72.21187259629558, 5.0, 15.525962007753474, 1696)
-    femmesh.addNode(173.91682829881694, 5.0, 12.60405564298918, 1697)
-    femmesh.addNode(174.22894712383743, 5.0, 15.223331283167376, 1698)
-    femmesh.addNode(177.0586636272818, 5.0, 14.29069717295133, 1699)
-    femmesh.addNode(84.46046704796183, 7.5, 17.340572219884717, 1700)
-    femmesh.addNode(86.91846568799718, 7.5, 16.894331235579, 1701)
-    femmesh.addNode(84.48056879863839, 2.5, 17.281593106539752, 1702)
-    femmesh.addNode(182.8112197975273, 7.5, 18.54750021365601, 1703)
-    femmesh.addNode(181.3029554441428, 7.5, 16.671421532773135, 1704)
-    femmesh.addNode(183.67640374112034, 6.2500000000000036, 16.301651217352678, 1705)
-    femmesh.addNode(183.72900284899242, 8.750000000000004, 14.849151431008687, 1706)
-    femmesh.addNode(25.804316108744956, 5.0, 15.210864334125095, 1707)
-    femmesh.addNode(26.079819005810563, 5.0, 12.604607236449903, 1708)
-    femmesh.addNode(22.9146750367267, 5.0, 14.303636810425143, 1709)
-    femmesh.addNode(115.53953295203847, 5.0, 6.051223261684847, 1710)
-    femmesh.addNode(118.98780881410742, 5.0, 7.659427780115293, 1711)
-    femmesh.addNode(118.79597701149419, 5.0, 10.000000000000004, 1712)
-    femmesh.addNode(115.34770114942523, 5.0, 8.391795481569558, 1713)
-    femmesh.addNode(26.08397741401923, 5.0, 7.394792716924109, 1714)
-    femmesh.addNode(25.810746210689274, 5.0, 4.791179937169218, 1715)
-    femmesh.addNode(22.98022399440876, 5.0, 5.724965687471984, 1716)
-    femmesh.addNode(153.41827746055733, 5.0, 6.0496739043276, 1717)
-    femmesh.addNode(149.97000159848835, 5.0, 7.657878422758041, 1718)
-    femmesh.addNode(150.16954022988506, 5.0, 9.999999999999996, 1719)
-    femmesh.addNode(153.61781609195404, 5.0, 8.391795481569554, 1720)
-    femmesh.addNode(46.472140839462, 5.0, 5.6987025143634575, 1721)
-    femmesh.addNode(49.614492985649306, 5.0, 7.606861021030859, 1722)
-    femmesh.addNode(49.81061177704137, 5.0, 9.947897583348801, 1723)
-    femmesh.addNode(46.66825963085407, 5.0, 8.0397390766814, 1724)
-    femmesh.addNode(60.726047611778824, 5.0, 12.392674636535912, 1725)
-    femmesh.addNode(63.842190952672574, 5.0, 14.289564027494464, 1726)
-    femmesh.addNode(63.6503591500594, 5.0, 11.948991807609747, 1727)
-    femmesh.addNode(93.82130518154977, 5.0, 10.000000000000018, 1728)
-    femmesh.addNode(100.0498851766241, 5.0, 9.919176407247042, 1729)
-    femmesh.addNode(46.50315517103782, 5.0, 14.213692736254396, 1730)
-    femmesh.addNode(49.638881725104866, 5.0, 12.22949068988857, 1731)
-    femmesh.addNode(46.674885222974325, 5.0, 11.932099629714628, 1732)
-    femmesh.addNode(115.5438199408174, 5.0, 14.264025610503595, 1733)
-    femmesh.addNode(118.99209580288635, 5.0, 12.343206592165963, 1734)
-    femmesh.addNode(115.34770114942523, 5.0, 11.920819018337635, 1735)
-    femmesh.addNode(153.41688507218572, 5.0, 14.28438111130584, 1736)
-    femmesh.addNode(149.97471606726788, 5.0, 12.341521607943228, 1737)
-    femmesh.addNode(153.6117092348029, 5.0, 11.942859503362609, 1738)
-    femmesh.addNode(106.68917420472013, 2.5, 17.77758122985055, 1739)
-    femmesh.addNode(103.24089834265118, 2.5, 17.77758122985055, 1740)
-    femmesh.addNode(106.89655172413815, 7.5, 17.79726516052318, 1741)
-    femmesh.addNode(103.4482758620692, 7.5, 17.79726516052318, 1742)
-    femmesh.addNode(106.68917420472013, 5.0, 15.574846390373734, 1743)
-    femmesh.addNode(159.16212726518458, 5.0, 5.395714794724868, 1744)
-    femmesh.addNode(171.01662151242627, 5.0, 11.911705299419943, 1745)
-    femmesh.addNode(170.99116834494401, 5.0, 8.066025153809818, 1746)
-    femmesh.addNode(31.7453631001313, 5.0, 6.134988533679475, 1747)
-    femmesh.addNode(34.77220894681919, 5.0, 8.052180656944795, 1748)
-    femmesh.addNode(34.75673281466175, 5.0, 11.908685606261045, 1749)
-    femmesh.addNode(31.72988696797386, 5.0, 9.991493482995725, 1750)
-    femmesh.addNode(29.020892791909546, 5.0, 8.08280787673468, 1751)
-    femmesh.addNode(29.063194770172146, 5.0, 11.908685606261045, 1752)
-    femmesh.addNode(168.29215120420457, 5.0, 9.978772361122223, 1753)
-    femmesh.addNode(168.26669803672232, 5.0, 6.1330922155121, 1754)
-    femmesh.addNode(69.48371647509592, 5.0, 11.928341021486684, 1755)
-    femmesh.addNode(31.750650847414143, 5.0, 13.849061746937505, 1756)
-    femmesh.addNode(168.307627336362, 5.0, 13.837403939689537, 1757)
-    femmesh.addNode(106.89655172413808, 7.500000000000035, 2.202734839476817, 1758)
-    femmesh.addNode(103.44827586206915, 7.50000000000006, 2.202734839476817, 1759)
-    femmesh.addNode(106.74469966728888, 2.5000000000000346, 2.2472499265700225, 1760)
-    femmesh.addNode(103.29642380521997, 2.5000000000000604, 2.2472499265700225, 1761)
-    femmesh.addNode(106.74469966728896, 5.0, 4.449984766046839, 1762)
-    femmesh.addNode(90.69206001088307, 5.0, 8.049925903093357, 1763)
-    femmesh.addNode(90.72567000290984, 5.0, 11.946433652230215, 1764)
-    femmesh.addNode(127.79348659003838, 2.5, 17.752527422477044, 1765)
-    femmesh.addNode(131.2417624521073, 2.5, 17.752527422477044, 1766)
-    femmesh.addNode(131.2417624521073, 5.0, 15.54979258300023, 1767)
-    femmesh.addNode(134.48275862068974, 7.5, 17.797265160523185, 1768)
-    femmesh.addNode(131.03448275862078, 7.5, 17.797265160523185, 1769)
-    femmesh.addNode(141.17203065134106, 2.5, 17.752527422477048, 1770)
-    femmesh.addNode(137.7237547892721, 2.5, 17.752527422477048, 1771)
-    femmesh.addNode(137.7237547892721, 5.0, 15.549792583000233, 1772)
-    femmesh.addNode(137.9310344827587, 7.5, 17.797265160523185, 1773)
-    femmesh.addNode(60.53196330209929, 5.0, 4.90319383949301, 1774)
-    femmesh.addNode(134.48275862068965, 7.500000000000009, 2.2027348394768147, 1775)
-    femmesh.addNode(131.03448275862073, 7.500000000000012, 2.2027348394768147, 1776)
-    femmesh.addNode(127.79348659003821, 2.500000000000013, 2.2301679920351503, 1777)
-    femmesh.addNode(131.24176245210725, 5.0, 4.432902831511965, 1778)
-    femmesh.addNode(131.24176245210717, 2.5000000000000093, 2.2301679920351503, 1779)
-    femmesh.addNode(137.9310344827586, 7.499999999999995, 2.2027348394768147, 1780)
-    femmesh.addNode(137.723754789272, 5.0, 4.432902831511943, 1781)
-    femmesh.addNode(141.1720306513409, 2.4999999999999947, 2.2301679920351285, 1782)
-    femmesh.addNode(137.72375478927194, 2.5000000000000093, 2.2301679920351285, 1783)
-    femmesh.addNode(90.48323382355002, 5.0, 5.332075684782342, 1784)
-    femmesh.addNode(69.54089558480129, 5.0, 14.651705170654777, 1785)
-    femmesh.addNode(77.75574712643697, 5.0, 6.2475227903290005, 1786)
-    femmesh.addNode(77.75574712643694, 5.0, 13.752477209670946, 1787)
-    femmesh.addNode(100.04988517662423, 5.0, 13.765693760812997, 1788)
-    femmesh.addNode(38.00037629994533, 5.0, 9.947897583348801, 1789)
-    femmesh.addNode(60.58657786309214, 5.0, 15.122634592804202, 1790)
-    femmesh.addNode(34.851611714497615, 5.0, 14.70595076678423, 1791)
-    femmesh.addNode(96.76582365575459, 2.5, 17.776427815065063, 1792)
-    femmesh.addNode(96.6816704160027, 7.5, 17.75245609911925, 1793)
-    femmesh.addNode(93.23339455393376, 7.5, 17.75245609911925, 1794)
-    femmesh.addNode(93.31754779368563, 2.5, 17.776427815065063, 1795)
-    femmesh.addNode(118.99209580288635, 2.5, 17.343206592165963, 1796)
-    femmesh.addNode(115.5438199408174, 2.5, 17.343206592165963, 1797)
-    femmesh.addNode(120.68965517241395, 7.5, 17.797265160523185, 1798)
-    femmesh.addNode(117.241379310345, 7.5, 17.797265160523185, 1799)
-    femmesh.addNode(118.99209580288635, 5.0, 15.140471752689146, 1800)
-    femmesh.addNode(93.25355054137283, 2.5000000000000115, 2.24706039904636, 1801)
-    femmesh.addNode(96.70182640344186, 2.5000000000000604, 2.24706039904636, 1802)
-    femmesh.addNode(96.77449479756461, 7.50000000000006, 2.213526889993579, 1803)
-    femmesh.addNode(93.3262189354956, 7.5000000000000115, 2.213526889993579, 1804)
-    femmesh.addNode(103.13923258584929, 5.0, 11.896977159126546, 1805)
-    femmesh.addNode(49.755442971682676, 5.0, 4.873493826835294, 1806)
-    femmesh.addNode(100.07696570107713, 5.0, 6.1090232456547575, 1807)
-    femmesh.addNode(103.16631311030231, 5.0, 8.086823997534262, 1808)
-    femmesh.addNode(34.867087846654975, 5.0, 5.254915496421614, 1809)
-    femmesh.addNode(100.04988517662423, 7.5, 16.844874742475394, 1810)
-    femmesh.addNode(90.49668782813754, 5.0, 14.661673739455745, 1811)
-    femmesh.addNode(162.09945253604025, 5.0, 10.0521024166512, 1812)
-    femmesh.addNode(52.04316862243686, 5.0, 8.049925903093335, 1813)
-    femmesh.addNode(55.17241379310352, 5.0, 6.1870436054805165, 1814)
-    femmesh.addNode(55.17241379310353, 5.0, 9.999999999999996, 1815)
-    femmesh.addNode(58.301658963770194, 5.0, 8.137117702387178, 1816)
-    femmesh.addNode(100.00000000000007, 2.5000000000000604, 3.0743016647716477, 1817)
-    femmesh.addNode(49.833815405445606, 5.0, 15.034927336347511, 1818)
-    femmesh.addNode(58.26804897174347, 5.0, 11.946433652230194, 1819)
-    femmesh.addNode(58.781246809557715, 2.4999999999999902, 2.2464004316589774, 1820)
-    femmesh.addNode(62.22952267162668, 2.499999999999988, 2.2464004316589774, 1821)
-    femmesh.addNode(63.819682009783, 7.499999999999988, 2.6567934078340327, 1822)
-    femmesh.addNode(60.37140614771404, 7.49999999999999, 2.6567934078340327, 1823)
-    femmesh.addNode(52.076778614463606, 5.0, 11.857115223685287, 1824)
-    femmesh.addNode(148.27586206896555, 7.50000000000003, 2.202734839476816, 1825)
-    femmesh.addNode(151.72413793103448, 7.500000000000005, 2.202734839476816, 1826)
-    femmesh.addNode(149.97000159848835, 5.0, 4.860613262234857, 1827)
-    femmesh.addNode(153.4182774605573, 2.5000000000000053, 2.657878422758041, 1828)
-    femmesh.addNode(149.97000159848835, 2.5000000000000298, 2.657878422758041, 1829)
-    femmesh.addNode(153.42299192933686, 2.5, 17.34152160794323, 1830)
-    femmesh.addNode(149.97471606726788, 2.5, 17.34152160794323, 1831)
-    femmesh.addNode(151.72413793103453, 7.5, 17.797265160523185, 1832)
-    femmesh.addNode(148.27586206896555, 7.5, 17.797265160523185, 1833)
-    femmesh.addNode(149.97471606726788, 5.0, 15.138786768466414, 1834)
-    femmesh.addNode(120.68965517241385, 7.500000000000007, 2.202734839476815, 1835)
-    femmesh.addNode(117.24137931034491, 7.500000000000026, 2.202734839476815, 1836)
-    femmesh.addNode(115.5395329520384, 2.5000000000000258, 2.6594277801152932, 1837)
-    femmesh.addNode(118.98780881410742, 5.0, 4.862162619592109, 1838)
-    femmesh.addNode(118.98780881410732, 2.5000000000000067, 2.6594277801152932, 1839)
-    femmesh.addNode(62.28842422139854, 2.5, 17.782062372919487, 1840)
-    femmesh.addNode(63.81539502100417, 7.5, 17.340572219884717, 1841)
-    femmesh.addNode(58.84014835932956, 2.5, 17.782062372919487, 1842)
-    femmesh.addNode(60.36711915893519, 7.5, 17.340572219884717, 1843)
-    femmesh.addNode(55.17241379310355, 5.0, 13.803548875915485, 1844)
-    femmesh.addNode(87.56281484021642, 5.0, 6.187043605480535, 1845)
-    femmesh.addNode(49.97342143849298, 2.499999999999992, 2.6589634376820586, 1846)
-    femmesh.addNode(46.52514557642401, 2.499999999999994, 2.6589634376820586, 1847)
-    femmesh.addNode(48.05788360215526, 7.499999999999994, 2.2145303891532357, 1848)
-    femmesh.addNode(51.506159464224226, 7.499999999999992, 2.2145303891532357, 1849)
-    femmesh.addNode(38.03014352396383, 7.499999999999995, 2.2079634633949983, 1850)
-    femmesh.addNode(37.93103448275863, 2.4999999999999942, 2.20273483947682, 1851)
-    femmesh.addNode(38.0301435239638, 5.0, 4.410698302871818, 1852)
-    femmesh.addNode(34.867087846655, 7.499999999999995, 3.0521806569447936, 1853)
-    femmesh.addNode(48.11186729646268, 7.5, 17.75333422980774, 1854)
-    femmesh.addNode(46.54953431587964, 2.5, 17.28159310653977, 1855)
-    femmesh.addNode(51.560143158531645, 7.5, 17.75333422980774, 1856)
-    femmesh.addNode(49.99781017794861, 2.5, 17.28159310653977, 1857)
-    femmesh.addNode(81.01219118589286, 7.5, 17.340572219884717, 1858)
-    femmesh.addNode(81.03229293656942, 2.5, 17.281593106539752, 1859)
-    femmesh.addNode(87.63003482426991, 5.0, 13.803548875915496, 1860)
-    femmesh.addNode(103.37338950629703, 5.0, 5.281971507453132, 1861)
-    femmesh.addNode(37.93103448275876, 7.5, 17.797265160523196, 1862)
-    femmesh.addNode(34.851611714497615, 7.5, 16.908685606261045, 1863)
-    femmesh.addNode(37.93103448275876, 2.5, 17.79726516052319, 1864)
-    femmesh.addNode(37.93103448275876, 5.0, 15.594530321046381, 1865)
-    femmesh.addNode(103.29078351927518, 5.0, 14.622455972325945, 1866)
-    femmesh.addNode(66.327365246179, 5.0, 9.944138975120868, 1867)
-    femmesh.addNode(66.32133616155367, 5.0, 13.82523041244525, 1868)
-    femmesh.addNode(58.10328766531174, 5.0, 5.331415717394959, 1869)
-    femmesh.addNode(161.96112938364513, 7.5, 17.78413211205668, 1870)
-    femmesh.addNode(162.18772150893196, 2.5, 17.762695947475535, 1871)
-    femmesh.addNode(165.1483882855025, 7.5, 16.925698640269598, 1872)
-    femmesh.addNode(44.00390821148008, 5.0, 10.05586102487911, 1873)
-    femmesh.addNode(43.99728261935982, 5.0, 6.163500471845882, 1874)
-    femmesh.addNode(155.17241379310343, 7.500000000000005, 3.391795481569559, 1875)
-    femmesh.addNode(72.21307841322046, 2.4999999999999862, 2.248752836420211, 1876)
-    femmesh.addNode(75.08477011494259, 2.4999999999999862, 3.12376139516451, 1877)
-    femmesh.addNode(72.41379310344841, 7.499999999999986, 2.249504558065797, 1878)
-    femmesh.addNode(113.79310344827596, 7.500000000000026, 3.391795481569554, 1879)
-    femmesh.addNode(28.76727508305256, 5.0, 14.544983377126364, 1880)
-    femmesh.addNode(72.21187259629558, 2.5, 17.775466565819272, 1881)
-    femmesh.addNode(72.41379310344853, 7.5, 17.750495441934202, 1882)
-    femmesh.addNode(75.08477011494269, 2.5, 16.876238604835436, 1883)
-    femmesh.addNode(171.2647442204051, 5.0, 5.460155561464628, 1884)
-    femmesh.addNode(141.37931034482764, 7.5, 16.608204518430444, 1885)
-    femmesh.addNode(141.17203065134106, 5.0, 14.360731940907492, 1886)
-    femmesh.addNode(127.58620689655177, 7.500000000000012, 3.391795481569546, 1887)
-    femmesh.addNode(127.7934865900383, 5.0, 5.621963473604696, 1888)
-    femmesh.addNode(106.53762327129425, 5.0, 10.052102416651152, 1889)
-    femmesh.addNode(161.95925552864384, 7.500000000000002, 2.302192991984608, 1890)
-    femmesh.addNode(165.13291215334505, 7.500000000000002, 3.0670670617022826, 1891)
-    femmesh.addNode(162.1752385883892, 2.500000000000002, 2.2319093913100154, 1892)
-    femmesh.addNode(28.750669611820946, 5.0, 5.477600593658789, 1893)
-    femmesh.addNode(58.12857922305679, 5.0, 14.676393608498485, 1894)
-    femmesh.addNode(171.28765040535106, 5.0, 14.515760942409122, 1895)
-    femmesh.addNode(52.18411860847023, 5.0, 5.31655870889777, 1896)
-    femmesh.addNode(65.54403731097898, 2.5, 16.948991807609747, 1897)
-    femmesh.addNode(69.48371647509592, 5.0, 8.175863811815677, 1898)
-    femmesh.addNode(65.5500663956042, 2.499999999999988, 3.067900370285364, 1899)
-    femmesh.addNode(66.327365246179, 5.0, 6.191661765449861, 1900)
-    femmesh.addNode(44.00390821148008, 5.0, 13.808338234550133, 1901)
-    femmesh.addNode(44.774581469934574, 7.499999999999994, 3.039739076681399, 1902)
-    femmesh.addNode(134.4827586206897, 2.5, 16.938500924200913, 1903)
-    femmesh.addNode(134.4827586206897, 5.0, 14.735766084724098, 1904)
-    femmesh.addNode(134.4827586206896, 5.0, 5.281915821139185, 1905)
-    femmesh.addNode(134.4827586206895, 2.5000000000000093, 3.07918098166237, 1906)
-    femmesh.addNode(77.75574712643697, 5.0, 10.00000000000002, 1907)
-    femmesh.addNode(52.271712294804345, 5.0, 14.662551870144227, 1908)
-    femmesh.addNode(121.46695402298855, 5.0, 11.876238604835489, 1909)
-    femmesh.addNode(121.46695402298855, 5.0, 8.123761395164564, 1910)
-    femmesh.addNode(44.7812070620549, 7.5, 16.932099629714628, 1911)
-    femmesh.addNode(147.49856321839087, 5.0, 11.876238604835521, 1912)
-    femmesh.addNode(147.4985632183908, 5.0, 8.123761395164468, 1913)
-    femmesh.addNode(100.00000000000024, 2.5, 16.920819018337603, 1914)
-    femmesh.addNode(100.07696570107723, 7.50000000000006, 3.0347215808831094, 1915)
-    femmesh.addNode(137.93103448275866, 5.0, 13.546705442631357, 1916)
-    femmesh.addNode(131.03448275862064, 5.0, 6.470976463231916, 1917)
-    femmesh.addNode(113.79310344827604, 7.5, 16.92081901833763, 1918)
-    femmesh.addNode(38.09525519978119, 5.0, 12.745162743871987, 1919)
-    femmesh.addNode(40.60201149425293, 5.0, 14.6735037653587, 1920)
-    femmesh.addNode(40.76623221127536, 5.0, 11.824136188184305, 1921)
-    femmesh.addNode(69.74281609195413, 7.499999999999986, 3.1237613951644967, 1922)
-    femmesh.addNode(159.10761653675968, 5.0, 8.14562421939146, 1923)
-    femmesh.addNode(159.14457797199097, 5.0, 11.953876854608941, 1924)
-    femmesh.addNode(127.58620689655184, 7.5, 16.920819018337628, 1925)
-    femmesh.addNode(127.79348659003838, 5.0, 14.673346440814672, 1926)
-    femmesh.addNode(69.74281609195424, 7.5, 16.876238604835503, 1927)
-    femmesh.addNode(141.3793103448276, 7.499999999999995, 3.079180981662367, 1928)
-    femmesh.addNode(141.17203065134098, 5.0, 5.309348973697496, 1929)
-    femmesh.addNode(40.701120535458045, 5.0, 5.331724858559481, 1930)
-    femmesh.addNode(40.76623221127535, 5.0, 8.071658978513282, 1931)
-    femmesh.addNode(38.09525519978112, 5.0, 7.15063242282562, 1932)
-    femmesh.addNode(141.12021072796938, 5.0, 11.55610210177925, 1933)
-    femmesh.addNode(24.971684225998068, 7.5, 17.6046072364499, 1934)
-    femmesh.addNode(22.080921845211464, 2.5, 16.699029573975242, 1935)
-    femmesh.addNode(24.97056291722972, 2.5, 17.606257097675194, 1936)
-    femmesh.addNode(175.02751006116577, 7.499999999999993, 2.39413040765481, 1937)
-    femmesh.addNode(177.91907815478856, 7.499999999999993, 3.3009704260247505, 1938)
-    femmesh.addNode(175.06889159711238, 2.4999999999999925, 2.3770889671124573, 1939)
-    femmesh.addNode(175.0249630786295, 7.5, 17.60405564298918, 1940)
-    femmesh.addNode(175.0660530107252, 2.5, 17.619275640178195, 1941)
-    femmesh.addNode(177.85467958207386, 7.5, 16.671421532773135, 1942)
-    femmesh.addNode(24.9758426342067, 7.499999999999993, 2.3947927169241074, 1943)
-    femmesh.addNode(24.972834610965336, 2.4999999999999933, 2.396387220245111, 1944)
-    femmesh.addNode(22.145320417926186, 7.499999999999993, 3.3285784672268734, 1945)
-    femmesh.addNode(155.86052282694448, 5.0, 10.2935699195273, 1946)
-    femmesh.addNode(155.82356139171316, 5.0, 6.485317284309819, 1947)
-    femmesh.addNode(109.66686844196093, 5.0, 14.71224987478718, 1948)
-    femmesh.addNode(109.66686844196093, 5.0, 11.914984714263998, 1949)
-    femmesh.addNode(106.68917420472013, 5.0, 12.77758122985055, 1950)
-    femmesh.addNode(177.85467958207386, 2.5, 16.671421532773138, 1951)
-    femmesh.addNode(22.145320417926165, 2.4999999999999933, 3.3285784672268646, 1952)
-    femmesh.addNode(113.11514430402987, 5.0, 10.30678019583355, 1953)
-    femmesh.addNode(113.08153431200309, 5.0, 6.497464245990538, 1954)
-    femmesh.addNode(109.63325844993415, 5.0, 8.105668764420985, 1955)
-    femmesh.addNode(131.03448275862075, 5.0, 13.85931994253854, 1956)
-    femmesh.addNode(127.84530651340998, 5.0, 11.868716601686446, 1957)
-    femmesh.addNode(127.84530651340998, 5.0, 8.339693064918364, 1958)
-    femmesh.addNode(155.16630693595235, 7.5, 16.942859503362612, 1959)
-    femmesh.addNode(177.91907815478856, 2.4999999999999925, 3.300970426024761, 1960)
-    femmesh.addNode(22.080921845211478, 7.5, 16.699029573975242, 1961)
-    femmesh.addNode(34.83007361567529, 2.5, 16.940376140676463, 1962)
-    femmesh.addNode(90.33313155803933, 7.5000000000000115, 3.085015285735982, 1963)
-    femmesh.addNode(141.12021072796938, 5.0, 8.027078565011172, 1964)
-    femmesh.addNode(137.93103448275855, 5.0, 6.158361963324737, 1965)
-    femmesh.addNode(113.11514430402987, 5.0, 13.835803732601628, 1966)
-    femmesh.addNode(34.80930973623495, 2.4999999999999942, 3.082807876734681, 1967)
-    femmesh.addNode(155.8544159697933, 5.0, 13.844633941320353, 1968)
-    femmesh.addNode(121.46695402298855, 5.0, 14.673503765358674, 1969)
-    femmesh.addNode(159.2718372537821, 2.500000000000002, 3.09352180274026, 1970)
-    femmesh.addNode(159.30879868901343, 2.5, 16.90177443795774, 1971)
-    femmesh.addNode(159.20096255541714, 5.0, 14.685906550014423, 1972)
-    femmesh.addNode(90.36674155006611, 2.5, 16.909217640336497, 1973)
-    femmesh.addNode(106.74469966728896, 5.0, 7.247249926570023, 1974)
-    femmesh.addNode(109.63325844993415, 5.0, 5.308403603897801, 1975)
-    femmesh.addNode(168.6510272626876, 2.499999999999999, 3.066025153809818, 1976)
-    femmesh.addNode(171.5792341990968, 7.499999999999999, 2.39413040765481, 1977)
-    femmesh.addNode(171.6206157350434, 2.499999999999999, 2.3770889671124573, 1978)
-    femmesh.addNode(28.419960088067064, 7.5, 17.6046072364499, 1979)
-    femmesh.addNode(28.418838779298717, 2.5, 17.606257097675194, 1980)
-    femmesh.addNode(31.38179775360632, 2.5, 16.940376140676463, 1981)
-    femmesh.addNode(134.4827586206897, 5.0, 11.938500924200913, 1982)
-    femmesh.addNode(137.67193486590043, 5.0, 9.947897583348805, 1983)
-    femmesh.addNode(171.61777714865622, 2.5, 17.619275640178195, 1984)
-    femmesh.addNode(168.67648043016987, 2.5, 16.911705299419943, 1985)
-    femmesh.addNode(171.57668721656052, 7.5, 17.60405564298918, 1986)
-    femmesh.addNode(121.46695402298855, 5.0, 5.326496234641379, 1987)
-    femmesh.addNode(147.49856321839087, 5.0, 14.673503765358706, 1988)
-    femmesh.addNode(28.421110473034304, 2.499999999999987, 2.396387220245111, 1989)
-    femmesh.addNode(31.361033874165976, 2.499999999999987, 3.082807876734681, 1990)
-    femmesh.addNode(28.424118496275668, 7.499999999999988, 2.3947927169241074, 1991)
-    femmesh.addNode(147.4985632183908, 5.0, 5.326496234641283, 1992)
-    femmesh.addNode(113.11514430402987, 2.5, 16.914984714263994, 1993)
-    femmesh.addNode(109.66686844196093, 2.5, 16.914984714263994, 1994)
-    femmesh.addNode(110.34482758620709, 7.5, 17.79726516052318, 1995)
-    femmesh.addNode(131.29358237547893, 5.0, 9.94789758334882, 1996)
-    femmesh.addNode(134.4827586206896, 5.0, 8.07918098166237, 1997)
-    femmesh.addNode(124.39703065134104, 5.0, 9.94789758334882, 1998)
-    femmesh.addNode(155.86052282694448, 2.5, 16.90177443795774, 1999)
-    femmesh.addNode(158.51285352157618, 7.5, 17.78413211205668, 2000)
-    femmesh.addNode(144.56848659003833, 5.0, 9.947897583348805, 2001)
-    femmesh.addNode(158.51097966657485, 7.500000000000005, 2.302192991984608, 2002)
-    femmesh.addNode(155.82356139171313, 2.5000000000000053, 3.09352180274026, 2003)
-    femmesh.addNode(40.60201149425292, 2.5, 16.876238604835507, 2004)
-    femmesh.addNode(41.37931034482774, 7.5, 17.797265160523196, 2005)
-    femmesh.addNode(44.0502873563219, 2.5, 16.876238604835507, 2006)
-    femmesh.addNode(144.05028735632192, 5.0, 13.484443123265965, 2007)
-    femmesh.addNode(40.602011494252864, 2.4999999999999942, 3.123761395164483, 2008)
-    femmesh.addNode(124.9152298850575, 5.0, 6.515556876734109, 2009)
-    femmesh.addNode(44.05028735632183, 2.499999999999994, 3.123761395164483, 2010)
-    femmesh.addNode(41.4784193860328, 7.499999999999994, 2.2079634633949983, 2011)
-    femmesh.addNode(124.91522988505749, 5.0, 13.797057623173117, 2012)
-    femmesh.addNode(110.34482758620702, 7.500000000000026, 2.202734839476817, 2013)
-    femmesh.addNode(113.08153431200301, 2.5000000000000258, 3.105668764420984, 2014)
-    femmesh.addNode(109.63325844993406, 2.5000000000000346, 3.105668764420984, 2015)
-    femmesh.addNode(124.91522988505749, 2.5, 16.87623860483549, 2016)
-    femmesh.addNode(121.46695402298855, 2.5, 16.87623860483549, 2017)
-    femmesh.addNode(124.1379310344829, 7.5, 17.797265160523185, 2018)
-    femmesh.addNode(68.7648025511515, 2.499999999999988, 2.248752836420211, 2019)
-    femmesh.addNode(66.29454022988517, 7.499999999999988, 3.1237613951644967, 2020)
-    femmesh.addNode(66.29454022988527, 7.5, 16.876238604835503, 2021)
-    femmesh.addNode(68.76359673422661, 2.5, 17.775466565819272, 2022)
-    femmesh.addNode(144.0502873563219, 5.0, 6.202942376826835, 2023)
-    femmesh.addNode(75.08477011494267, 7.499999999999986, 3.1237613951644905, 2024)
-    femmesh.addNode(75.08477011494278, 7.5, 16.87623860483551, 2025)
-    femmesh.addNode(31.403335852428647, 7.5, 16.908685606261045, 2026)
-    femmesh.addNode(31.41881198458602, 7.499999999999988, 3.0521806569447936, 2027)
-    femmesh.addNode(147.49856321839087, 2.5, 16.87623860483552, 2028)
-    femmesh.addNode(144.05028735632192, 2.5, 16.87623860483552, 2029)
-    femmesh.addNode(144.8275862068966, 7.5, 17.797265160523185, 2030)
-    femmesh.addNode(144.8275862068965, 7.499999999999995, 2.202734839476816, 2031)
-    femmesh.addNode(147.4985632183908, 2.5000000000000298, 3.1237613951644674, 2032)
-    femmesh.addNode(144.0502873563218, 2.4999999999999947, 3.1237613951644674, 2033)
-    femmesh.addNode(124.13793103448282, 7.500000000000012, 2.202734839476815, 2034)
-    femmesh.addNode(124.91522988505743, 2.500000000000013, 3.1237613951645633, 2035)
-    femmesh.addNode(121.46695402298846, 2.5000000000000067, 3.1237613951645633, 2036)
-    femmesh.addNode(86.88485569597032, 7.499999999999983, 3.085015285735982, 2037)
-    femmesh.addNode(57.90912051889984, 7.5, 16.894331235579, 2038)
-    femmesh.addNode(52.40209707528054, 2.499999999999992, 3.1020283197445346, 2039)
-    femmesh.addNode(57.94273051092648, 7.49999999999999, 3.085015285735982, 2040)
-    femmesh.addNode(15.93058157549238, 4.608187218137012, 3.085737918559607, 2041)
-    femmesh.addNode(17.386246821004757, 2.108187218137048, 6.414316385786472, 2042)
-    femmesh.addNode(18.69704455585719, 2.4999999999999636, 3.3285784672268646, 2043)
-    femmesh.addNode(18.69704455585721, 7.499999999999964, 3.3285784672268734, 2044)
-    femmesh.addNode(90.33313155803923, 2.5000000000000115, 3.1020283197445533, 2045)
-    femmesh.addNode(168.581188015414, 7.499999999999999, 3.0670670617022826, 2046)
-    femmesh.addNode(86.91846568799716, 2.5, 16.909217640336497, 2047)
-    femmesh.addNode(181.3029554441428, 2.5, 16.671421532773138, 2048)
-    femmesh.addNode(168.59666414757146, 7.5, 16.925698640269598, 2049)
-    femmesh.addNode(78.53304597701155, 2.499999999999985, 3.12376139516451, 2050)
-    femmesh.addNode(17.188780202472742, 7.499999999999964, 1.4524997863440068, 2051)
-    femmesh.addNode(52.43570706730735, 2.5, 16.909217640336486, 2052)
-    femmesh.addNode(15.877982467620274, 2.108187218137048, 4.538237704903594, 2053)
-    femmesh.addNode(17.188780202472707, 2.4999999999999636, 1.4524997863439868, 2054)
-    femmesh.addNode(184.15735802316806, 2.1185639620408208, 15.50362285664536, 2055)
-    femmesh.addNode(184.10475891529597, 4.61856396204082, 16.95612264298935, 2056)
-    femmesh.addNode(182.8112197975273, 2.5, 18.54750021365601, 2057)
-    femmesh.addNode(182.8483590838548, 7.500000000000034, 1.4888689946551699, 2058)
-    femmesh.addNode(181.36735401685755, 7.500000000000034, 3.3009704260247505, 2059)
-    femmesh.addNode(184.0694184245076, 4.608187218137081, 3.085737918559609, 2060)
-    femmesh.addNode(182.67815175171, 2.1081872181370476, 6.38670834458437, 2061)
-    femmesh.addNode(181.36735401685755, 2.5000000000000338, 3.300970426024761, 2062)
-    femmesh.addNode(90.36674155006614, 7.5, 16.894331235579, 2063)
-    femmesh.addNode(18.63264598314253, 7.5, 16.699029573975242, 2064)
-    femmesh.addNode(18.632645983142517, 2.5, 16.699029573975242, 2065)
-    femmesh.addNode(17.286507757501674, 2.1185639620408185, 13.655152216964588, 2066)
-    femmesh.addNode(17.28650775750169, 7.1185639620408185, 13.655152216964588, 2067)
-    femmesh.addNode(15.895241084704097, 4.6185639620408185, 16.956122642989346, 2068)
-    femmesh.addNode(184.15915681870723, 2.1081872181370476, 4.574606913214781, 2069)
-    femmesh.addNode(182.8483590838548, 2.5000000000000338, 1.488868994655172, 2070)
-    femmesh.addNode(17.151640916145254, 2.5, 18.511131005344833, 2071)
-    femmesh.addNode(15.805502690504412, 2.1185639620408185, 15.467253648334179, 2072)
-    femmesh.addNode(55.850372937349505, 2.4999999999999902, 3.1020283197445346, 2073)
-    femmesh.addNode(54.49445464885751, 7.499999999999992, 3.085015285735982, 2074)
-    femmesh.addNode(55.88398292937633, 2.5, 16.909217640336486, 2075)
-    femmesh.addNode(54.46084465683086, 7.5, 16.894331235579, 2076)
-    femmesh.addNode(78.53304597701165, 2.5, 16.876238604835436, 2077)
-    femmesh.addNode(78.53304597701177, 7.5, 16.87623860483551, 2078)
-    femmesh.addNode(165.62351445045817, 2.499999999999999, 2.2319093913100154, 2079)
-    femmesh.addNode(17.15164091614526, 7.5, 18.511131005344833, 2080)
-    femmesh.addNode(165.63599737100094, 2.5, 17.762695947475535, 2081)
-    femmesh.addNode(17.714862931677317, 8.750000000000004, 13.000680791327916, 2082)
-    femmesh.addNode(184.50884093925137, 7.500000000000033, 2.6545055525959267, 2083)
-    femmesh.addNode(15.491159060748625, 7.499999999999963, 2.6545055525959267, 2084)
-    femmesh.addNode(14.171103153669591, 7.1185639620408185, 16.956122642989346, 2085)
-    femmesh.addNode(15.805502690504419, 7.1185639620408185, 15.467253648334179, 2086)
-    femmesh.addNode(16.233857864680047, 8.750000000000004, 14.812782222697509, 2087)
-    femmesh.addNode(195.99996018406995, 4.997158145241443, 10.0218583982756, 2088)
-    femmesh.addNode(4.00003981593004, 4.997158145241441, 10.021858398275613, 2089)
-    femmesh.addNode(187.99635475794923, 7.325873049831443, 2.0019121129591535, 2090)
-    femmesh.addNode(185.7935563555421, 7.108187218137047, 3.085737918559609, 2091)
-    femmesh.addNode(12.003645242050817, 7.3258730498314435, 2.001912112959153, 2092)
-    femmesh.addNode(14.206443644457938, 7.108187218137048, 3.085737918559607, 2093)
-    femmesh.addNode(13.727783173085259, 4.825873049831406, 2.001912112959153, 2094)
-    femmesh.addNode(11.810087507604173, 7.325795662974189, 17.998753731012137, 2095)
-    femmesh.addNode(188.18991249239588, 7.325795662974189, 17.998753731012133, 2096)
-    femmesh.addNode(185.82889684633045, 7.11856396204082, 16.95612264298935, 2097)
-    femmesh.addNode(12.484365826789514, 4.6159201262299066, 16.956122642989346, 2098)
-    femmesh.addNode(187.51563417321051, 4.621207797851736, 16.95612264298935, 2099)
-    femmesh.addNode(10.123350180724096, 4.823151827163277, 17.998753731012137, 2100)
-    femmesh.addNode(189.87664981927594, 4.828439498785104, 17.998753731012133, 2101)
-    femmesh.addNode(185.79355635554208, 2.1081872181370476, 3.085737918559609, 2102)
-    femmesh.addNode(14.206443644457899, 2.108187218137048, 3.085737918559607, 2103)
-    femmesh.addNode(14.171103153669591, 2.1185639620408185, 16.956122642989346, 2104)
-    femmesh.addNode(185.82889684633045, 2.1185639620408208, 16.95612264298935, 2105)
-    femmesh.addNode(189.6830920848293, 4.823229214020536, 2.0019121129591535, 2106)
-    femmesh.addNode(187.4802936824222, 4.605543382326141, 3.085737918559609, 2107)
-    femmesh.addNode(187.99635475794918, 2.3258730498314426, 2.0019121129591535, 2108)
-    femmesh.addNode(10.316907915170697, 4.823229214020497, 2.001912112959153, 2109)
-    femmesh.addNode(2.015561291298553, 7.499999999999993, 18.178620324112956, 2110)
-    femmesh.addNode(4.453788385254384, 7.454808954932602, 18.178620324112956, 2111)
-    femmesh.addNode(2.438227093955831, 4.815920066043716, 17.499999999999993, 2112)
-    femmesh.addNode(2.015561291298553, 7.361111111111114, 15.67862032411295, 2113)
-    femmesh.addNode(2.438227093955824, 4.8159200660436525, 2.4999999999999933, 2114)
-    femmesh.addNode(2.0155612912985603, 7.3611111111111045, 4.321379675887025, 2115)
-    femmesh.addNode(2.0155612912985603, 7.499999999999993, 1.8213796758870315, 2116)
-    femmesh.addNode(4.453788385254384, 7.454808954932547, 1.8213796758870315, 2117)
-    femmesh.addNode(197.98443870870145, 7.499999999999993, 1.8213796758870306, 2118)
-    femmesh.addNode(195.54621161474563, 7.454808954932586, 1.8213796758870306, 2119)
-    femmesh.addNode(197.56177290604418, 4.81592006604369, 2.4999999999999933, 2120)
-    femmesh.addNode(197.98443870870145, 7.3611111111111045, 4.321379675887024, 2121)
-    femmesh.addNode(197.56177290604418, 4.906302156178564, 17.499999999999993, 2122)
-    femmesh.addNode(195.54621161474563, 7.545191045067449, 18.178620324112956, 2123)
-    femmesh.addNode(197.98443870870145, 7.361111111111114, 15.678620324112948, 2124)
-    femmesh.addNode(197.98443870870145, 7.499999999999993, 18.178620324112956, 2125)
-    femmesh.addNode(2.00001990796502, 1.2485790726207204, 11.677595865804454, 2126)
-    femmesh.addNode(197.99998009203497, 1.2485790726207213, 8.344262532471125, 2127)
-    femmesh.addNode(2.00001990796502, 8.748579072620721, 11.677595865804454, 2128)
-    femmesh.addNode(197.99998009203497, 8.748579072620721, 8.344262532471125, 2129)
-    femmesh.addNode(6.770664292086911, 7.454808954932547, 2.0752162634545224, 2130)
-    femmesh.addNode(4.98294897537338, 4.954808954932547, 3.2761643464615737, 2131)
-    femmesh.addNode(4.560283172716116, 7.5, 5.097544022348606, 2132)
-    femmesh.addNode(193.2293357079131, 7.454808954932584, 2.0752162634545224, 2133)
-    femmesh.addNode(195.4397168272839, 7.5, 5.097544022348604, 2134)
-    femmesh.addNode(195.01705102462662, 4.954808954932586, 3.2761643464615737, 2135)
-    femmesh.addNode(7.35176287742204, 4.780604617906791, 17.998753731012137, 2136)
-    femmesh.addNode(6.929097074764762, 7.325795662974189, 16.177374055125092, 2137)
-    femmesh.addNode(4.469311100429346, 7.467287119694401, 14.765002990905092, 2138)
-    femmesh.addNode(4.891976903086624, 4.922096074627003, 16.586382666792133, 2139)
-    femmesh.addNode(193.07090292523526, 7.325795662974189, 16.17737405512509, 2140)
-    femmesh.addNode(195.53068889957066, 7.4672871196944, 14.765002990905087, 2141)
-    femmesh.addNode(192.648237122578, 4.870986708041639, 17.998753731012133, 2142)
-    femmesh.addNode(195.1080230969134, 5.01247816476185, 16.586382666792133, 2143)
-    femmesh.addNode(6.7706642920868845, 7.454808954932602, 17.92478373654547, 2144)
-    femmesh.addNode(197.98443870870145, 2.4999999999999933, 18.178620324112956, 2145)
-    femmesh.addNode(197.98443870870145, 2.361111111111114, 15.67862032411295, 2146)
-    femmesh.addNode(195.54621161474563, 2.5451910450674498, 18.178620324112956, 2147)
-    femmesh.addNode(193.2293357079131, 2.4548089549325853, 2.075216263454524, 2148)
-    femmesh.addNode(195.4397168272839, 2.5, 5.097544022348606, 2149)
-    femmesh.addNode(195.54621161474563, 2.4548089549325858, 1.8213796758870315, 2150)
-    femmesh.addNode(4.560283172716109, 2.5, 5.097544022348606, 2151)
-    femmesh.addNode(4.453788385254377, 2.4548089549325476, 1.8213796758870315, 2152)
-    femmesh.addNode(6.770664292086911, 2.454808954932547, 2.075216263454524, 2153)
-    femmesh.addNode(193.22933570791312, 7.545191045067451, 17.92478373654547, 2154)
-    femmesh.addNode(4.453788385254384, 2.4548089549326018, 18.178620324112956, 2155)
-    femmesh.addNode(2.015561291298553, 2.4999999999999933, 18.178620324112956, 2156)
-    femmesh.addNode(2.015561291298553, 2.361111111111114, 15.67862032411295, 2157)
-    femmesh.addNode(197.98443870870145, 2.3611111111111045, 4.321379675887025, 2158)
-    femmesh.addNode(197.98443870870145, 2.4999999999999933, 1.8213796758870315, 2159)
-    femmesh.addNode(2.015561291298553, 2.3611111111111045, 4.321379675887025, 2160)
-    femmesh.addNode(2.015561291298553, 2.4999999999999933, 1.8213796758870315, 2161)
-    femmesh.addNode(188.18991249239588, 2.325795662974189, 17.998753731012133, 2162)
-    femmesh.addNode(11.810087507604173, 2.3257956629741887, 17.998753731012137, 2163)
-    femmesh.addNode(197.45527811858244, 4.8611111111111045, 5.776164346461567, 2164)
-    femmesh.addNode(197.99998009203497, 3.609690183731826, 7.510929199137793, 2165)
-    femmesh.addNode(197.70290660370725, 2.361111111111104, 6.198348782647302, 2166)
-    femmesh.addNode(193.07090292523526, 2.325795662974189, 16.177374055125092, 2167)
-    femmesh.addNode(195.53068889957066, 2.4672871196944, 14.765002990905089, 2168)
-    femmesh.addNode(12.003645242050778, 2.325873049831443, 2.001912112959153, 2169)
-    femmesh.addNode(6.929097074764762, 2.3257956629741887, 16.177374055125092, 2170)
-    femmesh.addNode(4.469311100429346, 2.467287119694401, 14.765002990905092, 2171)
-    femmesh.addNode(197.45527811858244, 7.5, 6.609497679794899, 2172)
-    femmesh.addNode(192.45467938813132, 4.780682004764028, 2.0019121129591535, 2173)
-    femmesh.addNode(7.545320611868677, 4.780682004763991, 2.001912112959153, 2174)
-    femmesh.addNode(193.22933570791312, 2.54519104506745, 17.92478373654547, 2175)
-    femmesh.addNode(6.7706642920868845, 2.454808954932602, 17.92478373654547, 2176)
-    femmesh.addNode(2.544721881417556, 4.8611111111111045, 5.776164346461567, 2177)
-    femmesh.addNode(197.99998009203497, 8.748579072620721, 11.677595865804449, 2178)
-    femmesh.addNode(197.99998009203497, 6.24857907262072, 10.010929199137788, 2179)
-    femmesh.addNode(2.00001990796502, 8.748579072620721, 8.344262532471133, 2180)
-    femmesh.addNode(2.00001990796502, 6.2485790726207195, 10.010929199137793, 2181)
-    femmesh.addNode(2.00001990796502, 3.74857907262072, 10.010929199137793, 2182)
-    femmesh.addNode(2.00001990796502, 1.2485790726207204, 8.344262532471133, 2183)
-    femmesh.addNode(197.99998009203497, 1.2485790726207213, 11.677595865804449, 2184)
-    femmesh.addNode(197.99998009203497, 3.748579072620721, 10.010929199137788, 2185)
-    femmesh.addNode(2.4537498091307928, 4.828398230805515, 14.086382666792128, 2186)
-    femmesh.addNode(2.00001990796502, 6.109690183731825, 7.5109291991378, 2187)
-    femmesh.addNode(197.54625019086922, 4.828398230805513, 14.086382666792124, 2188)
-    femmesh.addNode(2.4537498091307928, 7.467287119694401, 13.253049333458783, 2189)
-    femmesh.addNode(197.99998009203497, 6.109690183731835, 12.510929199137793, 2190)
-    femmesh.addNode(2.544721881417556, 7.5, 6.609497679794899, 2191)
-    femmesh.addNode(9.542251595388931, 7.497356164189053, 2.0752162634545224, 2192)
-    femmesh.addNode(190.45774840461107, 7.4973561641890925, 2.0752162634545224, 2193)
-    femmesh.addNode(190.4577484046111, 7.502643835810916, 17.92478373654547, 2194)
-    femmesh.addNode(9.54225159538894, 7.497356164189089, 17.92478373654547, 2195)
-    femmesh.addNode(197.45527811858244, 5.0, 8.27616434646156, 2196)
-    femmesh.addNode(2.544721881417556, 5.0, 8.27616434646156, 2197)
-    femmesh.addNode(191.4446306200182, 7.325873049831443, 2.0019121129591535, 2198)
-    femmesh.addNode(8.555369379981835, 7.3258730498314435, 2.001912112959153, 2199)
-    femmesh.addNode(197.99998009203497, 6.109690183731825, 7.510929199137793, 2200)
-    femmesh.addNode(197.54625019086922, 7.4672871196944, 13.25304933345878, 2201)
-    femmesh.addNode(2.2970933962927393, 2.3611111111111143, 13.801651217352662, 2202)
-    femmesh.addNode(2.00001990796502, 3.609690183731825, 7.5109291991378, 2203)
-    femmesh.addNode(197.54625019086922, 4.967287119694399, 11.586382666792119, 2204)
-    femmesh.addNode(2.4537498091307928, 4.967287119694401, 11.586382666792122, 2205)
-    femmesh.addNode(2.00001990796502, 6.109690183731834, 12.510929199137799, 2206)
-    femmesh.addNode(197.99998009203497, 3.609690183731835, 12.510929199137793, 2207)
-    femmesh.addNode(191.44463062001816, 2.3258730498314426, 2.0019121129591535, 2208)
-    femmesh.addNode(8.555369379981816, 2.325873049831443, 2.001912112959153, 2209)
-    femmesh.addNode(190.45774840461107, 2.497356164189093, 2.075216263454524, 2210)
-    femmesh.addNode(9.542251595388931, 2.4973561641890534, 2.075216263454524, 2211)
-    femmesh.addNode(8.361811645535191, 7.325795662974189, 17.998753731012137, 2212)
-    femmesh.addNode(191.63818835446483, 2.325795662974189, 17.998753731012133, 2213)
-    femmesh.addNode(190.4577484046111, 2.5026438358109155, 17.92478373654547, 2214)
-    femmesh.addNode(9.54225159538894, 2.4973561641890885, 17.92478373654547, 2215)
-    femmesh.addNode(2.2970933962927518, 2.361111111111104, 6.198348782647302, 2216)
-    femmesh.addNode(191.63818835446483, 7.325795662974189, 17.998753731012133, 2217)
-    femmesh.addNode(2.00001990796502, 3.6096901837318343, 12.510929199137799, 2218)
-    femmesh.addNode(8.361811645535191, 2.3257956629741887, 17.998753731012137, 2219)
-    femmesh.addNode(197.70290660370728, 2.3611111111111143, 13.801651217352662, 2220)
-    femmesh.addNode(184.5088409392514, 7.500000000000001, 17.345494447404093, 2221)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addVolume([660, 1261, 636, 114, 1612, 1611, 952, 1613, 1614, 1615], 975)
-    femmesh.addVolume([1259, 98, 635, 659, 1618, 1617, 1616, 1619, 1620, 945], 976)
-    femmesh.addVolume([1231, 636, 1261, 114, 1621, 1611, 1534, 1622, 1615, 1614], 977)
-    femmesh.addVolume([635, 98, 1259, 1230, 1617, 1618, 1616, 1623, 1624, 1527], 978)
-    femmesh.addVolume([1262, 1231, 114, 661, 1533, 1622, 1625, 1626, 1627, 1628], 979)
-    femmesh.addVolume([636, 114, 1231, 661, 1615, 1622, 1621, 951, 1628, 1627], 980)
-    femmesh.addVolume([1260, 635, 98, 662, 1630, 1617, 1629, 1631, 944, 1632], 981)
-    femmesh.addVolume([635, 98, 1230, 1260, 1617, 1624, 1623, 1630, 1629, 1526], 982)
-    femmesh.addVolume([114, 1261, 1231, 1262, 1614, 1534, 1622, 1625, 1326, 1533], 983)
-    femmesh.addVolume([660, 114, 636, 661, 1613, 1615, 952, 736, 1628, 951], 984)
-    femmesh.addVolume([98, 635, 659, 662, 1617, 945, 1620, 1632, 944, 731], 985)
-    femmesh.addVolume([98, 1259, 1230, 1260, 1618, 1527, 1624, 1629, 1321, 1526], 986)
-    femmesh.addVolume([1301, 710, 1265, 1241, 1634, 1633, 1489, 1601, 1635, 1600], 987)
-    femmesh.addVolume([1241, 1266, 1302, 707, 1599, 1412, 1602, 1636, 1637, 1638], 988)
-    femmesh.addVolume([710, 1301, 678, 1241, 1634, 1639, 885, 1635, 1601, 1640], 989)
-    femmesh.addVolume([1241, 1302, 1267, 707, 1602, 1413, 1604, 1636, 1638, 1641], 990)
-    femmesh.addVolume([1298, 1261, 242, 245, 1364, 1643, 1642, 1644, 1645, 280], 991)
-    femmesh.addVolume([1286, 663, 689, 1238, 1647, 880, 1646, 1581, 1648, 1649], 992)
-    femmesh.addVolume([1241, 710, 1265, 646, 1635, 1633, 1600, 1650, 1020, 1651], 993)
-    femmesh.addVolume([190, 1300, 1260, 187, 1653, 1350, 1652, 225, 1654, 1655], 994)
-    femmesh.addVolume([646, 1266, 1241, 707, 1656, 1599, 1650, 1021, 1637, 1636], 995)
-    femmesh.addVolume([192, 189, 659, 98, 226, 1658, 1657, 202, 203, 1620], 996)
-    femmesh.addVolume([1238, 689, 1286, 1264, 1649, 1646, 1581, 1577, 1659, 1497], 997)
-    femmesh.addVolume([710, 1241, 678, 646, 1635, 1640, 885, 1020, 1650, 1022], 998)
-    femmesh.addVolume([1267, 646, 1241, 707, 1660, 1650, 1604, 1641, 1021, 1636], 999)
-    femmesh.addVolume([692, 1258, 1280, 640, 1662, 1375, 1661, 979, 1663, 1664], 1000)
-    femmesh.addVolume([659, 189, 1259, 98, 1658, 1665, 1619, 1620, 203, 1618], 1001)
-    femmesh.addVolume([1284, 640, 1257, 696, 1667, 1666, 1453, 1668, 978, 1669], 1002)
-    femmesh.addVolume([1265, 1266, 1241, 646, 1583, 1599, 1600, 1651, 1656, 1650], 1003)
-    femmesh.addVolume([678, 320, 1301, 710, 1671, 1670, 1639, 885, 1672, 1634], 1004)
-    femmesh.addVolume([641, 1285, 1238, 665, 1674, 1580, 1673, 988, 1675, 1676], 1005)
-    femmesh.addVolume([1265, 317, 710, 1301, 1678, 1677, 1633, 1489, 1679, 1634], 1006)
-    femmesh.addVolume([1267, 678, 1241, 646, 1680, 1640, 1604, 1660, 1022, 1650], 1007)
-    femmesh.addVolume([635, 1260, 1296, 699, 1630, 1446, 1681, 942, 1682, 1683], 1008)
-    femmesh.addVolume([1304, 1242, 650, 638, 1608, 1685, 1684, 1686, 1687, 963], 1009)
-    femmesh.addVolume([643, 693, 1289, 1245, 1001, 1689, 1688, 1690, 1691, 1405], 1010)
-    femmesh.addVolume([1290, 651, 698, 1234, 1693, 891, 1692, 1554, 1694, 1695], 1011)
-    femmesh.addVolume([1285, 665, 641, 683, 1675, 988, 1674, 1696, 804, 986], 1012)
-    femmesh.addVolume([1295, 1259, 635, 701, 1368, 1616, 1697, 1698, 1699, 943], 1013)
-    femmesh.addVolume([1061, 1267, 1302, 707, 1701, 1413, 1700, 1702, 1641, 1638], 1014)
-    femmesh.addVolume([1259, 1066, 1299, 189, 1704, 1703, 1341, 1665, 1705, 1706], 1015)
-    femmesh.addVolume([701, 635, 659, 1259, 943, 945, 751, 1699, 1616, 1619], 1016)
-    femmesh.addVolume([700, 636, 1293, 661, 949, 1708, 1707, 830, 951, 1709], 1017)
-    femmesh.addVolume([1236, 708, 1246, 645, 1711, 1710, 1566, 1712, 1015, 1713], 1018)
-    femmesh.addVolume([1294, 1261, 636, 702, 1519, 1611, 1714, 1715, 1716, 950], 1019)
-    femmesh.addVolume([714, 1235, 1244, 647, 1718, 1563, 1717, 1026, 1719, 1720], 1020)
-    femmesh.addVolume([1239, 712, 1254, 648, 1722, 1721, 1585, 1723, 1032, 1724], 1021)
-    femmesh.addVolume([638, 1303, 1242, 653, 1725, 1607, 1687, 962, 1726, 1727], 1022)
-    femmesh.addVolume([702, 636, 660, 1261, 950, 952, 852, 1716, 1611, 1612], 1023)
-    femmesh.addVolume([662, 1260, 635, 699, 1631, 1630, 944, 931, 1682, 942], 1024)
-    femmesh.addVolume([643, 1234, 651, 1245, 1728, 1694, 999, 1690, 1552, 1729], 1025)
-    femmesh.addVolume([713, 1239, 1248, 648, 1731, 1587, 1730, 1033, 1723, 1732], 1026)
-    femmesh.addVolume([709, 1236, 1252, 645, 1734, 1565, 1733, 1014, 1712, 1735], 1027)
-    femmesh.addVolume([1296, 1260, 635, 1230, 1446, 1630, 1681, 1524, 1526, 1623], 1028)
-    femmesh.addVolume([1293, 1231, 1262, 661, 1532, 1533, 1441, 1709, 1627, 1626], 1029)
-    femmesh.addVolume([1231, 1293, 636, 661, 1532, 1708, 1621, 1627, 1709, 951], 1030)
-    femmesh.addVolume([1235, 711, 1253, 647, 1737, 1736, 1561, 1719, 1027, 1738], 1031)
-    femmesh.addVolume([636, 1261, 1294, 1231, 1611, 1519, 1714, 1621, 1534, 1531], 1032)
-    femmesh.addVolume([635, 1259, 1295, 1230, 1616, 1368, 1697, 1623, 1527, 1525], 1033)
-    femmesh.addVolume([1059, 1064, 697, 1276, 1135, 1740, 1739, 1741, 1742, 1743], 1034)
-    femmesh.addVolume([640, 1284, 676, 696, 1667, 1744, 981, 978, 1668, 922], 1035)
-    femmesh.addVolume([1230, 657, 635, 655, 1745, 939, 1623, 1746, 940, 941], 1036)
-    femmesh.addVolume([1255, 639, 658, 1256, 1748, 969, 1747, 1529, 1749, 1750], 1037)
-    femmesh.addVolume([1231, 658, 636, 1256, 1751, 946, 1621, 1528, 1750, 1752], 1038)
-    femmesh.addVolume([657, 655, 1257, 640, 940, 1754, 1753, 976, 977, 1666], 1039)
-    femmesh.addVolume([1285, 1238, 1263, 641, 1580, 1579, 1419, 1674, 1673, 1755], 1040)
-    femmesh.addVolume([1256, 639, 658, 656, 1749, 969, 1750, 1756, 970, 947], 1041)
-    femmesh.addVolume([657, 1257, 1258, 640, 1753, 1521, 1757, 976, 1666, 1663], 1042)
-    femmesh.addVolume([323, 322, 1278, 694, 380, 1759, 1758, 1760, 1761, 1762], 1043)
-    femmesh.addVolume([678, 1267, 1234, 643, 1680, 1557, 1763, 1003, 1764, 1728], 1044)
-    femmesh.addVolume([690, 1055, 1058, 1279, 1766, 1123, 1765, 1767, 1768, 1769], 1045)
-    femmesh.addVolume([1055, 686, 1057, 1279, 1771, 1770, 1120, 1768, 1772, 1773], 1046)
-    femmesh.addVolume([695, 1304, 650, 638, 1774, 1684, 874, 964, 1686, 963], 1047)
-    femmesh.addVolume([316, 1275, 313, 684, 1776, 1775, 392, 1777, 1778, 1779], 1048)
-    femmesh.addVolume([1275, 308, 313, 685, 1780, 395, 1775, 1781, 1782, 1783], 1049)
-    femmesh.addVolume([698, 1268, 1290, 1234, 1784, 1486, 1692, 1695, 1555, 1554], 1050)
-    femmesh.addVolume([641, 1263, 1285, 683, 1755, 1419, 1674, 986, 1785, 1696], 1051)
-    femmesh.addVolume([663, 1238, 1286, 1265, 1648, 1581, 1647, 1786, 1584, 1494], 1052)
-    femmesh.addVolume([1238, 1285, 1266, 665, 1580, 1416, 1582, 1676, 1675, 1787], 1053)
-    femmesh.addVolume([651, 652, 643, 1245, 991, 998, 999, 1729, 1788, 1690], 1054)
-    femmesh.addVolume([1255, 1240, 639, 1256, 1598, 1789, 1748, 1529, 1597, 1749], 1055)
-    femmesh.addVolume([1303, 653, 638, 691, 1726, 962, 1725, 1790, 810, 965], 1056)
-    femmesh.addVolume([1265, 710, 663, 646, 1633, 884, 1786, 1651, 1020, 1019], 1057)
-    femmesh.addVolume([687, 639, 1256, 656, 971, 1749, 1791, 824, 970, 1756], 1058)
-    femmesh.addVolume([1289, 1064, 693, 1060, 1793, 1792, 1689, 1794, 1138, 1795], 1059)
-    femmesh.addVolume([1069, 1062, 709, 1281, 1129, 1797, 1796, 1798, 1799, 1800], 1060)
-    femmesh.addVolume([322, 698, 321, 1290, 1802, 1801, 377, 1803, 1692, 1804], 1061)
-    femmesh.addVolume([640, 655, 1257, 696, 977, 1754, 1666, 978, 925, 1669], 1062)
-    femmesh.addVolume([651, 642, 652, 1245, 992, 990, 991, 1729, 1805, 1788], 1063)
-    femmesh.addVolume([1254, 1292, 712, 1239, 1508, 1806, 1721, 1585, 1589, 1722], 1064)
-    femmesh.addVolume([1234, 651, 698, 643, 1694, 891, 1695, 1728, 999, 1000], 1065)
-    femmesh.addVolume([1258, 692, 657, 640, 1662, 759, 1757, 1663, 979, 976], 1066)
-    femmesh.addVolume([1245, 651, 642, 1250, 1729, 992, 1805, 1544, 1807, 1808], 1067)
-    femmesh.addVolume([658, 688, 639, 1255, 860, 972, 969, 1747, 1809, 1748], 1068)
-    femmesh.addVolume([1064, 1289, 693, 1245, 1793, 1689, 1792, 1810, 1405, 1691], 1069)
-    femmesh.addVolume([1245, 1234, 651, 1250, 1552, 1694, 1729, 1544, 1551, 1807], 1070)
-    femmesh.addVolume([673, 1289, 643, 693, 1811, 1688, 1004, 796, 1689, 1001], 1071)
-    femmesh.addVolume([1257, 1237, 1258, 640, 1576, 1575, 1521, 1666, 1812, 1663], 1072)
-    femmesh.addVolume([665, 1266, 646, 707, 1787, 1656, 1018, 799, 1637, 1021], 1073)
-    femmesh.addVolume([1239, 1270, 675, 638, 1591, 1814, 1813, 1815, 1816, 967], 1074)
-    femmesh.addVolume([693, 643, 652, 1245, 1001, 998, 793, 1691, 1690, 1788], 1075)
-    femmesh.addVolume([1234, 643, 1289, 1245, 1728, 1688, 1553, 1552, 1690, 1405], 1076)
-    femmesh.addVolume([322, 651, 698, 1290, 1817, 891, 1802, 1803, 1693, 1692], 1077)
-    femmesh.addVolume([1291, 1239, 1248, 713, 1588, 1587, 1430, 1818, 1731, 1730], 1078)
-    femmesh.addVolume([1269, 1270, 1239, 638, 1590, 1591, 1592, 1819, 1816, 1815], 1079)
-    femmesh.addVolume([314, 695, 312, 1304, 1821, 1820, 362, 1822, 1774, 1823], 1080)
-    femmesh.addVolume([638, 675, 1239, 671, 967, 1813, 1815, 968, 966, 1824], 1081)
-    femmesh.addVolume([1242, 1304, 1270, 638, 1608, 1502, 1609, 1687, 1686, 1816], 1082)
-    femmesh.addVolume([1277, 309, 307, 714, 1826, 401, 1825, 1827, 1828, 1829], 1083)
-    femmesh.addVolume([1068, 1056, 711, 1283, 1114, 1831, 1830, 1832, 1833, 1834], 1084)
-    femmesh.addVolume([318, 1282, 319, 708, 1836, 1835, 386, 1837, 1838, 1839], 1085)
-    femmesh.addVolume([691, 1303, 1072, 1073, 1790, 1841, 1840, 1842, 1843, 1153], 1086)
-    femmesh.addVolume([1269, 638, 1239, 671, 1819, 1815, 1592, 1844, 968, 1824], 1087)
-    femmesh.addVolume([320, 710, 317, 1301, 1672, 1677, 371, 1670, 1634, 1679], 1088)
-    femmesh.addVolume([1268, 678, 1301, 1241, 1845, 1639, 1491, 1603, 1640, 1601], 1089)
-    femmesh.addVolume([712, 310, 311, 1292, 1847, 356, 1846, 1806, 1848, 1849], 1090)
-    femmesh.addVolume([1257, 657, 1230, 655, 1753, 1745, 1523, 1754, 940, 1746], 1091)
-    femmesh.addVolume([1288, 688, 306, 1255, 1852, 1851, 1850, 1514, 1809, 1853], 1092)
-    femmesh.addVolume([1291, 713, 1074, 1079, 1818, 1855, 1854, 1856, 1857, 1159], 1093)
-    femmesh.addVolume([1061, 1302, 1077, 707, 1700, 1858, 1144, 1702, 1638, 1859], 1094)
-    femmesh.addVolume([1238, 663, 689, 641, 1648, 880, 1649, 1673, 989, 985], 1095)
-    femmesh.addVolume([657, 1230, 1258, 1257, 1745, 1522, 1757, 1753, 1523, 1521], 1096)
-    femmesh.addVolume([1268, 1234, 678, 1267, 1555, 1763, 1845, 1556, 1557, 1680], 1097)
-    femmesh.addVolume([1267, 643, 678, 673, 1764, 1003, 1680, 1860, 1004, 1002], 1098)
-    femmesh.addVolume([1256, 658, 636, 656, 1750, 946, 1752, 1756, 947, 948], 1099)
-    femmesh.addVolume([1250, 651, 642, 694, 1807, 992, 1808, 1861, 894, 993], 1100)
-    femmesh.addVolume([658, 1231, 1255, 1256, 1751, 1530, 1747, 1750, 1528, 1529], 1101)
-    femmesh.addVolume([1256, 1075, 1287, 687, 1863, 1862, 1436, 1791, 1864, 1865], 1102)
-    femmesh.addVolume([642, 697, 652, 1245, 994, 790, 990, 1805, 1866, 1788], 1103)
-    femmesh.addVolume([1237, 1280, 1258, 640, 1574, 1375, 1575, 1812, 1664, 1663], 1104)
-    femmesh.addVolume([1276, 1064, 697, 1245, 1742, 1740, 1743, 1402, 1810, 1866], 1105)
-    femmesh.addVolume([1263, 650, 1242, 653, 1867, 1685, 1606, 1868, 961, 1727], 1106)
-    femmesh.addVolume([1236, 1282, 1246, 708, 1567, 1474, 1566, 1711, 1838, 1710], 1107)
-    femmesh.addVolume([1277, 1235, 1244, 714, 1564, 1563, 1459, 1827, 1718, 1717], 1108)
-    femmesh.addVolume([678, 1234, 698, 643, 1763, 1695, 888, 1003, 1728, 1000], 1109)
-    femmesh.addVolume([1304, 695, 1270, 638, 1774, 1869, 1502, 1686, 964, 1816], 1110)
-    femmesh.addVolume([1252, 709, 1281, 1236, 1733, 1800, 1396, 1565, 1734, 1570], 1111)
-    femmesh.addVolume([1280, 692, 1071, 1258, 1661, 1871, 1870, 1375, 1662, 1872], 1112)
-    femmesh.addVolume([1248, 1254, 669, 648, 1586, 1874, 1873, 1732, 1724, 1031], 1113)
-    femmesh.addVolume([641, 1238, 663, 665, 1673, 1648, 989, 988, 1676, 987], 1114)
-    femmesh.addVolume([309, 1277, 1244, 714, 1826, 1459, 1875, 1828, 1827, 1717], 1115)
-    femmesh.addVolume([315, 663, 689, 1286, 1877, 880, 1876, 1878, 1647, 1646], 1116)
-    femmesh.addVolume([318, 1246, 1282, 708, 1879, 1474, 1836, 1837, 1710, 1838], 1117)
-    femmesh.addVolume([1234, 1290, 651, 1250, 1554, 1693, 1694, 1551, 1483, 1807], 1118)
-    femmesh.addVolume([636, 700, 1293, 656, 949, 1707, 1708, 948, 827, 1880], 1119)
-    femmesh.addVolume([683, 1285, 665, 1078, 1696, 1675, 804, 1881, 1882, 1883], 1120)
-    femmesh.addVolume([712, 1239, 675, 648, 1722, 1813, 868, 1032, 1723, 1034], 1121)
-    femmesh.addVolume([1303, 1242, 1269, 638, 1607, 1610, 1424, 1725, 1687, 1819], 1122)
-    femmesh.addVolume([1267, 673, 646, 707, 1860, 1023, 1660, 1641, 801, 1021], 1123)
-    femmesh.addVolume([1296, 655, 635, 699, 1884, 941, 1681, 1683, 928, 942], 1124)
-    femmesh.addVolume([1057, 1279, 686, 1243, 1773, 1772, 1770, 1885, 1387, 1886], 1125)
-    femmesh.addVolume([316, 1247, 1275, 684, 1887, 1468, 1776, 1777, 1888, 1778], 1126)
-    femmesh.addVolume([1239, 648, 713, 671, 1723, 1033, 1731, 1824, 1035, 818], 1127)
-    femmesh.addVolume([642, 1233, 1245, 1250, 1889, 1545, 1805, 1808, 1543, 1544], 1128)
-    femmesh.addVolume([1257, 303, 1284, 696, 1891, 1890, 1453, 1669, 1892, 1668], 1129)
-    femmesh.addVolume([702, 658, 636, 1294, 857, 946, 950, 1715, 1893, 1714], 1130)
-    femmesh.addVolume([638, 1269, 1303, 691, 1819, 1424, 1725, 965, 1894, 1790], 1131)
-    femmesh.addVolume([635, 701, 657, 1295, 943, 756, 939, 1697, 1698, 1895], 1132)
-    femmesh.addVolume([712, 1292, 675, 1239, 1806, 1896, 868, 1722, 1589, 1813], 1133)
-    femmesh.addVolume([1256, 1293, 636, 1231, 1439, 1708, 1752, 1528, 1532, 1621], 1134)
-    femmesh.addVolume([653, 1303, 1072, 691, 1726, 1841, 1897, 810, 1790, 1840], 1135)
-    femmesh.addVolume([1264, 1238, 689, 641, 1577, 1649, 1659, 1898, 1673, 985], 1136)
-    femmesh.addVolume([695, 314, 650, 1304, 1821, 1899, 874, 1774, 1822, 1684], 1137)
-    femmesh.addVolume([1264, 650, 1242, 1263, 1900, 1685, 1605, 1578, 1867, 1606], 1138)
-    femmesh.addVolume([711, 1253, 1283, 1235, 1736, 1381, 1834, 1737, 1561, 1560], 1139)
-    femmesh.addVolume([670, 1248, 669, 648, 1901, 1873, 973, 1030, 1732, 1031], 1140)
-    femmesh.addVolume([1284, 1237, 1257, 640, 1573, 1576, 1453, 1667, 1812, 1666], 1141)
-    femmesh.addVolume([678, 1241, 1268, 1267, 1640, 1603, 1845, 1680, 1604, 1556], 1142)
-    femmesh.addVolume([1292, 712, 310, 1254, 1806, 1847, 1848, 1508, 1721, 1902], 1143)
-    femmesh.addVolume([1055, 690, 649, 1279, 1766, 776, 1903, 1768, 1767, 1904], 1144)
-    femmesh.addVolume([1055, 649, 686, 1279, 1903, 773, 1771, 1768, 1904, 1772], 1145)
-    femmesh.addVolume([684, 1275, 313, 654, 1778, 1775, 1779, 908, 1905, 1906], 1146)
-    femmesh.addVolume([1275, 685, 313, 654, 1781, 1783, 1775, 1905, 911, 1906], 1147)
-    femmesh.addVolume([1266, 1265, 663, 646, 1583, 1786, 1907, 1656, 1651, 1019], 1148)
-    femmesh.addVolume([1265, 663, 1238, 1266, 1786, 1648, 1584, 1583, 1907, 1582], 1149)
-    femmesh.addVolume([646, 663, 1266, 665, 1019, 1907, 1656, 1018, 987, 1787], 1150)
-    femmesh.addVolume([1266, 663, 1238, 665, 1907, 1648, 1582, 1787, 987, 1676], 1151)
-    femmesh.addVolume([1296, 1230, 635, 655, 1524, 1623, 1681, 1884, 1746, 941], 1152)
-    femmesh.addVolume([678, 646, 1267, 673, 1022, 1660, 1680, 1002, 1023, 1860], 1153)
-    femmesh.addVolume([1294, 658, 636, 1231, 1893, 946, 1714, 1531, 1751, 1621], 1154)
-    femmesh.addVolume([1289, 1234, 1267, 643, 1553, 1557, 1408, 1688, 1728, 1764], 1155)
-    femmesh.addVolume([713, 1291, 1239, 671, 1818, 1588, 1731, 818, 1908, 1824], 1156)
-    femmesh.addVolume([1236, 709, 664, 645, 1734, 783, 1909, 1712, 1014, 1013], 1157)
-    femmesh.addVolume([708, 1236, 666, 645, 1711, 1910, 900, 1015, 1712, 1012], 1158)
-    femmesh.addVolume([1074, 1291, 1248, 713, 1854, 1430, 1911, 1855, 1818, 1730], 1159)
-    femmesh.addVolume([1235, 668, 711, 647, 1912, 765, 1737, 1719, 1024, 1027], 1160)
-    femmesh.addVolume([1295, 657, 635, 1230, 1895, 939, 1697, 1525, 1745, 1623], 1161)
-    femmesh.addVolume([1235, 714, 667, 647, 1718, 918, 1913, 1719, 1026, 1025], 1162)
-    femmesh.addVolume([652, 1064, 693, 1245, 1914, 1792, 793, 1788, 1810, 1691], 1163)
-    femmesh.addVolume([1278, 322, 1250, 694, 1759, 1915, 1480, 1762, 1761, 1861], 1164)
-    femmesh.addVolume([1279, 649, 686, 1243, 1904, 773, 1772, 1387, 1916, 1886], 1165)
-    femmesh.addVolume([684, 1247, 1275, 654, 1888, 1468, 1778, 908, 1917, 1905], 1166)
-    femmesh.addVolume([1281, 1062, 709, 1252, 1799, 1797, 1800, 1396, 1918, 1733], 1167)
-    femmesh.addVolume([678, 1268, 698, 1234, 1845, 1784, 888, 1763, 1555, 1695], 1168)
-    femmesh.addVolume([687, 1287, 1240, 670, 1865, 1595, 1919, 821, 1920, 1921], 1169)
-    femmesh.addVolume([1263, 1238, 1264, 641, 1579, 1577, 1578, 1755, 1673, 1898], 1170)
-    femmesh.addVolume([1286, 689, 315, 1264, 1646, 1876, 1878, 1497, 1659, 1922], 1171)
-    femmesh.addVolume([676, 672, 1237, 640, 980, 1924, 1923, 981, 982, 1812], 1172)
-    femmesh.addVolume([1279, 1058, 690, 1249, 1769, 1765, 1767, 1390, 1925, 1926], 1173)
-    femmesh.addVolume([683, 1263, 1285, 1078, 1785, 1419, 1696, 1881, 1927, 1882], 1174)
-    femmesh.addVolume([1263, 641, 650, 653, 1755, 984, 1867, 1868, 983, 961], 1175)
-    femmesh.addVolume([308, 1275, 1251, 685, 1780, 1465, 1928, 1782, 1781, 1929], 1176)
-    femmesh.addVolume([1288, 669, 688, 1240, 1930, 863, 1852, 1596, 1931, 1932], 1177)
-    femmesh.addVolume([1243, 649, 686, 637, 1916, 773, 1886, 1933, 955, 956], 1178)
-    femmesh.addVolume([661, 1070, 1293, 700, 1935, 1934, 1709, 830, 1936, 1707], 1179)
-    femmesh.addVolume([1260, 300, 1296, 699, 1938, 1937, 1446, 1682, 1939, 1683], 1180)
-    femmesh.addVolume([1295, 701, 1067, 1259, 1698, 1941, 1940, 1368, 1699, 1942], 1181)
-    femmesh.addVolume([1294, 702, 297, 1261, 1715, 1944, 1943, 1519, 1716, 1945], 1182)
-    femmesh.addVolume([1244, 672, 1237, 676, 1946, 1924, 1572, 1947, 980, 1923], 1183)
-    femmesh.addVolume([669, 1254, 712, 648, 1874, 1721, 867, 1031, 1724, 1032], 1184)
-    femmesh.addVolume([677, 1276, 697, 1233, 1948, 1743, 787, 1949, 1546, 1950], 1185)
-    femmesh.addVolume([659, 1067, 701, 1259, 1951, 1941, 751, 1619, 1942, 1699], 1186)
-    femmesh.addVolume([660, 297, 702, 1261, 1952, 1944, 852, 1612, 1945, 1716], 1187)
-    femmesh.addVolume([1242, 1303, 1263, 653, 1607, 1422, 1606, 1727, 1726, 1868], 1188)
-    femmesh.addVolume([1304, 650, 1242, 1264, 1684, 1685, 1608, 1501, 1900, 1605], 1189)
-    femmesh.addVolume([669, 1240, 1254, 1248, 1931, 1593, 1874, 1873, 1594, 1586], 1190)
-    femmesh.addVolume([677, 1246, 1233, 674, 1953, 1549, 1949, 995, 1954, 1955], 1191)
-    femmesh.addVolume([649, 1249, 690, 644, 1956, 1926, 776, 1006, 1957, 1007], 1192)
-    femmesh.addVolume([644, 1247, 684, 654, 1958, 1888, 1008, 1005, 1917, 908], 1193)
-    femmesh.addVolume([652, 697, 1064, 1245, 790, 1740, 1914, 1788, 1866, 1810], 1194)
-    femmesh.addVolume([1283, 711, 1068, 1253, 1834, 1830, 1832, 1381, 1736, 1959], 1195)
-    femmesh.addVolume([687, 1240, 639, 670, 1919, 1789, 971, 821, 1921, 974], 1196)
-    femmesh.addVolume([1248, 670, 713, 648, 1901, 816, 1730, 1732, 1030, 1033], 1197)
-    femmesh.addVolume([662, 300, 1260, 699, 1960, 1938, 1631, 931, 1939, 1682], 1198)
-    femmesh.addVolume([1293, 1070, 661, 1262, 1934, 1935, 1709, 1441, 1961, 1626], 1199)
-    femmesh.addVolume([687, 1256, 1075, 656, 1791, 1863, 1864, 824, 1756, 1962], 1200)
-    femmesh.addVolume([676, 1244, 672, 647, 1947, 1946, 980, 1028, 1720, 1029], 1201)
-    femmesh.addVolume([1284, 676, 1237, 640, 1744, 1923, 1573, 1667, 981, 1812], 1202)
-    femmesh.addVolume([1263, 1264, 650, 641, 1578, 1900, 1867, 1755, 1898, 984], 1203)
-    femmesh.addVolume([1290, 698, 321, 1268, 1692, 1801, 1804, 1486, 1784, 1963], 1204)
-    femmesh.addVolume([674, 677, 1246, 645, 995, 1953, 1954, 1017, 1016, 1713], 1205)
-    femmesh.addVolume([637, 685, 1251, 654, 957, 1929, 1964, 954, 911, 1965], 1206)
-    femmesh.addVolume([1248, 669, 1240, 670, 1873, 1931, 1594, 1901, 973, 1921], 1207)
-    femmesh.addVolume([1246, 677, 1252, 645, 1953, 1966, 1548, 1713, 1016, 1735], 1208)
-    femmesh.addVolume([1252, 1233, 677, 1246, 1547, 1949, 1966, 1548, 1549, 1953], 1209)
-    femmesh.addVolume([643, 1267, 1289, 673, 1764, 1408, 1688, 1004, 1860, 1811], 1210)
-    femmesh.addVolume([636, 1293, 1256, 656, 1708, 1439, 1752, 948, 1880, 1756], 1211)
-    femmesh.addVolume([697, 642, 677, 1233, 994, 996, 787, 1950, 1889, 1949], 1212)
-    femmesh.addVolume([651, 1290, 322, 1250, 1693, 1803, 1817, 1807, 1483, 1915], 1213)
-    femmesh.addVolume([638, 1242, 650, 653, 1687, 1685, 963, 962, 1727, 961], 1214)
-    femmesh.addVolume([306, 688, 658, 1255, 1851, 860, 1967, 1853, 1809, 1747], 1215)
-    femmesh.addVolume([1254, 1248, 1239, 648, 1586, 1587, 1585, 1724, 1732, 1723], 1216)
-    femmesh.addVolume([1233, 642, 677, 674, 1889, 996, 1949, 1955, 997, 995], 1217)
-    femmesh.addVolume([649, 1279, 690, 1249, 1904, 1767, 776, 1956, 1390, 1926], 1218)
-    femmesh.addVolume([1244, 1253, 672, 647, 1562, 1968, 1946, 1720, 1738, 1029], 1219)
-    femmesh.addVolume([1251, 685, 1275, 654, 1929, 1781, 1465, 1965, 911, 1905], 1220)
-    femmesh.addVolume([651, 1250, 322, 694, 1807, 1915, 1817, 894, 1861, 1761], 1221)
-    femmesh.addVolume([672, 1237, 1253, 1244, 1924, 1571, 1968, 1946, 1572, 1562], 1222)
-    femmesh.addVolume([1230, 1296, 1257, 655, 1524, 1450, 1523, 1746, 1884, 1754], 1223)
-    femmesh.addVolume([1281, 709, 664, 1236, 1800, 783, 1969, 1570, 1734, 1909], 1224)
-    femmesh.addVolume([1255, 658, 1294, 1231, 1747, 1893, 1517, 1530, 1751, 1531], 1225)
-    femmesh.addVolume([676, 1284, 303, 696, 1744, 1890, 1970, 922, 1668, 1892], 1226)
-    femmesh.addVolume([1071, 672, 692, 1280, 1971, 762, 1871, 1870, 1972, 1661], 1227)
-    femmesh.addVolume([688, 669, 639, 1240, 863, 975, 972, 1932, 1931, 1789], 1228)
-    femmesh.addVolume([693, 673, 1289, 1060, 796, 1811, 1689, 1795, 1973, 1794], 1229)
-    femmesh.addVolume([1258, 657, 1295, 1230, 1757, 1895, 1372, 1522, 1745, 1525], 1230)
-    femmesh.addVolume([694, 1233, 1278, 674, 1974, 1550, 1762, 897, 1955, 1975], 1231)
-    femmesh.addVolume([655, 1296, 305, 699, 1884, 1977, 1976, 928, 1683, 1978], 1232)
-    femmesh.addVolume([1293, 700, 1080, 656, 1707, 1980, 1979, 1880, 827, 1981], 1233)
-    femmesh.addVolume([649, 1243, 1232, 637, 1916, 1537, 1982, 955, 1933, 1983], 1234)
-    femmesh.addVolume([1063, 657, 701, 1295, 1985, 756, 1984, 1986, 1895, 1698], 1235)
-    femmesh.addVolume([714, 1244, 676, 647, 1717, 1947, 919, 1026, 1720, 1028], 1236)
-    femmesh.addVolume([666, 1282, 1236, 708, 1987, 1567, 1910, 900, 1838, 1711], 1237)
-    femmesh.addVolume([639, 1240, 669, 670, 1789, 1931, 975, 974, 1921, 973], 1238)
-    femmesh.addVolume([1283, 668, 711, 1235, 1988, 765, 1834, 1560, 1912, 1737], 1239)
-    femmesh.addVolume([304, 658, 702, 1294, 1990, 857, 1989, 1991, 1893, 1715], 1240)
-    femmesh.addVolume([667, 1235, 1277, 714, 1913, 1564, 1992, 918, 1718, 1827], 1241)
-    femmesh.addVolume([1062, 1059, 677, 1276, 1132, 1994, 1993, 1995, 1741, 1948], 1242)
-    femmesh.addVolume([1252, 677, 709, 645, 1966, 784, 1733, 1735, 1016, 1014], 1243)
-    femmesh.addVolume([1247, 644, 1232, 654, 1958, 1996, 1541, 1917, 1005, 1997], 1244)
-    femmesh.addVolume([1249, 649, 1232, 644, 1956, 1982, 1540, 1957, 1006, 1996], 1245)
-    femmesh.addVolume([672, 1253, 711, 647, 1968, 1736, 767, 1029, 1738, 1027], 1246)
-    femmesh.addVolume([1233, 694, 642, 674, 1974, 993, 1889, 1955, 897, 997], 1247)
-    femmesh.addVolume([1246, 708, 674, 645, 1710, 902, 1954, 1713, 1015, 1017], 1248)
-    femmesh.addVolume([1249, 1247, 1236, 644, 1539, 1569, 1568, 1957, 1958, 1998], 1249)
-    femmesh.addVolume([672, 1071, 1068, 1280, 1971, 1111, 1999, 1972, 1870, 2000], 1250)
-    femmesh.addVolume([637, 1251, 1232, 654, 1964, 1536, 1983, 954, 1965, 1997], 1251)
-    femmesh.addVolume([1243, 1235, 1251, 637, 1559, 1558, 1535, 1933, 2001, 1964], 1252)
-    femmesh.addVolume([1284, 303, 309, 676, 1890, 404, 2002, 1744, 1970, 2003], 1253)
-    femmesh.addVolume([677, 1059, 697, 1276, 1994, 1739, 787, 1948, 1741, 1743], 1254)
-    femmesh.addVolume([687, 1075, 1287, 670, 1864, 1862, 1865, 821, 2004, 1920], 1255)
-    femmesh.addVolume([1287, 1075, 1074, 670, 1862, 1162, 2005, 1920, 2004, 2006], 1256)
-    femmesh.addVolume([1235, 1243, 668, 637, 1559, 2007, 1912, 2001, 1933, 959], 1257)
-    femmesh.addVolume([306, 669, 688, 1288, 2008, 863, 1851, 1850, 1930, 1852], 1258)
-    femmesh.addVolume([666, 1236, 1247, 644, 1910, 1569, 2009, 1010, 1998, 1958], 1259)
-    femmesh.addVolume([669, 306, 310, 1288, 2008, 353, 2010, 1930, 1850, 2011], 1260)
-    femmesh.addVolume([1232, 649, 1279, 1243, 1982, 1904, 1538, 1537, 1916, 1387], 1261)
-    femmesh.addVolume([1236, 664, 1249, 644, 1909, 2012, 1568, 1998, 1011, 1957], 1262)
-    femmesh.addVolume([318, 323, 1278, 674, 383, 1758, 2013, 2014, 2015, 1975], 1263)
-    femmesh.addVolume([1069, 664, 1058, 1281, 2017, 2016, 1126, 1798, 1969, 2018], 1264)
-    femmesh.addVolume([1232, 1275, 1247, 654, 1542, 1468, 1541, 1997, 1905, 1917], 1265)
-    femmesh.addVolume([315, 689, 314, 1264, 1876, 2019, 365, 1922, 1659, 2020], 1266)
-    femmesh.addVolume([1237, 1284, 1244, 676, 1573, 1456, 1572, 1923, 1744, 1947], 1267)
-    femmesh.addVolume([1263, 683, 1072, 1078, 1785, 2022, 2021, 1927, 1881, 1150], 1268)
-    femmesh.addVolume([637, 1235, 1251, 667, 2001, 1558, 1964, 960, 1913, 2023], 1269)
-    femmesh.addVolume([663, 1286, 315, 1265, 1647, 1878, 1877, 1786, 1494, 2024], 1270)
-    femmesh.addVolume([665, 1285, 1266, 1078, 1675, 1416, 1787, 1883, 1882, 2025], 1271)
-    femmesh.addVolume([1232, 1279, 649, 1249, 1538, 1904, 1982, 1540, 1390, 1956], 1272)
-    femmesh.addVolume([1275, 1232, 1251, 654, 1542, 1536, 1465, 1905, 1997, 1965], 1273)
-    femmesh.addVolume([1075, 1256, 1080, 656, 1863, 2026, 1165, 1962, 1756, 1981], 1274)
-    femmesh.addVolume([306, 658, 304, 1255, 1967, 1990, 350, 1853, 1747, 2027], 1275)
-    femmesh.addVolume([1056, 1057, 668, 1283, 1117, 2029, 2028, 1833, 2030, 1988], 1276)
-    femmesh.addVolume([1277, 307, 308, 667, 1825, 398, 2031, 1992, 2032, 2033], 1277)
-    femmesh.addVolume([316, 319, 1282, 666, 389, 1835, 2034, 2035, 2036, 1987], 1278)
-    femmesh.addVolume([1301, 320, 678, 1268, 1670, 1671, 1639, 1491, 2037, 1845], 1279)
-    femmesh.addVolume([1303, 691, 1269, 1073, 1790, 1894, 1424, 1843, 1842, 2038], 1280)
-    femmesh.addVolume([650, 1264, 689, 641, 1900, 1659, 877, 984, 1898, 985], 1281)
-    femmesh.addVolume([694, 1278, 323, 674, 1762, 1758, 1760, 897, 1975, 2015], 1282)
-    femmesh.addVolume([712, 311, 675, 1292, 1846, 2039, 868, 1806, 1849, 1896], 1283)
-    femmesh.addVolume([695, 1270, 312, 1304, 1869, 2040, 1820, 1774, 1502, 1823], 1284)
-    femmesh.addVolume([302, 660, 242, 1261, 2043, 2042, 2041, 2044, 1612, 1643], 1285)
-    femmesh.addVolume([1080, 1256, 1293, 656, 2026, 1439, 1979, 1981, 1756, 1880], 1286)
-    femmesh.addVolume([678, 321, 698, 1268, 2045, 1801, 888, 1845, 1963, 1784], 1287)
-    femmesh.addVolume([1253, 1244, 1235, 647, 1562, 1563, 1561, 1738, 1720, 1719], 1288)
-    femmesh.addVolume([668, 1057, 686, 1243, 2029, 1770, 770, 2007, 1885, 1886], 1289)
-    femmesh.addVolume([1246, 1252, 1236, 645, 1548, 1565, 1566, 1713, 1735, 1712], 1290)
-    femmesh.addVolume([684, 316, 1247, 666, 1777, 1887, 1888, 905, 2035, 2009], 1291)
-    femmesh.addVolume([1253, 672, 1280, 1237, 1968, 1972, 1378, 1571, 1924, 1574], 1292)
-    femmesh.addVolume([658, 1294, 304, 1255, 1893, 1991, 1990, 1747, 1517, 2027], 1293)
-    femmesh.addVolume([305, 1257, 1296, 655, 2046, 1450, 1977, 1976, 1754, 1884], 1294)
-    femmesh.addVolume([653, 1263, 641, 683, 1868, 1755, 983, 807, 1785, 986], 1295)
-    femmesh.addVolume([309, 1244, 1284, 676, 1875, 1456, 2002, 2003, 1947, 1744], 1296)
-    femmesh.addVolume([1252, 1276, 677, 1233, 1399, 1948, 1966, 1547, 1546, 1949], 1297)
-    femmesh.addVolume([666, 664, 1236, 644, 1009, 1909, 1910, 1010, 1011, 1998], 1298)
-    femmesh.addVolume([673, 1267, 1061, 707, 1860, 1701, 2047, 801, 1641, 1702], 1299)
-    femmesh.addVolume([1283, 1057, 668, 1243, 2030, 2029, 1988, 1384, 1885, 2007], 1300)
-    femmesh.addVolume([1247, 316, 1282, 666, 1887, 2034, 1471, 2009, 2035, 1987], 1301)
-    femmesh.addVolume([637, 668, 1235, 667, 959, 1912, 2001, 960, 958, 1913], 1302)
-    femmesh.addVolume([297, 660, 302, 1261, 1952, 2043, 344, 1945, 1612, 2044], 1303)
-    femmesh.addVolume([1067, 659, 1066, 1259, 1951, 2048, 1102, 1942, 1619, 1704], 1304)
-    femmesh.addVolume([1295, 1063, 657, 1258, 1986, 1985, 1895, 1372, 2049, 1757], 1305)
-    femmesh.addVolume([317, 710, 663, 1265, 1677, 884, 2050, 1678, 1633, 1786], 1306)
-    femmesh.addVolume([242, 1298, 302, 1261, 1642, 2051, 2041, 1643, 1364, 2044], 1307)
-    femmesh.addVolume([1278, 1233, 1246, 674, 1550, 1549, 1477, 1975, 1955, 1954], 1308)
-    femmesh.addVolume([1240, 1287, 1248, 670, 1595, 1433, 1594, 1921, 1920, 1901], 1309)
-    femmesh.addVolume([1254, 669, 1288, 1240, 1874, 1930, 1511, 1593, 1931, 1596], 1310)
-    femmesh.addVolume([1291, 671, 713, 1079, 1908, 818, 1818, 1856, 2052, 1857], 1311)
-    femmesh.addVolume([1246, 318, 1278, 674, 1879, 2013, 1477, 1954, 2014, 1975], 1312)
-    femmesh.addVolume([664, 1069, 709, 1281, 2017, 1796, 783, 1969, 1798, 1800], 1313)
-    femmesh.addVolume([644, 649, 1232, 654, 1006, 1982, 1996, 1005, 953, 1997], 1314)
-    femmesh.addVolume([637, 1232, 649, 654, 1983, 1982, 955, 954, 1997, 953], 1315)
-    femmesh.addVolume([1062, 1276, 677, 1252, 1995, 1948, 1993, 1918, 1399, 1966], 1316)
-    femmesh.addVolume([1232, 1247, 1249, 644, 1541, 1539, 1540, 1996, 1958, 1957], 1317)
-    femmesh.addVolume([1244, 676, 309, 714, 1947, 2003, 1875, 1717, 919, 1828], 1318)
-    femmesh.addVolume([1251, 1232, 1243, 637, 1536, 1537, 1535, 1964, 1983, 1933], 1319)
-    femmesh.addVolume([1074, 1248, 1287, 670, 1911, 1433, 2005, 2006, 1901, 1920], 1320)
-    femmesh.addVolume([672, 1280, 1068, 1253, 1972, 2000, 1999, 1968, 1378, 1959], 1321)
-    femmesh.addVolume([242, 705, 660, 302, 2053, 854, 2042, 2041, 2054, 2043], 1322)
-    femmesh.addVolume([192, 706, 659, 1066, 2055, 753, 1657, 2056, 2057, 2048], 1323)
-    femmesh.addVolume([299, 1260, 1300, 187, 2059, 1350, 2058, 2060, 1655, 1654], 1324)
-    femmesh.addVolume([187, 299, 1260, 662, 2060, 2059, 1655, 2061, 2062, 1631], 1325)
-    femmesh.addVolume([674, 1246, 318, 708, 1954, 1879, 2014, 902, 1710, 1837], 1326)
-    femmesh.addVolume([673, 1267, 1289, 1060, 1860, 1408, 1811, 1973, 2063, 1794], 1327)
-    femmesh.addVolume([669, 1288, 310, 1254, 1930, 2011, 2010, 1874, 1511, 1902], 1328)
-    femmesh.addVolume([1269, 1242, 1270, 638, 1610, 1609, 1590, 1819, 1687, 1816], 1329)
-    femmesh.addVolume([1058, 1281, 664, 1249, 2018, 1969, 2016, 1925, 1393, 2012], 1330)
-    femmesh.addVolume([1070, 1262, 1081, 661, 1961, 2064, 1171, 1935, 1626, 2065], 1331)
-    femmesh.addVolume([300, 1260, 299, 662, 1938, 2059, 413, 1960, 1631, 2062], 1332)
-    femmesh.addVolume([648, 1239, 675, 671, 1723, 1813, 1034, 1035, 1824, 966], 1333)
-    femmesh.addVolume([650, 314, 689, 1264, 1899, 2019, 877, 1900, 2020, 1659], 1334)
-    femmesh.addVolume([661, 1262, 1081, 247, 1626, 2064, 2065, 2066, 2067, 2068], 1335)
-    femmesh.addVolume([1263, 653, 1072, 683, 1868, 1897, 2021, 1785, 807, 2022], 1336)
-    femmesh.addVolume([666, 319, 1282, 708, 2036, 1835, 1987, 900, 1839, 1838], 1337)
-    femmesh.addVolume([668, 711, 1056, 1283, 765, 1831, 2028, 1988, 1834, 1833], 1338)
-    femmesh.addVolume([667, 1277, 307, 714, 1992, 1825, 2032, 918, 1827, 1829], 1339)
-    femmesh.addVolume([664, 690, 1058, 1249, 779, 1765, 2016, 2012, 1926, 1925], 1340)
-    femmesh.addVolume([308, 1251, 1277, 667, 1928, 1462, 2031, 2033, 2023, 1992], 1341)
-    femmesh.addVolume([685, 1251, 308, 667, 1929, 1928, 1782, 914, 2023, 2033], 1342)
-    femmesh.addVolume([668, 1243, 686, 637, 2007, 1886, 770, 959, 1933, 956], 1343)
-    femmesh.addVolume([662, 187, 299, 703, 2061, 2060, 2062, 933, 2069, 2070], 1344)
-    femmesh.addVolume([661, 1081, 704, 247, 2065, 2071, 832, 2066, 2068, 2072], 1345)
-    femmesh.addVolume([1249, 664, 690, 644, 2012, 779, 1926, 1957, 1011, 1007], 1346)
-    femmesh.addVolume([666, 1247, 684, 644, 2009, 1888, 905, 1010, 1958, 1008], 1347)
-    femmesh.addVolume([675, 1270, 695, 638, 1814, 1869, 871, 967, 1816, 964], 1348)
-    femmesh.addVolume([637, 1251, 685, 667, 1964, 1929, 957, 960, 2023, 914], 1349)
-    femmesh.addVolume([305, 1296, 300, 699, 1977, 1937, 410, 1978, 1683, 1939], 1350)
-    femmesh.addVolume([1063, 701, 1067, 1295, 1984, 1941, 1105, 1986, 1698, 1940], 1351)
-    femmesh.addVolume([709, 1062, 677, 1252, 1797, 1993, 784, 1733, 1918, 1966], 1352)
-    femmesh.addVolume([1239, 1292, 675, 1270, 1589, 1896, 1813, 1591, 1505, 1814], 1353)
-    femmesh.addVolume([1304, 314, 650, 1264, 1822, 1899, 1684, 1501, 2020, 1900], 1354)
-    femmesh.addVolume([1072, 1263, 1303, 653, 2021, 1422, 1841, 1897, 1868, 1726], 1355)
-    femmesh.addVolume([672, 1068, 711, 1253, 1999, 1830, 767, 1968, 1959, 1736], 1356)
-    femmesh.addVolume([675, 311, 312, 1270, 2039, 359, 2073, 1814, 2074, 2040], 1357)
-    femmesh.addVolume([678, 320, 321, 1268, 1671, 374, 2045, 1845, 2037, 1963], 1358)
-    femmesh.addVolume([669, 310, 712, 1254, 2010, 1847, 867, 1874, 1902, 1721], 1359)
-    femmesh.addVolume([1293, 1070, 1080, 700, 1934, 1168, 1979, 1707, 1936, 1980], 1360)
-    femmesh.addVolume([304, 702, 297, 1294, 1989, 1944, 347, 1991, 1715, 1943], 1361)
-    femmesh.addVolume([671, 1269, 638, 691, 1844, 1819, 968, 813, 1894, 965], 1362)
-    femmesh.addVolume([1239, 1291, 1269, 671, 1588, 1427, 1592, 1824, 1908, 1844], 1363)
-    femmesh.addVolume([1074, 713, 1248, 670, 1855, 1730, 1911, 2006, 816, 1901], 1364)
-    femmesh.addVolume([664, 1249, 1281, 1236, 2012, 1393, 1969, 1909, 1568, 1570], 1365)
-    femmesh.addVolume([1282, 1236, 1247, 666, 1567, 1569, 1471, 1987, 1910, 2009], 1366)
-    femmesh.addVolume([1292, 311, 675, 1270, 1849, 2039, 1896, 1505, 2074, 1814], 1367)
-    femmesh.addVolume([1243, 668, 1283, 1235, 2007, 1988, 1384, 1559, 1912, 1560], 1368)
-    femmesh.addVolume([1269, 1073, 671, 1079, 2038, 2075, 1844, 2076, 1156, 2052], 1369)
-    femmesh.addVolume([1267, 673, 1061, 1060, 1860, 2047, 1701, 2063, 1973, 1141], 1370)
-    femmesh.addVolume([675, 312, 695, 1270, 2073, 1820, 871, 1814, 2040, 1869], 1371)
-    femmesh.addVolume([1269, 691, 671, 1073, 1894, 813, 1844, 2038, 1842, 2075], 1372)
-    femmesh.addVolume([1277, 1251, 1235, 667, 1462, 1558, 1564, 1992, 2023, 1913], 1373)
-    femmesh.addVolume([664, 666, 1236, 645, 1009, 1910, 1909, 1013, 1012, 1712], 1374)
-    femmesh.addVolume([667, 668, 1235, 647, 958, 1912, 1913, 1025, 1024, 1719], 1375)
-    femmesh.addVolume([671, 1291, 1269, 1079, 1908, 1427, 1844, 2052, 1856, 2076], 1376)
-    femmesh.addVolume([315, 317, 663, 1265, 368, 2050, 1877, 2024, 1678, 1786], 1377)
-    femmesh.addVolume([665, 1266, 1077, 1078, 1787, 2078, 2077, 1883, 2025, 1147], 1378)
-    femmesh.addVolume([706, 491, 659, 1066, 745, 752, 753, 2057, 1098, 2048], 1379)
-    femmesh.addVolume([14, 660, 705, 302, 853, 854, 846, 340, 2043, 2054], 1380)
-    femmesh.addVolume([1298, 155, 302, 1261, 1518, 468, 2051, 1364, 1520, 2044], 1381)
-    femmesh.addVolume([1299, 561, 1066, 1259, 1365, 1178, 1703, 1341, 1369, 1704], 1382)
-    femmesh.addVolume([703, 299, 662, 37, 2070, 2062, 933, 930, 411, 932], 1383)
-    femmesh.addVolume([303, 696, 305, 35, 1892, 2079, 407, 403, 920, 405], 1384)
-    femmesh.addVolume([704, 514, 1081, 661, 829, 1169, 2071, 832, 831, 2065], 1385)
-    femmesh.addVolume([132, 1260, 1300, 299, 1447, 1350, 1443, 421, 2059, 2058], 1386)
-    femmesh.addVolume([584, 1262, 1297, 1081, 1442, 1355, 1440, 1227, 2064, 2080], 1387)
-    femmesh.addVolume([1071, 692, 493, 1063, 1871, 758, 1106, 1108, 2081, 1104], 1388)
-    femmesh.addVolume([1074, 1287, 581, 1075, 2005, 1431, 1218, 1162, 1862, 1221], 1389)
-    femmesh.addVolume([563, 1071, 1063, 1258, 1185, 1108, 1182, 1371, 1872, 2049], 1390)
-    femmesh.addVolume([570, 1062, 1069, 1281, 1199, 1129, 1196, 1392, 1799, 1798], 1391)
-    femmesh.addVolume([571, 1059, 1062, 1276, 1201, 1132, 1198, 1397, 1741, 1995], 1392)
-    femmesh.addVolume([1058, 569, 1069, 1281, 1194, 1197, 1126, 2018, 1391, 1798], 1393)
-    femmesh.addVolume([143, 322, 1278, 323, 444, 1759, 1475, 443, 380, 1758], 1394)
-    femmesh.addVolume([1280, 1071, 563, 1258, 1870, 1185, 1373, 1375, 1872, 1371], 1395)
-    femmesh.addVolume([1288, 306, 153, 1255, 1850, 463, 1509, 1514, 1853, 1513], 1396)
-    femmesh.addVolume([305, 134, 1257, 303, 425, 1448, 2046, 407, 426, 1891], 1397)
-    femmesh.addVolume([572, 1064, 1059, 1276, 1203, 1135, 1200, 1398, 1742, 1741], 1398)
-    femmesh.addVolume([304, 153, 306, 1255, 464, 463, 350, 2027, 1513, 1853], 1399)
-    femmesh.addVolume([152, 310, 306, 1288, 461, 353, 462, 1510, 2011, 1850], 1400)
-    femmesh.addVolume([1283, 1068, 1056, 565, 1832, 1114, 1833, 1379, 1186, 1189], 1401)
-    femmesh.addVolume([137, 308, 1277, 307, 432, 2031, 1457, 431, 398, 1825], 1402)
-    femmesh.addVolume([1279, 1055, 1058, 568, 1768, 1123, 1769, 1386, 1192, 1195], 1403)
-    femmesh.addVolume([138, 313, 1275, 308, 434, 1775, 1464, 433, 395, 1780], 1404)
-    femmesh.addVolume([114, 1261, 8, 245, 1614, 1324, 115, 261, 1645, 260], 1405)
-    femmesh.addVolume([189, 7, 1259, 98, 204, 1317, 1665, 203, 99, 1618], 1406)
-    femmesh.addVolume([315, 1286, 147, 1265, 1878, 1493, 452, 2024, 1494, 1487], 1407)
-    femmesh.addVolume([1285, 1263, 577, 1078, 1419, 1417, 1415, 1882, 1927, 1210], 1408)
-    femmesh.addVolume([576, 1266, 1285, 1078, 1410, 1416, 1414, 1211, 2025, 1882], 1409)
-    femmesh.addVolume([148, 1286, 315, 1264, 1492, 1878, 453, 1496, 1497, 1922], 1410)
-    femmesh.addVolume([1257, 134, 1284, 303, 1448, 1452, 1453, 1891, 426, 1890], 1411)
-    femmesh.addVolume([696, 655, 305, 35, 925, 1976, 2079, 920, 924, 405], 1412)
-    femmesh.addVolume([564, 1068, 1071, 1280, 1187, 1111, 1184, 1374, 2000, 1870], 1413)
-    femmesh.addVolume([493, 692, 657, 1063, 758, 759, 754, 1104, 2081, 1985], 1414)
-    femmesh.addVolume([698, 321, 25, 322, 1801, 373, 886, 1802, 377, 375], 1415)
-    femmesh.addVolume([190, 7, 98, 1260, 206, 99, 205, 1652, 1320, 1629], 1416)
-    femmesh.addVolume([244, 8, 114, 1262, 258, 115, 259, 2082, 1323, 1625], 1417)
-    femmesh.addVolume([26, 322, 323, 694, 376, 380, 378, 893, 1761, 1760], 1418)
-    femmesh.addVolume([314, 21, 689, 315, 361, 876, 2019, 365, 363, 1876], 1419)
-    femmesh.addVolume([581, 1248, 1287, 1074, 1429, 1433, 1431, 1218, 1911, 2005], 1420)
-    femmesh.addVolume([696, 303, 676, 34, 1892, 1970, 922, 921, 402, 915], 1421)
-    femmesh.addVolume([683, 507, 1072, 1078, 802, 1148, 2022, 1881, 1146, 1150], 1422)
-    femmesh.addVolume([312, 20, 695, 314, 358, 869, 1820, 362, 360, 1821], 1423)
-    femmesh.addVolume([1066, 491, 659, 1067, 1098, 752, 2048, 1102, 1100, 1951], 1424)
-    femmesh.addVolume([690, 498, 1058, 1055, 775, 1121, 1765, 1766, 1119, 1123], 1425)
-    femmesh.addVolume([686, 1057, 497, 1055, 1770, 1116, 768, 1771, 1120, 1118], 1426)
-    femmesh.addVolume([1074, 580, 1291, 1079, 1219, 1426, 1854, 1159, 1216, 1856], 1427)
-    femmesh.addVolume([302, 14, 660, 297, 340, 853, 2043, 344, 342, 1952], 1428)
-    femmesh.addVolume([302, 155, 297, 1261, 468, 467, 344, 2044, 1520, 1945], 1429)
-    femmesh.addVolume([1066, 561, 1067, 1259, 1178, 1181, 1102, 1704, 1369, 1942], 1430)
-    femmesh.addVolume([1064, 1276, 572, 1245, 1742, 1398, 1203, 1810, 1402, 1400], 1431)
-    femmesh.addVolume([684, 313, 316, 30, 1779, 392, 1777, 903, 390, 388], 1432)
-    femmesh.addVolume([313, 685, 308, 31, 1783, 1782, 395, 391, 910, 393], 1433)
-    femmesh.addVolume([697, 502, 1064, 1059, 785, 1133, 1740, 1739, 1131, 1135], 1434)
-    femmesh.addVolume([1064, 1289, 573, 1060, 1793, 1403, 1202, 1138, 1794, 1205], 1435)
-    femmesh.addVolume([1064, 503, 693, 1060, 1134, 792, 1792, 1138, 1136, 1795], 1436)
-    femmesh.addVolume([1282, 319, 141, 318, 1835, 439, 1469, 1836, 386, 440], 1437)
-    femmesh.addVolume([313, 139, 1275, 316, 435, 1463, 1775, 392, 436, 1776], 1438)
-    femmesh.addVolume([1055, 1279, 1057, 567, 1768, 1773, 1120, 1193, 1385, 1190], 1439)
-    femmesh.addVolume([1283, 1056, 1057, 566, 1833, 1117, 2030, 1380, 1188, 1191], 1440)
-    femmesh.addVolume([136, 307, 1277, 309, 430, 1825, 1458, 429, 401, 1826], 1441)
-    femmesh.addVolume([323, 1278, 142, 318, 1758, 1476, 442, 383, 2013, 441], 1442)
-    femmesh.addVolume([319, 1282, 140, 316, 1835, 1470, 438, 389, 2034, 437], 1443)
-    femmesh.addVolume([1281, 1058, 569, 1249, 2018, 1194, 1391, 1393, 1925, 1389], 1444)
-    femmesh.addVolume([1276, 1062, 571, 1252, 1995, 1198, 1397, 1399, 1918, 1395], 1445)
-    femmesh.addVolume([1281, 570, 1062, 1252, 1392, 1199, 1799, 1396, 1394, 1918], 1446)
-    femmesh.addVolume([692, 494, 672, 1071, 757, 761, 762, 1871, 1107, 1971], 1447)
-    femmesh.addVolume([662, 299, 300, 37, 2062, 413, 1960, 932, 411, 409], 1448)
-    femmesh.addVolume([1278, 1250, 322, 143, 1480, 1915, 1759, 1475, 1479, 444], 1449)
-    femmesh.addVolume([691, 1072, 508, 1073, 1840, 1149, 809, 1842, 1153, 1151], 1450)
-    femmesh.addVolume([1292, 310, 311, 151, 1848, 356, 1849, 1503, 460, 459], 1451)
-    femmesh.addVolume([310, 1288, 152, 1254, 2011, 1510, 461, 1902, 1511, 1506], 1452)
-    femmesh.addVolume([106, 299, 1300, 187, 2083, 2058, 1349, 240, 2060, 1654], 1453)
-    femmesh.addVolume([1070, 1081, 514, 661, 1171, 1169, 1167, 1935, 2065, 831], 1454)
-    femmesh.addVolume([299, 132, 1260, 300, 421, 1447, 2059, 413, 422, 1938], 1455)
-    femmesh.addVolume([1262, 1081, 584, 1070, 2064, 1227, 1442, 1961, 1171, 1224], 1456)
-    femmesh.addVolume([676, 303, 309, 34, 1970, 404, 2003, 915, 402, 400], 1457)
-    femmesh.addVolume([321, 144, 322, 1290, 446, 445, 377, 1804, 1482, 1803], 1458)
-    femmesh.addVolume([1068, 565, 1283, 1253, 1186, 1379, 1832, 1959, 1377, 1381], 1459)
-    femmesh.addVolume([242, 122, 1298, 245, 295, 1362, 1642, 280, 263, 1644], 1460)
-    femmesh.addVolume([309, 1284, 135, 303, 2002, 1451, 428, 404, 1890, 427], 1461)
-    femmesh.addVolume([1277, 137, 1251, 308, 1457, 1461, 1462, 2031, 432, 1928], 1462)
-    femmesh.addVolume([568, 1058, 1279, 1249, 1195, 1769, 1386, 1388, 1925, 1390], 1463)
-    femmesh.addVolume([1275, 1251, 138, 308, 1465, 1460, 1464, 1780, 1928, 433], 1464)
-    femmesh.addVolume([1300, 190, 106, 187, 1653, 208, 1349, 1654, 225, 240], 1465)
-    femmesh.addVolume([312, 675, 19, 311, 2073, 864, 357, 359, 2039, 355], 1466)
-    femmesh.addVolume([321, 678, 24, 320, 2045, 881, 372, 374, 1671, 370], 1467)
-    femmesh.addVolume([141, 1246, 1282, 318, 1473, 1474, 1469, 440, 1879, 1836], 1468)
-    femmesh.addVolume([1247, 1275, 139, 316, 1468, 1463, 1467, 1887, 1776, 436], 1469)
-    femmesh.addVolume([1283, 566, 1057, 1243, 1380, 1191, 2030, 1384, 1382, 1885], 1470)
-    femmesh.addVolume([567, 1279, 1057, 1243, 1385, 1773, 1190, 1383, 1387, 1885], 1471)
-    femmesh.addVolume([1277, 1244, 136, 309, 1459, 1454, 1458, 1826, 1875, 429], 1472)
-    femmesh.addVolume([1246, 142, 1278, 318, 1472, 1476, 1477, 1879, 441, 2013], 1473)
-    femmesh.addVolume([1247, 140, 1282, 316, 1466, 1470, 1471, 1887, 437, 2034], 1474)
-    femmesh.addVolume([150, 312, 311, 1270, 457, 359, 458, 1498, 2040, 2074], 1475)
-    femmesh.addVolume([145, 321, 320, 1268, 447, 374, 448, 1485, 1963, 2037], 1476)
-    femmesh.addVolume([501, 1059, 677, 1062, 1130, 1994, 780, 1128, 1132, 1993], 1477)
-    femmesh.addVolume([1068, 672, 494, 1071, 1999, 761, 1109, 1111, 1971, 1107], 1478)
-    femmesh.addVolume([687, 511, 1075, 670, 820, 1160, 1864, 821, 814, 2004], 1479)
-    femmesh.addVolume([25, 651, 698, 322, 890, 891, 886, 375, 1817, 1802], 1480)
-    femmesh.addVolume([26, 651, 322, 694, 889, 1817, 376, 893, 894, 1761], 1481)
-    femmesh.addVolume([1267, 1061, 574, 1060, 1701, 1207, 1406, 2063, 1141, 1204], 1482)
-    femmesh.addVolume([579, 1073, 1269, 1079, 1214, 2038, 1421, 1217, 1156, 2076], 1483)
-    femmesh.addVolume([27, 323, 318, 674, 379, 383, 381, 896, 2015, 2014], 1484)
-    femmesh.addVolume([669, 688, 17, 306, 863, 858, 862, 2008, 1851, 349], 1485)
-    femmesh.addVolume([1073, 509, 671, 1079, 1152, 812, 2075, 1156, 1154, 2052], 1486)
-    femmesh.addVolume([673, 504, 1061, 1060, 795, 1139, 2047, 1973, 1137, 1141], 1487)
-    femmesh.addVolume([1280, 564, 1068, 1253, 1374, 1187, 2000, 1378, 1376, 1959], 1488)
-    femmesh.addVolume([1298, 242, 302, 122, 1642, 2041, 2051, 1362, 295, 2084], 1489)
-    femmesh.addVolume([135, 1244, 1284, 309, 1455, 1456, 1451, 428, 1875, 2002], 1490)
-    femmesh.addVolume([695, 20, 650, 314, 869, 873, 874, 1821, 360, 1899], 1491)
-    femmesh.addVolume([689, 650, 21, 314, 877, 872, 876, 2019, 1899, 361], 1492)
-    femmesh.addVolume([1289, 1064, 573, 1245, 1793, 1202, 1403, 1405, 1810, 1401], 1493)
-    femmesh.addVolume([678, 24, 698, 321, 881, 887, 888, 2045, 372, 1801], 1494)
-    femmesh.addVolume([653, 507, 1072, 683, 806, 1148, 1897, 807, 802, 2022], 1495)
-    femmesh.addVolume([677, 501, 697, 1059, 780, 786, 787, 1994, 1130, 1739], 1496)
-    femmesh.addVolume([649, 498, 690, 1055, 771, 775, 776, 1903, 1119, 1766], 1497)
-    femmesh.addVolume([497, 649, 686, 1055, 772, 773, 768, 1118, 1903, 1771], 1498)
-    femmesh.addVolume([1058, 1069, 499, 664, 1126, 1124, 1122, 2016, 2017, 778], 1499)
-    femmesh.addVolume([147, 317, 315, 1265, 451, 368, 452, 1487, 1678, 2024], 1500)
-    femmesh.addVolume([22, 317, 663, 315, 366, 2050, 879, 364, 368, 1877], 1501)
-    femmesh.addVolume([1072, 577, 1263, 1078, 1213, 1417, 2021, 1150, 1210, 1927], 1502)
-    femmesh.addVolume([307, 32, 308, 667, 396, 394, 398, 2032, 913, 2033], 1503)
-    femmesh.addVolume([316, 29, 319, 666, 387, 385, 389, 2035, 898, 2036], 1504)
-    femmesh.addVolume([668, 1056, 496, 1057, 2028, 1113, 763, 2029, 1117, 1115], 1505)
-    femmesh.addVolume([1077, 1266, 576, 1078, 2078, 1410, 1208, 1147, 2025, 1211], 1506)
-    femmesh.addVolume([17, 310, 669, 306, 351, 2010, 862, 349, 353, 2008], 1507)
-    femmesh.addVolume([314, 148, 315, 1264, 454, 453, 365, 2020, 1496, 1922], 1508)
-    femmesh.addVolume([665, 1077, 506, 1078, 2077, 1143, 797, 1883, 1147, 1145], 1509)
-    femmesh.addVolume([1075, 511, 1074, 670, 1160, 1158, 1162, 2004, 814, 2006], 1510)
-    femmesh.addVolume([1291, 1248, 580, 1074, 1430, 1428, 1426, 1854, 1911, 1219], 1511)
-    femmesh.addVolume([695, 675, 19, 312, 871, 864, 870, 1820, 2073, 357], 1512)
-    femmesh.addVolume([502, 1064, 652, 697, 1133, 1914, 789, 785, 1740, 790], 1513)
-    femmesh.addVolume([117, 585, 1297, 247, 1352, 1353, 1354, 284, 2085, 2086], 1514)
-    femmesh.addVolume([30, 684, 313, 654, 903, 1779, 390, 907, 908, 1906], 1515)
-    femmesh.addVolume([31, 313, 685, 654, 391, 1783, 910, 906, 1906, 911], 1516)
-    femmesh.addVolume([693, 652, 503, 1064, 793, 788, 792, 1792, 1914, 1134], 1517)
-    femmesh.addVolume([150, 311, 1292, 1270, 458, 1849, 1504, 1498, 2074, 1505], 1518)
-    femmesh.addVolume([1290, 321, 145, 1268, 1804, 447, 1481, 1486, 1963, 1485], 1519)
-    femmesh.addVolume([694, 323, 27, 674, 1760, 379, 892, 897, 2015, 896], 1520)
-    femmesh.addVolume([693, 504, 673, 1060, 791, 795, 796, 1795, 1137, 1973], 1521)
-    femmesh.addVolume([508, 653, 1072, 691, 805, 1897, 1149, 809, 810, 1840], 1522)
-    femmesh.addVolume([691, 509, 671, 1073, 808, 812, 813, 1842, 1152, 2075], 1523)
-    femmesh.addVolume([1081, 1297, 585, 247, 2080, 1353, 1226, 2068, 2086, 2085], 1524)
-    femmesh.addVolume([1269, 1291, 579, 1079, 1427, 1425, 1421, 2076, 1856, 1217], 1525)
-    femmesh.addVolume([310, 151, 1292, 1254, 460, 1503, 1848, 1902, 1507, 1508], 1526)
-    femmesh.addVolume([574, 1289, 1267, 1060, 1404, 1408, 1406, 1204, 1794, 2063], 1527)
-    femmesh.addVolume([322, 1290, 144, 1250, 1803, 1482, 445, 1915, 1483, 1478], 1528)
-    femmesh.addVolume([663, 689, 22, 315, 880, 875, 879, 1877, 1876, 364], 1529)
-    femmesh.addVolume([506, 683, 665, 1078, 803, 804, 797, 1145, 1881, 1883], 1530)
-    femmesh.addVolume([1297, 244, 117, 247, 2087, 262, 1354, 2086, 281, 284], 1531)
-    femmesh.addVolume([114, 8, 1261, 1262, 115, 1324, 1614, 1625, 1323, 1326], 1532)
-    femmesh.addVolume([1259, 98, 7, 1260, 1618, 99, 1317, 1321, 1629, 1320], 1533)
-    femmesh.addVolume([499, 690, 1058, 664, 774, 1765, 1122, 778, 779, 2016], 1534)
-    femmesh.addVolume([668, 496, 686, 1057, 763, 769, 770, 2029, 1115, 1770], 1535)
-    femmesh.addVolume([29, 316, 684, 666, 387, 1777, 904, 898, 2035, 905], 1536)
-    femmesh.addVolume([32, 685, 308, 667, 909, 1782, 394, 913, 914, 2033], 1537)
-    femmesh.addVolume([106, 131, 1300, 299, 1345, 1348, 1349, 2083, 420, 2058], 1538)
-    femmesh.addVolume([196, 195, 194, 193, 234, 217, 2088, 237, 241, 220], 1539)
-    femmesh.addVolume([250, 251, 248, 249, 2089, 292, 275, 272, 289, 296], 1540)
-    femmesh.addVolume([1298, 302, 156, 122, 2051, 469, 1363, 1362, 2084, 1360], 1541)
-    femmesh.addVolume([114, 660, 5, 661, 1613, 735, 116, 1628, 736, 732], 1542)
-    femmesh.addVolume([98, 659, 4, 662, 1620, 728, 100, 1632, 731, 729], 1543)
-    femmesh.addVolume([713, 510, 1074, 1079, 817, 1157, 1855, 1857, 1155, 1159], 1544)
-    femmesh.addVolume([1061, 1077, 505, 707, 1144, 1142, 1140, 1702, 1859, 800], 1545)
-    femmesh.addVolume([1077, 575, 1302, 1061, 1209, 1411, 1858, 1144, 1206, 1700], 1546)
-    femmesh.addVolume([1072, 1303, 578, 1073, 1841, 1423, 1212, 1153, 1843, 1215], 1547)
-    femmesh.addVolume([319, 28, 318, 708, 384, 382, 386, 1839, 901, 1837], 1548)
-    femmesh.addVolume([710, 317, 23, 320, 1677, 367, 883, 1672, 371, 369], 1549)
-    femmesh.addVolume([311, 712, 18, 310, 1846, 866, 354, 356, 1847, 352], 1550)
-    femmesh.addVolume([711, 495, 1056, 1068, 766, 1112, 1831, 1830, 1110, 1114], 1551)
-    femmesh.addVolume([714, 309, 307, 33, 1828, 401, 1829, 917, 399, 397], 1552)
-    femmesh.addVolume([500, 709, 1069, 1062, 782, 1796, 1125, 1127, 1797, 1129], 1553)
-    femmesh.addVolume([312, 149, 314, 1304, 456, 455, 362, 1823, 1500, 1822], 1554)
-    femmesh.addVolume([317, 146, 320, 1301, 450, 449, 371, 1679, 1490, 1670], 1555)
-    femmesh.addVolume([188, 131, 106, 187, 2090, 1345, 238, 224, 2091, 240], 1556)
-    femmesh.addVolume([156, 242, 243, 122, 2093, 279, 2092, 1360, 295, 294], 1557)
-    femmesh.addVolume([302, 242, 243, 156, 2041, 279, 2094, 469, 2093, 2092], 1558)
-    femmesh.addVolume([701, 659, 491, 1067, 751, 752, 750, 1941, 1951, 1100], 1559)
-    femmesh.addVolume([699, 662, 300, 37, 931, 1960, 1939, 926, 932, 409], 1560)
-    femmesh.addVolume([660, 14, 702, 297, 853, 851, 852, 1952, 342, 1944], 1561)
-    femmesh.addVolume([155, 1294, 297, 1261, 1515, 1943, 467, 1520, 1519, 1945], 1562)
-    femmesh.addVolume([561, 1295, 1067, 1259, 1366, 1940, 1181, 1369, 1368, 1942], 1563)
-    femmesh.addVolume([700, 1070, 514, 661, 1936, 1167, 825, 830, 1935, 831], 1564)
-    femmesh.addVolume([1260, 132, 1296, 300, 1447, 1445, 1446, 1938, 422, 1937], 1565)
-    femmesh.addVolume([584, 1293, 1262, 1070, 1438, 1441, 1442, 1224, 1934, 1961], 1566)
-    femmesh.addVolume([246, 585, 117, 247, 2095, 1352, 283, 266, 2085, 284], 1567)
-    femmesh.addVolume([560, 192, 191, 101, 2097, 211, 2096, 1337, 229, 227], 1568)
-    femmesh.addVolume([1081, 585, 1076, 247, 1226, 1229, 1174, 2068, 2085, 2098], 1569)
-    femmesh.addVolume([1065, 1066, 192, 560, 1099, 2056, 2099, 1176, 1179, 2097], 1570)
-    femmesh.addVolume([305, 699, 300, 36, 1978, 1939, 410, 406, 927, 408], 1571)
-    femmesh.addVolume([299, 106, 131, 187, 2083, 1345, 420, 2060, 240, 2091], 1572)
-    femmesh.addVolume([1067, 492, 701, 1063, 1101, 749, 1941, 1105, 1103, 1984], 1573)
-    femmesh.addVolume([585, 246, 1076, 247, 2095, 2100, 1229, 2085, 266, 2098], 1574)
-    femmesh.addVolume([1065, 192, 191, 560, 2099, 211, 2101, 1176, 2097, 2096], 1575)
-    femmesh.addVolume([156, 302, 242, 122, 469, 2041, 2093, 1360, 2084, 295], 1576)
-    femmesh.addVolume([703, 187, 299, 38, 2069, 2060, 2070, 929, 2102, 412], 1577)
-    femmesh.addVolume([1070, 513, 1080, 700, 1166, 1164, 1168, 1936, 826, 1980], 1578)
-    femmesh.addVolume([297, 15, 702, 304, 343, 850, 1944, 347, 345, 1989], 1579)
-    femmesh.addVolume([297, 154, 304, 1294, 466, 465, 347, 1943, 1516, 1991], 1580)
-    femmesh.addVolume([1296, 300, 133, 305, 1937, 423, 1444, 1977, 410, 424], 1581)
-    femmesh.addVolume([1067, 562, 1063, 1295, 1180, 1183, 1105, 1940, 1367, 1986], 1582)
-    femmesh.addVolume([1080, 1293, 583, 1070, 1979, 1437, 1222, 1168, 1934, 1225], 1583)
-    femmesh.addVolume([242, 13, 705, 302, 2103, 847, 2053, 2041, 339, 2054], 1584)
-    femmesh.addVolume([704, 1081, 515, 247, 2071, 1170, 828, 2072, 2068, 2104], 1585)
-    femmesh.addVolume([490, 706, 192, 1066, 746, 2055, 2105, 1097, 2057, 2056], 1586)
-    femmesh.addVolume([298, 187, 188, 38, 2107, 224, 2106, 414, 2102, 2108], 1587)
-    femmesh.addVolume([187, 703, 74, 38, 2069, 937, 199, 2102, 929, 936], 1588)
-    femmesh.addVolume([302, 243, 301, 156, 2094, 2109, 341, 469, 2092, 470], 1589)
-    femmesh.addVolume([299, 187, 298, 38, 2060, 2107, 416, 412, 2102, 414], 1590)
-    femmesh.addVolume([87, 13, 705, 242, 848, 847, 849, 255, 2103, 2053], 1591)
-    femmesh.addVolume([515, 82, 704, 247, 835, 836, 828, 2104, 253, 2072], 1592)
-    femmesh.addVolume([1082, 1271, 551, 1037, 2111, 2110, 1091, 2112, 2113, 1041], 1593)
-    femmesh.addVolume([1038, 95, 324, 1273, 1044, 333, 2114, 2115, 2116, 2117], 1594)
-    femmesh.addVolume([325, 1274, 9, 618, 2119, 2118, 327, 2120, 2121, 624], 1595)
-    femmesh.addVolume([1066, 192, 490, 1065, 2056, 2105, 1097, 1099, 2099, 1095], 1596)
-    femmesh.addVolume([515, 1081, 1076, 247, 1170, 1174, 1172, 2104, 2068, 2098], 1597)
-    femmesh.addVolume([1083, 617, 481, 1272, 2122, 621, 1084, 2123, 2124, 2125], 1598)
-    femmesh.addVolume([659, 4, 192, 98, 728, 198, 1657, 1620, 100, 202], 1599)
-    femmesh.addVolume([699, 305, 655, 36, 1978, 1976, 928, 927, 406, 923], 1600)
-    femmesh.addVolume([701, 492, 657, 1063, 749, 755, 756, 1984, 1103, 1985], 1601)
-    femmesh.addVolume([85, 84, 547, 250, 91, 841, 839, 271, 270, 2126], 1602)
-    femmesh.addVolume([71, 476, 194, 72, 738, 2127, 216, 78, 739, 215], 1603)
-    femmesh.addVolume([120, 251, 555, 119, 288, 2128, 1332, 126, 287, 1335], 1604)
-    femmesh.addVolume([196, 484, 103, 104, 2129, 1327, 233, 232, 1329, 110], 1605)
-    femmesh.addVolume([121, 248, 324, 1273, 291, 2131, 2130, 1358, 2132, 2117], 1606)
-    femmesh.addVolume([1274, 325, 105, 193, 2119, 2133, 1344, 2134, 2135, 235], 1607)
-    femmesh.addVolume([242, 660, 5, 114, 2042, 735, 254, 256, 1613, 116], 1608)
-    femmesh.addVolume([490, 69, 192, 706, 747, 197, 2105, 746, 748, 2055], 1609)
-    femmesh.addVolume([246, 1271, 1082, 249, 2137, 2111, 2136, 269, 2138, 2139], 1610)
-    femmesh.addVolume([1271, 246, 118, 249, 2137, 282, 1356, 2138, 269, 286], 1611)
-    femmesh.addVolume([191, 102, 195, 1272, 228, 230, 214, 2140, 1342, 2141], 1612)
-    femmesh.addVolume([195, 1083, 191, 1272, 2143, 2142, 214, 2141, 2123, 2140], 1613)
-    femmesh.addVolume([700, 513, 1080, 656, 826, 1164, 1980, 827, 822, 1981], 1614)
-    femmesh.addVolume([583, 1256, 1293, 1080, 1435, 1439, 1437, 1222, 2026, 1979], 1615)
-    femmesh.addVolume([133, 1257, 1296, 305, 1449, 1450, 1444, 424, 2046, 1977], 1616)
-    femmesh.addVolume([1271, 1082, 118, 246, 2111, 2144, 1356, 2137, 2136, 282], 1617)
-    femmesh.addVolume([658, 702, 15, 304, 857, 850, 856, 1990, 1989, 345], 1618)
-    femmesh.addVolume([1294, 154, 304, 1255, 1516, 465, 1991, 1517, 1512, 2027], 1619)
-    femmesh.addVolume([1295, 562, 1063, 1258, 1367, 1183, 1986, 1372, 1370, 2049], 1620)
-    femmesh.addVolume([680, 617, 481, 1083, 2146, 621, 2145, 2147, 2122, 1084], 1621)
-    femmesh.addVolume([73, 193, 325, 681, 219, 2135, 2148, 938, 2149, 2150], 1622)
-    femmesh.addVolume([248, 682, 86, 324, 2151, 845, 273, 2131, 2152, 2153], 1623)
-    femmesh.addVolume([102, 191, 1083, 1272, 228, 2142, 2154, 1342, 2140, 2123], 1624)
-    femmesh.addVolume([661, 5, 114, 247, 732, 116, 1628, 2066, 252, 257], 1625)
-    femmesh.addVolume([551, 679, 1082, 1037, 2156, 2155, 1091, 1041, 2157, 2112], 1626)
-    femmesh.addVolume([618, 9, 325, 681, 624, 327, 2120, 2158, 2159, 2150], 1627)
-    femmesh.addVolume([682, 324, 1038, 95, 2152, 2114, 2160, 2161, 333, 1044], 1628)
-    femmesh.addVolume([317, 1265, 146, 1301, 1678, 1488, 450, 1679, 1489, 1490], 1629)
-    femmesh.addVolume([709, 500, 1069, 664, 782, 1125, 1796, 783, 777, 2017], 1630)
-    femmesh.addVolume([1304, 149, 314, 1264, 1500, 455, 1822, 1501, 1495, 2020], 1631)
-    femmesh.addVolume([714, 307, 667, 33, 1829, 2032, 918, 917, 397, 912], 1632)
-    femmesh.addVolume([668, 495, 1056, 711, 764, 1112, 2028, 765, 766, 1831], 1633)
-    femmesh.addVolume([18, 712, 669, 310, 866, 867, 861, 352, 1847, 2010], 1634)
-    femmesh.addVolume([23, 710, 663, 317, 883, 884, 878, 367, 1677, 2050], 1635)
-    femmesh.addVolume([666, 28, 319, 708, 899, 384, 2036, 900, 901, 1839], 1636)
-    femmesh.addVolume([578, 1263, 1303, 1072, 1418, 1422, 1423, 1212, 2021, 1841], 1637)
-    femmesh.addVolume([575, 1302, 1266, 1077, 1411, 1412, 1409, 1209, 1858, 2078], 1638)
-    femmesh.addVolume([1274, 2, 9, 618, 1308, 11, 2118, 2121, 628, 624], 1639)
-    femmesh.addVolume([95, 1038, 6, 1273, 1044, 1047, 97, 2116, 2115, 1315], 1640)
-    femmesh.addVolume([551, 1271, 475, 1037, 2110, 1311, 553, 1041, 2113, 1045], 1641)
-    femmesh.addVolume([481, 617, 473, 1272, 621, 625, 483, 2125, 2124, 1306], 1642)
-    femmesh.addVolume([187, 98, 4, 662, 201, 100, 200, 2061, 1632, 729], 1643)
-    femmesh.addVolume([191, 490, 192, 1065, 2162, 2105, 211, 2101, 1095, 2099], 1644)
-    femmesh.addVolume([1076, 246, 515, 247, 2100, 2163, 1172, 2098, 266, 2104], 1645)
-    femmesh.addVolume([1077, 665, 505, 707, 2077, 798, 1142, 1859, 799, 800], 1646)
-    femmesh.addVolume([510, 713, 1074, 670, 817, 1855, 1157, 815, 816, 2006], 1647)
-    femmesh.addVolume([1269, 578, 1303, 1073, 1420, 1423, 1424, 2038, 1215, 1843], 1648)
-    femmesh.addVolume([575, 1267, 1302, 1061, 1407, 1413, 1411, 1206, 1701, 1700], 1649)
-    femmesh.addVolume([674, 318, 28, 708, 2014, 382, 895, 902, 1837, 901], 1650)
-    femmesh.addVolume([23, 678, 710, 320, 882, 885, 883, 369, 1671, 1672], 1651)
-    femmesh.addVolume([18, 675, 712, 311, 865, 868, 866, 354, 2039, 1846], 1652)
-    femmesh.addVolume([495, 711, 672, 1068, 766, 767, 760, 1110, 1830, 1999], 1653)
-    femmesh.addVolume([677, 709, 500, 1062, 784, 782, 781, 1993, 1797, 1127], 1654)
-    femmesh.addVolume([1270, 149, 312, 1304, 1499, 456, 2040, 1502, 1500, 1823], 1655)
-    femmesh.addVolume([1301, 146, 320, 1268, 1490, 449, 1670, 1491, 1484, 2037], 1656)
-    femmesh.addVolume([714, 676, 309, 33, 919, 2003, 1828, 917, 916, 399], 1657)
-    femmesh.addVolume([671, 510, 713, 1079, 811, 817, 818, 2052, 1155, 1857], 1658)
-    femmesh.addVolume([673, 1061, 505, 707, 2047, 1140, 794, 801, 1702, 800], 1659)
-    femmesh.addVolume([680, 481, 472, 1083, 2145, 482, 715, 2147, 1084, 1085], 1660)
-    femmesh.addVolume([325, 9, 1, 681, 327, 10, 326, 2150, 2159, 719], 1661)
-    femmesh.addVolume([474, 1082, 551, 679, 1090, 1091, 552, 721, 2155, 2156], 1662)
-    femmesh.addVolume([324, 682, 3, 95, 2152, 724, 331, 333, 2161, 96], 1663)
-    femmesh.addVolume([1038, 3, 682, 95, 1043, 724, 2160, 1044, 96, 2161], 1664)
-    femmesh.addVolume([618, 1, 9, 681, 622, 10, 624, 2158, 719, 2159], 1665)
-    femmesh.addVolume([474, 679, 551, 1037, 721, 2156, 552, 1039, 2157, 1041], 1666)
-    femmesh.addVolume([74, 188, 187, 38, 222, 224, 199, 936, 2108, 2102], 1667)
-    femmesh.addVolume([82, 515, 246, 247, 835, 2163, 264, 253, 2104, 266], 1668)
-    femmesh.addVolume([193, 194, 618, 72, 220, 2165, 2164, 218, 215, 2166], 1669)
-    femmesh.addVolume([191, 195, 680, 1083, 214, 2168, 2167, 2142, 2143, 2147], 1670)
-    femmesh.addVolume([617, 481, 472, 680, 621, 482, 620, 2146, 2145, 715], 1671)
-    femmesh.addVolume([242, 87, 13, 243, 255, 848, 2103, 279, 276, 2169], 1672)
-    femmesh.addVolume([69, 490, 192, 191, 747, 2105, 197, 210, 2162, 211], 1673)
-    femmesh.addVolume([1082, 679, 246, 249, 2155, 2170, 2136, 2139, 2171, 269], 1674)
-    femmesh.addVolume([95, 6, 324, 1273, 97, 334, 333, 2116, 1315, 2117], 1675)
-    femmesh.addVolume([1274, 9, 2, 325, 2118, 11, 1308, 2119, 327, 329], 1676)
-    femmesh.addVolume([1271, 551, 475, 1082, 2110, 553, 1311, 2111, 1091, 1092], 1677)
-    femmesh.addVolume([104, 196, 484, 193, 232, 2129, 1329, 236, 237, 2172], 1678)
-    femmesh.addVolume([188, 105, 325, 193, 239, 2133, 2173, 223, 235, 2135], 1679)
-    femmesh.addVolume([248, 324, 243, 121, 2131, 2174, 278, 291, 2130, 293], 1680)
-    femmesh.addVolume([8, 1261, 122, 245, 1324, 1325, 129, 260, 1645, 263], 1681)
-    femmesh.addVolume([473, 1083, 481, 1272, 1087, 1084, 483, 1306, 2123, 2125], 1682)
-    femmesh.addVolume([70, 191, 680, 1083, 209, 2167, 744, 2175, 2142, 2147], 1683)
-    femmesh.addVolume([567, 1057, 566, 1243, 1190, 1191, 595, 1383, 1885, 1382], 1684)
-    femmesh.addVolume([1246, 141, 142, 318, 1473, 170, 1472, 1879, 440, 441], 1685)
-    femmesh.addVolume([135, 136, 1244, 309, 164, 1454, 1455, 428, 429, 1875], 1686)
-    femmesh.addVolume([140, 1247, 139, 316, 1466, 1467, 168, 437, 1887, 436], 1687)
-    femmesh.addVolume([679, 1082, 246, 83, 2155, 2136, 2170, 837, 2176, 265], 1688)
-    femmesh.addVolume([1259, 101, 7, 189, 1318, 107, 1317, 1665, 207, 204], 1689)
-    femmesh.addVolume([193, 325, 188, 73, 2135, 2173, 223, 219, 2148, 221], 1690)
-    femmesh.addVolume([86, 243, 248, 324, 277, 278, 273, 2153, 2174, 2131], 1691)
-    femmesh.addVolume([1261, 1298, 122, 245, 1364, 1362, 1325, 1645, 1644, 263], 1692)
-    femmesh.addVolume([618, 325, 1274, 193, 2120, 2119, 2121, 2164, 2135, 2134], 1693)
-    femmesh.addVolume([324, 248, 1038, 1273, 2131, 2177, 2114, 2117, 2132, 2115], 1694)
-    femmesh.addVolume([83, 246, 679, 249, 265, 2170, 837, 267, 269, 2171], 1695)
-    femmesh.addVolume([195, 680, 70, 191, 2168, 744, 213, 214, 2167, 209], 1696)
-    femmesh.addVolume([196, 485, 484, 616, 2178, 487, 2129, 2179, 633, 634], 1697)
-    femmesh.addVolume([251, 1036, 554, 555, 2181, 1053, 2180, 2128, 1054, 557], 1698)
-    femmesh.addVolume([547, 1036, 546, 250, 1049, 1050, 549, 2126, 2182, 2183], 1699)
-    femmesh.addVolume([477, 194, 476, 616, 2184, 2127, 479, 630, 2185, 629], 1700)
-    femmesh.addVolume([572, 573, 1064, 1245, 601, 1202, 1203, 1400, 1401, 1810], 1701)
-    femmesh.addVolume([249, 1271, 1082, 1037, 2138, 2111, 2139, 2186, 2113, 2112], 1702)
-    femmesh.addVolume([192, 69, 659, 706, 197, 727, 1657, 2055, 748, 753], 1703)
-    femmesh.addVolume([1274, 130, 105, 325, 1310, 1347, 1344, 2119, 330, 2133], 1704)
-    femmesh.addVolume([121, 324, 157, 1273, 2130, 335, 1361, 1358, 2117, 1316], 1705)
-    femmesh.addVolume([503, 652, 502, 1064, 788, 789, 531, 1134, 1914, 1133], 1706)
-    femmesh.addVolume([651, 322, 25, 26, 1817, 375, 890, 889, 376, 54], 1707)
-    femmesh.addVolume([85, 250, 547, 546, 271, 2126, 839, 838, 2183, 549], 1708)
-    femmesh.addVolume([194, 477, 476, 71, 2184, 479, 2127, 216, 737, 738], 1709)
-    femmesh.addVolume([555, 251, 120, 554, 2128, 288, 1332, 557, 2180, 1333], 1710)
-    femmesh.addVolume([103, 485, 484, 196, 1328, 487, 1327, 233, 2178, 2129], 1711)
-    femmesh.addVolume([493, 657, 492, 1063, 754, 755, 521, 1104, 1985, 1103], 1712)
-    femmesh.addVolume([30, 313, 31, 654, 390, 391, 59, 907, 1906, 906], 1713)
-    femmesh.addVolume([649, 497, 498, 1055, 772, 526, 771, 1903, 1118, 1119], 1714)
-    femmesh.addVolume([1038, 1036, 554, 251, 1051, 1053, 1048, 2187, 2181, 2180], 1715)
-    femmesh.addVolume([582, 1256, 583, 1080, 1434, 1435, 611, 1223, 2026, 1222], 1716)
-    femmesh.addVolume([484, 1274, 104, 193, 1309, 1330, 1329, 2172, 2134, 236], 1717)
-    femmesh.addVolume([658, 15, 16, 304, 856, 44, 855, 1990, 345, 346], 1718)
-    femmesh.addVolume([20, 21, 650, 314, 49, 872, 873, 360, 361, 1899], 1719)
-    femmesh.addVolume([1260, 190, 7, 106, 1652, 206, 1320, 1319, 208, 113], 1720)
-    femmesh.addVolume([36, 305, 655, 35, 406, 1976, 923, 64, 405, 924], 1721)
-    femmesh.addVolume([1072, 508, 507, 653, 1149, 536, 1148, 1897, 805, 806], 1722)
-    femmesh.addVolume([617, 1083, 195, 1272, 2122, 2143, 2188, 2124, 2123, 2141], 1723)
-    femmesh.addVolume([1248, 581, 580, 1074, 1429, 609, 1428, 1911, 1218, 1219], 1724)
-    femmesh.addVolume([1259, 1299, 101, 189, 1341, 1339, 1318, 1665, 1706, 207], 1725)
-    femmesh.addVolume([563, 1063, 562, 1258, 1182, 1183, 591, 1371, 2049, 1370], 1726)
-    femmesh.addVolume([87, 705, 660, 242, 849, 854, 734, 255, 2053, 2042], 1727)
-    femmesh.addVolume([151, 310, 152, 1254, 460, 461, 180, 1507, 1902, 1506], 1728)
-    femmesh.addVolume([119, 251, 555, 249, 287, 2128, 1335, 285, 289, 2189], 1729)
-    femmesh.addVolume([1257, 133, 134, 305, 1449, 162, 1448, 2046, 424, 425], 1730)
-    femmesh.addVolume([131, 106, 105, 188, 1345, 112, 1346, 2090, 238, 239], 1731)
-    femmesh.addVolume([1080, 513, 512, 656, 1164, 541, 1163, 1981, 822, 823], 1732)
-    femmesh.addVolume([322, 1250, 144, 143, 1915, 1478, 445, 444, 1479, 172], 1733)
-    femmesh.addVolume([243, 121, 156, 122, 293, 1359, 2092, 294, 128, 1360], 1734)
-    femmesh.addVolume([485, 196, 617, 616, 2178, 2190, 626, 633, 2179, 632], 1735)
-    femmesh.addVolume([680, 489, 70, 1083, 717, 743, 744, 2147, 1086, 2175], 1736)
-    femmesh.addVolume([153, 304, 154, 1255, 464, 465, 182, 1513, 2027, 1512], 1737)
-    femmesh.addVolume([568, 569, 1058, 1249, 597, 1194, 1195, 1388, 1389, 1925], 1738)
-    femmesh.addVolume([571, 1062, 570, 1252, 1198, 1199, 599, 1395, 1918, 1394], 1739)
-    femmesh.addVolume([1251, 137, 138, 308, 1461, 166, 1460, 1928, 432, 433], 1740)
-    femmesh.addVolume([499, 1069, 500, 664, 1124, 1125, 528, 778, 2017, 777], 1741)
-    femmesh.addVolume([23, 663, 22, 317, 878, 879, 51, 367, 2050, 366], 1742)
-    femmesh.addVolume([317, 147, 146, 1265, 451, 175, 450, 1678, 1487, 1488], 1743)
-    femmesh.addVolume([314, 149, 148, 1264, 455, 177, 454, 2020, 1495, 1496], 1744)
-    femmesh.addVolume([1077, 506, 505, 665, 1143, 534, 1142, 2077, 797, 798], 1745)
-    femmesh.addVolume([1266, 576, 575, 1077, 1410, 604, 1409, 2078, 1208, 1209], 1746)
-    femmesh.addVolume([28, 319, 29, 666, 384, 385, 57, 899, 2036, 898], 1747)
-    femmesh.addVolume([1056, 496, 495, 668, 1113, 524, 1112, 2028, 763, 764], 1748)
-    femmesh.addVolume([577, 1263, 578, 1072, 1417, 1418, 606, 1213, 2021, 1212], 1749)
-    femmesh.addVolume([669, 17, 18, 310, 862, 46, 861, 2010, 351, 352], 1750)
-    femmesh.addVolume([667, 307, 32, 33, 2032, 396, 913, 912, 397, 61], 1751)
-    femmesh.addVolume([1074, 511, 510, 670, 1158, 539, 1157, 2006, 814, 815], 1752)
-    femmesh.addVolume([476, 618, 194, 72, 623, 2165, 2127, 739, 2166, 215], 1753)
-    femmesh.addVolume([565, 1068, 564, 1253, 1186, 1187, 593, 1377, 1959, 1376], 1754)
-    femmesh.addVolume([1271, 586, 118, 1082, 1313, 1357, 1356, 2111, 1093, 2144], 1755)
-    femmesh.addVolume([661, 704, 82, 247, 832, 836, 733, 2066, 2072, 253], 1756)
-    femmesh.addVolume([1267, 575, 574, 1061, 1407, 603, 1406, 1701, 1206, 1207], 1757)
-    femmesh.addVolume([578, 1269, 579, 1073, 1420, 1421, 607, 1215, 2038, 1214], 1758)
-    femmesh.addVolume([27, 318, 28, 674, 381, 382, 56, 896, 2014, 895], 1759)
-    femmesh.addVolume([37, 703, 299, 38, 930, 2070, 411, 66, 929, 412], 1760)
-    femmesh.addVolume([678, 23, 24, 320, 882, 52, 881, 1671, 369, 370], 1761)
-    femmesh.addVolume([18, 19, 675, 311, 47, 864, 865, 354, 355, 2039], 1762)
-    femmesh.addVolume([495, 672, 494, 1068, 760, 761, 523, 1110, 1999, 1109], 1763)
-    femmesh.addVolume([510, 671, 509, 1079, 811, 812, 538, 1155, 2052, 1154], 1764)
-    femmesh.addVolume([1061, 505, 504, 673, 1140, 533, 1139, 2047, 794, 795], 1765)
-    femmesh.addVolume([617, 680, 195, 1083, 2146, 2168, 2188, 2122, 2147, 2143], 1766)
-    femmesh.addVolume([33, 676, 309, 34, 916, 2003, 399, 62, 915, 400], 1767)
-    femmesh.addVolume([706, 490, 491, 1066, 746, 519, 745, 2057, 1097, 1098], 1768)
-    femmesh.addVolume([677, 500, 501, 1062, 781, 529, 780, 1993, 1127, 1128], 1769)
-    femmesh.addVolume([150, 149, 312, 1270, 178, 456, 457, 1498, 1499, 2040], 1770)
-    femmesh.addVolume([145, 320, 146, 1268, 448, 449, 174, 1485, 2037, 1484], 1771)
-    femmesh.addVolume([1262, 244, 8, 117, 2082, 258, 1323, 1322, 262, 123], 1772)
-    femmesh.addVolume([554, 248, 1038, 251, 2191, 2177, 1048, 2180, 292, 2187], 1773)
-    femmesh.addVolume([555, 1271, 119, 249, 1312, 1336, 1335, 2189, 2138, 285], 1774)
-    femmesh.addVolume([514, 1081, 515, 704, 1169, 1170, 543, 829, 2071, 828], 1775)
-    femmesh.addVolume([132, 1300, 131, 299, 1443, 1348, 160, 421, 2058, 420], 1776)
-    femmesh.addVolume([1297, 585, 584, 1081, 1353, 613, 1440, 2080, 1226, 1227], 1777)
-    femmesh.addVolume([187, 662, 74, 703, 2061, 730, 199, 2069, 933, 937], 1778)
-    femmesh.addVolume([325, 193, 618, 681, 2135, 2164, 2120, 2150, 2149, 2158], 1779)
-    femmesh.addVolume([1038, 682, 248, 324, 2160, 2151, 2177, 2114, 2152, 2131], 1780)
-    femmesh.addVolume([585, 117, 118, 246, 1352, 124, 1351, 2095, 283, 282], 1781)
-    femmesh.addVolume([191, 102, 560, 101, 228, 1338, 2096, 227, 108, 1337], 1782)
-    femmesh.addVolume([681, 325, 73, 39, 2150, 2148, 938, 720, 328, 935], 1783)
-    femmesh.addVolume([12, 86, 682, 324, 843, 845, 726, 332, 2153, 2152], 1784)
-    femmesh.addVolume([705, 13, 14, 302, 847, 42, 846, 2054, 339, 340], 1785)
-    femmesh.addVolume([302, 156, 155, 1298, 469, 184, 468, 2051, 1363, 1518], 1786)
-    femmesh.addVolume([561, 1066, 560, 1299, 1178, 1179, 589, 1365, 1703, 1340], 1787)
-    femmesh.addVolume([190, 106, 1260, 1300, 208, 1319, 1652, 1653, 1349, 1350], 1788)
-    femmesh.addVolume([249, 1082, 679, 1037, 2139, 2155, 2171, 2186, 2112, 2157], 1789)
-    femmesh.addVolume([6, 1273, 1038, 554, 1315, 2115, 1047, 556, 1314, 1048], 1790)
-    femmesh.addVolume([617, 485, 473, 1272, 626, 488, 625, 2124, 1305, 1306], 1791)
-    femmesh.addVolume([301, 156, 243, 121, 470, 2092, 2109, 2192, 1359, 293], 1792)
-    femmesh.addVolume([105, 298, 131, 188, 2193, 419, 1346, 239, 2106, 2090], 1793)
-    femmesh.addVolume([1082, 679, 516, 83, 2155, 722, 1089, 2176, 837, 833], 1794)
-    femmesh.addVolume([560, 191, 1065, 102, 2096, 2101, 1176, 1338, 228, 2194], 1795)
-    femmesh.addVolume([72, 618, 193, 681, 2166, 2164, 218, 740, 2158, 2149], 1796)
-    femmesh.addVolume([118, 1076, 585, 246, 2195, 1229, 1351, 282, 2100, 2095], 1797)
-    femmesh.addVolume([194, 616, 196, 193, 2185, 2179, 2088, 220, 2196, 237], 1798)
-    femmesh.addVolume([251, 248, 1036, 250, 292, 2197, 2181, 2089, 275, 2182], 1799)
-    femmesh.addVolume([325, 130, 105, 188, 330, 1347, 2133, 2173, 2198, 239], 1800)
-    femmesh.addVolume([157, 243, 324, 121, 2199, 2174, 335, 1361, 293, 2130], 1801)
-    femmesh.addVolume([102, 1083, 559, 1272, 2154, 1088, 1343, 1342, 2123, 1307], 1802)
-    femmesh.addVolume([244, 117, 1262, 1297, 262, 1322, 2082, 2087, 1354, 1355], 1803)
-    femmesh.addVolume([1286, 315, 147, 148, 1878, 452, 1493, 1492, 453, 176], 1804)
-    femmesh.addVolume([577, 576, 1285, 1078, 605, 1414, 1415, 1210, 1211, 1882], 1805)
-    femmesh.addVolume([1036, 1038, 248, 251, 1051, 2177, 2197, 2181, 2187, 292], 1806)
-    femmesh.addVolume([618, 196, 616, 193, 2200, 2179, 631, 2164, 237, 2196], 1807)
-    femmesh.addVolume([489, 680, 472, 1083, 717, 715, 517, 1086, 2147, 1085], 1808)
-    femmesh.addVolume([118, 119, 1271, 249, 125, 1336, 1356, 286, 285, 2138], 1809)
-    femmesh.addVolume([485, 195, 617, 196, 2201, 2188, 626, 2178, 234, 2190], 1810)
-    femmesh.addVolume([659, 192, 4, 69, 1657, 198, 728, 727, 197, 75], 1811)
-    femmesh.addVolume([249, 679, 84, 1037, 2171, 842, 268, 2186, 2157, 2202], 1812)
-    femmesh.addVolume([546, 1036, 1038, 250, 1050, 1051, 1042, 2183, 2182, 2203], 1813)
-    femmesh.addVolume([196, 195, 617, 616, 234, 2188, 2190, 2179, 2204, 632], 1814)
-    femmesh.addVolume([251, 249, 1036, 1037, 289, 2205, 2181, 2206, 2186, 1052], 1815)
-    femmesh.addVolume([616, 484, 196, 618, 634, 2129, 2179, 631, 627, 2200], 1816)
-    femmesh.addVolume([194, 477, 617, 616, 2184, 619, 2207, 2185, 630, 632], 1817)
-    femmesh.addVolume([6, 157, 324, 1273, 186, 335, 334, 1315, 1316, 2117], 1818)
-    femmesh.addVolume([475, 586, 1271, 1082, 615, 1313, 1311, 1092, 1093, 2111], 1819)
-    femmesh.addVolume([2, 130, 1274, 325, 158, 1310, 1308, 329, 330, 2119], 1820)
-    femmesh.addVolume([87, 660, 5, 242, 734, 735, 94, 255, 2042, 254], 1821)
-    femmesh.addVolume([516, 1082, 474, 679, 1089, 1090, 545, 722, 2155, 721], 1822)
-    femmesh.addVolume([325, 681, 1, 39, 2150, 719, 326, 328, 720, 68], 1823)
-    femmesh.addVolume([682, 3, 12, 324, 724, 40, 726, 2152, 331, 332], 1824)
-    femmesh.addVolume([120, 248, 554, 251, 290, 2191, 1333, 288, 292, 2180], 1825)
-    femmesh.addVolume([1036, 555, 251, 1037, 1054, 2128, 2181, 1052, 1046, 2206], 1826)
-    femmesh.addVolume([105, 104, 1274, 193, 111, 1330, 1344, 235, 236, 2134], 1827)
-    femmesh.addVolume([193, 73, 72, 681, 219, 79, 218, 2149, 938, 740], 1828)
-    femmesh.addVolume([679, 84, 83, 249, 842, 90, 837, 2171, 268, 267], 1829)
-    femmesh.addVolume([298, 105, 130, 188, 2193, 1347, 418, 2106, 239, 2198], 1830)
-    femmesh.addVolume([243, 157, 301, 121, 2199, 471, 2109, 293, 1361, 2192], 1831)
-    femmesh.addVolume([298, 130, 325, 188, 418, 330, 417, 2106, 2198, 2173], 1832)
-    femmesh.addVolume([243, 324, 301, 157, 2174, 338, 2109, 2199, 335, 471], 1833)
-    femmesh.addVolume([1273, 248, 1038, 554, 2132, 2177, 2115, 1314, 2191, 1048], 1834)
-    femmesh.addVolume([5, 661, 82, 247, 732, 733, 88, 252, 2066, 253], 1835)
-    femmesh.addVolume([618, 484, 196, 193, 627, 2129, 2200, 2164, 2172, 237], 1836)
-    femmesh.addVolume([682, 546, 3, 1038, 725, 548, 724, 2160, 1042, 1043], 1837)
-    femmesh.addVolume([34, 696, 303, 35, 921, 1892, 402, 63, 920, 403], 1838)
-    femmesh.addVolume([4, 74, 187, 662, 81, 199, 200, 729, 730, 2061], 1839)
-    femmesh.addVolume([494, 692, 493, 1071, 757, 758, 522, 1107, 1871, 1106], 1840)
-    femmesh.addVolume([2, 1274, 484, 618, 1308, 1309, 486, 628, 2121, 627], 1841)
-    femmesh.addVolume([475, 1271, 555, 1037, 1311, 1312, 558, 1045, 2113, 1046], 1842)
-    femmesh.addVolume([473, 559, 1083, 1272, 587, 1088, 1087, 1306, 1307, 2123], 1843)
-    femmesh.addVolume([73, 325, 188, 39, 2148, 2173, 221, 935, 328, 2208], 1844)
-    femmesh.addVolume([243, 86, 12, 324, 277, 843, 2209, 2174, 2153, 332], 1845)
-    femmesh.addVolume([246, 83, 515, 82, 265, 834, 2163, 264, 89, 835], 1846)
-    femmesh.addVolume([195, 485, 617, 1272, 2201, 626, 2188, 2141, 1305, 2124], 1847)
-    femmesh.addVolume([157, 156, 301, 121, 185, 470, 471, 1361, 1359, 2192], 1848)
-    femmesh.addVolume([131, 105, 130, 298, 1346, 1347, 159, 419, 2193, 418], 1849)
-    femmesh.addVolume([300, 36, 699, 37, 408, 927, 1939, 409, 65, 926], 1850)
-    femmesh.addVolume([298, 38, 73, 39, 414, 934, 2210, 415, 67, 935], 1851)
-    femmesh.addVolume([86, 12, 13, 301, 843, 41, 844, 2211, 336, 337], 1852)
-    femmesh.addVolume([492, 701, 491, 1067, 749, 750, 520, 1101, 1941, 1100], 1853)
-    femmesh.addVolume([73, 188, 74, 38, 221, 222, 80, 934, 2108, 936], 1854)
-    femmesh.addVolume([617, 472, 477, 680, 620, 480, 619, 2146, 715, 716], 1855)
-    femmesh.addVolume([1082, 586, 118, 246, 1093, 1357, 2144, 2136, 2212, 282], 1856)
-    femmesh.addVolume([618, 616, 194, 193, 631, 2185, 2165, 2164, 2196, 220], 1857)
-    femmesh.addVolume([1036, 248, 1038, 250, 2197, 2177, 1051, 2182, 275, 2203], 1858)
-    femmesh.addVolume([1070, 514, 513, 700, 1167, 542, 1166, 1936, 825, 826], 1859)
-    femmesh.addVolume([702, 14, 15, 297, 851, 43, 850, 1944, 342, 343], 1860)
-    femmesh.addVolume([297, 155, 154, 1294, 467, 183, 466, 1943, 1515, 1516], 1861)
-    femmesh.addVolume([70, 490, 69, 191, 742, 747, 76, 209, 2162, 210], 1862)
-    femmesh.addVolume([1067, 561, 562, 1295, 1181, 590, 1180, 1940, 1366, 1367], 1863)
-    femmesh.addVolume([133, 1296, 132, 300, 1444, 1445, 161, 423, 1937, 422], 1864)
-    femmesh.addVolume([188, 73, 298, 38, 221, 2210, 2106, 2108, 934, 414], 1865)
-    femmesh.addVolume([13, 243, 86, 301, 2169, 277, 844, 337, 2109, 2211], 1866)
-    femmesh.addVolume([1075, 512, 511, 687, 1161, 540, 1160, 1864, 819, 820], 1867)
-    femmesh.addVolume([583, 1293, 584, 1070, 1437, 1438, 612, 1225, 1934, 1224], 1868)
-    femmesh.addVolume([248, 554, 1273, 120, 2191, 1314, 2132, 290, 1333, 1334], 1869)
-    femmesh.addVolume([191, 70, 489, 1083, 209, 743, 2213, 2142, 2175, 1086], 1870)
-    femmesh.addVolume([490, 70, 489, 1065, 742, 743, 518, 1095, 2214, 1094], 1871)
-    femmesh.addVolume([13, 87, 86, 243, 848, 93, 844, 2169, 276, 277], 1872)
-    femmesh.addVolume([1076, 516, 515, 83, 1173, 544, 1172, 2215, 833, 834], 1873)
-    femmesh.addVolume([688, 16, 17, 306, 859, 45, 858, 1851, 348, 349], 1874)
-    femmesh.addVolume([72, 476, 618, 681, 739, 623, 2166, 740, 718, 2158], 1875)
-    femmesh.addVolume([547, 84, 679, 1037, 841, 842, 723, 1040, 2202, 2157], 1876)
-    femmesh.addVolume([585, 118, 586, 1076, 1351, 1357, 614, 1229, 2195, 1228], 1877)
-    femmesh.addVolume([1065, 559, 560, 102, 1177, 588, 1176, 2194, 1343, 1338], 1878)
-    femmesh.addVolume([485, 103, 195, 196, 1328, 231, 2201, 2178, 233, 234], 1879)
-    femmesh.addVolume([85, 1038, 248, 250, 2216, 2177, 274, 271, 2203, 275], 1880)
-    femmesh.addVolume([22, 689, 21, 315, 875, 876, 50, 364, 1876, 363], 1881)
-    femmesh.addVolume([249, 251, 555, 1037, 289, 2128, 2189, 2186, 2206, 1046], 1882)
-    femmesh.addVolume([559, 191, 1083, 102, 2217, 2142, 1088, 1343, 228, 2154], 1883)
-    femmesh.addVolume([1038, 85, 546, 250, 2216, 838, 1042, 2203, 271, 2183], 1884)
-    femmesh.addVolume([683, 506, 507, 1078, 803, 535, 802, 1881, 1145, 1146], 1885)
-    femmesh.addVolume([1058, 499, 498, 690, 1122, 527, 1121, 1765, 774, 775], 1886)
-    femmesh.addVolume([497, 686, 496, 1057, 768, 769, 525, 1116, 1770, 1115], 1887)
-    femmesh.addVolume([191, 70, 490, 1065, 209, 742, 2162, 2101, 2214, 1095], 1888)
-    femmesh.addVolume([476, 616, 194, 618, 629, 2185, 2127, 623, 631, 2165], 1889)
-    femmesh.addVolume([515, 246, 1076, 83, 2163, 2100, 1172, 834, 265, 2215], 1890)
-    femmesh.addVolume([485, 1272, 195, 103, 1305, 2141, 2201, 1328, 1331, 231], 1891)
-    femmesh.addVolume([30, 316, 684, 29, 388, 1777, 903, 58, 387, 904], 1892)
-    femmesh.addVolume([32, 308, 685, 31, 394, 1782, 909, 60, 393, 910], 1893)
-    femmesh.addVolume([693, 503, 504, 1060, 792, 532, 791, 1795, 1136, 1137], 1894)
-    femmesh.addVolume([250, 547, 1036, 1037, 2126, 1049, 2182, 2218, 1040, 1052], 1895)
-    femmesh.addVolume([194, 617, 195, 616, 2207, 2188, 217, 2185, 632, 2204], 1896)
-    femmesh.addVolume([1036, 249, 250, 1037, 2205, 272, 2182, 1052, 2186, 2218], 1897)
-    femmesh.addVolume([697, 501, 502, 1059, 786, 530, 785, 1739, 1130, 1131], 1898)
-    femmesh.addVolume([691, 508, 509, 1073, 809, 537, 808, 1842, 1151, 1152], 1899)
-    femmesh.addVolume([26, 323, 27, 694, 378, 379, 55, 893, 1760, 892], 1900)
-    femmesh.addVolume([25, 698, 24, 321, 886, 887, 53, 373, 1801, 372], 1901)
-    femmesh.addVolume([306, 153, 152, 1288, 463, 181, 462, 1850, 1509, 1510], 1902)
-    femmesh.addVolume([311, 150, 1292, 151, 458, 1504, 1849, 459, 179, 1503], 1903)
-    femmesh.addVolume([251, 250, 1036, 249, 2089, 2182, 2181, 289, 272, 2205], 1904)
-    femmesh.addVolume([195, 196, 194, 616, 234, 2088, 217, 2204, 2179, 2185], 1905)
-    femmesh.addVolume([516, 246, 1082, 83, 2219, 2136, 1089, 833, 265, 2176], 1906)
-    femmesh.addVolume([20, 695, 19, 312, 869, 870, 48, 358, 1820, 357], 1907)
-    femmesh.addVolume([618, 1274, 484, 193, 2121, 1309, 627, 2164, 2134, 2172], 1908)
-    femmesh.addVolume([321, 145, 144, 1290, 447, 173, 446, 1804, 1481, 1482], 1909)
-    femmesh.addVolume([1291, 580, 579, 1079, 1426, 608, 1425, 1856, 1216, 1217], 1910)
-    femmesh.addVolume([586, 1082, 1076, 246, 1093, 1175, 1228, 2212, 2136, 2100], 1911)
-    femmesh.addVolume([1071, 563, 564, 1280, 1185, 592, 1184, 1870, 1373, 1374], 1912)
-    femmesh.addVolume([679, 474, 547, 1037, 721, 550, 723, 2157, 1039, 1040], 1913)
-    femmesh.addVolume([1, 618, 476, 681, 622, 623, 478, 719, 2158, 718], 1914)
-    femmesh.addVolume([1065, 191, 1083, 559, 2101, 2142, 1096, 1177, 2217, 1088], 1915)
-    femmesh.addVolume([581, 1287, 582, 1075, 1431, 1432, 610, 1221, 1862, 1220], 1916)
-    femmesh.addVolume([1271, 249, 555, 1037, 2138, 2189, 1312, 2113, 2186, 1046], 1917)
-    femmesh.addVolume([188, 325, 298, 39, 2173, 417, 2106, 2208, 328, 415], 1918)
-    femmesh.addVolume([12, 301, 243, 324, 336, 2109, 2209, 332, 338, 2174], 1919)
-    femmesh.addVolume([1289, 574, 573, 1060, 1404, 602, 1403, 1794, 1204, 1205], 1920)
-    femmesh.addVolume([1069, 569, 570, 1281, 1197, 598, 1196, 1798, 1391, 1392], 1921)
-    femmesh.addVolume([135, 1284, 134, 303, 1451, 1452, 163, 427, 1890, 426], 1922)
-    femmesh.addVolume([1059, 571, 572, 1276, 1201, 600, 1200, 1741, 1397, 1398], 1923)
-    femmesh.addVolume([559, 1065, 191, 102, 1177, 2101, 2217, 1343, 2194, 228], 1924)
-    femmesh.addVolume([1076, 118, 586, 246, 2195, 1357, 1228, 2100, 282, 2212], 1925)
-    femmesh.addVolume([682, 248, 85, 1038, 2151, 274, 840, 2160, 2177, 2216], 1926)
-    femmesh.addVolume([1083, 489, 191, 1065, 1086, 2213, 2142, 1096, 1094, 2101], 1927)
-    femmesh.addVolume([143, 1278, 142, 323, 1475, 1476, 171, 443, 1758, 442], 1928)
-    femmesh.addVolume([85, 546, 682, 1038, 838, 725, 840, 2216, 1042, 2160], 1929)
-    femmesh.addVolume([477, 71, 617, 680, 737, 2220, 619, 716, 741, 2146], 1930)
-    femmesh.addVolume([1056, 566, 1283, 565, 1188, 1380, 1833, 1189, 594, 1379], 1931)
-    femmesh.addVolume([195, 1272, 102, 103, 2141, 1342, 230, 231, 1331, 109], 1932)
-    femmesh.addVolume([568, 1279, 1055, 567, 1386, 1768, 1192, 596, 1385, 1193], 1933)
-    femmesh.addVolume([1275, 138, 139, 313, 1464, 167, 1463, 1775, 434, 435], 1934)
-    femmesh.addVolume([1277, 136, 137, 307, 1458, 165, 1457, 1825, 430, 431], 1935)
-    femmesh.addVolume([1082, 516, 1076, 246, 1089, 1173, 1175, 2136, 2219, 2100], 1936)
-    femmesh.addVolume([617, 71, 195, 680, 2220, 212, 2188, 2146, 741, 2168], 1937)
-    femmesh.addVolume([243, 12, 86, 301, 2209, 843, 277, 2109, 336, 2211], 1938)
-    femmesh.addVolume([298, 73, 188, 39, 2210, 221, 2106, 415, 935, 2208], 1939)
-    femmesh.addVolume([70, 195, 71, 680, 213, 212, 77, 744, 2168, 741], 1940)
-    femmesh.addVolume([85, 682, 86, 248, 840, 845, 92, 274, 2151, 273], 1941)
-    femmesh.addVolume([1273, 121, 248, 120, 1358, 291, 2132, 1334, 127, 290], 1942)
-    femmesh.addVolume([141, 1282, 140, 319, 1469, 1470, 169, 439, 1835, 438], 1943)
-    femmesh.addVolume([191, 489, 70, 1065, 2213, 743, 209, 2101, 1094, 2214], 1944)
-    femmesh.addVolume([246, 516, 1076, 83, 2219, 1173, 2100, 265, 833, 2215], 1945)
-    femmesh.addVolume([1297, 1262, 247, 1081, 1355, 2067, 2086, 2080, 2064, 2068], 1946)
-    femmesh.addVolume([1262, 1297, 247, 244, 1355, 2086, 2067, 2082, 2087, 281], 1947)
-    femmesh.addVolume([189, 101, 1066, 1299, 207, 2221, 1705, 1706, 1339, 1703], 1948)
-    femmesh.addVolume([189, 1066, 101, 192, 1705, 2221, 207, 226, 2056, 229], 1949)
-    femmesh.addVolume([560, 1066, 101, 1299, 1179, 2221, 1337, 1340, 1703, 1339], 1950)
-    femmesh.addVolume([560, 101, 1066, 192, 1337, 2221, 1179, 2097, 229, 2056], 1951)
-    femmesh.addVolume([659, 1066, 189, 192, 2048, 1705, 1658, 1657, 2056, 226], 1952)
-    femmesh.addVolume([1066, 659, 189, 1259, 2048, 1658, 1705, 1704, 1619, 1665], 1953)
-    femmesh.addVolume([242, 114, 1261, 660, 256, 1614, 1643, 2042, 1613, 1612], 1954)
-    femmesh.addVolume([242, 1261, 114, 245, 1643, 1614, 256, 280, 1645, 261], 1955)
-    femmesh.addVolume([640, 672, 1280, 692, 982, 1972, 1664, 979, 762, 1661], 1956)
-    femmesh.addVolume([640, 1280, 672, 1237, 1664, 1972, 982, 1812, 1574, 1924], 1957)
-    femmesh.addVolume([247, 114, 1262, 244, 257, 1625, 2067, 281, 259, 2082], 1958)
-    femmesh.addVolume([247, 1262, 114, 661, 2067, 1625, 257, 2066, 1626, 1628], 1959)
-    femmesh.addVolume([187, 98, 1260, 190, 201, 1629, 1655, 225, 205, 1652], 1960)
-    femmesh.addVolume([187, 1260, 98, 662, 1655, 1629, 201, 2061, 1631, 1632], 1961)
-    femmesh.addVolume([692, 1258, 1063, 1071, 1662, 2049, 2081, 1871, 1872, 1108], 1962)
-    femmesh.addVolume([1258, 692, 1063, 657, 1662, 2081, 2049, 1757, 759, 1985], 1963)
-    femmesh.addVolume([1266, 1077, 707, 665, 2078, 1859, 1637, 1787, 2077, 799], 1964)
-    femmesh.addVolume([1077, 1266, 707, 1302, 2078, 1637, 1859, 1858, 1412, 1638], 1965)
-    femmesh.addVolume([688, 1255, 1240, 639, 1809, 1598, 1932, 972, 1748, 1789], 1966)
-    femmesh.addVolume([1255, 688, 1240, 1288, 1809, 1932, 1598, 1514, 1852, 1596], 1967)
-    femmesh.addVolume([305, 1257, 696, 303, 2046, 1669, 2079, 407, 1891, 1892], 1968)
-    femmesh.addVolume([1257, 305, 696, 655, 2046, 2079, 1669, 1754, 1976, 925], 1969)
-    femmesh.addVolume([687, 1256, 1240, 1287, 1791, 1597, 1919, 1865, 1436, 1595], 1970)
-    femmesh.addVolume([687, 1240, 1256, 639, 1919, 1597, 1791, 971, 1789, 1749], 1971)
-    femmesh.addVolume([694, 1250, 1233, 642, 1861, 1543, 1974, 993, 1808, 1889], 1972)
-    femmesh.addVolume([694, 1233, 1250, 1278, 1974, 1543, 1861, 1762, 1550, 1480], 1973)
-    femmesh.addVolume([697, 1245, 1233, 1276, 1866, 1545, 1950, 1743, 1402, 1546], 1974)
-    femmesh.addVolume([1245, 697, 1233, 642, 1866, 1950, 1545, 1805, 994, 1889], 1975)
-    femmesh.addVolume([658, 16, 306, 304, 855, 348, 1967, 1990, 346, 350], 1976)
-    femmesh.addVolume([16, 658, 306, 688, 855, 1967, 348, 859, 860, 1851], 1977)
-    femmesh.addVolume([1075, 512, 656, 1080, 1161, 823, 1962, 1165, 1163, 1981], 1978)
-    femmesh.addVolume([512, 1075, 656, 687, 1161, 1962, 823, 819, 1864, 824], 1979)
-    femmesh.addVolume([1075, 582, 1256, 1287, 1220, 1434, 1863, 1862, 1432, 1436], 1980)
-    femmesh.addVolume([1075, 1256, 582, 1080, 1863, 1434, 1220, 1165, 2026, 1223], 1981)
-    femmesh.addVolume([298, 131, 187, 299, 419, 2091, 2107, 416, 420, 2060], 1982)
-    femmesh.addVolume([131, 298, 187, 188, 419, 2107, 2091, 2090, 2106, 224], 1983)
-    femmesh.addVolume([243, 13, 302, 301, 2169, 339, 2094, 2109, 337, 341], 1984)
-    femmesh.addVolume([13, 243, 302, 242, 2169, 2094, 339, 2103, 279, 2041], 1985)
-    femmesh.addVolume([1037, 250, 84, 249, 2218, 270, 2202, 2186, 272, 268], 1986)
-    femmesh.addVolume([1037, 84, 250, 547, 2202, 270, 2218, 1040, 841, 2126], 1987)
-    femmesh.addVolume([617, 194, 71, 477, 2207, 216, 2220, 619, 2184, 737], 1988)
-    femmesh.addVolume([194, 617, 71, 195, 2207, 2220, 216, 217, 2188, 212], 1989)
-    return True
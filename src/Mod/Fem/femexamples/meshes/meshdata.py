@@ -0,0 +1,105 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM example meshes"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+
+## @package meshdata
+#  \ingroup FEM
+#  \brief load the example meshes from the compressed mesh data files
+
+# The example meshes are saved as compressed numpy arrays in mesh_<name>.npz,
+# the arrays are the FEM Mesh arrays of importToolsFem.make_femmesh_from_arrays,
+# for every key "<key>_ids" and "<key>_values", for example "Nodes_ids" and
+# "Tetra10Elem_values". Nodes and elements are added to the mesh in one call
+# per element type. To add a new example mesh use save_mesh_data.
+
+import functools
+import os
+
+import numpy as np
+
+from feminout.importToolsFem import MESH_ELEMENT_TYPES
+from feminout.importToolsFem import get_mesh_arrays
+from feminout.importToolsFem import make_dict_from_femmesh
+
+
+def get_mesh_data_file(
+    mesh_name
+):
+    return os.path.join(os.path.dirname(__file__), mesh_name + ".npz")
+
+
+@functools.lru_cache(maxsize=1)
+def load_mesh_arrays(
+    mesh_name
+):
+    """ returns the FEM Mesh arrays of the example mesh mesh_name, for example
+    "mesh_canticcx_tetra10", the last loaded mesh is kept for create_elements
+    """
+    mesh_arrays = {}
+    with np.load(get_mesh_data_file(mesh_name)) as data:
+        for key in ["Nodes"] + list(MESH_ELEMENT_TYPES):
+            if key + "_ids" in data:
+                mesh_arrays[key] = (data[key + "_ids"], data[key + "_values"])
+    return mesh_arrays
+
+
+def create_nodes(
+    femmesh,
+    mesh_name
+):
+    node_ids, coords = load_mesh_arrays(mesh_name)["Nodes"]
+    femmesh.addNodes(coords.ravel(), node_ids)
+    return True
+
+
+def create_elements(
+    femmesh,
+    mesh_name
+):
+    for key, (ele_ids, connectivity) in load_mesh_arrays(mesh_name).items():
+        if key == "Nodes":
+            continue
+        ele_type, nodes_count = MESH_ELEMENT_TYPES[key]
+        femmesh.addElements(ele_type, nodes_count, connectivity.ravel(), ele_ids)
+    return True
+
+
+def save_mesh_data(
+    femmesh,
+    file_path
+):
+    """ saves a FemMesh as compressed mesh data file, see load_mesh_arrays
+    """
+    mesh_data = {}
+    for key, (ids, values) in get_mesh_arrays(make_dict_from_femmesh(femmesh)).items():
+        if len(ids) == 0:
+            continue
+        mesh_data[key + "_ids"] = ids.astype(np.int32)
+        if key == "Nodes":
+            mesh_data[key + "_values"] = values
+        else:
+            mesh_data[key + "_values"] = values.astype(np.int32)
+    np.savez_compressed(file_path, **mesh_data)
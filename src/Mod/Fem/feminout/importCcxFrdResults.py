@@ -33,6 +33,8 @@ __url__ = "https://www.freecadweb.org"
 
 import os
 
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 
@@ -70,8 +72,16 @@ def importFrd(
     filename,
     analysis=None,
     result_name_prefix="",
-    result_analysis_type=""
+    result_analysis_type="",
+    result_steps=None,
+    lazy=False
 ):
+    """ imports a CalculiX frd file
+    result_steps: None to import all result sets, otherwise a sequence of
+    result set indices (0 based). Only these result sets are read from the file.
+    lazy: if True the result objects only get a reference to their result set in
+    the frd file. The values are read on first use, see load_result_set.
+    """
     import ObjectsFem
     from . import importToolsFem
 
@@ -80,12 +90,12 @@ def importFrd(
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    mesh_data = read_frd_mesh(filename)
     result_mesh_object = None
     res_obj = None
 
-    if len(m["Nodes"]) > 0:
-        mesh = importToolsFem.make_femmesh(m)
+    if len(mesh_data["Nodes"][0]) > 0:
+        mesh = importToolsFem.make_femmesh_from_arrays(mesh_data)
         result_mesh_object = ObjectsFem.makeMeshResult(
             doc,
             "ResultMesh"
@@ -94,54 +104,56 @@ def importFrd(
         res_mesh_is_compacted = False
         nodenumbers_for_compacted_mesh = []
 
-        number_of_increments = len(m["Results"])
-        Console.PrintLog(
-            "Increments: " + str(number_of_increments) + "\n"
-        )
-        if len(m["Results"]) > 0:
-            for result_set in m["Results"]:
-                if "number" in result_set:
-                    eigenmode_number = result_set["number"]
-                else:
-                    eigenmode_number = 0
-                step_time = result_set["time"]
-                step_time = round(step_time, 2)
-                if eigenmode_number > 0:
-                    results_name = (
-                        "{}EigenMode_{}_Results"
-                        .format(result_name_prefix, eigenmode_number)
-                    )
-                elif number_of_increments > 1:
-
-                    if result_analysis_type == "buckling":
-
-                        results_name = (
-                            "{}BucklingFactor_{}_Results"
-                            .format(result_name_prefix, step_time)
-                        )
-                    else:
-                        results_name = (
-                            "{}Time_{}_Results"
-                            .format(result_name_prefix, step_time)
-                        )
-
-                else:
-                    results_name = (
-                        "{}Results"
-                        .format(result_name_prefix)
-                    )
-
+        if lazy:
+            # only the index of the result sets is read, no result values
+            frd_index = read_frd_index(filename)
+            result_sets = (
+                result_set for result_set in frd_index["result_sets"]
+                if result_steps is None or result_set["step"] in result_steps
+            )
+        else:
+            # the result sets are read one by one, only one result set is held in memory
+            result_sets = iter_frd_results(filename, result_steps)
+        # look one result set ahead, the result object names depend on
+        # whether there is more than one result set
+        result_set = next(result_sets, None)
+        next_result_set = next(result_sets, None)
+        multiple_result_sets = next_result_set is not None
+        number_of_increments = 0
+        if result_set is not None:
+            while result_set is not None:
+                number_of_increments += 1
+                results_name = _get_result_name(
+                    result_set,
+                    multiple_result_sets,
+                    result_name_prefix,
+                    result_analysis_type
+                )
                 res_obj = ObjectsFem.makeResultMechanical(doc, results_name)
                 res_obj.Mesh = result_mesh_object
-                res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
                 if analysis:
                     # need to be here, becasause later on, the analysis objs are needed
                     # see fill of principal stresses
                     analysis.addObject(res_obj)
 
+                if lazy:
+                    _set_lazy_result_set(res_obj, filename, result_set)
+                    if "mflow" not in result_set["fields"] and res_mesh_is_compacted is False:
+                        # compact the FemMesh only, the NodeNumbers are set on load
+                        # see the notes on compacting below
+                        from femmesh.meshtools import compact_mesh
+                        result_mesh_object.FemMesh = compact_mesh(result_mesh_object.FemMesh)[0]
+                        res_mesh_is_compacted = True
+                    result_set, next_result_set = next_result_set, next(result_sets, None)
+                    continue
+
+                res_obj = importToolsFem.fill_femresult_mechanical(
+                    res_obj,
+                    frd_result_to_dict(result_set)
+                )
+
                 # more result object calculations
                 from femresult import resulttools
-                from femtools import femutils
                 if not res_obj.MassFlowRate:
                     # information 1:
                     # only compact result if not Flow 1D results
@@ -163,40 +175,12 @@ def importFrd(
                         # all other result sets, do not compact FemMesh, only set NodeNumbers
                         res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
 
-                # fill DisplacementLengths
-                res_obj = resulttools.add_disp_apps(res_obj)
-                # fill vonMises
-                res_obj = resulttools.add_von_mises(res_obj)
-                # fill principal stress
-                # if material reinforced object use add additional values to the res_obj
-                if res_obj.getParentGroup():
-                    has_reinforced_mat = False
-                    for obj in res_obj.getParentGroup().Group:
-                        if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
-                            has_reinforced_mat = True
-                            Console.PrintLog(
-                                "Reinforced material object detected, "
-                                "reinforced principal stresses and standard principal "
-                                "stresses will be added.\n"
-                            )
-                            resulttools.add_principal_stress_reinforced(res_obj)
-                            break
-                    if has_reinforced_mat is False:
-                        Console.PrintLog(
-                            "No reinforced material object detected, "
-                            "standard principal stresses will be added.\n"
-                        )
-                        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                        res_obj = resulttools.add_principal_stress_std(res_obj)
-                else:
-                    Console.PrintLog(
-                        "No Analysis detected, standard principal stresses will be added.\n"
-                    )
-                    # if a pure frd file was opened no analysis and thus no parent group
-                    # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                    res_obj = resulttools.add_principal_stress_std(res_obj)
-                # fill Stats
-                res_obj = resulttools.fill_femresult_stats(res_obj)
+                res_obj = _add_result_values(res_obj)
+
+                result_set, next_result_set = next_result_set, next(result_sets, None)
+            Console.PrintLog(
+                "Increments: " + str(number_of_increments) + "\n"
+            )
 
         else:
             error_message = (
@@ -240,6 +224,161 @@ def importFrd(
     return res_obj
 
 
+def load_result_set(
+    res_obj
+):
+    """ reads the result values of a lazy imported result object from its frd file
+    does nothing if the result values are already loaded
+    returns True if the result values are loaded
+    """
+    if not getattr(res_obj, "ResultFile", ""):
+        return True
+    from . import importToolsFem
+    frd_input = res_obj.ResultFile
+    if not os.path.isfile(frd_input):
+        Console.PrintError(
+            "FEM: Result file {} of {} not found, results can not be loaded.\n"
+            .format(frd_input, res_obj.Label)
+        )
+        return False
+    Console.PrintMessage(
+        "Load result set {} of {} from frd file: {}\n"
+        .format(res_obj.ResultSetIndex, res_obj.Label, frd_input)
+    )
+    result_set = read_frd_result_set(frd_input, res_obj.ResultSetIndex)
+    if result_set is None:
+        Console.PrintError(
+            "FEM: Result set {} not found in {}.\n"
+            .format(res_obj.ResultSetIndex, frd_input)
+        )
+        return False
+    res_obj = importToolsFem.fill_femresult_mechanical(res_obj, frd_result_to_dict(result_set))
+    if not res_obj.MassFlowRate:
+        # the FemMesh was compacted on import, see importFrd
+        node_numbers = _compacted_node_numbers(
+            _read_frd_node_ids(frd_input),
+            res_obj.NodeNumbers
+        )
+        if node_numbers is None:
+            Console.PrintError(
+                "FEM: Result set {} of {} has nodes which are not in the mesh of {}.\n"
+                .format(res_obj.ResultSetIndex, res_obj.Label, frd_input)
+            )
+            return False
+        res_obj.NodeNumbers = node_numbers
+    res_obj = _add_result_values(res_obj)
+    res_obj.ResultFile = ""
+    return True
+
+
+def _get_result_name(
+    result_set,
+    multiple_result_sets,
+    result_name_prefix,
+    result_analysis_type
+):
+    if "number" in result_set:
+        eigenmode_number = result_set["number"]
+    else:
+        eigenmode_number = 0
+    step_time = result_set["time"]
+    step_time = round(step_time, 2)
+    if eigenmode_number > 0:
+        results_name = (
+            "{}EigenMode_{}_Results"
+            .format(result_name_prefix, eigenmode_number)
+        )
+    elif multiple_result_sets:
+
+        if result_analysis_type == "buckling":
+
+            results_name = (
+                "{}BucklingFactor_{}_Results"
+                .format(result_name_prefix, step_time)
+            )
+        else:
+            results_name = (
+                "{}Time_{}_Results"
+                .format(result_name_prefix, step_time)
+            )
+
+    else:
+        results_name = (
+            "{}Results"
+            .format(result_name_prefix)
+        )
+    return results_name
+
+
+def _set_lazy_result_set(
+    res_obj,
+    frd_input,
+    result_set
+):
+    if not hasattr(res_obj, "ResultFile"):
+        res_obj.addProperty(
+            "App::PropertyString",
+            "ResultFile",
+            "Base",
+            "frd file to read the result values from, empty if they are loaded",
+            1  # the 1 set the property to ReadOnly
+        )
+    if not hasattr(res_obj, "ResultSetIndex"):
+        res_obj.addProperty(
+            "App::PropertyInteger",
+            "ResultSetIndex",
+            "Base",
+            "index of the result set in the frd file",
+            1
+        )
+    res_obj.ResultFile = frd_input
+    res_obj.ResultSetIndex = result_set["step"]
+    if result_set["number"] > 0:
+        res_obj.Eigenmode = result_set["number"]
+
+
+def _add_result_values(
+    res_obj
+):
+    from femresult import resulttools
+    from femtools import femutils
+    # fill DisplacementLengths
+    res_obj = resulttools.add_disp_apps(res_obj)
+    # fill vonMises
+    res_obj = resulttools.add_von_mises(res_obj)
+    # fill principal stress
+    # if material reinforced object use add additional values to the res_obj
+    if res_obj.getParentGroup():
+        has_reinforced_mat = False
+        for obj in res_obj.getParentGroup().Group:
+            if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
+                has_reinforced_mat = True
+                Console.PrintLog(
+                    "Reinforced material object detected, "
+                    "reinforced principal stresses and standard principal "
+                    "stresses will be added.\n"
+                )
+                resulttools.add_principal_stress_reinforced(res_obj)
+                break
+        if has_reinforced_mat is False:
+            Console.PrintLog(
+                "No reinforced material object detected, "
+                "standard principal stresses will be added.\n"
+            )
+            # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+            res_obj = resulttools.add_principal_stress_std(res_obj)
+    else:
+        Console.PrintLog(
+            "No Analysis detected, standard principal stresses will be added.\n"
+        )
+        # if a pure frd file was opened no analysis and thus no parent group
+        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+        res_obj = resulttools.add_principal_stress_std(res_obj)
+    # fill Stats
+    res_obj = resulttools.fill_femresult_stats(res_obj)
+    return res_obj
+
+
 # read a calculix result file and extract the nodes
 # displacement vectors and stress values.
 def read_frd_result(
@@ -788,3 +927,466 @@ def read_frd_result(
         "Penta15Elem": elements_penta15,
         "Results": results
     }
+
+
+# ********* array based frd reader *********
+# The reader streams the frd file block by block. Every block is parsed at once
+# from its fixed width columns into numpy arrays. Nodes, elements and every result
+# field are returned as tuple (ids, values), with ids as 1D int array and values
+# as 2D array with one row per id. For large frd files this is much faster and
+# needs much less memory than read_frd_result, which creates dicts of Python objects.
+
+# {absolute frd file path: ((modification time, size), index)}, see read_frd_index
+_frd_index_cache = {}
+
+# frd element type: (mesh data key, number of nodes, node order frd --> FreeCAD)
+# the node orders are the same as in read_frd_result, see the comments there
+FRD_ELEMENT_TYPES = {
+    1: ("Hexa8Elem", 8, (5, 6, 7, 4, 1, 2, 3, 0)),
+    2: ("Penta6Elem", 6, (4, 5, 3, 1, 2, 0)),
+    3: ("Tetra4Elem", 4, (1, 0, 2, 3)),
+    4: ("Hexa20Elem", 20, (
+        7, 4, 5, 6, 3, 0, 1, 2, 19, 16, 17, 18, 11, 8, 9, 10, 15, 12, 13, 14
+    )),
+    5: ("Penta15Elem", 15, (4, 5, 3, 1, 2, 0, 13, 14, 12, 7, 8, 6, 10, 11, 9)),
+    6: ("Tetra10Elem", 10, (1, 0, 2, 3, 4, 6, 5, 8, 7, 9)),
+    7: ("Tria3Elem", 3, (0, 1, 2)),
+    8: ("Tria6Elem", 6, (0, 1, 2, 3, 4, 5)),
+    9: ("Quad4Elem", 4, (0, 1, 2, 3)),
+    10: ("Quad8Elem", 8, (0, 1, 2, 3, 4, 5, 6, 7)),
+    11: ("Seg2Elem", 2, (0, 1)),
+    12: ("Seg3Elem", 3, (0, 1, 2)),
+}
+
+# frd result field name: (result set key, number of values, value order frd --> FreeCAD)
+# CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+# FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+# thus exchange the last two entries, same for the strains
+FRD_RESULT_FIELDS = {
+    b"DISP": ("disp", 3, (0, 1, 2)),
+    b"STRESS": ("stress", 6, (0, 1, 2, 3, 5, 4)),
+    b"TOSTRAIN": ("strain", 6, (0, 1, 2, 3, 5, 4)),
+    b"PE": ("peeq", 1, (0,)),
+    b"NDTEMP": ("temp", 1, (0,)),
+    b"MAFLOW": ("mflow", 1, (0,)),
+    b"STPRES": ("npressure", 1, (0,)),
+}
+
+
+def read_frd_mesh(
+    frd_input
+):
+    """ reads the nodes and elements of a CalculiX frd file into numpy arrays
+    returns a dict with the same keys as read_frd_result (without "Results")
+    every value is a tuple (ids, values)
+    "Nodes": int array of node ids and float array (n, 3) of the coordinates
+    "Tetra10Elem" etc.: int array of element ids and int array (n, nodes) of node ids
+    """
+    Console.PrintMessage(
+        "Read ccx mesh from frd file: {}\n"
+        .format(frd_input)
+    )
+    inout_nodes = _read_inout_nodes(frd_input)
+    mesh_data = {"Nodes": (np.empty(0, dtype=np.int64), np.empty((0, 3)))}
+    for key, nodes_count, order in FRD_ELEMENT_TYPES.values():
+        mesh_data[key] = (
+            np.empty(0, dtype=np.int64),
+            np.empty((0, nodes_count), dtype=np.int64)
+        )
+    with pyopen(frd_input, "rb") as frd_file:
+        for step, number, time, key, offset, lines in _iter_frd_blocks(frd_file, steps=()):
+            if step is not None:
+                # nodes and elements are written before any result block
+                break
+            if key == b"2C":
+                mesh_data["Nodes"] = (
+                    _parse_fixed_width(lines, 3, 10, 1, np.int64)[:, 0],
+                    _parse_fixed_width(lines, 13, 12, 3, np.float64)
+                )
+            elif key == b"3C":
+                mesh_data.update(_parse_frd_elements(lines))
+    if inout_nodes:
+        mesh_data["Seg3Elem"] = _apply_inout_nodes_seg3(mesh_data["Seg3Elem"], inout_nodes)
+    if len(mesh_data["Nodes"][0]) == 0:
+        Console.PrintError("FEM: No nodes found in Frd file.\n")
+    return mesh_data
+
+
+def iter_frd_results(
+    frd_input,
+    steps=None
+):
+    """ iterates over the result sets (time steps or eigenmodes) of a CalculiX frd file
+    steps: None for all result sets, otherwise a sequence of result set indices (0 based)
+    Only the blocks of the requested result sets are parsed, the file is closed
+    as soon as the last requested result set is read.
+    yields one dict per result set with the same keys as the result sets of
+    read_frd_result and additionally "step", the index of the result set.
+    The result fields are tuples (ids, values), values is a float array (n, components)
+    """
+    inout_nodes = _read_inout_nodes(frd_input)
+    result_set = None
+    with pyopen(frd_input, "rb") as frd_file:
+        for step, number, time, key, offset, lines in _iter_frd_blocks(
+            frd_file,
+            steps=steps,
+            mesh=False
+        ):
+            if step is None:
+                # nodes and elements
+                continue
+            if result_set is not None and result_set["step"] != step:
+                yield result_set
+                result_set = None
+            if steps is not None and step not in steps:
+                continue
+            if result_set is None:
+                result_set = {"step": step, "number": number, "time": time}
+            if lines is not None:
+                name, values = _parse_frd_result_block(key, lines, inout_nodes)
+                result_set[name] = values
+    if result_set is not None:
+        yield result_set
+    if not inout_nodes and result_set is not None:
+        if "mflow" in result_set or "npressure" in result_set:
+            Console.PrintError(
+                "We have mflow or npressure, but no inout_nodes file.\n"
+            )
+
+
+def read_frd_index(
+    frd_input
+):
+    """ reads the index of the result sets of a CalculiX frd file
+    no values are parsed, only the block headers are read
+    returns a dict with "mesh_offsets", the file offsets of the nodes and the elements
+    block and "result_sets", a list with a dict for every result set with the keys
+    "step", "number", "time", "fields" (the result set keys of the fields) and
+    "offsets" (the file offsets of the field blocks)
+    The index is cached as long as the frd file is not changed.
+    """
+    stat = os.stat(frd_input)
+    cache_key = os.path.abspath(frd_input)
+    cached = _frd_index_cache.get(cache_key)
+    if cached is not None and cached[0] == (stat.st_mtime, stat.st_size):
+        return cached[1]
+    frd_index = {"mesh_offsets": {}, "result_sets": []}
+    result_sets = frd_index["result_sets"]
+    with pyopen(frd_input, "rb") as frd_file:
+        for step, number, time, key, offset, lines in _iter_frd_blocks(
+            frd_file,
+            steps=(),
+            mesh=False
+        ):
+            if step is None:
+                frd_index["mesh_offsets"][key] = offset
+                continue
+            if not result_sets or result_sets[-1]["step"] != step:
+                result_sets.append({
+                    "step": step,
+                    "number": number,
+                    "time": time,
+                    "fields": [],
+                    "offsets": []
+                })
+            if key in FRD_RESULT_FIELDS:
+                result_sets[-1]["fields"].append(FRD_RESULT_FIELDS[key][0])
+                result_sets[-1]["offsets"].append(offset)
+    _frd_index_cache[cache_key] = ((stat.st_mtime, stat.st_size), frd_index)
+    return frd_index
+
+
+def read_frd_result_set(
+    frd_input,
+    step
+):
+    """ reads one result set of a CalculiX frd file
+    the blocks of the result set are read directly by their file offsets, see read_frd_index
+    returns the result set in the format of iter_frd_results or None if there is no such step
+    """
+    frd_index = read_frd_index(frd_input)
+    if step < 0 or step >= len(frd_index["result_sets"]):
+        return None
+    index_set = frd_index["result_sets"][step]
+    inout_nodes = _read_inout_nodes(frd_input)
+    result_set = {"step": step, "number": index_set["number"], "time": index_set["time"]}
+    with pyopen(frd_input, "rb") as frd_file:
+        for offset in index_set["offsets"]:
+            frd_file.seek(offset)
+            block = next(_iter_frd_blocks(frd_file, mesh=False), None)
+            if block is None or block[5] is None:
+                continue
+            name, values = _parse_frd_result_block(block[3], block[5], inout_nodes)
+            result_set[name] = values
+    return result_set
+
+
+def frd_mesh_to_dict(
+    mesh_data
+):
+    """ converts the mesh arrays of read_frd_mesh into the mesh dict of read_frd_result
+    """
+    node_ids, coords = mesh_data["Nodes"]
+    mesh_dict = {"Nodes": dict(zip(
+        node_ids.tolist(),
+        [FreeCAD.Vector(x, y, z) for x, y, z in coords.tolist()]
+    ))}
+    for key, nodes_count, order in FRD_ELEMENT_TYPES.values():
+        ele_ids, connectivity = mesh_data[key]
+        mesh_dict[key] = dict(zip(
+            ele_ids.tolist(),
+            [tuple(nodes) for nodes in connectivity.tolist()]
+        ))
+    return mesh_dict
+
+
+def frd_result_to_dict(
+    result_set
+):
+    """ converts a result set of iter_frd_results into a result set of read_frd_result
+    """
+    result_dict = {}
+    for key, value in result_set.items():
+        if key == "step":
+            continue
+        if not isinstance(value, tuple):
+            # eigenmode number and time
+            result_dict[key] = value
+            continue
+        ids, values = value
+        if key == "disp":
+            values = [FreeCAD.Vector(x, y, z) for x, y, z in values.tolist()]
+        elif values.shape[1] == 1:
+            values = values[:, 0].tolist()
+        else:
+            values = [tuple(row) for row in values.tolist()]
+        result_dict[key] = dict(zip(ids.tolist(), values))
+    return result_dict
+
+
+def _read_frd_node_ids(
+    frd_input
+):
+    node_offset = read_frd_index(frd_input)["mesh_offsets"].get(b"2C")
+    if node_offset is None:
+        return np.empty(0, dtype=np.int64)
+    with pyopen(frd_input, "rb") as frd_file:
+        frd_file.seek(node_offset)
+        block = next(_iter_frd_blocks(frd_file), None)
+    return _parse_fixed_width(block[5], 3, 10, 1, np.int64)[:, 0]
+
+
+def _compacted_node_numbers(
+    node_ids,
+    node_numbers
+):
+    """ maps frd node numbers to the node numbers of the compacted mesh
+    compact_mesh renumbers the nodes in the order of their ids starting with 1,
+    the node blocks of a frd file do not need to be sorted and may have gaps
+    returns None if a node number is not in node_ids
+    """
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+    node_numbers = np.asarray(node_numbers, dtype=np.int64)
+    if not len(node_numbers):
+        return []
+    if not len(node_ids):
+        return None
+    sorted_ids = np.sort(node_ids)
+    rows = np.searchsorted(sorted_ids, node_numbers)
+    rows[rows == len(sorted_ids)] = 0
+    if not np.array_equal(sorted_ids[rows], node_numbers):
+        return None
+    return (rows + 1).tolist()
+
+
+def _read_inout_nodes(
+    frd_input
+):
+    inout_nodes = []
+    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
+    if os.path.exists(inout_nodes_file):
+        Console.PrintMessage(
+            "Read special 1DFlow nodes data form: {}\n".format(inout_nodes_file)
+        )
+        with pyopen(inout_nodes_file, "r") as f:
+            for line in f:
+                a = line.split(",")
+                inout_nodes.append((int(a[1]), int(a[2])))
+    return inout_nodes
+
+
+def _iter_frd_blocks(
+    frd_file,
+    steps=None,
+    mesh=True
+):
+    """ iterates over the blocks of a frd file opened in binary mode
+    yields a tuple (step, number, time, key, offset, lines) for every block
+    step: None for the nodes and elements blocks, otherwise the index of the
+        result set the block belongs to
+    number, time: eigenmode number and step time of the result set, NaN if not set
+    key: b"2C" for nodes, b"3C" for elements, otherwise the frd field name
+    offset: file offset of the block header
+    lines: list of the raw data lines, None if the data is not needed, which means
+        the field is unknown or the result set is not in steps
+    A new result set starts if the eigenmode number or the step time
+    increases, same as in read_frd_result.
+    """
+    last_step = max(steps) if steps else None
+    offset = frd_file.tell()
+    header_offset = None
+    key = None
+    lines = None
+    step = -1
+    number = float("NaN")
+    time = float("NaN")
+    eigenmode = 0
+    timestep = 0.0
+    mode_changed = False
+    time_changed = False
+
+    for line in frd_file:
+        line_offset = offset
+        offset += len(line)
+        code = line[1:3]
+        if code == b"-1" or code == b"-2":
+            if lines is not None:
+                lines.append(line)
+        elif code == b"-3":
+            if key is not None:
+                if key == b"2C" or key == b"3C":
+                    yield (None, number, time, key, header_offset, lines)
+                else:
+                    yield (step, number, time, key, header_offset, lines)
+            key = None
+            lines = None
+            header_offset = None
+        elif code == b"-4":
+            if step < 0 or mode_changed or time_changed:
+                step += 1
+                if last_step is not None and step > last_step:
+                    return
+                number = eigenmode if mode_changed else float("NaN")
+                time = timestep if time_changed else float("NaN")
+                mode_changed = False
+                time_changed = False
+            key = line[5:13].strip()
+            if header_offset is None:
+                header_offset = line_offset
+            if key in FRD_RESULT_FIELDS and (steps is None or step in steps):
+                lines = []
+        elif line[4:6] == b"2C" or line[4:6] == b"3C":
+            key = line[4:6]
+            header_offset = line_offset
+            if mesh:
+                lines = []
+        elif line[4:6] == b"1P":
+            if header_offset is None:
+                header_offset = line_offset
+            if line[5:10] == b"PMODE":
+                mode = int(line[30:36])
+                if mode > eigenmode:
+                    eigenmode = mode
+                    mode_changed = True
+        elif line[2:7] == b"100CL":
+            step_time = float(line[13:25])
+            if step_time > timestep:
+                timestep = step_time
+                time_changed = True
+        elif line[1:5] == b"9999":
+            break
+
+
+def _parse_fixed_width(
+    lines,
+    start,
+    width,
+    count,
+    dtype
+):
+    """ parses count fields of equal width beginning at column start
+    of every line into an array (number of lines, count)
+    """
+    if not lines:
+        return np.empty((0, count), dtype=dtype)
+    size = width * count
+    end = start + size
+    data = b"".join(line[start:end].rstrip(b"\r\n").ljust(size) for line in lines)
+    values = np.frombuffer(data, dtype="S{}".format(width)).astype(dtype)
+    return values.reshape(len(lines), count)
+
+
+def _parse_frd_elements(
+    lines
+):
+    # an element is a "-1" line (element id and type) followed by
+    # "-2" lines with up to ten node ids each
+    elements = {}
+    node_ids = None
+    for line in lines:
+        if line[1:3] == b"-1":
+            ids, node_ids = elements.setdefault(int(line[13:18]), ([], []))
+            ids.append(line[3:13])
+            node_ids.append(b"")
+        elif node_ids is not None:
+            node_ids[-1] += line[3:].rstrip()
+    mesh_data = {}
+    for ele_type, (ids, node_ids) in elements.items():
+        if ele_type not in FRD_ELEMENT_TYPES:
+            Console.PrintWarning(
+                "FEM: frd element type {} is not supported.\n".format(ele_type)
+            )
+            continue
+        key, nodes_count, order = FRD_ELEMENT_TYPES[ele_type]
+        ele_ids = np.array(ids).astype(np.int64)
+        connectivity = _parse_fixed_width(node_ids, 0, 10, nodes_count, np.int64)
+        mesh_data[key] = (ele_ids, connectivity[:, order])
+    return mesh_data
+
+
+def _apply_inout_nodes_seg3(
+    seg3,
+    inout_nodes
+):
+    # same as in read_frd_result, seg3 elements which are not
+    # connected to an inlet or outlet node are removed
+    ele_ids, connectivity = seg3
+    keep = np.zeros(len(ele_ids), dtype=bool)
+    new_connectivity = connectivity.copy()
+    for node, inout_node in inout_nodes:
+        # fluid inlet node numbering
+        inlet = connectivity[:, 0] == node
+        new_connectivity[inlet, 0] = inout_node
+        new_connectivity[inlet, 1] = connectivity[inlet, 2]
+        new_connectivity[inlet, 2] = connectivity[inlet, 0]
+        # fluid outlet node numbering
+        outlet = ~inlet & (connectivity[:, 2] == node)
+        new_connectivity[outlet] = connectivity[outlet]
+        new_connectivity[outlet, 1] = inout_node
+        keep |= inlet | outlet
+    return (ele_ids[keep], new_connectivity[keep])
+
+
+def _parse_frd_result_block(
+    key,
+    lines,
+    inout_nodes
+):
+    name, count, order = FRD_RESULT_FIELDS[key]
+    ids = _parse_fixed_width(lines, 3, 10, 1, np.int64)[:, 0]
+    values = _parse_fixed_width(lines, 13, 12, count, np.float64)[:, order]
+    if name == "mflow":
+        # convert units to kg/s from t/s
+        values = values * 1000
+    if inout_nodes and (name == "mflow" or name == "npressure"):
+        # the values of the inlet and outlet nodes are copied to the inout nodes
+        # network results are small, thus a dict is used to keep the order of read_frd_result
+        field = {}
+        for node, value in zip(ids.tolist(), values[:, 0].tolist()):
+            field[node] = value
+            for inout in inout_nodes:
+                if node == inout[0]:
+                    field[inout[1]] = value
+        ids = np.array(list(field.keys()), dtype=np.int64)
+        values = np.array(list(field.values()), dtype=np.float64).reshape(-1, 1)
+    return name, (ids, values)
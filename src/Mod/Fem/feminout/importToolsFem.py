@@ -29,6 +29,8 @@ __url__ = "https://www.freecadweb.org"
 #  \ingroup FEM
 #  \brief FreeCAD FEM import tools
 
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 
@@ -132,119 +134,105 @@ def get_MaxDimElementFromList(
     return elem_list[-1]
 
 
+# element type and node count of the element keys of the FEM Mesh data
+MESH_ELEMENT_TYPES = {
+    "Hexa8Elem": ("Volume", 8),
+    "Penta6Elem": ("Volume", 6),
+    "Tetra4Elem": ("Volume", 4),
+    "Tetra10Elem": ("Volume", 10),
+    "Penta15Elem": ("Volume", 15),
+    "Hexa20Elem": ("Volume", 20),
+    "Tria3Elem": ("Face", 3),
+    "Tria6Elem": ("Face", 6),
+    "Quad4Elem": ("Face", 4),
+    "Quad8Elem": ("Face", 8),
+    "Seg2Elem": ("Edge", 2),
+    "Seg3Elem": ("Edge", 3),
+}
+
+
 def make_femmesh(
     mesh_data
 ):
     """ makes an FreeCAD FEM Mesh object from FEM Mesh data
+    mesh_data: dict with a dict {id: nodes} for "Nodes" and every element type
+    """
+    return make_femmesh_from_arrays(get_mesh_arrays(mesh_data))
+
+
+def make_femmesh_from_arrays(
+    mesh_arrays
+):
+    """ makes an FreeCAD FEM Mesh object from FEM Mesh arrays
+    mesh_arrays: dict with the keys of the FEM Mesh data, every value is a tuple (ids, values)
+    "Nodes": node ids and coordinates (n, 3)
+    "Tetra10Elem" etc.: element ids and node ids (n, nodes)
+    see importCcxFrdResults.read_frd_mesh, anything numpy.asarray accepts works
+    all nodes and all elements of one type are added to the mesh in one call
     """
     import Fem
     mesh = Fem.FemMesh()
-    m = mesh_data
-    if ("Nodes" in m) and (len(m["Nodes"]) > 0):
-        FreeCAD.Console.PrintLog("Found: nodes\n")
-        if (
-            ("Seg2Elem" in m)
-            or ("Seg3Elem" in m)
-            or ("Tria3Elem" in m)
-            or ("Tria6Elem" in m)
-            or ("Quad4Elem" in m)
-            or ("Quad8Elem" in m)
-            or ("Tetra4Elem" in m)
-            or ("Tetra10Elem" in m)
-            or ("Penta6Elem" in m)
-            or ("Penta15Elem" in m)
-            or ("Hexa8Elem" in m)
-            or ("Hexa20Elem" in m)
-        ):
-
-            nds = m["Nodes"]
-            FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9],
-                                e[10], e[11], e[12], e[13], e[14]], i)
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume([
-                    e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9],
-                    e[10], e[11], e[12], e[13], e[14], e[15], e[16], e[17], e[18], e[19]
-                ], i)
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
-            Console.PrintLog(
-                "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n"
-                .format(
-                    len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15)
-                )
-            )
-            Console.PrintLog(
-                "imported mesh: {} "
-                "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n"
-                .format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3)
-                )
-            )
-        else:
-            Console.PrintError("No Elements found!\n")
-    else:
+    node_ids, coords = mesh_arrays.get("Nodes", ((), ()))
+    if len(node_ids) == 0:
         Console.PrintError("No Nodes found!\n")
+        return mesh
+    FreeCAD.Console.PrintLog("Found: nodes\n")
+    elements = [
+        (key, mesh_arrays[key]) for key in MESH_ELEMENT_TYPES
+        if key in mesh_arrays and len(mesh_arrays[key][0]) > 0
+    ]
+    if not elements:
+        Console.PrintError("No Elements found!\n")
+        return mesh
+    FreeCAD.Console.PrintLog("Found: elements\n")
+
+    mesh.addNodes(
+        np.ascontiguousarray(coords, dtype=np.float64).ravel(),
+        np.ascontiguousarray(node_ids, dtype=np.int64)
+    )
+    for key, (ele_ids, connectivity) in elements:
+        ele_type, nodes_count = MESH_ELEMENT_TYPES[key]
+        mesh.addElements(
+            ele_type,
+            nodes_count,
+            np.ascontiguousarray(connectivity, dtype=np.int64).ravel(),
+            np.ascontiguousarray(ele_ids, dtype=np.int64)
+        )
+    Console.PrintLog(
+        "imported mesh: {} nodes, {}\n".format(
+            len(node_ids),
+            ", ".join(
+                "{} {}".format(len(ele_ids), key[:-len("Elem")].upper())
+                for key, (ele_ids, connectivity) in elements
+            )
+        )
+    )
     return mesh
 
 
+def get_mesh_arrays(
+    mesh_data
+):
+    """ converts the dicts {id: nodes} of FEM Mesh data into the
+    arrays (ids, values) for make_femmesh_from_arrays
+    the ids might be strings too, JSON and YAML save dict keys as strings
+    """
+    mesh_arrays = {}
+    for key, values in mesh_data.items():
+        if key == "Nodes":
+            nodes_count = 3
+            dtype = np.float64
+        elif key in MESH_ELEMENT_TYPES:
+            nodes_count = MESH_ELEMENT_TYPES[key][1]
+            dtype = np.int64
+        else:
+            continue
+        ids = np.array(list(values.keys())).astype(np.int64)
+        values = np.array([tuple(v) for v in values.values()], dtype=dtype)
+        mesh_arrays[key] = (ids, values.reshape(len(ids), nodes_count))
+    return mesh_arrays
+
+
 def make_dict_from_femmesh(
     femmesh
 ):
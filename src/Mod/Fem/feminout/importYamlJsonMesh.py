@@ -169,11 +169,10 @@ def read(
             "Unknown extension, "
             "please select other importer.\n")
 
-    Console.PrintMessage("Converting indices to integer numbers ...")
-    mesh_data = convert_raw_data_to_mesh_data(raw_mesh_data)
-    Console.PrintMessage("OK\n")
-
-    return importToolsFem.make_femmesh(mesh_data)
+    # the string indices of JSON and YAML are converted together with the mesh arrays
+    return importToolsFem.make_femmesh_from_arrays(
+        importToolsFem.get_mesh_arrays(raw_mesh_data)
+    )
 
 
 def convert_raw_data_to_mesh_data(
@@ -27,6 +27,7 @@ __url__ = "https://www.freecadweb.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
 import os
 import subprocess
 import sys
@@ -41,6 +42,12 @@ from femtools import femutils
 from femtools import geomtools
 
 
+# gmsh version for each gmsh binary, retrieved once per session
+_gmsh_versions = {}
+# maximum number of meshes in the mesh cache, the least recently used are removed
+MESH_CACHE_SIZE = 50
+
+
 class GmshError(Exception):
     pass
 
@@ -173,6 +180,7 @@ class GmshTools():
         self.temp_file_geo = ""
         self.mesh_name = ""
         self.gmsh_bin = ""
+        self.mesh_cache_file = ""
         self.error = False
 
     def update_mesh_data(self):
@@ -192,8 +200,11 @@ class GmshTools():
             self.get_tmp_file_paths()
             self.get_gmsh_command()
             self.write_gmsh_input_files()
+            if self.read_mesh_from_cache():
+                return ""
             error = self.run_gmsh_with_geo()
             self.read_and_set_new_mesh()
+            self.write_mesh_to_cache()
         except GmshError as e:
             error = str(e)
         return error
@@ -950,6 +961,125 @@ class GmshTools():
         else:
             Console.PrintError("No mesh was created.\n")
 
+    # mesh cache
+    # the meshes are saved in binary med format in the mesh cache directory
+    # the file name is the hash of the brep geometry, the geo file and the gmsh version
+    # thus Gmsh is not run again if geometry and mesh parameter have not changed
+    # the cache is off by default, see preference Mod/Fem/Gmsh UseMeshCache
+    def get_mesh_cache_file(self):
+        if not FreeCAD.ParamGet(
+            "User parameter:BaseApp/Preferences/Mod/Fem/Gmsh"
+        ).GetBool("UseMeshCache", False):
+            return ""
+        if self.gmsh_bin not in _gmsh_versions:
+            _gmsh_versions[self.gmsh_bin] = self.get_gmsh_version()[0]
+        if None in _gmsh_versions[self.gmsh_bin]:
+            return ""
+        key = get_mesh_cache_key(
+            _gmsh_versions[self.gmsh_bin],
+            self.temp_file_geometry,
+            self.temp_file_geo,
+            {self.temp_file_geometry: "geometry", self.temp_file_mesh: "mesh"}
+        )
+        return os.path.join(get_mesh_cache_dir(), key + ".med")
+
+    def read_mesh_from_cache(self):
+        self.mesh_cache_file = self.get_mesh_cache_file()
+        fem_mesh = read_mesh_cache_file(self.mesh_cache_file)
+        if fem_mesh is None:
+            return False
+        self.mesh_obj.FemMesh = fem_mesh
+        Console.PrintMessage(
+            "  Geometry and mesh parameter unchanged, "
+            "the mesh was read from the mesh cache: {}\n".format(self.mesh_cache_file)
+        )
+        return True
+
+    def write_mesh_to_cache(self):
+        if self.error or not self.mesh_cache_file or not self.mesh_obj.FemMesh.NodeCount:
+            return
+        write_mesh_cache_file(self.mesh_obj.FemMesh, self.mesh_cache_file)
+
+
+def get_mesh_cache_key(gmsh_version, geometry_file, geo_file, replace_paths=None):
+    """sha256 hex digest of the gmsh version, the brep geometry file and the geo file
+    comments in the geo file are skipped, the paths in replace_paths are replaced
+    by their values, because the temporary file paths are different on every run
+    """
+    key = hashlib.sha256()
+    key.update(".".join(gmsh_version).encode("utf-8"))
+    with open(geometry_file, "rb") as brep:
+        for chunk in iter(lambda: brep.read(1 << 20), b""):
+            key.update(chunk)
+    with open(geo_file, "r") as geo:
+        for line in geo:
+            if line.startswith("//"):
+                continue
+            for path, name in (replace_paths or {}).items():
+                line = line.replace(path, name)
+            key.update(line.encode("utf-8"))
+    return key.hexdigest()
+
+
+def get_mesh_cache_dir():
+    cache_dir = os.path.join(FreeCAD.getUserAppDataDir(), "FemMeshCache")
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    return cache_dir
+
+
+def read_mesh_cache_file(cache_file):
+    """the FemMesh of the cache file, None if it is not in the cache
+    a cache file which can not be read is removed
+    """
+    if not cache_file or not os.path.isfile(cache_file):
+        return None
+    try:
+        fem_mesh = Fem.read(cache_file)
+    except Exception as e:
+        Console.PrintWarning(
+            "Mesh cache file {} could not be read: {}\n".format(cache_file, e)
+        )
+        os.remove(cache_file)
+        return None
+    # mark it as recently used
+    os.utime(cache_file)
+    return fem_mesh
+
+
+def write_mesh_cache_file(fem_mesh, cache_file, max_size=MESH_CACHE_SIZE):
+    # write to a temporary file first, an interrupted write should not be in the cache
+    tmp_file = os.path.splitext(cache_file)[0] + "_tmp.med"
+    fem_mesh.write(tmp_file)
+    os.replace(tmp_file, cache_file)
+    prune_mesh_cache(max_size, os.path.dirname(cache_file))
+
+
+def prune_mesh_cache(max_size=MESH_CACHE_SIZE, cache_dir=None):
+    """removes the least recently used meshes if there are more than max_size"""
+    if cache_dir is None:
+        cache_dir = get_mesh_cache_dir()
+    # the temporary files of other writers are not part of the cache
+    cache_files = [
+        os.path.join(cache_dir, f) for f in os.listdir(cache_dir)
+        if f.endswith(".med") and not f.endswith("_tmp.med")
+    ]
+    if len(cache_files) <= max_size:
+        return
+    # another process may prune the cache at the same time
+    mtimes = {}
+    for f in cache_files:
+        try:
+            mtimes[f] = os.path.getmtime(f)
+        except FileNotFoundError:
+            pass
+    cache_files = sorted(mtimes, key=mtimes.get)
+    for f in cache_files[:len(cache_files) - max_size]:
+        try:
+            os.remove(f)
+        except FileNotFoundError:
+            pass
+
 ##  @}
 
 
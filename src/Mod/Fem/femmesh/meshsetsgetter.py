@@ -28,6 +28,8 @@ __url__ = "https://www.freecadweb.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
+import itertools
 import time
 
 import FreeCAD
@@ -36,6 +38,93 @@ from femmesh import meshtools
 from femtools.femutils import type_of_obj
 
 
+# revisions of the document objects { (document name, object name) : revision }
+# a new revision is set on every change of the object, see _ObjectObserver
+_object_revisions = {}
+# { document name : generation }, a document gets a new generation every time it is opened
+_document_generations = {}
+_revision_counter = itertools.count(1)
+# mesh sets of the last runs { (document name, object name, getter name) : (key, data) }
+_mesh_sets_cache = {}
+# topology index of the meshes { (document name, mesh object name) : (mesh key, topology) }
+_topology_cache = {}
+# caches with the document name as first item of their keys, cleared if a document is closed
+_document_caches = [_object_revisions, _mesh_sets_cache, _topology_cache]
+# these properties do not change the mesh sets or the written input
+_not_key_properties = ("ExpressionEngine", "Label2", "Proxy", "Visibility")
+
+
+class _ObjectObserver(object):
+
+    _instance = None
+
+    @classmethod
+    def attach(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            FreeCAD.addDocumentObserver(cls._instance)
+
+    def slotCreatedDocument(self, doc):
+        _document_generations[doc.Name] = next(_revision_counter)
+
+    def slotDeletedDocument(self, doc):
+        _document_generations.pop(doc.Name, None)
+        for cache in _document_caches:
+            for key in [key for key in cache if key[0] == doc.Name]:
+                del cache[key]
+
+    def slotChangedObject(self, obj, prop):
+        _object_revisions[(obj.Document.Name, obj.Name)] = next(_revision_counter)
+
+    def slotDeletedObject(self, obj):
+        _object_revisions.pop((obj.Document.Name, obj.Name), None)
+
+
+def get_object_revision(obj):
+    """revision of a document object
+    it changes with every change of the object and if its document is opened again,
+    only changes after the first call are known
+    """
+    _ObjectObserver.attach()
+    doc_name = obj.Document.Name
+    return (
+        _document_generations.get(doc_name, 0),
+        _object_revisions.get((doc_name, obj.Name), 0)
+    )
+
+
+def add_document_cache(cache):
+    """the entries of cache are removed if their document is closed
+    the keys of the cache have to be tuples starting with the document name
+    """
+    if cache not in _document_caches:
+        _document_caches.append(cache)
+
+
+def get_value_key(value):
+    """hashable key of a property value
+    linked document objects are represented by their name and revision
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(get_value_key(v) for v in value)
+    if isinstance(value, FreeCAD.DocumentObject):
+        return (value.Name, get_object_revision(value))
+    return repr(value)
+
+
+def get_femobj_key(femobj, *context):
+    """key of the femobj for the mesh sets cache
+    made from the properties of the document object, thus from its References too,
+    the revisions of the linked objects and the given context
+    """
+    obj = femobj["Object"]
+    key = [obj.TypeId, femobj.get("RefShapeType"), context]
+    for prop in obj.PropertiesList:
+        if prop not in _not_key_properties:
+            key.append((prop, get_value_key(obj.getPropertyByName(prop))))
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+
 class MeshSetsGetter():
     def __init__(
         self,
@@ -98,6 +187,7 @@ class MeshSetsGetter():
         self.femelement_table = {}
         self.constraint_conflict_nodes = []
         self.femnodes_ele_table = {}
+        self.femmesh_topology = None
         self.femelements_edges_only = []
         self.femelements_faces_only = []
         self.femelement_volumes_table = {}
@@ -105,6 +195,14 @@ class MeshSetsGetter():
         self.femelement_edges_table = {}
         self.femelement_count_test = True
         self.mat_geo_sets = []
+        self.constraint_times = {}
+        self.mesh_key = None
+        if self.mesh_object:
+            self.mesh_key = (
+                self.mesh_object.Name,
+                get_object_revision(self.mesh_object),
+                get_value_key(self.theshape)
+            )
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -131,50 +229,226 @@ class MeshSetsGetter():
         time_start = time.process_time()
 
         # materials and element geometry element sets getter
-        self.get_element_sets_material_and_femelement_geometry()
+        self.get_cached_material_sets()
 
         # constraints element sets getter
-        self.get_constraints_centrif_elements()
+        # the elements of a centrif constraint without references depend on the other ones
+        self.get_cached_sets(
+            self.member.cons_centrif,
+            self.get_constraints_centrif_elements,
+            all_or_none=True
+        )
 
         # constraints node sets getter
-        self.get_constraints_fixed_nodes()
-        self.get_constraints_displacement_nodes()
-        self.get_constraints_planerotation_nodes()
+        # fixed nodes are split into solid and shell/beam nodes if there are shells or beams
+        self.get_cached_sets(
+            self.member.cons_fixed,
+            self.get_constraints_fixed_nodes,
+            bool(self.member.geos_shellthickness or self.member.geos_beamsection)
+        )
+        self.get_cached_sets(
+            self.member.cons_displacement,
+            self.get_constraints_displacement_nodes
+        )
+        # nodes of fixed and displacement constraints, needed by constraint plane rotation
+        # the written plane rotation sets leave them out, thus their keys are part of its key
+        conflict_keys = []
+        for femobj in self.member.cons_fixed + self.member.cons_displacement:
+            self.constraint_conflict_nodes.extend(femobj["Nodes"])
+            conflict_keys.append(femobj["MeshSetsKey"])
+        self.get_cached_sets(
+            self.member.cons_planerotation,
+            self.get_constraints_planerotation_nodes,
+            tuple(conflict_keys)
+        )
 
         # constraints surface sets getter
-        self.get_constraints_contact_faces()
-        self.get_constraints_tie_faces()
-        self.get_constraints_sectionprint_faces()
-        self.get_constraints_transform_nodes()
-        self.get_constraints_temperature_nodes()
+        self.get_cached_sets(self.member.cons_contact, self.get_constraints_contact_faces)
+        self.get_cached_sets(self.member.cons_tie, self.get_constraints_tie_faces)
+        self.get_cached_sets(
+            self.member.cons_sectionprint,
+            self.get_constraints_sectionprint_faces
+        )
+        self.get_cached_sets(self.member.cons_transform, self.get_constraints_transform_nodes)
+        self.get_cached_sets(
+            self.member.cons_temperature,
+            self.get_constraints_temperature_nodes
+        )
 
         # constraints sets with constraint data
-        self.get_constraints_force_nodeloads()
-        self.get_constraints_pressure_faces()
-        self.get_constraints_heatflux_faces()
+        self.get_cached_sets(self.member.cons_force, self.get_constraints_force_nodeloads)
+        self.get_cached_sets(self.member.cons_pressure, self.get_constraints_pressure_faces)
+        self.get_cached_sets(self.member.cons_heatflux, self.get_constraints_heatflux_faces)
 
         setstime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(
             "Getting mesh data time: {} seconds.\n".format(setstime)
         )
+        self.print_constraint_times()
 
     # ********************************************************************************************
     # ********************************************************************************************
-    # node sets
-    def get_constraints_fixed_nodes(self):
-        if not self.member.cons_fixed:
+    # mesh sets cache
+    # the sets of a femobj are only retrieved again if the mesh, the properties of its
+    # document object or one of the objects it links to have changed since the last run,
+    # the key of the sets is kept in femobj["MeshSetsKey"] for the input writer
+    def get_cached_sets(self, femobjs, getter, *context, all_or_none=False):
+        if not femobjs:
             return
-        # get nodes
-        for femobj in self.member.cons_fixed:
+        keys = [get_femobj_key(femobj, self.mesh_key, *context) for femobj in femobjs]
+        if all_or_none:
+            # the sets of the femobjs depend on each other
+            all_key = hashlib.sha1(repr(keys).encode("utf-8")).hexdigest()
+            keys = [all_key + key for key in keys]
+        changed = []
+        for femobj, key in zip(femobjs, keys):
+            femobj["MeshSetsKey"] = key
+            cached = _mesh_sets_cache.get(self.get_cache_key(femobj["Object"], getter))
+            if cached is not None and cached[0] == key:
+                femobj.update(cached[1])
+            else:
+                changed.append(femobj)
+        if len(changed) < len(femobjs):
+            FreeCAD.Console.PrintMessage(
+                "{} of {}: mesh data of {} unchanged objects are reused.\n"
+                .format(getter.__name__, len(femobjs), len(femobjs) - len(changed))
+            )
+        if all_or_none and changed:
+            changed = femobjs
+        if not changed:
+            return
+        getter(changed)
+        for femobj in changed:
+            data = {
+                k: v for k, v in femobj.items()
+                if k not in ("Object", "RefShapeType", "MeshSetsKey")
+            }
+            _mesh_sets_cache[self.get_cache_key(femobj["Object"], getter)] = (
+                femobj["MeshSetsKey"],
+                data
+            )
+
+    def get_cache_key(self, obj, getter):
+        return (obj.Document.Name, obj.Name, getter.__name__)
+
+    def get_cached_material_sets(self):
+        # the material and element geometry sets are retrieved for all objects together
+        femobjs = (
+            self.member.mats_linear
+            + self.member.geos_beamsection
+            + self.member.geos_beamrotation
+            + self.member.geos_shellthickness
+            + self.member.geos_fluidsection
+        )
+        if not self.member.mats_linear:
+            return
+        key = hashlib.sha1(repr([
+            get_femobj_key(femobj, self.mesh_key) for femobj in femobjs
+        ]).encode("utf-8")).hexdigest()
+        cache_key = (self.document.Name, self.mesh_object.Name, "mat_geo_sets")
+        cached = _mesh_sets_cache.get(cache_key)
+        if cached is not None and cached[0] == key:
+            FreeCAD.Console.PrintMessage(
+                "Mesh data of materials and element geometry unchanged, they are reused.\n"
+            )
+            mat_geo_sets, femobjs_data = cached[1]
+            # the document objects in the mat_geo_sets are kept by their name
+            for matgeoset in mat_geo_sets:
+                self.mat_geo_sets.append({
+                    k: self.document.getObject(v) if k.endswith("_obj") else v
+                    for k, v in matgeoset.items()
+                })
+            for femobj, data in zip(femobjs, femobjs_data):
+                femobj.update(data)
+            return
+        self.get_element_sets_material_and_femelement_geometry()
+        mat_geo_sets = [
+            {k: v.Name if k.endswith("_obj") else v for k, v in matgeoset.items()}
+            for matgeoset in self.mat_geo_sets
+        ]
+        femobjs_data = [
+            {k: v for k, v in femobj.items() if k not in ("Object", "RefShapeType")}
+            for femobj in femobjs
+        ]
+        _mesh_sets_cache[cache_key] = (key, (mat_geo_sets, femobjs_data))
+
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # time report, the slowest constraint first
+    def timed_femobjs(self, femobjs):
+        # yields the femobjs and adds the time spent on each to self.constraint_times
+        for femobj in femobjs:
+            time_start = time.process_time()
+            yield femobj
+            name = femobj["Object"].Name
+            self.constraint_times[name] = (
+                self.constraint_times.get(name, 0.0) + time.process_time() - time_start
+            )
+
+    def resolve_femobjs(self, femobjs, resolve, log=False):
+        # returns [resolve(femobj) for femobj in femobjs]
+        # the lookups query the shapes and the mesh of the document,
+        # which must not be done from other threads, thus they run one after the other
+        results = []
+        for femobj in self.timed_femobjs(femobjs):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+            print_obj_info(femobj["Object"], log)
+            results.append(resolve(femobj))
+        return results
+
+    def get_femnodes(self, femobj):
+        return meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+
+    def print_constraint_times(self):
+        if not self.constraint_times:
+            return
+        FreeCAD.Console.PrintMessage("Getting mesh data time per constraint:\n")
+        for name, seconds in sorted(
+            self.constraint_times.items(),
+            key=lambda item: item[1],
+            reverse=True
+        ):
+            FreeCAD.Console.PrintMessage(
+                "    {}: {} seconds\n".format(name, round(seconds, 3))
+            )
+
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # topology index, shared by all element and element face sets getter
+    def get_femmesh_topology(self):
+        # the topology is reused as long as the mesh object has the same key
+        if self.femmesh_topology is None:
+            cache_key = None
+            if self.mesh_object:
+                cache_key = (self.mesh_object.Document.Name, self.mesh_object.Name)
+                cached = _topology_cache.get(cache_key)
+                if cached is not None and cached[0] == self.mesh_key:
+                    self.femmesh_topology = cached[1]
+                    if not self.femelement_table:
+                        self.femelement_table = self.femmesh_topology.femelement_table
+        if self.femmesh_topology is None:
+            if not self.femelement_table:
+                self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+            self.femmesh_topology = meshtools.get_femmesh_topology(
                 self.femmesh,
-                femobj
+                self.femelement_table
             )
-            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
-            for node in femobj["Nodes"]:
-                self.constraint_conflict_nodes.append(node)
+            if cache_key is not None:
+                _topology_cache[cache_key] = (self.mesh_key, self.femmesh_topology)
+        self.femnodes_ele_table = self.femmesh_topology.femnodes_ele_table
+        return self.femmesh_topology
+
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # node sets
+    def get_constraints_fixed_nodes(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_fixed
+        if not femobjs:
+            return
+        # get nodes
+        for femobj, nodes in zip(femobjs, self.resolve_femobjs(femobjs, self.get_femnodes)):
+            femobj["Nodes"] = nodes
         # if mixed mesh with solids the node set needs to be split
         # because solid nodes do not have rotational degree of freedom
         if (
@@ -189,90 +463,73 @@ class MeshSetsGetter():
                 self.femelement_volumes_table = meshtools.get_femelement_volumes_table(
                     self.femmesh
                 )
-            for femobj in self.member.cons_fixed:
+            solid_nodes = set()
+            for ve_nodes in self.femelement_volumes_table.values():
+                solid_nodes.update(ve_nodes)
+            for femobj in self.timed_femobjs(femobjs):
                 # femobj --> dict, FreeCAD document object is femobj["Object"]
                 nds_solid = []
                 nds_faceedge = []
                 for n in femobj["Nodes"]:
-                    solid_node = False
-                    for ve in self.femelement_volumes_table:
-                        if n in self.femelement_volumes_table[ve]:
-                            solid_node = True
-                            nds_solid.append(n)
-                            break
-                    if not solid_node:
+                    if n in solid_nodes:
+                        nds_solid.append(n)
+                    else:
                         nds_faceedge.append(n)
                 femobj["NodesSolid"] = set(nds_solid)
                 femobj["NodesFaceEdge"] = set(nds_faceedge)
 
-    def get_constraints_displacement_nodes(self):
-        if not self.member.cons_displacement:
+    def get_constraints_displacement_nodes(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_displacement
+        if not femobjs:
             return
         # get nodes
-        for femobj in self.member.cons_displacement:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                self.femmesh,
-                femobj
-            )
-            # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
-            for node in femobj["Nodes"]:
-                self.constraint_conflict_nodes.append(node)
+        for femobj, nodes in zip(femobjs, self.resolve_femobjs(femobjs, self.get_femnodes)):
+            femobj["Nodes"] = nodes
 
-    def get_constraints_planerotation_nodes(self):
-        if not self.member.cons_planerotation:
+    def get_constraints_planerotation_nodes(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_planerotation
+        if not femobjs:
             return
         # get nodes
-        for femobj in self.member.cons_planerotation:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                self.femmesh,
-                femobj
-            )
+        for femobj, nodes in zip(femobjs, self.resolve_femobjs(femobjs, self.get_femnodes)):
+            femobj["Nodes"] = nodes
 
-    def get_constraints_transform_nodes(self):
-        if not self.member.cons_transform:
+    def get_constraints_transform_nodes(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_transform
+        if not femobjs:
             return
         # get nodes
-        for femobj in self.member.cons_transform:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                self.femmesh,
-                femobj
-            )
+        for femobj, nodes in zip(femobjs, self.resolve_femobjs(femobjs, self.get_femnodes)):
+            femobj["Nodes"] = nodes
 
-    def get_constraints_temperature_nodes(self):
-        if not self.member.cons_temperature:
+    def get_constraints_temperature_nodes(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_temperature
+        if not femobjs:
             return
         # get nodes
-        for femobj in self.member.cons_temperature:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                self.femmesh,
-                femobj
-            )
+        for femobj, nodes in zip(femobjs, self.resolve_femobjs(femobjs, self.get_femnodes)):
+            femobj["Nodes"] = nodes
 
-    def get_constraints_fluidsection_nodes(self):
-        if not self.member.geos_fluidsection:
+    def get_constraints_fluidsection_nodes(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.geos_fluidsection
+        if not femobjs:
             return
         # get nodes
-        for femobj in self.member.geos_fluidsection:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                self.femmesh,
-                femobj
-            )
+        for femobj, nodes in zip(femobjs, self.resolve_femobjs(femobjs, self.get_femnodes)):
+            femobj["Nodes"] = nodes
 
-    def get_constraints_force_nodeloads(self):
-        if not self.member.cons_force:
+    def get_constraints_force_nodeloads(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_force
+        if not femobjs:
             return
         # check shape type of reference shape
-        for femobj in self.member.cons_force:
+        for femobj in self.timed_femobjs(femobjs):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"], log=True)
             if femobj["RefShapeType"] == "Vertex":
@@ -309,35 +566,46 @@ class MeshSetsGetter():
             "    The appropriate finite element mesh node load values will "
             "be calculated according to the finite element definition.\n"
         )
-        for femobj in self.member.cons_force:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            frc_obj = femobj["Object"]
-            print_obj_info(frc_obj)
-            if frc_obj.Force == 0:
-                FreeCAD.Console.PrintMessage("  Warning --> Force = 0\n")
-            if femobj["RefShapeType"] == "Vertex":  # point load on vertices
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_vertex_nodeload_table(
-                    self.femmesh,
-                    frc_obj
-                )
-            elif femobj["RefShapeType"] == "Edge":  # line load on edges
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
-                    self.femmesh,
-                    self.femelement_table,
-                    self.femnodes_mesh, frc_obj
-                )
-            elif femobj["RefShapeType"] == "Face":  # area load on faces
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
-                    self.femmesh,
-                    self.femelement_table,
-                    self.femnodes_mesh, frc_obj
+        for femobj in femobjs:
+            if femobj["Object"].Force == 0:
+                FreeCAD.Console.PrintMessage(
+                    "  Warning --> Force = 0: {}\n".format(femobj["Object"].Name)
                 )
+        for femobj, node_load_table in zip(
+            femobjs,
+            self.resolve_femobjs(femobjs, self.get_force_nodeload_table)
+        ):
+            if node_load_table is not None:
+                femobj["NodeLoadTable"] = node_load_table
+
+    def get_force_nodeload_table(self, femobj):
+        frc_obj = femobj["Object"]
+        if femobj["RefShapeType"] == "Vertex":  # point load on vertices
+            return meshtools.get_force_obj_vertex_nodeload_table(
+                self.femmesh,
+                frc_obj
+            )
+        elif femobj["RefShapeType"] == "Edge":  # line load on edges
+            return meshtools.get_force_obj_edge_nodeload_table(
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_mesh, frc_obj
+            )
+        elif femobj["RefShapeType"] == "Face":  # area load on faces
+            return meshtools.get_force_obj_face_nodeload_table(
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_mesh, frc_obj
+            )
+        return None
 
     # ********************************************************************************************
     # ********************************************************************************************
     # faces sets
-    def get_constraints_pressure_faces(self):
-        if not self.member.cons_pressure:
+    def get_constraints_pressure_faces(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_pressure
+        if not femobjs:
             return
         # TODO see comments in get_constraints_force_nodeloads()
         # it applies here too. Mhh it applies to all constraints ...
@@ -345,7 +613,7 @@ class MeshSetsGetter():
         """
         # deprecated version
         # get the faces and face numbers
-        for femobj in self.member.cons_pressure:
+        for femobj in femobjs:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             femobj["PressureFaces"] = meshtools.get_pressure_obj_faces_depreciated(
                 self.femmesh,
@@ -354,24 +622,12 @@ class MeshSetsGetter():
             # print(femobj["PressureFaces"])
         """
 
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
-                self.femelement_table
-            )
+        self.get_femmesh_topology()
 
-        for femobj in self.member.cons_pressure:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            pressure_faces = meshtools.get_pressure_obj_faces(
-                self.femmesh,
-                self.femelement_table,
-                self.femnodes_ele_table, femobj
-            )
+        for femobj, pressure_faces in zip(
+            femobjs,
+            self.resolve_femobjs(femobjs, self.get_pressure_faces)
+        ):
             # the data model is for compatibility reason with deprecated version
             # get_pressure_obj_faces_depreciated returns the face ids in a tuple per ref_shape
             # some_string was the reference_shape_element_string in deprecated method
@@ -380,27 +636,25 @@ class MeshSetsGetter():
             femobj["PressureFaces"] = [(some_string, pressure_faces)]
             FreeCAD.Console.PrintLog("{}\n".format(femobj["PressureFaces"]))
 
-    def get_constraints_contact_faces(self):
-        if not self.member.cons_contact:
+    def get_pressure_faces(self, femobj):
+        return meshtools.get_pressure_obj_faces(
+            self.femmesh,
+            self.femelement_table,
+            self.femnodes_ele_table, femobj,
+            self.femmesh_topology
+        )
+
+    def get_constraints_contact_faces(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_contact
+        if not femobjs:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
-                self.femelement_table
-            )
+        self.get_femmesh_topology()
 
-        for femobj in self.member.cons_contact:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            contact_slave_faces, contact_master_faces = meshtools.get_contact_obj_faces(
-                self.femmesh,
-                self.femelement_table,
-                self.femnodes_ele_table, femobj
-            )
+        for femobj, (contact_slave_faces, contact_master_faces) in zip(
+            femobjs,
+            self.resolve_femobjs(femobjs, self.get_contact_faces)
+        ):
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
             femobj["ContactSlaveFaces"] = contact_slave_faces
@@ -408,6 +662,14 @@ class MeshSetsGetter():
             # FreeCAD.Console.PrintLog("{}\n".format(femobj["ContactSlaveFaces"]))
             # FreeCAD.Console.PrintLog("{}\n".format(femobj["ContactMasterFaces"]))
 
+    def get_contact_faces(self, femobj):
+        return meshtools.get_contact_obj_faces(
+            self.femmesh,
+            self.femelement_table,
+            self.femnodes_ele_table, femobj,
+            self.femmesh_topology
+        )
+
     # information in the regard of element faces constraints
     # forum post: https://forum.freecadweb.org/viewtopic.php?f=18&t=42783&p=370286#p366723
     # contact: master and slave could be the same face: rubber of a damper
@@ -415,27 +677,17 @@ class MeshSetsGetter():
     # section print: only the element faces of solid elements
     #                from one side of the geometric face are needed
 
-    def get_constraints_tie_faces(self):
-        if not self.member.cons_tie:
+    def get_constraints_tie_faces(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_tie
+        if not femobjs:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
-                self.femelement_table
-            )
+        self.get_femmesh_topology()
 
-        for femobj in self.member.cons_tie:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"])
-            slave_faces, master_faces = meshtools.get_tie_obj_faces(
-                self.femmesh,
-                self.femelement_table,
-                self.femnodes_ele_table, femobj
-            )
+        for femobj, (slave_faces, master_faces) in zip(
+            femobjs,
+            self.resolve_femobjs(femobjs, self.get_tie_faces)
+        ):
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
             femobj["TieSlaveFaces"] = slave_faces
@@ -443,12 +695,22 @@ class MeshSetsGetter():
             # FreeCAD.Console.PrintLog("{}\n".format(femobj["ContactSlaveFaces"]))
             # FreeCAD.Console.PrintLog("{}\n".format(femobj["ContactMasterFaces"]))
 
-    def get_constraints_sectionprint_faces(self):
-        if not self.member.cons_sectionprint:
+    def get_tie_faces(self, femobj):
+        return meshtools.get_tie_obj_faces(
+            self.femmesh,
+            self.femelement_table,
+            self.femnodes_ele_table, femobj,
+            self.femmesh_topology
+        )
+
+    def get_constraints_sectionprint_faces(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_sectionprint
+        if not femobjs:
             return
         # TODO: use meshtools to get the surfaces
         # see constraint contact or constraint tie
-        for femobj in self.member.cons_sectionprint:
+        for femobj in self.timed_femobjs(femobjs):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             sectionprint_obj = femobj["Object"]
             if len(sectionprint_obj.References) > 1:
@@ -486,8 +748,10 @@ class MeshSetsGetter():
                             .format(sectionprint_obj.Name, ref_shape.ShapeType)
                         )
 
-    def get_constraints_heatflux_faces(self):
-        if not self.member.cons_heatflux:
+    def get_constraints_heatflux_faces(self, femobjs=None):
+        if femobjs is None:
+            femobjs = self.member.cons_heatflux
+        if not femobjs:
             return
         # TODO: use meshtools to get the surfaces (or move to mesh tools)
         # see constraint contact or constraint tie and constraint force
@@ -497,7 +761,7 @@ class MeshSetsGetter():
         #         ...,
         #         ("refshape_name:elemname", face_table)
         #     ]
-        for femobj in self.member.cons_heatflux:
+        for femobj in self.timed_femobjs(femobjs):
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             heatflux_obj = femobj["Object"]
             femobj["HeatFluxFaceTable"] = []
@@ -512,17 +776,19 @@ class MeshSetsGetter():
     # ********************************************************************************************
     # ********************************************************************************************
     # element sets constraints
-    def get_constraints_centrif_elements(self):
+    def get_constraints_centrif_elements(self, femobjs=None):
         # get element ids and write them into the femobj
-        if not self.member.cons_centrif:
+        if femobjs is None:
+            femobjs = self.member.cons_centrif
+        if not femobjs:
             return
         if (
-            len(self.member.cons_centrif) == 1
-            and not self.member.cons_centrif[0]["Object"].References
+            len(femobjs) == 1
+            and not femobjs[0]["Object"].References
         ):
-            self.member.cons_centrif[0]["FEMElements"] = self.ccx_evolumes
+            femobjs[0]["FEMElements"] = self.ccx_evolumes
         else:
-            self.get_solid_element_sets(self.member.cons_centrif)
+            self.get_solid_element_sets(femobjs)
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -538,22 +804,15 @@ class MeshSetsGetter():
             FreeCAD.Console.PrintMessage(all_found)
             FreeCAD.Console.PrintMessage("\n")
         if all_found is False:
-            if not self.femelement_table:
-                self.femelement_table = meshtools.get_femelement_table(self.femmesh)
             # we're going to use the binary search for get_femelements_by_femnodes()
-            # thus we need the parameter values self.femnodes_ele_table
-            if not self.femnodes_mesh:
-                self.femnodes_mesh = self.femmesh.Nodes
-            if not self.femnodes_ele_table:
-                self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                    self.femnodes_mesh,
-                    self.femelement_table
-                )
+            # thus we need the topology index with the femnodes_ele_table
+            self.get_femmesh_topology()
             control = meshtools.get_femelement_sets(
                 self.femmesh,
                 self.femelement_table,
                 femobjs,
-                self.femnodes_ele_table
+                self.femnodes_ele_table,
+                self.femmesh_topology
             )
             # we only need to set it, if it is still True
             if (self.femelement_count_test is True) and (control is False):
@@ -32,6 +32,29 @@ import FreeCAD
 from femtools import geomtools
 
 
+# CalculiX element face masks, key is the number of nodes of the volume element
+# the bit of a node position is set if the node belongs to the element face
+# https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=50#p141108
+CCX_FACE_MASKS = {
+    4: {7: 1, 11: 2, 13: 3, 14: 4},
+    6: {56: 1, 7: 2, 54: 3, 45: 4, 27: 5},
+    8: {240: 1, 15: 2, 102: 3, 204: 4, 153: 5, 51: 6},
+    10: {119: 1, 411: 2, 717: 3, 814: 4},
+    15: {3640: 1, 455: 2, 25782: 3, 22829: 4, 12891: 5},
+    20: {61680: 1, 3855: 2, 402022: 3, 804044: 4, 624793: 5, 201011: 6}
+}
+
+# all nodes of a volume element, key is the number of nodes of the volume element
+VOLUME_MASKS = {
+    4: 15,
+    6: 63,
+    8: 255,
+    10: 1023,
+    15: 32767,
+    20: 1048575
+}
+
+
 # ************************************************************************************************
 def get_femnodes_by_femobj_with_references(
     femmesh,
@@ -65,7 +88,8 @@ def get_femelements_by_references(
     femmesh,
     femelement_table,
     references,
-    femnodes_ele_table=None
+    femnodes_ele_table=None,
+    femmesh_topology=None
 ):
     """get the femelements for a list of references
     """
@@ -73,7 +97,12 @@ def get_femelements_by_references(
     for ref in references:
         # femnodes for the current ref
         ref_femnodes = get_femnodes_by_refshape(femmesh, ref)
-        if femnodes_ele_table:
+        if femmesh_topology is not None:
+            # blind fast binary search on the cached topology, works for volumes only
+            references_femelements += femmesh_topology.get_femelements_by_femnodes(
+                ref_femnodes
+            )
+        elif femnodes_ele_table:
             # blind fast binary search, works for volumes only
             # femelements for all references
             references_femelements += get_femelements_by_femnodes_bin(
@@ -237,6 +266,110 @@ def get_femnodes_ele_table(
     return femnodes_ele_table
 
 
+# ************************************************************************************************
+class FemMeshTopology(object):
+    """topology index of the elements of a femelement_table
+    The index is built once and can be queried for any number of node sets.
+    Only the elements which share a node with the node set are looked at,
+    thus a query does not depend on the size of the mesh.
+    femnodes_ele_table: {nodeID : [[eleID, NodePosition], [], ...], ...}
+        see get_femnodes_ele_table(), only nodes used by elements are in there
+    element_positions: {eleID : position of the element in the femelement_table}
+    The element type masks are CCX_FACE_MASKS and VOLUME_MASKS.
+    """
+
+    def __init__(
+        self,
+        femelement_table,
+        femnodes_ele_table=None
+    ):
+        self.femelement_table = femelement_table
+        self._femnodes_ele_table = femnodes_ele_table
+        self._element_positions = None
+
+    @property
+    def femnodes_ele_table(self):
+        if not self._femnodes_ele_table:
+            femnodes_ele_table = {}
+            for ele, ele_nodes in self.femelement_table.items():
+                pos = 1
+                for ele_node in ele_nodes:
+                    femnodes_ele_table.setdefault(ele_node, []).append([ele, pos])
+                    pos = pos << 1
+            self._femnodes_ele_table = femnodes_ele_table
+        return self._femnodes_ele_table
+
+    @property
+    def element_positions(self):
+        if self._element_positions is None:
+            self._element_positions = {
+                ele: i for i, ele in enumerate(self.femelement_table)
+            }
+        return self._element_positions
+
+    def get_femelements_by_femnode(
+        self,
+        node
+    ):
+        """the elements the node belongs to"""
+        return [ele_pos[0] for ele_pos in self.femnodes_ele_table.get(node, [])]
+
+    def get_bit_pattern_dict(
+        self,
+        node_set
+    ):
+        """{eleID : [lenEleNodes, binary_position]} for the elements touched by node_set
+        the elements are in the order of the femelement_table
+        see get_bit_pattern_dict()
+        """
+        femnodes_ele_table = self.femnodes_ele_table
+        bit_patterns = {}
+        for node in set(node_set):
+            for ele, pos in femnodes_ele_table.get(node, []):
+                bit_patterns[ele] = bit_patterns.get(ele, 0) + pos
+        positions = self.element_positions
+        bit_pattern_dict = {}
+        for ele in sorted(bit_patterns, key=positions.__getitem__):
+            bit_pattern_dict[ele] = [len(self.femelement_table[ele]), bit_patterns[ele]]
+        return bit_pattern_dict
+
+    def get_femelements_by_femnodes(
+        self,
+        node_set
+    ):
+        """the volume elements with all their nodes in node_set"""
+        ele_list = []
+        for ele, (len_ele, bits) in self.get_bit_pattern_dict(node_set).items():
+            if bits == VOLUME_MASKS[len_ele]:
+                ele_list.append(ele)
+        FreeCAD.Console.PrintMessage("found Volumes: {}\n".format(len(ele_list)))
+        return ele_list
+
+    def get_ccxelement_faces(
+        self,
+        node_set
+    ):
+        """the CalculiX volume element faces with all their nodes in node_set
+        [[eleID, ccx face number], ...]
+        """
+        return get_ccxelement_faces_from_binary_search(self.get_bit_pattern_dict(node_set))
+
+
+# ************************************************************************************************
+def get_femmesh_topology(
+    femmesh,
+    femelement_table=None
+):
+    """get the FemMeshTopology of a femmesh
+    The topology is built on every call, the mesh sets getter keeps it
+    as long as the mesh object is unchanged.
+    """
+    if femelement_table is None:
+        femelement_table = get_femelement_table(femmesh)
+    FreeCAD.Console.PrintLog("Build the topology index of the femmesh.\n")
+    return FemMeshTopology(femelement_table)
+
+
 # ************************************************************************************************
 def get_copy_of_empty_femelement_table(
     femelement_table
@@ -265,18 +398,15 @@ def get_bit_pattern_dict(
     or has this element a face we are searching for?
     The number in the ele_dict is organized as a bit array.
     The corresponding bit is set, if the node of the node_set is contained in the element.
+    Only elements with at least one node in the node_set are in the bit_pattern_dict.
     """
     FreeCAD.Console.PrintLog("len femnodes_ele_table: " + str(len(femnodes_ele_table)) + "\n")
     FreeCAD.Console.PrintLog("len node_set: " + str(len(node_set)) + "\n")
     FreeCAD.Console.PrintLog("node_set: {}\n".format(node_set))
-    bit_pattern_dict = get_copy_of_empty_femelement_table(femelement_table)
-    # # initializing the bit_pattern_dict
-    for ele in femelement_table:
-        len_ele = len(femelement_table[ele])
-        bit_pattern_dict[ele] = [len_ele, 0]
-    for node in node_set:
-        for nList in femnodes_ele_table[node]:
-            bit_pattern_dict[nList[0]][1] += nList[1]
+    bit_pattern_dict = FemMeshTopology(
+        femelement_table,
+        femnodes_ele_table
+    ).get_bit_pattern_dict(node_set)
     FreeCAD.Console.PrintLog("len bit_pattern_dict: " + str(len(bit_pattern_dict)) + "\n")
     # FreeCAD.Console.PrintMessage("bit_pattern_dict: {}\n".format(bit_pattern_dict))
     return bit_pattern_dict
@@ -293,52 +423,9 @@ def get_ccxelement_faces_from_binary_search(
     # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=60#p141484
     # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=50#p141108
     # https://forum.freecadweb.org/viewtopic.php?f=18&t=17318&start=40#p140371
-    tet10_mask = {
-        119: 1,
-        411: 2,
-        717: 3,
-        814: 4}
-    tet4_mask = {
-        7: 1,
-        11: 2,
-        13: 3,
-        14: 4}
-    hex8_mask = {
-        240: 1,
-        15: 2,
-        102: 3,
-        204: 4,
-        153: 5,
-        51: 6}
-    hex20_mask = {
-        61680: 1,
-        3855: 2,
-        402022: 3,
-        804044: 4,
-        624793: 5,
-        201011: 6}
-    pent6_mask = {
-        56: 1,
-        7: 2,
-        54: 3,
-        45: 4,
-        27: 5}
-    pent15_mask = {
-        3640: 1,
-        455: 2,
-        25782: 3,
-        22829: 4,
-        12891: 5}
-    vol_dict = {
-        4: tet4_mask,
-        6: pent6_mask,
-        8: hex8_mask,
-        10: tet10_mask,
-        15: pent15_mask,
-        20: hex20_mask}
     faces = []
     for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
+        mask_dict = CCX_FACE_MASKS[bit_pattern_dict[ele][0]]
         for key in mask_dict:
             if (key & bit_pattern_dict[ele][1]) == key:
                 faces.append([ele, mask_dict[key]])
@@ -359,13 +446,6 @@ def get_femelements_by_femnodes_bin(
     blind fast binary search, but works for volumes only
     """
     FreeCAD.Console.PrintMessage("binary search: get_femelements_by_femnodes_bin\n")
-    vol_masks = {
-        4: 15,
-        6: 63,
-        8: 255,
-        10: 1023,
-        15: 32767,
-        20: 1048575}
     # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
     FreeCAD.Console.PrintMessage(
         "len femnodes_ele_table: {}\n"
@@ -378,7 +458,7 @@ def get_femelements_by_femnodes_bin(
         FreeCAD.Console.PrintLog(
             "bit_pattern_dict[ele][0]: {}\n".format(bit_pattern_dict[ele][0])
         )
-        if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
+        if bit_pattern_dict[ele][1] == VOLUME_MASKS[bit_pattern_dict[ele][0]]:
             ele_list.append(ele)
     FreeCAD.Console.PrintMessage("found Volumes: {}\n".format(len(ele_list)))
     # FreeCAD.Console.PrintMessage("   volumes: {}\n".format(ele_list))
@@ -396,6 +476,7 @@ def get_femelements_by_femnodes_std(
     e: elementlist
     nodes: nodelist """
     FreeCAD.Console.PrintMessage("std search: get_femelements_by_femnodes_std\n")
+    node_list = set(node_list)
     e = []  # elementlist
     for elementID in sorted(femelement_table):
         nodecount = 0
@@ -425,6 +506,7 @@ def get_femvolumeelements_by_femfacenodes(
         --> if exact 6 or 8 element nodes are in node_list --> add femelement
     e: elementlist
     nodes: nodelist """
+    node_list = set(node_list)
     e = []  # elementlist
     for elementID in sorted(femelement_table):
         nodecount = 0
@@ -480,7 +562,8 @@ def get_femelement_sets(
     femmesh,
     femelement_table,
     fem_objects,
-    femnodes_ele_table=None
+    femnodes_ele_table=None,
+    femmesh_topology=None
 ):
     # fem_objects = FreeCAD FEM document objects
     # get femelements for reference shapes of each obj.References
@@ -501,7 +584,8 @@ def get_femelement_sets(
             ref_shape_femelements = get_femelements_by_references(
                 femmesh, femelement_table,
                 obj.References,
-                femnodes_ele_table
+                femnodes_ele_table,
+                femmesh_topology
             )
             referenced_femelements += ref_shape_femelements
             count_femelements += len(ref_shape_femelements)
@@ -511,6 +595,7 @@ def get_femelement_sets(
     # get remaining femelements for the fem_objects
     if has_remaining_femelements:
         remaining_femelements = []
+        referenced_femelements = set(referenced_femelements)
         for elemid in femelement_table:
             if elemid not in referenced_femelements:
                 remaining_femelements.append(elemid)
@@ -980,7 +1065,7 @@ def get_ref_edgenodes_table(
     refedge
 ):
     edge_table = {}  # { meshedgeID : ( nodeID, ... , nodeID ) }
-    refedge_nodes = femmesh.getNodesByEdge(refedge)
+    refedge_nodes = set(femmesh.getNodesByEdge(refedge))
     if is_solid_femmesh(femmesh):
         refedge_fem_volumeelements = []
         # if at least two nodes of a femvolumeelement are in
@@ -1222,7 +1307,7 @@ def get_ref_facenodes_table(
             # they are not sorted, we just have the nodes.
             # We need to sort them according to the
             # shell mesh notation of tria3, tria6, quad4, quad8
-            ref_face_nodes = femmesh.getNodesByFace(ref_face)
+            ref_face_nodes = set(femmesh.getNodesByFace(ref_face))
             # try to use getccxVolumesByFace() to get the volume ids
             # of element with elementfaces on the ref_face
             # --> should work for tetra4 and tetra10
@@ -1615,7 +1700,8 @@ def get_pressure_obj_faces(
     femmesh,
     femelement_table,
     femnodes_ele_table,
-    femobj
+    femobj,
+    femmesh_topology=None
 ):
     # see get_ccxelement_faces_from_binary_search for more information
     if is_solid_femmesh(femmesh):
@@ -1624,12 +1710,9 @@ def get_pressure_obj_faces(
         prs_face_node_set = get_femnodes_by_femobj_with_references(femmesh, femobj)
         # FreeCAD.Console.PrintMessage("prs_face_node_set: {}\n".format(prs_face_node_set))
         # fill the bit_pattern_dict and search for the faces
-        bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table,
-            femnodes_ele_table,
-            prs_face_node_set
-        )
-        pressure_faces = get_ccxelement_faces_from_binary_search(bit_pattern_dict)
+        if femmesh_topology is None:
+            femmesh_topology = FemMeshTopology(femelement_table, femnodes_ele_table)
+        pressure_faces = femmesh_topology.get_ccxelement_faces(prs_face_node_set)
     elif is_face_femmesh(femmesh):
         pressure_faces = []
         # normally we should call get_femelements_by_references and
@@ -1686,7 +1769,8 @@ def get_contact_obj_faces(
     femmesh,
     femelement_table,
     femnodes_ele_table,
-    femobj
+    femobj,
+    femmesh_topology=None
 ):
     # see comment on get_pressure_obj_faces_depreciated in the regard of getccxVolumesByFace()
 
@@ -1742,20 +1826,12 @@ def get_contact_obj_faces(
         FreeCAD.Console.PrintLog("    masterface_nds: {}\n".format(slaveface_nds))
 
         FreeCAD.Console.PrintLog("    Fill the bit_pattern_dict and search for the faces.\n")
-        slave_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table,
-            femnodes_ele_table,
-            slaveface_nds
-        )
-        master_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table,
-            femnodes_ele_table,
-            masterface_nds
-        )
+        if femmesh_topology is None:
+            femmesh_topology = FemMeshTopology(femelement_table, femnodes_ele_table)
 
         FreeCAD.Console.PrintLog("    Get the FaceIDs.\n")
-        slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-        master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
+        slave_faces = femmesh_topology.get_ccxelement_faces(slaveface_nds)
+        master_faces = femmesh_topology.get_ccxelement_faces(masterface_nds)
 
     elif is_face_femmesh(femmesh):
         slave_ref_shape = slave_ref[0].Shape.getElement(slave_ref[1][0])
@@ -1788,7 +1864,8 @@ def get_tie_obj_faces(
     femmesh,
     femelement_table,
     femnodes_ele_table,
-    femobj
+    femobj,
+    femmesh_topology=None
 ):
     # see comment get_contact_obj_faces
     # solid mesh is same as contact, but face mesh is not allowed for tie
@@ -1834,20 +1911,12 @@ def get_tie_obj_faces(
         # FreeCAD.Console.PrintLog("masterface_nds: {}\n".format(slaveface_nds))
 
         # fill the bit_pattern_dict and search for the faces
-        slave_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table,
-            femnodes_ele_table,
-            slaveface_nds
-        )
-        master_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table,
-            femnodes_ele_table,
-            masterface_nds
-        )
+        if femmesh_topology is None:
+            femmesh_topology = FemMeshTopology(femelement_table, femnodes_ele_table)
 
         # get the faces ids
-        slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-        master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
+        slave_faces = femmesh_topology.get_ccxelement_faces(slaveface_nds)
+        master_faces = femmesh_topology.get_ccxelement_faces(masterface_nds)
 
     elif is_face_femmesh(femmesh):
         FreeCAD.Console.PrintError(
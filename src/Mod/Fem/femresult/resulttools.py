@@ -282,40 +282,34 @@ def fill_femresult_stats(res_obj):
     temp_min = temp_max = 0
     mflow_min = mflow_max = npress_min = npress_max = 0
 
+    # min and max are computed with numpy on the whole value lists,
+    # NaN values, which can happen on CalculiX frd result files, are ignored
     if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
+        disp = np.array(res_obj.DisplacementVectors, dtype=float).reshape(-1, 3)
+        x_min, x_max = calculate_min_max_array(disp[:, 0])
+        y_min, y_max = calculate_min_max_array(disp[:, 1])
+        z_min, z_max = calculate_min_max_array(disp[:, 2])
     if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
+        a_min, a_max = calculate_min_max_array(res_obj.DisplacementLengths)
     if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
+        s_min, s_max = calculate_min_max_array(res_obj.vonMises)
     if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
+        p1_min, p1_max = calculate_min_max_array(res_obj.PrincipalMax)
     if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
+        p2_min, p2_max = calculate_min_max_array(res_obj.PrincipalMed)
     if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
+        p3_min, p3_max = calculate_min_max_array(res_obj.PrincipalMin)
     if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
+        ms_min, ms_max = calculate_min_max_array(res_obj.MaxShear)
     if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
+        peeq_min, peeq_max = calculate_min_max_array(res_obj.Peeq)
     if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
+        temp_min, temp_max = calculate_min_max_array(res_obj.Temperature)
     if res_obj.MassFlowRate:
         # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
+        mflow_min, mflow_max = calculate_min_max_array(res_obj.MassFlowRate)
     if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+        npress_min, npress_max = calculate_min_max_array(res_obj.NetworkPressure)
 
     res_obj.Stats = [x_min, x_max,
                      y_min, y_max,
@@ -360,25 +354,39 @@ def fill_femresult_stats(res_obj):
     return res_obj
 
 
-def add_disp_apps(res_obj):
-    res_obj.DisplacementLengths = calculate_disp_abs(res_obj.DisplacementVectors)
-    FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
-    return res_obj
+def get_stress_array(res_obj):
+    """Returns the node stresses of a result object as array
 
+    Parameters
+    ----------
+    resultobj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
 
-def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
+    Returns
+    -------
+    numpy.ndarray
+        (N, 6) array, one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) per node
+    """
+
+    return np.array([
         res_obj.NodeStressXX,
         res_obj.NodeStressYY,
         res_obj.NodeStressZZ,
         res_obj.NodeStressXY,
         res_obj.NodeStressXZ,
         res_obj.NodeStressYZ
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    ], dtype=float).T.reshape(-1, 6)
+
+
+def add_disp_apps(res_obj):
+    res_obj.DisplacementLengths = calculate_disp_abs_array(res_obj.DisplacementVectors).tolist()
+    FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
+    return res_obj
+
+
+def add_von_mises(res_obj):
+    mstress = calculate_von_mises_array(get_stress_array(res_obj))
+    res_obj.vonMises = mstress.tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -388,28 +396,11 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecadweb.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    prinstress = calculate_principal_stress_std_array(get_stress_array(res_obj))
+    res_obj.PrincipalMax = prinstress[:, 0].tolist()
+    res_obj.PrincipalMed = prinstress[:, 1].tolist()
+    res_obj.PrincipalMin = prinstress[:, 2].tolist()
+    res_obj.MaxShear = prinstress[:, 3].tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
     return res_obj
 
@@ -436,26 +427,20 @@ def get_concrete_nodes(res_obj):
                 and is_of_type(obj, "Fem::MaterialReinforced"):
             FreeCAD.Console.PrintMessage("ReinforcedMaterial\n")
             if obj.References == []:
-                for iic in range(nsr):
-                    if ic[iic] == 0:
-                        ic[iic] = 1
+                ic[ic == 0] = 1
             else:
                 for ref in obj.References:
                     concrete_nodes = get_femnodes_by_refshape(femmesh, ref)
-                    for cn in concrete_nodes:
-                        ic[cn - 1] = 1
+                    ic[np.array(concrete_nodes, dtype=int) - 1] = 1
         elif obj.isDerivedFrom("App::MaterialObjectPython") \
                 and is_of_type(obj, "Fem::MaterialCommon"):
             FreeCAD.Console.PrintMessage("No ReinforcedMaterial\n")
             if obj.References == []:
-                for iic in range(nsr):
-                    if ic[iic] == 0:
-                        ic[iic] = 2
+                ic[ic == 0] = 2
             else:
                 for ref in obj.References:
                     non_concrete_nodes = get_femnodes_by_refshape(femmesh, ref)
-                    for ncn in non_concrete_nodes:
-                        ic[ncn - 1] = 2
+                    ic[np.array(non_concrete_nodes, dtype=int) - 1] = 2
     return ic
 
 
@@ -473,21 +458,6 @@ def add_principal_stress_reinforced(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecadweb.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    ps1v = []
-    ps2v = []
-    ps3v = []
-    #
-    # HarryvL: additional arrays to hold reinforcement ratios
-    # and mohr coulomb stress
-    #
-    rhx = []
-    rhy = []
-    rhz = []
-    moc = []
 
     # material parameter
     for obj in res_obj.getParentGroup().Group:
@@ -505,53 +475,40 @@ def add_principal_stress_reinforced(res_obj):
     # print(matrix_cs)
     # print(reinforce_yield)
 
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ
-    )
-    for isv, stress_tensor in enumerate(iterator):
-
-        rhox = 0.
-        rhoy = 0.
-        rhoz = 0.
-        mc = 0.
-
-        if ic[isv] == 1:
-            #
-            # HarryvL: for concrete scxx etc. are affected by
-            # reinforcement (see calculate_rho(stress_tensor)). for all other
-            # materials scxx etc. are the original stresses
-            #
-            rhox, rhoy, rhoz = calculate_rho(
-                stress_tensor,
-                reinforce_yield
-            )
+    stress_tensors = get_stress_array(res_obj)
+    prinstress, psv = calculate_principal_stress_reinforced_array(stress_tensors)
 
-        prin1, prin2, prin3, shear, psv = calculate_principal_stress_reinforced(
-            stress_tensor
+    #
+    # HarryvL: for concrete scxx etc. are affected by
+    # reinforcement (see calculate_rho(stress_tensor)). for all other
+    # materials scxx etc. are the original stresses
+    #
+    # reinforcement ratios and mohr coulomb criterion are only calculated
+    # for concrete nodes, they are 0 for all other nodes
+    #
+    is_concrete = ic[:len(stress_tensors)] == 1
+    rho = np.zeros((len(stress_tensors), 3))
+    moc = np.zeros(len(stress_tensors))
+    if is_concrete.any():
+        rho[is_concrete] = calculate_rho_array(stress_tensors[is_concrete], reinforce_yield)
+        moc[is_concrete] = calculate_mohr_coulomb_array(
+            prinstress[is_concrete, 0],
+            prinstress[is_concrete, 2],
+            matrix_af,
+            matrix_cs
         )
 
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-        ps1v.append(psv[0])
-        ps2v.append(psv[1])
-        ps3v.append(psv[2])
-
-        #
-        # reinforcement ratios and mohr coulomb criterion
-        #
-        rhx.append(rhox)
-        rhy.append(rhoy)
-        rhz.append(rhoz)
-        if ic[isv] == 1:
-            mc = calculate_mohr_coulomb(prin1, prin3, matrix_af, matrix_cs)
-        moc.append(mc)
+    prinstress1 = prinstress[:, 0].tolist()
+    prinstress2 = prinstress[:, 1].tolist()
+    prinstress3 = prinstress[:, 2].tolist()
+    shearstress = prinstress[:, 3].tolist()
+    ps1v = list(map(tuple, psv[:, 0].tolist()))
+    ps2v = list(map(tuple, psv[:, 1].tolist()))
+    ps3v = list(map(tuple, psv[:, 2].tolist()))
+    rhx = rho[:, 0].tolist()
+    rhy = rho[:, 1].tolist()
+    rhz = rho[:, 2].tolist()
+    moc = moc.tolist()
 
     res_obj.PrincipalMax = prinstress1
     res_obj.PrincipalMed = prinstress2
@@ -864,4 +821,189 @@ def calculate_disp_abs(displacements):
     # see https://forum.freecadweb.org/viewtopic.php?f=18&t=33106&start=100#p296657
     return [np.linalg.norm(nd) for nd in displacements]
 
+
+# ************************************************************************************************
+# array versions of the calculate methods above
+# they calculate the values of all nodes at once and return the same values
+# as the methods above called for every node, but are much faster on large results
+# stress_tensors ... (N, 6) array, one row (Sxx, Syy, Szz, Sxy, Sxz, Syz) per node
+
+def _stress_tensor_matrices(stress_tensors):
+    # (N, 6) stress tensors --> (N, 3, 3) symmetric stress matrices
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    index = [[0, 3, 4], [3, 1, 5], [4, 5, 2]]
+    return stress_tensors[:, index]
+
+
+def calculate_von_mises_array(stress_tensors):
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    normal = stress_tensors[:, :3]
+    shear = stress_tensors[:, 3:]
+    pressure = np.average(normal, axis=1)
+    return np.sqrt(
+        1.5 * np.sum((normal - pressure[:, np.newaxis])**2, axis=1)
+        + 3.0 * np.sum(shear**2, axis=1)
+    )
+
+
+def calculate_principal_stress_std_array(stress_tensors):
+    # returns (N, 4) array, one row (prin1, prin2, prin3, maxshear) per node
+    # rows with NaN in the stress tensor are NaN, see calculate_principal_stress_std
+    sigma = _stress_tensor_matrices(stress_tensors)
+    result = np.full((len(sigma), 4), float("NaN"))
+    valid = ~np.isnan(sigma).any(axis=(1, 2))
+    eigvals = np.linalg.eigvalsh(sigma[valid])[:, ::-1]
+    result[valid, :3] = eigvals
+    result[valid, 3] = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return result
+
+
+def calculate_principal_stress_reinforced_array(stress_tensors):
+    # returns a tuple of
+    # (N, 4) array, one row (prin1, prin2, prin3, maxshear) per node
+    # (N, 3, 3) array, the three principal stress vectors per node
+    sigma = _stress_tensor_matrices(stress_tensors)
+    if len(sigma) == 0:
+        return np.empty((0, 4)), np.empty((0, 3, 3))
+    eigenvalues, eigenvectors = np.linalg.eig(sigma)
+
+    # suppress complex eigenvalue and vectors, see calculate_principal_stress_reinforced
+    eigenvalues = eigenvalues.real
+    eigenvectors = eigenvectors.real * eigenvalues[:, np.newaxis, :]
+
+    idx = eigenvalues.argsort(axis=1)[:, ::-1]
+    eigenvalues = np.take_along_axis(eigenvalues, idx, axis=1)
+    eigenvectors = np.take_along_axis(eigenvectors, idx[:, np.newaxis, :], axis=2)
+
+    prinstress = np.empty((len(sigma), 4))
+    prinstress[:, :3] = eigenvalues
+    prinstress[:, 3] = (eigenvalues[:, 0] - eigenvalues[:, 2]) / 2.0
+    return prinstress, eigenvectors.transpose(0, 2, 1)
+
+
+def calculate_rho_array(stress_tensors, fy):
+    # returns (N, 3) array, one row (rhox, rhoy, rhoz) per node
+    # see calculate_rho for the solutions
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    sxx = stress_tensors[:, 0]
+    syy = stress_tensors[:, 1]
+    szz = stress_tensors[:, 2]
+    sxy = stress_tensors[:, 3]
+    syz = stress_tensors[:, 5]
+    sxz = stress_tensors[:, 4]
+
+    n = len(stress_tensors)
+    rhox = np.zeros((n, 15))
+    rhoy = np.zeros((n, 15))
+    rhoz = np.zeros((n, 15))
+
+    i3 = (sxx * syy * szz + 2 * sxy * sxz * syz - sxx * syz**2
+          - syy * sxz**2 - szz * sxy**2)
+
+    def where_nonzero(divisor, value):
+        # value if divisor is not 0, otherwise 0
+        return np.where(divisor != 0., value, 0.)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        #    Solution (5), (6), (7)
+        d = (sxx * syy - sxy**2)
+        rhoz[:, 0] = where_nonzero(d, i3 / d / fy)
+        d = (sxx * szz - sxz**2)
+        rhoy[:, 1] = where_nonzero(d, i3 / d / fy)
+        d = (syy * szz - syz**2)
+        rhox[:, 2] = where_nonzero(d, i3 / d / fy)
+
+        #    Solution (9+), (9-)
+        fc = sxz * sxy / sxx - syz
+        fxy = sxy**2 / sxx
+        fxz = sxz**2 / sxx
+        rhoy[:, 3] = where_nonzero(sxx, (syy - fxy + fc) / fy)
+        rhoz[:, 3] = where_nonzero(sxx, (szz - fxz + fc) / fy)
+        rhoy[:, 4] = where_nonzero(sxx, (syy - fxy - fc) / fy)
+        rhoz[:, 4] = where_nonzero(sxx, (szz - fxz - fc) / fy)
+
+        #   Solution (10+), (10-)
+        fc = syz * sxy / syy - sxz
+        fxy = sxy**2 / syy
+        fyz = syz**2 / syy
+        rhox[:, 5] = where_nonzero(syy, (sxx - fxy + fc) / fy)
+        rhoz[:, 5] = where_nonzero(syy, (szz - fyz + fc) / fy)
+        rhox[:, 6] = where_nonzero(syy, (sxx - fxy - fc) / fy)
+        rhoz[:, 6] = where_nonzero(syy, (szz - fyz - fc) / fy)
+
+        # Solution (11+), (11-)
+        fc = sxz * syz / szz - sxy
+        fxz = sxz**2 / szz
+        fyz = syz**2 / szz
+        rhox[:, 7] = where_nonzero(szz, (sxx - fxz + fc) / fy)
+        rhoy[:, 7] = where_nonzero(szz, (syy - fyz + fc) / fy)
+        rhox[:, 8] = where_nonzero(szz, (sxx - fxz - fc) / fy)
+        rhoy[:, 8] = where_nonzero(szz, (syy - fyz - fc) / fy)
+
+        # Solution (13), (14), (15), (16)
+        rhox[:, 9] = (sxx + sxy + sxz) / fy
+        rhoy[:, 9] = (syy + sxy + syz) / fy
+        rhoz[:, 9] = (szz + sxz + syz) / fy
+        rhox[:, 10] = (sxx + sxy - sxz) / fy
+        rhoy[:, 10] = (syy + sxy - syz) / fy
+        rhoz[:, 10] = (szz - sxz - syz) / fy
+        rhox[:, 11] = (sxx - sxy - sxz) / fy
+        rhoy[:, 11] = (syy - sxy + syz) / fy
+        rhoz[:, 11] = (szz - sxz + syz) / fy
+        rhox[:, 12] = (sxx - sxy + sxz) / fy
+        rhoy[:, 12] = (syy - sxy - syz) / fy
+        rhoz[:, 12] = (szz + sxz - syz) / fy
+
+        # Solution (17)
+        rhox[:, 13] = where_nonzero(syz, (sxx - sxy * sxz / syz) / fy)
+        rhoy[:, 13] = where_nonzero(sxz, (syy - sxy * syz / sxz) / fy)
+        rhoz[:, 13] = where_nonzero(sxy, (szz - sxz * syz / sxy) / fy)
+
+    # Concrete Stresses, one column per solution
+    scxx = sxx[:, np.newaxis] - rhox * fy
+    scyy = syy[:, np.newaxis] - rhoy * fy
+    sczz = szz[:, np.newaxis] - rhoz * fy
+    sxy = sxy[:, np.newaxis]
+    sxz = sxz[:, np.newaxis]
+    syz = syz[:, np.newaxis]
+    ic1 = (scxx + scyy + sczz)
+    ic2 = (scxx * scyy + scyy * sczz + sczz * scxx - sxy**2
+           - sxz**2 - syz**2)
+    ic3 = (scxx * scyy * sczz + 2 * sxy * sxz * syz - scxx * syz**2
+           - scyy * sxz**2 - sczz * sxy**2)
+
+    rsum = rhox + rhoy + rhoz
+    valid = (
+        (rhox >= -1.e-10) & (rhoy >= -1.e-10) & (rhoz > -1.e-10)
+        & (ic1 <= 1.e-6) & (ic2 >= -1.e-6) & (ic3 <= 1.0e-6)
+        & (rsum < 1.0e9) & (rsum > 0.)
+    )
+    # the first solution with the smallest sum, solution 15 (all 0) if there is none
+    rsum = np.where(valid, rsum, np.inf)
+    eqmin = np.where(valid.any(axis=1), np.argmin(rsum, axis=1), 14)
+    rows = np.arange(n)
+    return np.stack((rhox[rows, eqmin], rhoy[rows, eqmin], rhoz[rows, eqmin]), axis=1)
+
+
+def calculate_mohr_coulomb_array(prin1, prin3, phi, fck):
+    prin1 = np.asarray(prin1, dtype=float)
+    prin3 = np.asarray(prin3, dtype=float)
+    coh = fck * (1 - np.sin(phi)) / 2 / np.cos(phi)
+    mc_stress = ((prin1 - prin3) + (prin1 + prin3) * np.sin(phi)
+                 - 2. * coh * np.cos(phi))
+    return np.where(mc_stress < 0., 0., mc_stress)
+
+
+def calculate_disp_abs_array(displacements):
+    displacements = np.asarray(displacements, dtype=float).reshape(-1, 3)
+    return np.linalg.norm(displacements, axis=1)
+
+
+def calculate_min_max_array(values):
+    # returns (min, max) of the values, NaN values are ignored
+    values = np.asarray(values, dtype=float)
+    if values.size == 0 or np.isnan(values).all():
+        return (0.0, 0.0)
+    return (float(np.nanmin(values)), float(np.nanmax(values)))
+
 ##  @}
@@ -165,8 +165,11 @@ class Results(run.Results):
             self.directory, _inputFileName + ".frd")
         if os.path.isfile(frd_result_file):
             result_name_prefix = "CalculiX_" + self.solver.AnalysisType + "_"
+            ccx_prefs = FreeCAD.ParamGet(
+                "User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
             importCcxFrdResults.importFrd(
-                frd_result_file, self.analysis, result_name_prefix)
+                frd_result_file, self.analysis, result_name_prefix,
+                lazy=ccx_prefs.GetBool("LazyResultLoading", False))
         else:
             # TODO: use solver framework status message system
             FreeCAD.Console.PrintError(
@@ -29,7 +29,10 @@ __url__ = "https://www.freecadweb.org"
 import codecs
 from os.path import join
 
+import FreeCAD
+
 from femmesh import meshtools
+from .. import writerbase
 
 
 def write_mesh(ccxwriter):
@@ -41,15 +44,28 @@ def write_mesh(ccxwriter):
         file_name_split = ccxwriter.mesh_name + "_" + write_name + ".inp"
         ccxwriter.femmesh_file = join(ccxwriter.dir_name, file_name_split)
 
-        ccxwriter.femmesh.writeABAQUS(
-            ccxwriter.femmesh_file,
+        # the mesh file of the last run is reused if the mesh object has not changed
+        mesh_key = (
+            ccxwriter.mesh_object.Document.Name,
+            ccxwriter.mesh_object.Name,
+            writerbase.get_mesh_revision(ccxwriter.mesh_object),
             element_param,
-            group_param
+            group_param,
+            bool(ccxwriter.member.geos_fluidsection)
         )
+        if writerbase.is_written_file_unchanged(ccxwriter.femmesh_file, mesh_key):
+            FreeCAD.Console.PrintMessage("Mesh unchanged, the mesh file is reused.\n")
+        else:
+            ccxwriter.femmesh.writeABAQUS(
+                ccxwriter.femmesh_file,
+                element_param,
+                group_param
+            )
 
-        # Check to see if fluid sections are in analysis and use D network element type
-        if ccxwriter.member.geos_fluidsection:
-            meshtools.write_D_network_element_to_inputfile(ccxwriter.femmesh_file)
+            # Check to see if fluid sections are in analysis and use D network element type
+            if ccxwriter.member.geos_fluidsection:
+                meshtools.write_D_network_element_to_inputfile(ccxwriter.femmesh_file)
+            writerbase.set_written_file(ccxwriter.femmesh_file, mesh_key)
 
         inpfile = codecs.open(ccxwriter.file_name, "w", encoding="utf-8")
         inpfile.write("{}\n".format(59 * "*"))
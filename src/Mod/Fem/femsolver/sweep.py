@@ -0,0 +1,205 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+""" Run a solver for a series of property variations.
+
+Parameter sweep on top of the :class:`femsolver.run.Machine`. For every
+variation the properties are set, the document is recomputed and the check and
+prepare tasks are run by the machine. They access the document, thus the sweep
+waits for them to finish before the next variation is set. The solve task only
+runs the solver binary in its own working directory, thus up to *max_parallel*
+solver processes run at the same time. The results are not loaded into the
+document, summary values are read from the result files. Works without Gui,
+for example in FreeCADCmd::
+
+    from femsolver import sweep
+    runs = sweep.run_sweep(
+        doc.SolverCalculix,
+        [{"ConstraintForce.Force": f} for f in (100.0, 200.0, 400.0)],
+        max_parallel=4
+    )
+    for r in runs:
+        print(r["variation"], r["failed"], r["stats"])
+"""
+
+__title__ = "FreeCAD FEM solver parameter sweep"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import glob
+import os
+import tempfile
+
+import FreeCAD as App
+
+from . import report
+from . import run
+
+
+def run_sweep(solver, variations, max_parallel=None, working_dir=None):
+    """ Run *solver* once for each of the *variations*.
+
+    :param solver:
+        A framework compliant solver document object, see
+        :func:`femsolver.run.run_fem_solver`. The CalculiX ccx tools solver
+        does not use a :class:`femsolver.run.Machine` and is not supported.
+
+    :param variations:
+        A list of dicts ``{"ObjectName.PropertyName": value}``. The values are
+        set on the objects of the solver document before the run. Properties
+        not given keep the value of the previous variation. All changed
+        properties are reset to their original values after the sweep.
+
+    :param max_parallel:
+        Maximum number of solver processes running at the same time. Defaults
+        to the number of CPUs. Solvers running multi threaded themselves
+        (for example CalculiX with OMP_NUM_THREADS) should get a smaller value.
+
+    :param working_dir:
+        Base directory for the working directories of the runs. Every run gets
+        its own unique sub directory. If ``None`` a temporary directory is
+        created.
+
+    :returns:
+        A list with one dict per variation in the order of *variations*
+        with the keys ``variation``, ``directory``, ``failed``, ``time``
+        (solver run time in seconds), ``report`` (the
+        :class:`femsolver.report.Report` of all tasks of the run) and
+        ``stats``, see :func:`get_result_stats`.
+    """
+    if solver.Proxy.Type == "Fem::SolverCcxTools":
+        raise ValueError("The ccx tools solver is not supported, use the CalculiX solver.")
+    if max_parallel is None:
+        max_parallel = os.cpu_count() or 1
+    if working_dir is None:
+        working_dir = tempfile.mkdtemp(prefix="femsweep")
+    elif not os.path.isdir(working_dir):
+        os.makedirs(working_dir)
+    doc = solver.Document
+    originals = {}
+    runs = []
+    running = []
+    try:
+        for variation in variations:
+            _set_variation(doc, variation, originals)
+            doc.recompute()
+            sweep_run = {
+                "variation": variation,
+                "directory": _get_run_dir(solver, working_dir),
+                "failed": False,
+                "time": None,
+                "report": None,
+                "stats": {},
+            }
+            runs.append(sweep_run)
+            machine = solver.Proxy.createMachine(solver, sweep_run["directory"], False)
+            machine.target = run.PREPARE
+            machine.start()
+            machine.join()
+            # start() gives the machine a new report, keep the one of check and prepare
+            sweep_run["report"] = report.Report()
+            sweep_run["report"].extend(machine.report)
+            if machine.failed or machine.aborted:
+                _finish_run(sweep_run, machine, solved=False)
+                continue
+            while len(running) >= max_parallel:
+                _finish_run(*running.pop(0))
+            machine.target = run.SOLVE
+            machine.start()
+            running.append((sweep_run, machine))
+        while running:
+            _finish_run(*running.pop(0))
+    finally:
+        for (obj_name, prop), value in originals.items():
+            setattr(doc.getObject(obj_name), prop, value)
+        if originals:
+            doc.recompute()
+    return runs
+
+
+def get_result_stats(directory):
+    """ Summary values of the CalculiX result files in *directory*.
+
+    :returns:
+        ``{"result_sets": count, "disp_abs_max": value, "von_mises_max": value}``,
+        the maximum over all result sets, a key is only given if the field is
+        in the results. An empty dict if there are no result files.
+    """
+    from feminout import importCcxFrdResults
+    from femresult import resulttools
+    stats = {}
+    for frd_file in sorted(glob.glob(os.path.join(directory, "*.frd"))):
+        for result_set in importCcxFrdResults.iter_frd_results(frd_file):
+            stats["result_sets"] = stats.get("result_sets", 0) + 1
+            if "disp" in result_set:
+                values = resulttools.calculate_disp_abs_array(result_set["disp"][1])
+                _set_max(stats, "disp_abs_max", values)
+            if "stress" in result_set:
+                values = resulttools.calculate_von_mises_array(result_set["stress"][1])
+                _set_max(stats, "von_mises_max", values)
+    return stats
+
+
+def _set_max(stats, key, values):
+    from femresult import resulttools
+    if len(values):
+        value_max = resulttools.calculate_min_max_array(values)[1]
+        stats[key] = max(stats.get(key, value_max), value_max)
+
+
+def _set_variation(doc, variation, originals):
+    for name, value in variation.items():
+        obj_name, prop = name.split(".", 1)
+        obj = doc.getObject(obj_name)
+        if obj is None:
+            raise ValueError("Object {} of variation {} not found".format(obj_name, name))
+        if (obj_name, prop) not in originals:
+            originals[(obj_name, prop)] = getattr(obj, prop)
+        setattr(obj, prop, value)
+
+
+def _get_run_dir(solver, working_dir):
+    # a new directory for every run, also if working_dir has been used before
+    return tempfile.mkdtemp(prefix=solver.Label + "_", dir=working_dir)
+
+
+def _finish_run(sweep_run, machine, solved=True):
+    machine.join()
+    sweep_run["failed"] = machine.failed or machine.aborted
+    sweep_run["time"] = machine.time
+    if solved:
+        # the report of the solve and results tasks
+        sweep_run["report"].extend(machine.report)
+    if sweep_run["failed"]:
+        App.Console.PrintError(
+            "Sweep run in {} failed.\n".format(sweep_run["directory"])
+        )
+        return
+    sweep_run["stats"] = get_result_stats(sweep_run["directory"])
+    App.Console.PrintMessage(
+        "Sweep run in {} finished: {}\n".format(sweep_run["directory"], sweep_run["stats"])
+    )
+
+##  @}
@@ -28,6 +28,8 @@ __url__ = "https://www.freecadweb.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
+import io
 import os
 from os.path import join
 
@@ -36,6 +38,41 @@ import FreeCAD
 from femmesh import meshsetsgetter
 
 
+# split input files written in this session { file path : (key, size, modification time) }
+_written_files = {}
+# rendered mesh sets of the constraints
+# { (document name, object name, writer module name) : (mesh sets key, text) }
+_constraint_texts = {}
+meshsetsgetter.add_document_cache(_constraint_texts)
+
+
+def get_mesh_revision(mesh_obj):
+    """revision of the mesh object, it changes with every change of the mesh object
+    only changes after the first writer was created are known
+    """
+    return meshsetsgetter.get_object_revision(mesh_obj)
+
+
+def get_file_stat(file_path):
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def is_written_file_unchanged(file_path, key):
+    """True if the file was written with the same key and has not been changed since then"""
+    written = _written_files.get(file_path)
+    return (
+        written is not None
+        and written[0] == key
+        and os.path.isfile(file_path)
+        and get_file_stat(file_path) == written[1:]
+    )
+
+
+def set_written_file(file_path, key):
+    _written_files[file_path] = (key,) + get_file_stat(file_path)
+
+
 class FemInputWriter():
     def __init__(
         self,
@@ -165,9 +202,7 @@ class FemInputWriter():
                 the_file.write(write_before)
             for femobj in femobjs:
                 # femobj --> dict, FreeCAD document object is femobj["Object"]
-                the_obj = femobj["Object"]
-                the_file.write("** {}\n".format(the_obj.Label))
-                con_module.write_meshdata_constraint(the_file, femobj, the_obj, self)
+                the_file.write(self.get_meshdata_constraint_text(femobj, con_module))
             if write_after != "":
                 the_file.write(write_after)
 
@@ -182,12 +217,53 @@ class FemInputWriter():
         if self.split_inpfile is True:
             file_name_split = "{}_{}.inp".format(self.mesh_name, write_name)
             f.write("*INCLUDE,INPUT={}\n".format(file_name_split))
-            inpfile_split = open(join(self.dir_name, file_name_split), "w")
+            file_path = join(self.dir_name, file_name_split)
+            # the file is not rendered again if the mesh sets of all constraints are unchanged
+            keys = [femobj.get("MeshSetsKey") for femobj in femobjs]
+            key = None
+            if None not in keys:
+                key = (con_module.__name__, write_before, write_after, tuple(keys))
+                if is_written_file_unchanged(file_path, key):
+                    FreeCAD.Console.PrintLog(
+                        "Unchanged, not written: {}\n".format(file_name_split)
+                    )
+                    return
+            inpfile_split = io.StringIO()
             constraint_sets_loop_writing(inpfile_split, femobjs, write_before, write_after)
-            inpfile_split.close()
+            content = inpfile_split.getvalue()
+            if key is None:
+                key = hashlib.sha1(content.encode("utf-8")).hexdigest()
+                if is_written_file_unchanged(file_path, key):
+                    FreeCAD.Console.PrintLog(
+                        "Unchanged, not written: {}\n".format(file_name_split)
+                    )
+                    return
+            with open(file_path, "w") as split_file:
+                split_file.write(content)
+            set_written_file(file_path, key)
         else:
             constraint_sets_loop_writing(f, femobjs, write_before, write_after)
 
+    # the mesh sets of a constraint are only rendered again if their key has changed
+    def get_meshdata_constraint_text(
+        self,
+        femobj,
+        con_module
+    ):
+        the_obj = femobj["Object"]
+        key = femobj.get("MeshSetsKey")
+        cache_key = (the_obj.Document.Name, the_obj.Name, con_module.__name__)
+        cached = _constraint_texts.get(cache_key)
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+        text = io.StringIO()
+        text.write("** {}\n".format(the_obj.Label))
+        con_module.write_meshdata_constraint(text, femobj, the_obj, self)
+        text = text.getvalue()
+        if key is not None:
+            _constraint_texts[cache_key] = (key, text)
+        return text
+
     # write constraint property data
     def write_constraints_propdata(
         self,
@@ -56,6 +56,9 @@ class _TaskPanel:
     """
 
     def __init__(self, obj):
+        # lazy imported results are read from their result file on first use
+        from feminout.importCcxFrdResults import load_result_set
+        load_result_set(obj)
         self.result_obj = obj
         self.mesh_obj = self.result_obj.Mesh
         # task panel should be started by use of setEdit of view provider
@@ -150,6 +150,151 @@ class TestMeshCommon(unittest.TestCase):
             "Edges of Python created seg3 element are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_mesh_topology(
+        self
+    ):
+        from femmesh import meshtools
+        # two hexa8 stacked in z, sharing the nodes 5, 6, 7, 8
+        hexa8 = Fem.FemMesh()
+        for z in range(3):
+            hexa8.addNode(0, 0, z, 4 * z + 1)
+            hexa8.addNode(1, 0, z, 4 * z + 2)
+            hexa8.addNode(1, 1, z, 4 * z + 3)
+            hexa8.addNode(0, 1, z, 4 * z + 4)
+        hexa8.addVolume([1, 2, 3, 4, 5, 6, 7, 8], 1)
+        hexa8.addVolume([5, 6, 7, 8, 9, 10, 11, 12], 2)
+
+        femelement_table = meshtools.get_femelement_table(hexa8)
+        topology = meshtools.get_femmesh_topology(hexa8, femelement_table)
+        self.assertEqual(
+            meshtools.get_femmesh_topology(hexa8).femelement_table,
+            femelement_table,
+            "Topology without femelement_table uses another element table"
+        )
+        self.assertEqual(topology.get_femelements_by_femnode(6), [1, 2])
+        self.assertEqual(topology.get_ccxelement_faces([5, 6, 7, 8]), [[1, 1], [2, 2]])
+        self.assertEqual(topology.get_femelements_by_femnodes(range(1, 9)), [1])
+        # the old tables give the same results
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(hexa8.Nodes, femelement_table)
+        bit_pattern_dict = meshtools.get_bit_pattern_dict(
+            femelement_table,
+            femnodes_ele_table,
+            [5, 6, 7, 8]
+        )
+        self.assertEqual(
+            meshtools.get_ccxelement_faces_from_binary_search(bit_pattern_dict),
+            [[1, 1], [2, 2]]
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_bin(
+                femelement_table,
+                femnodes_ele_table,
+                list(range(5, 13))
+            ),
+            [2]
+        )
+
+    # ********************************************************************************************
+    def test_mesh_from_arrays(
+        self
+    ):
+        from feminout import importToolsFem
+        # two hexa8 stacked in z and a tria3 on the top face
+        node_ids = list(range(1, 13))
+        coords = []
+        for z in range(3):
+            coords += [(0, 0, z), (1, 0, z), (1, 1, z), (0, 1, z)]
+        mesh_arrays = {
+            "Nodes": (node_ids, coords),
+            "Hexa8Elem": ([1, 2], [[1, 2, 3, 4, 5, 6, 7, 8], [5, 6, 7, 8, 9, 10, 11, 12]]),
+            "Tria3Elem": ([3], [[9, 10, 11]]),
+        }
+        femmesh = importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+        self.assertEqual(femmesh.NodeCount, 12)
+        self.assertEqual(femmesh.VolumeCount, 2)
+        self.assertEqual(femmesh.FaceCount, 1)
+        self.assertEqual(femmesh.Nodes[11], FreeCAD.Vector(1, 1, 2))
+        self.assertEqual(femmesh.getElementNodes(2), (5, 6, 7, 8, 9, 10, 11, 12))
+        self.assertEqual(femmesh.getElementNodes(3), (9, 10, 11))
+
+        # mesh data dicts with string ids as saved by JSON and YAML
+        mesh_data = {
+            "Nodes": {str(i): c for i, c in zip(node_ids, coords)},
+            "Hexa8Elem": {"1": [1, 2, 3, 4, 5, 6, 7, 8], "2": [5, 6, 7, 8, 9, 10, 11, 12]},
+            "Tria3Elem": {"3": [9, 10, 11]},
+            "Groups": {},
+        }
+        femmesh_dict = importToolsFem.make_femmesh(mesh_data)
+        self.assertEqual(femmesh_dict.Nodes, femmesh.Nodes)
+        self.assertEqual(femmesh_dict.Volumes, femmesh.Volumes)
+        self.assertEqual(femmesh_dict.getElementNodes(3), (9, 10, 11))
+
+    # ********************************************************************************************
+    def test_gmsh_mesh_cache(
+        self
+    ):
+        import os
+        import time
+        import Part
+        from femmesh import gmshtools
+        cache_dir = testtools.get_fem_test_tmp_dir("mesh_common_gmsh_cache")
+        geometry_file = join(cache_dir, "geometry.brep")
+        geo_file = join(cache_dir, "shape2mesh.geo")
+
+        def get_key(box_length, mesh_size, gmsh_version=("4", "8", "4")):
+            Part.makeBox(box_length, 10, 10).exportBrep(geometry_file)
+            with open(geo_file, "w") as geo:
+                geo.write("// geo file written by the test\n")
+                geo.write('Merge "{}";\n'.format(geometry_file))
+                geo.write("Mesh.CharacteristicLengthMax = {};\n".format(mesh_size))
+            return gmshtools.get_mesh_cache_key(
+                gmsh_version,
+                geometry_file,
+                geo_file,
+                {geometry_file: "geometry"}
+            )
+
+        key = get_key(10, 2)
+        self.assertEqual(key, get_key(10, 2), "Same input gives a different cache key")
+        self.assertNotEqual(key, get_key(20, 2), "Changed geometry gives the same cache key")
+        self.assertNotEqual(key, get_key(10, 3), "Changed parameter gives the same cache key")
+        self.assertNotEqual(
+            key,
+            get_key(10, 2, ("4", "9", "0")),
+            "Changed gmsh version gives the same cache key"
+        )
+
+        # miss and hit
+        cache_file = join(cache_dir, key + ".med")
+        self.assertIsNone(gmshtools.read_mesh_cache_file(cache_file))
+        femmesh = Fem.FemMesh()
+        femmesh.addNode(0, 0, 0, 1)
+        femmesh.addNode(1, 0, 0, 2)
+        femmesh.addNode(0, 1, 0, 3)
+        femmesh.addFace([1, 2, 3], 1)
+        gmshtools.write_mesh_cache_file(femmesh, cache_file)
+        cached_mesh = gmshtools.read_mesh_cache_file(cache_file)
+        self.assertIsNotNone(cached_mesh, "Mesh written to the cache is not found")
+        self.assertEqual(cached_mesh.NodeCount, 3)
+        self.assertEqual(cached_mesh.FaceCount, 1)
+
+        # pruning keeps the most recently used meshes
+        cache_files = []
+        for i in range(4):
+            cache_files.append(join(cache_dir, "mesh_{}.med".format(i)))
+            gmshtools.write_mesh_cache_file(femmesh, cache_files[-1], max_size=10)
+            os.utime(cache_files[-1], (time.time() + i, time.time() + i))
+        # the temporary file of another writer is left alone
+        femmesh.write(join(cache_dir, "mesh_4_tmp.med"))
+        os.utime(join(cache_dir, "mesh_4_tmp.med"), (time.time() - 10, time.time() - 10))
+        gmshtools.prune_mesh_cache(3, cache_dir)
+        self.assertEqual(
+            sorted(f for f in os.listdir(cache_dir) if f.endswith(".med")),
+            ["mesh_1.med", "mesh_2.med", "mesh_3.med", "mesh_4_tmp.med"],
+            "Pruned mesh cache is unexpected"
+        )
+
     # ********************************************************************************************
     def test_unv_save_load(
         self
@@ -577,14 +722,13 @@ class TestMeshGroups(unittest.TestCase):
         correct.
         """
 
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes.meshdata import create_nodes, create_elements
 
         fm = Fem.FemMesh()
-        control = create_nodes(fm)
+        control = create_nodes(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create nodes")
-        control = create_elements(fm)
+        control = create_elements(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create elements")
 
@@ -639,14 +783,13 @@ class TestMeshGroups(unittest.TestCase):
         Adds a number of groups to FemMesh and deletes them
         afterwards. Checks whether GroupCount is OK
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes.meshdata import create_nodes, create_elements
 
         fm = Fem.FemMesh()
-        control = create_nodes(fm)
+        control = create_nodes(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create nodes")
-        control = create_elements(fm)
+        control = create_elements(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create elements")
 
@@ -673,14 +816,13 @@ class TestMeshGroups(unittest.TestCase):
         Add a node group, add elements to it. Verify that elements added
         and elements in getGroupElements are the same.
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes.meshdata import create_nodes, create_elements
 
         fm = Fem.FemMesh()
-        control = create_nodes(fm)
+        control = create_nodes(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create nodes")
-        control = create_elements(fm)
+        control = create_elements(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create elements")
 
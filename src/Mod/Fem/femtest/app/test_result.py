@@ -286,6 +286,109 @@ class TestResult(unittest.TestCase):
             "Values of read npressure result data are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_read_frd_arrays(
+        self
+    ):
+        # the array based reader has to return the same data as read_frd_result
+        from feminout.importCcxFrdResults import frd_mesh_to_dict
+        from feminout.importCcxFrdResults import frd_result_to_dict
+        from feminout.importCcxFrdResults import iter_frd_results
+        from feminout.importCcxFrdResults import read_frd_mesh
+        from feminout.importCcxFrdResults import read_frd_result
+        for frd_name in ("box_static.frd", "box_frequency.frd", "thermomech_flow1D.frd"):
+            frd_file = join(
+                testtools.get_fem_test_home_dir(),
+                "calculix",
+                frd_name
+            )
+            frd_content = read_frd_result(frd_file)
+            mesh_content = frd_mesh_to_dict(read_frd_mesh(frd_file))
+            for key in mesh_content:
+                self.assertEqual(
+                    mesh_content[key],
+                    frd_content[key],
+                    "Values of read {} data in {} are unexpected".format(key, frd_name)
+                )
+            result_sets = list(iter_frd_results(frd_file))
+            self.assertEqual(
+                len(result_sets),
+                len(frd_content["Results"]),
+                "Number of read result sets in {} is unexpected".format(frd_name)
+            )
+            for result_set, expected_result_set in zip(result_sets, frd_content["Results"]):
+                result_set = frd_result_to_dict(result_set)
+                for key in ("disp", "stress", "strain", "temp", "mflow", "npressure"):
+                    self.assertEqual(
+                        result_set.get(key),
+                        expected_result_set.get(key),
+                        "Values of read {} data in {} are unexpected".format(key, frd_name)
+                    )
+
+        # only the requested result sets are read
+        frd_file = join(
+            testtools.get_fem_test_home_dir(),
+            "calculix",
+            "thermomech_flow1D.frd"
+        )
+        self.assertEqual(
+            [result_set["step"] for result_set in iter_frd_results(frd_file, (1, 3))],
+            [1, 3],
+            "Read result sets are unexpected"
+        )
+
+    # ********************************************************************************************
+    def test_read_frd_result_set_by_index(
+        self
+    ):
+        # result sets read by their file offsets have to be the same as the iterated ones
+        from feminout.importCcxFrdResults import frd_result_to_dict
+        from feminout.importCcxFrdResults import iter_frd_results
+        from feminout.importCcxFrdResults import read_frd_index
+        from feminout.importCcxFrdResults import read_frd_result_set
+        frd_file = join(
+            testtools.get_fem_test_home_dir(),
+            "calculix",
+            "thermomech_flow1D.frd"
+        )
+        frd_index = read_frd_index(frd_file)
+        result_sets = list(iter_frd_results(frd_file))
+        self.assertEqual(
+            len(frd_index["result_sets"]),
+            len(result_sets),
+            "Number of indexed result sets is unexpected"
+        )
+        for result_set in result_sets:
+            self.assertEqual(
+                frd_result_to_dict(read_frd_result_set(frd_file, result_set["step"])),
+                frd_result_to_dict(result_set),
+                "Values of result set {} are unexpected".format(result_set["step"])
+            )
+        self.assertIsNone(
+            read_frd_result_set(frd_file, len(result_sets)),
+            "A not existing result set should not be read"
+        )
+
+    # ********************************************************************************************
+    def test_compacted_node_numbers(
+        self
+    ):
+        # node blocks of frd files do not need to be sorted and may have gaps
+        from feminout.importCcxFrdResults import _compacted_node_numbers
+        self.assertEqual(
+            _compacted_node_numbers([7, 3, 10, 5], [10, 3, 5, 7]),
+            [4, 1, 2, 3],
+            "Compacted node numbers are unexpected"
+        )
+        self.assertIsNone(
+            _compacted_node_numbers([7, 3, 10, 5], [3, 4]),
+            "A node number which is not in the node ids should not be mapped"
+        )
+        self.assertIsNone(
+            _compacted_node_numbers([7, 3, 10, 5], [11]),
+            "A node number which is not in the node ids should not be mapped"
+        )
+
     # ********************************************************************************************
     def get_stress_values(
         self
@@ -445,6 +548,73 @@ class TestResult(unittest.TestCase):
                 .format(i + 1)
             )
 
+    # ********************************************************************************************
+    def test_stress_arrays(
+        self
+    ):
+        # the array methods have to return the same values as the methods for one node
+        from femresult import resulttools
+        stress_tensors = (
+            self.get_stress_values(),
+            (2.000, -2.000, 5.000, 6.000, -4.000, 2.000),
+            (-3.000, -7.000, 0.000, 6.000, -4.000, 2.000),
+            (1.000, 0.000, 3.000, 10.000, -8.000, 7.000),
+            (0.000, 0.000, 0.000, 5.000, 0.000, 0.000),
+        )
+        mises = resulttools.calculate_von_mises_array(stress_tensors)
+        prin_std = resulttools.calculate_principal_stress_std_array(stress_tensors)
+        prin_rc, prin_vectors = resulttools.calculate_principal_stress_reinforced_array(
+            stress_tensors
+        )
+        rho = resulttools.calculate_rho_array(stress_tensors, 500)
+        moc = resulttools.calculate_mohr_coulomb_array(prin_rc[:, 0], prin_rc[:, 2], 0.5, 30.0)
+        for i, stress in enumerate(stress_tensors):
+            expected_prin_rc = resulttools.calculate_principal_stress_reinforced(stress)
+            expected_values = (
+                [resulttools.calculate_von_mises(stress)]
+                + list(resulttools.calculate_principal_stress_std(stress))
+                + list(expected_prin_rc[:4])
+                + [v for vector in expected_prin_rc[4] for v in vector]
+                + list(resulttools.calculate_rho(stress, 500))
+                + [resulttools.calculate_mohr_coulomb(
+                    expected_prin_rc[0], expected_prin_rc[2], 0.5, 30.0
+                )]
+            )
+            values = (
+                [mises[i]]
+                + list(prin_std[i])
+                + list(prin_rc[i])
+                + list(prin_vectors[i].flatten())
+                + list(rho[i])
+                + [moc[i]]
+            )
+            self.assertEqual(
+                [round(v, 6) for v in values],
+                [round(v, 6) for v in expected_values],
+                "Calculated array values of stress tensor {} are unexpected.".format(i)
+            )
+
+    # ********************************************************************************************
+    def test_sweep_result_stats(
+        self
+    ):
+        import shutil
+        from feminout.importCcxFrdResults import read_frd_result
+        from femresult import resulttools
+        from femsolver.sweep import get_result_stats
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        run_dir = testtools.get_fem_test_tmp_dir("sweep_result_stats")
+        shutil.copy(frd_file, run_dir)
+        stats = get_result_stats(run_dir)
+        result_set = read_frd_result(frd_file)["Results"][0]
+        expected_disp_abs_max = max(resulttools.calculate_disp_abs(result_set["disp"].values()))
+        expected_von_mises_max = max(
+            resulttools.calculate_von_mises(stress) for stress in result_set["stress"].values()
+        )
+        self.assertEqual(stats["result_sets"], 1)
+        self.assertAlmostEqual(stats["disp_abs_max"], expected_disp_abs_max, places=6)
+        self.assertAlmostEqual(stats["von_mises_max"], expected_von_mises_max, places=3)
+
     # ********************************************************************************************
     def test_disp_abs(
         self
@@ -820,11 +820,13 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         import feminout.importCcxFrdResults as importCcxFrdResults
         frd_result_file = os.path.splitext(self.inp_file_name)[0] + ".frd"
         if os.path.isfile(frd_result_file):
+            ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
             importCcxFrdResults.importFrd(
                 frd_result_file,
                 self.analysis,
                 "CCX_",
-                self.solver.AnalysisType
+                self.solver.AnalysisType,
+                lazy=ccx_prefs.GetBool("LazyResultLoading", False)
             )
             for m in self.analysis.Group:
                 if m.isDerivedFrom("Fem::FemResultObject"):
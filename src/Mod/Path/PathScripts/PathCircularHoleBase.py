@@ -23,6 +23,7 @@
 import FreeCAD
 import PathScripts.PathLog as PathLog
 import PathScripts.PathOp as PathOp
+import PathScripts.PathPreferences as PathPreferences
 import PathScripts.PathUtils as PathUtils
 
 from PySide import QtCore
@@ -194,6 +195,14 @@ class ObjectOp(PathOp.ObjectOp):
         if len(holes) > 0:
             self.circularHoleExecute(obj, holes)
 
+    def sortHoles(self, holes):
+        """sortHoles(holes) ... returns the holes in the order they should be processed.
+        They are sorted by the nearest neighbour method, see PathUtils.sort_jobs. If the
+        preference HoleOrderOptimizeTime is set, the rapid moves are shortened afterwards."""
+        return PathUtils.sort_jobs(
+            holes, ["x", "y"], optimize_time=PathPreferences.holeOrderOptimizeTime()
+        )
+
     def circularHoleExecute(self, obj, holes):
         """circularHoleExecute(obj, holes) ... implement processing of holes.
         holes is a list of dictionaries with 'x', 'y' and 'r' specified for each hole.
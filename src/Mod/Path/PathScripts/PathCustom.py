@@ -22,6 +22,7 @@
 
 import FreeCAD
 import Path
+import re
 
 import PathScripts.PathOp as PathOp
 import PathScripts.PathLog as PathLog
@@ -37,6 +38,11 @@ __doc__ = "Path Custom object and FreeCAD command"
 PathLog.setLevel(PathLog.Level.INFO, PathLog.thisModule())
 # PathLog.trackModule(PathLog.thisModule())
 
+# A line Path.Path splits into exactly the Command Path.Command makes of it:
+# a comment or a single G or M code other than G20/G21, which Path.Path
+# would use to scale the following commands.
+SingleCommand = re.compile(r'^\s*(\([^()]*\)|(?![gG]0*2[01](?![0-9.]))[gGmM][^gGmM()]*)\s*$')
+
 
 # Qt translation handling
 def translate(context, text, disambig=None):
@@ -56,9 +62,14 @@ class ObjectCustom(PathOp.ObjectOp):
     def opExecute(self, obj):
         self.commandlist.append(Path.Command("(Begin Custom)"))
         if obj.Gcode:
-            for l in obj.Gcode:
-                newcommand = Path.Command(str(l))
-                self.commandlist.append(newcommand)
+            lines = [str(l) for l in obj.Gcode]
+            if all(SingleCommand.match(l) for l in lines):
+                # a single parse of all lines is much faster than a Command per line
+                self.commandlist.extend(Path.Path('\n'.join(lines)).Commands)
+            else:
+                for l in lines:
+                    newcommand = Path.Command(l)
+                    self.commandlist.append(newcommand)
 
         self.commandlist.append(Path.Command("(End Custom)"))
 
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import collections
+import math
+import numpy
+import time
+
+import PathScripts.PathLog as PathLog
+import PathScripts.PathStockSim as PathStockSim
+import PathScripts.PathUtil as PathUtil
+
+__title__ = "PathCycleTime - cycle time estimation"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+__doc__ = "Cycle time estimation of Path commands taking the machine's acceleration into account."
+
+# Every move is planned like a motion controller does: the speed at the
+# junction of two moves is limited by the junction deviation, the speed on arcs
+# by the centripetal acceleration, and each move accelerates from its entry speed to its feed rate and decelerates to its exit
+# speed. The junction speeds are found with a forward and backward pass over
+# all moves, both of which are prefix scans and computed with numpy.
+#
+# Without acceleration limits, the default of a SetupSheet, the estimate is the
+# length of each move divided by its feed rate.
+#
+#   estimate = PathCycleTime.pathCycleTime(op.Path, 10, 5, 50, 20, limits)
+#   print(estimate.seconds, estimate.rapidTime)
+
+PathLog.setLevel(PathLog.Level.INFO, PathLog.thisModule())
+# PathLog.trackModule(PathLog.thisModule())
+
+# Maximum deviation of the lines arcs are split into
+ArcTolerance = 0.01
+# Number of estimates kept by pathCycleTime
+CacheSize = 256
+
+_cache = collections.OrderedDict()
+
+
+class MachineLimits(object):
+    '''MachineLimits(horizAcceleration=0, vertAcceleration=0, horizJerk=0, vertJerk=0, junctionDeviation=0) ...
+    the dynamic limits of a machine in mm/s^2, mm/s^3 and mm. The horizontal limits apply
+    to each of the X and Y axis, the vertical ones to the Z axis. A limit of 0 means the
+    axis is not limited, a junctionDeviation of 0 that the speed at junctions is not limited.'''
+
+    def __init__(self, horizAcceleration=0, vertAcceleration=0, horizJerk=0, vertJerk=0, junctionDeviation=0):
+        self.horizAcceleration = float(horizAcceleration)
+        self.vertAcceleration = float(vertAcceleration)
+        self.horizJerk = float(horizJerk)
+        self.vertJerk = float(vertJerk)
+        self.junctionDeviation = float(junctionDeviation)
+
+    def key(self):
+        return (self.horizAcceleration, self.vertAcceleration, self.horizJerk, self.vertJerk, self.junctionDeviation)
+
+    def hasAcceleration(self):
+        return self.horizAcceleration > 0 or self.vertAcceleration > 0
+
+    def hasJerk(self):
+        return self.horizJerk > 0 or self.vertJerk > 0
+
+
+def machineLimits(job):
+    '''machineLimits(job) ... returns the MachineLimits stored in the SetupSheet of job.'''
+    sheet = getattr(job, 'SetupSheet', None)
+
+    def value(name):
+        prop = getattr(sheet, name, 0)
+        return getattr(prop, 'Value', prop)
+
+    return MachineLimits(value('HorizAcceleration'), value('VertAcceleration'),
+                         value('HorizJerk'), value('VertJerk'), value('JunctionDeviation'))
+
+
+class CycleTime(object):
+    '''CycleTime(commandTimes, feedTime, rapidTime, feedLength, rapidLength) ... the
+    estimated time of a list of commands in seconds, in total and for each command.'''
+
+    def __init__(self, commandTimes, feedTime, rapidTime, feedLength, rapidLength):
+        self.commandTimes = commandTimes
+        self.feedTime = feedTime
+        self.rapidTime = rapidTime
+        self.feedLength = feedLength
+        self.rapidLength = rapidLength
+        self.seconds = feedTime + rapidTime
+
+    def __str__(self):
+        return formatTime(self.seconds)
+
+
+def formatTime(seconds):
+    '''formatTime(seconds) ... returns seconds as HH:MM:SS, the format of the CycleTime properties.'''
+    return time.strftime("%H:%M:%S", time.gmtime(seconds))
+
+
+def _axisLimit(directions, horiz, vert):
+    # the move is limited by the first axis reaching its limit
+    inverse = numpy.abs(directions) * numpy.array([1.0 / horiz if horiz > 0 else 0.0] * 2 + [1.0 / vert if vert > 0 else 0.0])
+    inverse = inverse.max(axis=1)
+    with numpy.errstate(divide='ignore'):
+        return numpy.where(inverse > 0, 1.0 / inverse, numpy.inf)
+
+
+def _phaseTime(dv, accel, jerk):
+    # time to change the speed by dv, a jerk limited phase is an S-curve
+    dv = numpy.maximum(dv, 0)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        t = dv / accel
+        scurve = numpy.isfinite(jerk)
+        full = scurve & (dv * jerk >= accel * accel)
+        t = numpy.where(full, t + accel / jerk, t)
+        short = scurve & ~full
+        t = numpy.where(short, 2 * numpy.sqrt(dv / jerk), t)
+    return t
+
+
+def segmentTimes(lengths, directions, speeds, limits, radii=None, joined=None):
+    '''segmentTimes(lengths, directions, speeds, limits, radii=None, joined=None) ... returns
+    the time of each move of a continuous tool path. The moves are given by their lengths,
+    unit directions and feed rates, the path starts and ends at rest. All moves must have a
+    length. Moves that are chords of an arc have the radius of the arc in radii, 0 otherwise,
+    joined is True for the junctions between two chords of the same arc.'''
+    times = lengths / speeds
+    if not limits.hasAcceleration() or len(lengths) == 0:
+        return times
+
+    accel = _axisLimit(directions, limits.horizAcceleration, limits.vertAcceleration)
+    speed2 = speeds * speeds
+    if radii is not None:
+        # the centripetal acceleration on an arc is v^2 / r
+        onArc = radii > 0
+        with numpy.errstate(invalid='ignore'):
+            speed2 = numpy.where(onArc, numpy.minimum(speed2, accel * radii), speed2)
+        speeds = numpy.sqrt(speed2)
+    maxSpeed2 = speed2.max()
+
+    # highest squared speed at each junction, including the start and the end of the path
+    cap = numpy.zeros(len(lengths) + 1)
+    if limits.junctionDeviation > 0:
+        cosTheta = -numpy.einsum('ij,ij->i', directions[:-1], directions[1:])
+        sinHalf = numpy.sqrt(numpy.clip((1 - cosTheta) / 2, 0, 1))
+        junctionAccel = numpy.minimum(accel[:-1], accel[1:])
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            junction = junctionAccel * limits.junctionDeviation * sinHalf / (1 - sinHalf)
+        junction[(sinHalf >= 1) | numpy.isnan(junction)] = numpy.inf
+        if joined is not None:
+            # the chords of an arc are limited by its centripetal acceleration instead
+            junction[joined] = numpy.inf
+    else:
+        junction = numpy.full(len(lengths) - 1, numpy.inf)
+    cap[1:-1] = numpy.minimum(junction, numpy.minimum(speed2[:-1], speed2[1:]))
+
+    # squared speed gained over each move, more than maxSpeed2 is never needed
+    gain = numpy.minimum(2 * accel * lengths, maxSpeed2)
+    total = numpy.concatenate(([0.0], numpy.cumsum(gain)))
+    # backward pass: w[i] = min(cap[i], w[i + 1] + gain[i])
+    backward = numpy.minimum.accumulate((cap + total)[::-1])[::-1] - total
+    # forward pass: w[i + 1] = min(backward[i + 1], w[i] + gain[i])
+    v2 = numpy.maximum(numpy.minimum.accumulate(backward - total) + total, 0)
+
+    v0 = numpy.sqrt(v2[:-1])
+    v1 = numpy.sqrt(v2[1:])
+    with numpy.errstate(invalid='ignore'):
+        peak = numpy.sqrt(numpy.minimum((2 * accel * lengths + v2[:-1] + v2[1:]) / 2, speed2))
+    peak = numpy.maximum(peak, numpy.maximum(v0, v1))
+
+    if limits.hasJerk():
+        jerk = _axisLimit(directions, limits.horizJerk, limits.vertJerk)
+    else:
+        jerk = numpy.full(len(lengths), numpy.inf)
+    tAccel = _phaseTime(peak - v0, accel, jerk)
+    tDecel = _phaseTime(peak - v1, accel, jerk)
+    cruise = numpy.maximum(lengths - (v0 + peak) / 2 * tAccel - (v1 + peak) / 2 * tDecel, 0)
+    planned = tAccel + tDecel + cruise / peak
+    return numpy.where(numpy.isfinite(accel), planned, times)
+
+
+def cycleTime(commands, hFeed, vFeed, hRapid, vRapid, limits=None, position=(0, 0, 0)):
+    '''cycleTime(commands, hFeed, vFeed, hRapid, vRapid, limits=None, position=(0, 0, 0)) ...
+    returns the CycleTime of commands starting at position. Feed moves use the F parameter
+    of their command, or hFeed and vFeed for moves without and with a Z component. Rapid
+    moves use hRapid and vRapid, which default to the feed rates if 0.'''
+    if limits is None:
+        limits = MachineLimits()
+    hRapid = hRapid if hRapid > 0 else hFeed
+    vRapid = vRapid if vRapid > 0 else vFeed
+
+    (pts, owner, rapid) = PathStockSim.commandSegments(commands, position, ArcTolerance)
+    commandTimes = numpy.zeros(len(commands))
+    if len(owner) == 0:
+        return CycleTime(commandTimes, 0.0, 0.0, 0.0, 0.0)
+
+    delta = pts[1:] - pts[:-1]
+    lengths = numpy.sqrt(numpy.einsum('ij,ij->i', delta, delta))
+    moves = lengths > 1e-9
+    delta, lengths, owner, rapid = delta[moves], lengths[moves], owner[moves], rapid[moves]
+    directions = delta / lengths[:, None] if len(lengths) else delta
+
+    arcRadii = numpy.array([math.hypot(cmd.Parameters.get('I', 0.0), cmd.Parameters.get('J', 0.0))
+                            if cmd.Name in ['G2', 'G02', 'G3', 'G03'] else 0.0 for cmd in commands])
+    radii = arcRadii[owner]
+    joined = (owner[:-1] == owner[1:]) & (radii[:-1] > 0)
+
+    feeds = numpy.array([cmd.Parameters.get('F', 0.0) for cmd in commands], dtype=float)
+    vertical = delta[:, 2] != 0
+    speeds = numpy.where(vertical, vFeed, hFeed)
+    speeds = numpy.where(feeds[owner] > 0, feeds[owner], speeds)
+    speeds = numpy.where(rapid, numpy.where(vertical, vRapid, hRapid), speeds)
+
+    times = segmentTimes(lengths, directions, speeds, limits, radii, joined)
+    commandTimes = numpy.bincount(owner, times, minlength=len(commands))
+    return CycleTime(commandTimes,
+                     float(times[~rapid].sum()), float(times[rapid].sum()),
+                     float(lengths[~rapid].sum()), float(lengths[rapid].sum()))
+
+
+def pathCycleTime(path, hFeed, vFeed, hRapid, vRapid, limits=None):
+    '''pathCycleTime(path, hFeed, vFeed, hRapid, vRapid, limits=None) ... returns the
+    CycleTime of a Path, see cycleTime. The estimates are cached by the content of path,
+    which makes repeated calls for unchanged paths cheap.'''
+    if limits is None:
+        limits = MachineLimits()
+    key = (PathUtil.pathDigest(path), float(hFeed), float(vFeed), float(hRapid), float(vRapid), limits.key())
+    estimate = _cache.get(key)
+    if estimate is None:
+        estimate = cycleTime(path.Commands, hFeed, vFeed, hRapid, vRapid, limits)
+        _cache[key] = estimate
+        if len(_cache) > CacheSize:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return estimate
+
+
+def operationCycleTime(op, limits=None):
+    '''operationCycleTime(op, limits=None) ... returns the CycleTime of op with the rates
+    of its tool controller, None if op has no tool controller or feed rates.'''
+    tc = PathUtil.toolControllerForOp(op)
+    if tc is None or getattr(tc, 'ToolNumber', 0) == 0 or op.Path is None:
+        return None
+    hFeed = tc.HorizFeed.Value
+    vFeed = tc.VertFeed.Value
+    if hFeed == 0 or vFeed == 0:
+        return None
+    return pathCycleTime(op.Path, hFeed, vFeed, tc.HorizRapid.Value, tc.VertRapid.Value, limits)
+
+
+def jobCycleTime(job):
+    '''jobCycleTime(job) ... returns the total cycle time of the active operations of job in
+    seconds and a list of (op, CycleTime) for each of them. Operations without estimate are
+    listed with None.'''
+    limits = machineLimits(job)
+    seconds = 0.0
+    breakdown = []
+    for op in job.Operations.Group:
+        if PathUtil.opProperty(op, 'Active') is False:
+            continue
+        estimate = operationCycleTime(op, limits)
+        if estimate is not None:
+            seconds += estimate.seconds
+        breakdown.append((op, estimate))
+    return (seconds, breakdown)
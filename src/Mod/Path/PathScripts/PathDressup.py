@@ -22,6 +22,10 @@
 
 import FreeCAD
 import PathScripts.PathJob as PathJob
+import PathScripts.PathUtil as PathUtil
+
+# properties of a dressup which are not inputs of its path
+NonInputProperties = ['Base', 'Path', 'Proxy', 'Label', 'Label2', 'Visibility', 'ExpressionEngine', 'CycleTime']
 
 def selection():
     '''isActive() ... return True if a dressup command is possible.'''
@@ -50,3 +54,19 @@ def toolController(path):
     '''toolController(path) ... return the tool controller from the base op.'''
     return baseOp(path).ToolController
 
+def dressupKey(obj, *values):
+    '''dressupKey(obj, *values) ... return a key of all inputs of dressup obj: the base path, the
+    dressup's properties, the base op's tool controller and cutting side, and the given values.
+    Dressups compare it with the key of their last execution to skip processing unchanged input.
+    Returns None if obj is not a document object, such objects are always processed.'''
+    if not hasattr(obj, 'PropertiesList'):
+        return None
+    op = baseOp(obj.Base)
+    tc = getattr(op, 'ToolController', None)
+    tool = getattr(tc, 'Tool', None)
+    props = [p for p in obj.PropertiesList if p not in NonInputProperties]
+    return (PathUtil.pathDigest(obj.Base.Path),
+            tuple(PathUtil.propertyKey(getattr(obj, p, None)) for p in props),
+            tuple(PathUtil.propertyKey(getattr(op, p, None)) for p in ['Side', 'Direction', 'Active', 'StartDepth']),
+            tuple(PathUtil.propertyKey(getattr(tc, p, None)) for p in ['ToolNumber', 'HorizFeed', 'VertFeed', 'HorizRapid', 'VertRapid']),
+            PathUtil.propertyKey(getattr(tool, 'Diameter', None))) + values
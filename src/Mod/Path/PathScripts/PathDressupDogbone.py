@@ -756,6 +756,12 @@ class ObjectDressup(object):
         if not obj.Base.Path.Commands:
             return
 
+        key = PathDressup.dressupKey(obj)
+        if key is not None and key == getattr(self, 'executedKey', None):
+            # the bones of the last execution are still valid
+            PathLog.debug("base path and parameters unchanged")
+            return
+
         self.setup(obj, False)
 
         commands = []           # the dressed commands
@@ -850,6 +856,7 @@ class ObjectDressup(object):
         #    PathLog.debug("cmd = '%s'" % cmd)
         path = Path.Path(commands)
         obj.Path = path
+        self.executedKey = key
 
     def setup(self, obj, initial):
         PathLog.info("Here we go ... ")
@@ -115,6 +115,7 @@ class Tag:
         self.r2 = None
         self.solid = None
         self.z = None
+        self.nearEdges = None
 
     def fullWidth(self):
         return 2 * self.toolRadius + self.width
@@ -550,6 +551,38 @@ class _RapidEdges:
         return False
 
 
+class _EdgeIndex:
+    '''Grid of the path edges by their bounding boxes, finds the edges near a tag without
+    looking at all of them.'''
+
+    def __init__(self, edges):
+        self.boxes = [e.BoundBox for e in edges]
+        self.cells = {}
+        self.size = 1.0
+        if self.boxes:
+            bb = FreeCAD.BoundBox()
+            for box in self.boxes:
+                bb.add(box)
+            self.size = max(bb.XLength, bb.YLength, 1.0) / max(1.0, math.sqrt(len(self.boxes)))
+            for i, box in enumerate(self.boxes):
+                for cell in self._cells(box):
+                    self.cells.setdefault(cell, []).append(i)
+
+    def _cells(self, bb):
+        i0 = int(math.floor(bb.XMin / self.size))
+        i1 = int(math.floor(bb.XMax / self.size))
+        j0 = int(math.floor(bb.YMin / self.size))
+        j1 = int(math.floor(bb.YMax / self.size))
+        return [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+
+    def edgesNear(self, bb):
+        '''edgesNear(bb) ... returns the indices of the edges whose bounding box intersects bb.'''
+        found = set()
+        for cell in self._cells(bb):
+            found.update(self.cells.get(cell, []))
+        return set(i for i in found if self.boxes[i].intersect(bb))
+
+
 class PathData:
     def __init__(self, obj):
         PathLog.track(obj.Base.Name)
@@ -561,6 +594,13 @@ class PathData:
         else:
             self.edges = []
         self.baseWire = self.findBottomWire(self.edges)
+        self.edgeIndex = _EdgeIndex(self.edges)
+
+    def edgesNear(self, tag):
+        '''edgesNear(tag) ... returns the indices of the edges which might intersect the solid of tag.'''
+        bb = FreeCAD.BoundBox(tag.solid.BoundBox)
+        bb.enlarge(PathGeom.Tolerance)
+        return self.edgeIndex.edgesNear(bb)
 
     def findBottomWire(self, edges):
         (minZ, maxZ) = self.findZLimits(edges)
@@ -775,6 +815,9 @@ class ObjectTagDressup:
         self.pathData = None
         self.toolRadius = None
         self.mappers = []
+        self.solidCache = {}
+        self.pathDigest = None
+        self.executedKey = None
 
         obj.Proxy = self
         obj.Base = base
@@ -789,6 +832,9 @@ class ObjectTagDressup:
         self.pathData = None
         self.toolRadius = None
         self.mappers = []
+        self.solidCache = {}
+        self.pathDigest = None
+        self.executedKey = None
         return None
 
     def onDocumentRestored(self, obj):
@@ -859,6 +905,13 @@ class ObjectTagDressup:
         self.mappers = []
         mapper = None
 
+        # a tag can only intersect the edges near it
+        nearTags = [[] for e in pathData.edges]
+        for (tIndex, tag) in enumerate(tags):
+            for i in tag.nearEdges if tag.nearEdges is not None else range(len(nearTags)):
+                nearTags[i].append(tIndex)
+        nearTags = [set(near) for near in nearTags]
+
         tc = PathDressup.toolController(obj.Base)
         horizFeed = tc.HorizFeed.Value
         vertFeed = tc.VertFeed.Value
@@ -885,7 +938,9 @@ class ObjectTagDressup:
             if edge:
                 tIndex = (t + lastTag) % len(tags)
                 t += 1
-                i = tags[tIndex].intersects(edge, edge.FirstParameter)
+                i = None
+                if tIndex in nearTags[lastEdge - 1]:
+                    i = tags[tIndex].intersects(edge, edge.FirstParameter)
                 if i and self.isValidTagStartIntersection(edge, i):
                     mapper = MapWireToTag(edge, tags[tIndex], i, segm, pathData.maxZ, hSpeed = horizFeed, vSpeed = vertFeed)
                     self.mappers.append(mapper)
@@ -912,12 +967,28 @@ class ObjectTagDressup:
     def problems(self):
         return list([m for m in self.mappers if m.haveProblem])
 
+    def createTagSolids(self, tag, solidCache):
+        '''createTagSolids(tag, solidCache) ... creates the solids of tag, or takes them from an
+        identical tag of the previous execution, and adds them to solidCache.'''
+        key = (tag.x, tag.y, tag.width, tag.height, tag.angle, tag.radius.Value, self.pathData.minZ, self.toolRadius)
+        cached = getattr(self, 'solidCache', {}).get(key)
+        if cached is None:
+            tag.createSolidsAt(self.pathData.minZ, self.toolRadius)
+            tag.nearEdges = self.pathData.edgesNear(tag)
+        else:
+            for attr in ['z', 'toolRadius', 'r1', 'r2', 'actualHeight', 'isSquare', 'realRadius', 'solid', 'nearEdges']:
+                setattr(tag, attr, getattr(cached, attr))
+        solidCache[key] = tag
+
     def createTagsPositionDisabled(self, obj, positionsIn, disabledIn):
         rawTags = []
+        solidCache = {}
         for i, pos in enumerate(positionsIn):
             tag = Tag(i, pos.x, pos.y, obj.Width.Value, obj.Height.Value, obj.Angle, obj.Radius, not i in disabledIn)
-            tag.createSolidsAt(self.pathData.minZ, self.toolRadius)
+            self.createTagSolids(tag, solidCache)
             rawTags.append(tag)
+        # only keep the solids of the current tags
+        self.solidCache = solidCache
         # disable all tags that intersect with their previous tag
         prev = None
         tags = []
@@ -926,7 +997,7 @@ class ObjectTagDressup:
         for i, tag in enumerate(self.pathData.sortedTags(rawTags)):
             if tag.enabled:
                 if prev:
-                    if prev.solid.common(tag.solid).Faces:
+                    if prev.solid.BoundBox.intersect(tag.solid.BoundBox) and prev.solid.common(tag.solid).Faces:
                         PathLog.info("Tag #%d intersects with previous tag - disabling\n" % i)
                         PathLog.debug("this tag = %d [%s]" % (i, tag.solid.BoundBox))
                         tag.enabled = False
@@ -966,6 +1037,11 @@ class ObjectTagDressup:
         if not obj.Base.Path.Commands:
             return
 
+        key = PathDressup.dressupKey(obj)
+        if key is not None and key == getattr(self, 'executedKey', None) and self.pathData:
+            PathLog.debug("execute - base path and tags unchanged")
+            return
+
         pathData = self.setup(obj)
         if not pathData:
             PathLog.debug("execute - no pathData")
@@ -982,6 +1058,7 @@ class ObjectTagDressup:
         if not self.tags:
             PathLog.debug("execute - no tags")
             obj.Path = obj.Base.Path
+            self.executedKey = PathDressup.dressupKey(obj)
             return
 
         try:
@@ -1004,6 +1081,7 @@ class ObjectTagDressup:
         self.solids = solids
         if obj.Disabled != disabled:
             obj.Disabled = disabled
+        self.executedKey = PathDressup.dressupKey(obj)
 
     @waiting_effects
     def processTags(self, obj):
@@ -1026,8 +1104,15 @@ class ObjectTagDressup:
     def setup(self, obj, generate=False):
         PathLog.debug("setup")
         self.obj = obj
+        digest = PathUtil.pathDigest(obj.Base.Path)
         try:
-            pathData = PathData(obj)
+            if self.pathData and digest == getattr(self, 'pathDigest', None):
+                # the base path didn't change, neither did its edges
+                pathData = self.pathData
+            else:
+                pathData = PathData(obj)
+                self.solidCache = {}
+                self.pathDigest = digest
         except ValueError:
             PathLog.error(translate("Path_DressupTag", "Cannot insert holding tags for this path - please select a Profile path")+"\n")
             #if sys.version_info.major < 3:
@@ -108,8 +108,13 @@ class ObjectDressup:
         if obj.Length < 0:
             PathLog.error(translate("Length/Radius positive not Null")+"\n")
             obj.Length = 0.1
+        key = PathDressup.dressupKey(obj)
+        if key is not None and key == getattr(self, 'executedKey', None):
+            PathLog.debug("base path and parameters unchanged")
+            return
         self.wire, self.rapids = PathGeom.wireForPath(obj.Base.Path)
         obj.Path = self.generateLeadInOutCurve(obj)
+        self.executedKey = key
 
     def getDirectionOfPath(self, obj):
         op = PathDressup.baseOp(obj.Base)
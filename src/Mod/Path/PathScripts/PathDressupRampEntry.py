@@ -163,6 +163,7 @@ class ObjectDressup:
         if not obj.Base.Active:
             path = Path.Path("(inactive operation)")
             obj.Path = path
+            self.executedKey = None
             return
 
         if obj.Angle >= 90:
@@ -177,6 +178,11 @@ class ObjectDressup:
             self.ignoreAboveEnabled = False
             self.ignoreAbove = 0
 
+        key = PathDressup.dressupKey(obj)
+        if key is not None and key == getattr(self, "executedKey", None):
+            PathLog.debug("base path and parameters unchanged")
+            return
+
         self.angle = obj.Angle
         self.method = obj.Method
         self.wire, self.rapids = PathGeom.wireForPath(obj.Base.Path)
@@ -185,6 +191,7 @@ class ObjectDressup:
         else:
             self.outedges = self.generateHelix()
         obj.Path = self.createCommands(obj, self.outedges)
+        self.executedKey = key
 
     def generateRamps(self, allowBounce=True):
         edges = self.wire.Edges
@@ -84,7 +84,7 @@ class ObjectDrilling(PathCircularHoleBase.ObjectOp):
         elif obj.ExtraOffset == '2x Drill Tip':
             tiplength = PathUtils.drillTipLength(self.tool) * 2
 
-        holes = PathUtils.sort_jobs(holes, ['x', 'y'])
+        holes = self.sortHoles(holes)
         self.commandlist.append(Path.Command('G90'))
         self.commandlist.append(Path.Command(obj.ReturnLevel))
 
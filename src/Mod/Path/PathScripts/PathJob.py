@@ -23,6 +23,7 @@
 from PathScripts.PathPostProcessor import PostProcessor
 from PySide import QtCore
 import FreeCAD
+import PathScripts.PathCycleTime as PathCycleTime
 import PathScripts.PathLog as PathLog
 import PathScripts.PathPreferences as PathPreferences
 import PathScripts.PathSetupSheet as PathSetupSheet
@@ -30,7 +31,6 @@ import PathScripts.PathStock as PathStock
 import PathScripts.PathToolController as PathToolController
 import PathScripts.PathUtil as PathUtil
 import json
-import time
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -573,37 +573,14 @@ class ObjectJob:
             self.getCycleTime()
 
     def getCycleTime(self):
+        """getCycleTime() ... updates CycleTime with the sum of the active operations' estimates and returns it in seconds."""
         seconds = 0
-
         if len(self.obj.Operations.Group):
-            for op in self.obj.Operations.Group:
-
-                # Skip inactive operations
-                if PathUtil.opProperty(op, "Active") is False:
-                    continue
-
-                # Skip operations that don't have a cycletime attribute
-                if PathUtil.opProperty(op, "CycleTime") is None:
-                    continue
-
-                formattedCycleTime = PathUtil.opProperty(op, "CycleTime")
-                opCycleTime = 0
-                try:
-                    # Convert the formatted time from HH:MM:SS to just seconds
-                    opCycleTime = sum(
-                        x * int(t)
-                        for x, t in zip(
-                            [1, 60, 3600], reversed(formattedCycleTime.split(":"))
-                        )
-                    )
-                except Exception:
-                    continue
-
-                if opCycleTime > 0:
-                    seconds = seconds + opCycleTime
+            # the estimates of unchanged operations are cached
+            seconds = PathCycleTime.jobCycleTime(self.obj)[0]
 
-        cycleTimeString = time.strftime("%H:%M:%S", time.gmtime(seconds))
-        self.obj.CycleTime = cycleTimeString
+        self.obj.CycleTime = PathCycleTime.formatTime(seconds)
+        return seconds
 
     def addOperation(self, op, before=None, removeBefore=False):
         group = self.obj.Operations.Group
@@ -20,12 +20,11 @@
 # *                                                                         *
 # ***************************************************************************
 
-import time
-
 from PySide import QtCore
 
 from PathScripts.PathUtils import waiting_effects
 import Path
+import PathScripts.PathCycleTime as PathCycleTime
 import PathScripts.PathGeom as PathGeom
 import PathScripts.PathLog as PathLog
 import PathScripts.PathPreferences as PathPreferences
@@ -805,16 +804,24 @@ class ObjectOp(object):
                 )
             )
 
-        # Get the cycle time in seconds
-        seconds = obj.Path.getCycleTime(hFeedrate, vFeedrate, hRapidrate, vRapidrate)
+        if hFeedrate == 0 or vFeedrate == 0:
+            return translate("Path", "Cycletime Error")
 
-        if not seconds:
+        # Get the cycle time in seconds, the estimate is cached for the job
+        estimate = PathCycleTime.pathCycleTime(
+            obj.Path,
+            hFeedrate,
+            vFeedrate,
+            hRapidrate,
+            vRapidrate,
+            PathCycleTime.machineLimits(self.job),
+        )
+
+        if not estimate.seconds:
             return translate("Path", "Cycletime Error")
 
         # Convert the cycle time to a HH:MM:SS format
-        cycleTime = time.strftime("%H:%M:%S", time.gmtime(seconds))
-
-        return cycleTime
+        return PathCycleTime.formatTime(estimate.seconds)
 
     def addBase(self, obj, base, sub):
         PathLog.track(obj, base, sub)
@@ -56,6 +56,10 @@ UseAbsoluteToolPaths            = "UseAbsoluteToolPaths"
 # Linear tolerance to use when generating Paths, eg when tessellating geometry
 GeometryTolerance               = "GeometryTolerance"
 LibAreaCurveAccuracy            = "LibAreaCurveAccuarcy"
+# Seconds spent on shortening the rapid moves between holes, 0 disables it
+HoleOrderOptimizeTime           = "HoleOrderOptimizeTime"
+# Number of threads for the OpenCamLib drop cutter scans, 0 uses all processors
+OclScanThreads                  = "OclScanThreads"
 
 WarningSuppressRapidSpeeds      = "WarningSuppressRapidSpeeds"
 WarningSuppressAllSpeeds        = "WarningSuppressAllSpeeds"
@@ -116,6 +120,14 @@ def defaultLibAreaCurveAccuracy():
     return preferences().GetFloat(LibAreaCurveAccuracy, 0.01)
 
 
+def holeOrderOptimizeTime():
+    return preferences().GetFloat(HoleOrderOptimizeTime, 0.0)
+
+
+def oclScanThreads():
+    return preferences().GetInt(OclScanThreads, 0)
+
+
 def defaultFilePath():
     return preferences().GetString(DefaultFilePath)
 
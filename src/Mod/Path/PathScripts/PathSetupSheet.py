@@ -47,6 +47,11 @@ class Template:
 
     HorizRapid = 'HorizRapid'
     VertRapid = 'VertRapid'
+    HorizAcceleration = 'HorizAcceleration'
+    VertAcceleration = 'VertAcceleration'
+    HorizJerk = 'HorizJerk'
+    VertJerk = 'VertJerk'
+    JunctionDeviation = 'JunctionDeviation'
     CoolantMode = 'CoolantMode'
     SafeHeightOffset = 'SafeHeightOffset'
     SafeHeightExpression = 'SafeHeightExpression'
@@ -59,7 +64,7 @@ class Template:
     OrderOutputBy = 'OrderOutputBy'
     SplitOutput = 'SplitOutput'
 
-    All = [HorizRapid, VertRapid, CoolantMode, SafeHeightOffset, SafeHeightExpression, ClearanceHeightOffset, ClearanceHeightExpression, StartDepthExpression, FinalDepthExpression, StepDownExpression]
+    All = [HorizRapid, VertRapid, HorizAcceleration, VertAcceleration, HorizJerk, VertJerk, JunctionDeviation, CoolantMode, SafeHeightOffset, SafeHeightExpression, ClearanceHeightOffset, ClearanceHeightExpression, StartDepthExpression, FinalDepthExpression, StepDownExpression]
 
 
 def _traverseTemplateAttributes(attrs, codec):
@@ -101,6 +106,7 @@ class SetupSheet:
         self.obj = obj
         obj.addProperty('App::PropertySpeed', 'VertRapid', 'ToolController', translate('PathSetupSheet', 'Default speed for horizontal rapid moves.'))
         obj.addProperty('App::PropertySpeed', 'HorizRapid', 'ToolController', translate('PathSetupSheet', 'Default speed for vertical rapid moves.'))
+        self.setupMachineProperties(obj)
 
         obj.addProperty('App::PropertyStringList', 'CoolantModes', 'CoolantMode', translate('PathSetupSheet', 'Coolant Modes'))
         obj.addProperty('App::PropertyEnumeration', 'CoolantMode', 'CoolantMode', translate('PathSetupSheet', 'Default coolant mode.'))
@@ -128,6 +134,19 @@ class SetupSheet:
 
         obj.Proxy = self
 
+    def setupMachineProperties(self, obj):
+        '''setupMachineProperties(obj) ... adds the machine limits used for the cycle time estimates, 0 means unlimited.'''
+        if not hasattr(obj, 'HorizAcceleration'):
+            obj.addProperty('App::PropertyAcceleration', 'HorizAcceleration', 'Machine', translate('PathSetupSheet', 'Maximum acceleration of the X and Y axis, 0 for no limit.'))
+        if not hasattr(obj, 'VertAcceleration'):
+            obj.addProperty('App::PropertyAcceleration', 'VertAcceleration', 'Machine', translate('PathSetupSheet', 'Maximum acceleration of the Z axis, 0 for no limit.'))
+        if not hasattr(obj, 'HorizJerk'):
+            obj.addProperty('App::PropertyFloat', 'HorizJerk', 'Machine', translate('PathSetupSheet', 'Maximum jerk of the X and Y axis in mm/s^3, 0 for no limit.'))
+        if not hasattr(obj, 'VertJerk'):
+            obj.addProperty('App::PropertyFloat', 'VertJerk', 'Machine', translate('PathSetupSheet', 'Maximum jerk of the Z axis in mm/s^3, 0 for no limit.'))
+        if not hasattr(obj, 'JunctionDeviation'):
+            obj.addProperty('App::PropertyLength', 'JunctionDeviation', 'Machine', translate('PathSetupSheet', 'Deviation from the path the machine allows at the junction of two moves, limits the speed at corners, 0 for no limit.'))
+
     def __getstate__(self):
         return None
 
@@ -194,6 +213,11 @@ class SetupSheet:
         if includeRapids:
             attrs[Template.VertRapid] = self.obj.VertRapid.UserString
             attrs[Template.HorizRapid] = self.obj.HorizRapid.UserString
+            attrs[Template.HorizAcceleration] = self.obj.HorizAcceleration.UserString
+            attrs[Template.VertAcceleration] = self.obj.VertAcceleration.UserString
+            attrs[Template.HorizJerk] = self.obj.HorizJerk
+            attrs[Template.VertJerk] = self.obj.VertJerk
+            attrs[Template.JunctionDeviation] = self.obj.JunctionDeviation.UserString
 
         if includeCoolantMode:
             attrs[Template.CoolantMode] = self.obj.CoolantMode
@@ -291,6 +315,8 @@ class SetupSheet:
             obj.addProperty('App::PropertyEnumeration', 'CoolantMode', 'CoolantMode', translate('PathSetupSheet', 'Default coolant mode.'))
             obj.CoolantMode = self.DefaultCoolantModes
 
+        self.setupMachineProperties(obj)
+
 
 def Create(name='SetupSheet'):
     obj = FreeCAD.ActiveDocument.addObject('App::FeaturePython', name)
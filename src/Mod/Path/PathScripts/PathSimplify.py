@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import numpy
+
+__title__ = "PathSimplify - simplification of dense point sets"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+__doc__ = "Functions to reduce dense tool paths, like drop cutter results, to lines and arcs within a tolerance."
+
+# All functions take the points as numpy array of shape (N, 3), anything else
+# numpy can convert, or a list of FreeCAD.Vector, see asArray.
+
+
+def asArray(points):
+    """asArray(points) ... returns the points as float array of shape (N, 3).
+    Accepts arrays, sequences of coordinate tuples and lists of FreeCAD.Vector."""
+    if isinstance(points, numpy.ndarray):
+        return points.astype(float, copy=False).reshape(-1, 3)
+    if len(points) and hasattr(points[0], "x"):
+        return numpy.array([(p.x, p.y, p.z) for p in points], dtype=float).reshape(-1, 3)
+    return numpy.array(points, dtype=float).reshape(-1, 3)
+
+
+def segmentDistances(points, start, end):
+    """segmentDistances(points, start, end) ... returns the distance of every point
+    to the line segment from start to end."""
+    d = end - start
+    length2 = d.dot(d)
+    if length2 == 0.0:
+        return numpy.sqrt(((points - start) ** 2).sum(axis=1))
+    t = numpy.clip((points - start).dot(d) / length2, 0.0, 1.0)
+    closest = start + t[:, None] * d
+    return numpy.sqrt(((points - closest) ** 2).sum(axis=1))
+
+
+def rdpIndices(points, tolerance):
+    """rdpIndices(points, tolerance) ... returns the indices of the points kept by the
+    Ramer-Douglas-Peucker algorithm, the simplified line deviates at most tolerance
+    from the original one. The first and last point are always kept."""
+    pts = asArray(points)
+    count = len(pts)
+    if count < 3:
+        return numpy.arange(count)
+    keep = numpy.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dist = segmentDistances(pts[start + 1:end], pts[start], pts[end])
+        i = int(numpy.argmax(dist))
+        if dist[i] > tolerance:
+            i += start + 1
+            keep[i] = True
+            stack.append((i, end))
+            stack.append((start, i))
+    return numpy.flatnonzero(keep)
+
+
+def rdp(points, tolerance):
+    """rdp(points, tolerance) ... returns the array of points kept by rdpIndices."""
+    pts = asArray(points)
+    return pts[rdpIndices(pts, tolerance)]
+
+
+def mergeCollinear(points, tolerance=1e-9):
+    """mergeCollinear(points, tolerance=1e-9) ... removes duplicate points and points
+    lying within tolerance on the segment between their neighbours. Each point is only
+    compared with its direct neighbours, so the deviation of the result is bounded by
+    the number of merged points times tolerance; use rdp for larger tolerances."""
+    pts = asArray(points)
+    if len(pts) < 3:
+        return pts
+    # duplicate points first, they have no direction
+    same = numpy.all(pts[1:] == pts[:-1], axis=1)
+    if same.any():
+        pts = pts[numpy.concatenate(([True], ~same))]
+        if len(pts) < 3:
+            return pts
+    prev = pts[:-2]
+    nxt = pts[2:]
+    d = nxt - prev
+    length2 = (d ** 2).sum(axis=1)
+    t = ((pts[1:-1] - prev) * d).sum(axis=1) / numpy.where(length2 > 0.0, length2, 1.0)
+    offset = pts[1:-1] - (prev + t[:, None] * d)
+    onSegment = (t > 0.0) & (t < 1.0) & ((offset ** 2).sum(axis=1) <= tolerance * tolerance)
+    return pts[numpy.concatenate(([True], ~onSegment, [True]))]
+
+
+def _fitCircle(p1, p2, p3):
+    # center and radius of the circle through three points in the XY plane
+    ax, ay = p1[0], p1[1]
+    bx, by = p2[0], p2[1]
+    cx, cy = p3[0], p3[1]
+    det = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if det == 0.0:
+        return None
+    a2 = ax * ax + ay * ay
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / det
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / det
+    return (ux, uy, math.hypot(ax - ux, ay - uy))
+
+
+def _fitArc(pts, tolerance, maxRadius):
+    # Returns (ccw, center) if all points lie within tolerance on one arc in the XY plane
+    # with a linear change of Z over the angle (helix), None otherwise.
+    circle = _fitCircle(pts[0], pts[len(pts) // 2], pts[-1])
+    if circle is None or circle[2] > maxRadius or circle[2] <= tolerance:
+        return None
+    (ux, uy, radius) = circle
+    dx = pts[:, 0] - ux
+    dy = pts[:, 1] - uy
+    if numpy.abs(numpy.hypot(dx, dy) - radius).max() > tolerance:
+        return None
+    steps = numpy.diff(numpy.unwrap(numpy.arctan2(dy, dx)))
+    if not (numpy.all(steps > 0.0) or numpy.all(steps < 0.0)):
+        return None
+    angles = numpy.concatenate(([0.0], numpy.cumsum(steps)))
+    sweep = angles[-1]
+    if abs(sweep) >= 2.0 * math.pi - 1e-6:
+        return None
+    z = pts[0, 2] + (pts[-1, 2] - pts[0, 2]) * angles / sweep
+    if numpy.abs(pts[:, 2] - z).max() > tolerance:
+        return None
+    return (sweep > 0.0, (ux, uy))
+
+
+def fitArcs(points, tolerance, minPoints=5, maxRadius=1e4):
+    """fitArcs(points, tolerance, minPoints=5, maxRadius=1e4) ... replaces runs of at
+    least minPoints points lying within tolerance on an arc in the XY plane by the arc.
+    The Z value may change linearly over the arc, which is a helix in G-code.
+    Returns a list of moves, each either ('G1', end) or ('G2'|'G3', end, center),
+    end and center are coordinate tuples, center holds X and Y only. The start is
+    points[0], which is not part of the result."""
+    pts = asArray(points)
+    count = len(pts)
+    moves = []
+    i = 0
+    while i < count - 1:
+        # exponential search for the longest run fitting an arc, refined by bisection
+        best = None
+        lo = i + minPoints - 1
+        if lo < count and _fitArc(pts[i:lo + 1], tolerance, maxRadius) is not None:
+            best = lo
+            step = minPoints
+            hi = None
+            while hi is None:
+                j = min(best + step, count - 1)
+                if j == best:
+                    break
+                if _fitArc(pts[i:j + 1], tolerance, maxRadius) is not None:
+                    best = j
+                    step *= 2
+                else:
+                    hi = j
+            while hi is not None and hi - best > 1:
+                j = (best + hi) // 2
+                if _fitArc(pts[i:j + 1], tolerance, maxRadius) is not None:
+                    best = j
+                else:
+                    hi = j
+        if best is None:
+            moves.append(("G1", tuple(pts[i + 1])))
+            i += 1
+        else:
+            (ccw, center) = _fitArc(pts[i:best + 1], tolerance, maxRadius)
+            moves.append(("G3" if ccw else "G2", tuple(pts[best]), center))
+            i = best
+    return moves
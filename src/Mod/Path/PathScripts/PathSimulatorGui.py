@@ -31,6 +31,7 @@ import PathScripts.PathJob as PathJob
 import PathSimulator
 import math
 import os
+import time
 
 from FreeCAD import Vector, Base
 
@@ -45,6 +46,9 @@ if FreeCAD.GuiUp:
 
 _filePath = os.path.dirname(os.path.abspath(__file__))
 
+# Seconds spent on applying commands per timer tick when fast forwarding
+FastForwardSlice = 0.1
+
 
 class CAMSimTaskUi:
     def __init__(self, parent):
@@ -342,7 +346,12 @@ class PathSimulation:
 
     def PerformCut(self):
         if (self.isVoxel):
+            # without animation apply as many commands as fit into one time slice,
+            # a single command per timer tick limits the speed to the timer rate
+            end = time.time() + FastForwardSlice
             self.PerformCutVoxel()
+            while self.disableAnim and not self.resetSimulation and time.time() < end:
+                self.PerformCutVoxel()
         else:
             self.PerformCutBoolean()
 
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import math
+import numpy
+
+import PathScripts.PathLog as PathLog
+import PathScripts.PathUtil as PathUtil
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+Mesh = LazyLoader('Mesh', globals(), 'Mesh')
+
+__title__ = "PathStockSim - headless stock simulation"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+__doc__ = "Height map simulation of the material removal of a Job, without the GUI."
+
+# The stock is a height map, one Z value per cell of a regular XY grid, which
+# is exact for 3 axis milling with the tool axis along Z. All moves of a batch
+# are applied at once with numpy: every move lowers the cells it covers to the
+# lowest Z the tool bottom reaches above that cell.
+#
+#   sim = PathStockSim.Simulation(job.Stock.Shape.BoundBox, 0.2)
+#   sim.simulateJob(job)
+#   Mesh.show(sim.mesh())
+
+PathLog.setLevel(PathLog.Level.INFO, PathLog.thisModule())
+# PathLog.trackModule(PathLog.thisModule())
+
+# Number of cells evaluated at once, bounds the memory used by a batch
+CellBudget = 1 << 21
+# Number of cells along the side of a mesh tile
+TileSize = 64
+
+
+class ToolProfile(object):
+    '''ToolProfile(radius, radii=None, heights=None) ... the shape of a tool as the height
+    of its bottom above the tip at the given distances from the tool axis. Without radii
+    the tool is a flat end mill.'''
+
+    def __init__(self, radius, radii=None, heights=None):
+        self.radius = radius
+        self.isFlat = radii is None
+        if self.isFlat:
+            radii = [0.0, radius]
+            heights = [0.0, 0.0]
+        self.radii = numpy.asarray(radii, dtype=float)
+        self.heights = numpy.asarray(heights, dtype=float)
+
+    def heightAt(self, distance):
+        '''heightAt(distance) ... returns the height of the tool bottom at distance, which
+        can be a numpy array.'''
+        if self.isFlat:
+            return numpy.zeros_like(distance)
+        return numpy.interp(distance, self.radii, self.heights)
+
+
+def _profile(radius, height, samples=64):
+    radii = numpy.linspace(0.0, radius, samples)
+    return ToolProfile(radius, radii, height(radii))
+
+
+def ballProfile(radius):
+    '''ballProfile(radius) ... returns the profile of a ball end mill.'''
+    return _profile(radius, lambda r: radius - numpy.sqrt(numpy.maximum(radius * radius - r * r, 0.0)))
+
+
+def bullnoseProfile(radius, flatRadius):
+    '''bullnoseProfile(radius, flatRadius) ... returns the profile of an end mill with a
+    corner radius of radius - flatRadius.'''
+    corner = radius - flatRadius
+    if corner <= 0.0:
+        return ToolProfile(radius)
+
+    def height(r):
+        d = numpy.maximum(r - flatRadius, 0.0)
+        return corner - numpy.sqrt(numpy.maximum(corner * corner - d * d, 0.0))
+    return _profile(radius, height)
+
+
+def vbitProfile(radius, angle, flatRadius=0.0):
+    '''vbitProfile(radius, angle, flatRadius=0.0) ... returns the profile of a v-bit, drill
+    or chamfer mill with the included tip angle in degrees.'''
+    if angle <= 0.0 or angle >= 180.0:
+        return ToolProfile(radius)
+    slope = 1.0 / math.tan(math.radians(angle / 2.0))
+    return ToolProfile(radius, [0.0, flatRadius, radius], [0.0, 0.0, (radius - flatRadius) * slope])
+
+
+def _toolValue(tool, name, default=0.0):
+    if hasattr(tool, name):
+        return float(getattr(tool, name))
+    return default
+
+
+def toolProfile(tool):
+    '''toolProfile(tool) ... returns the ToolProfile of a ToolBit or legacy tool.'''
+    radius = float(tool.Diameter) / 2.0
+    if hasattr(tool, 'ShapeName'):
+        shape = tool.ShapeName.lower()
+    else:
+        shape = getattr(tool, 'ToolType', 'EndMill').lower()
+    flatRadius = _toolValue(tool, 'FlatRadius')
+    if shape in ['ballend', 'ballendmill']:
+        return ballProfile(radius)
+    if shape == 'bullnose':
+        return bullnoseProfile(radius, flatRadius)
+    if shape in ['drill', 'centerdrill', 'countersink']:
+        angle = _toolValue(tool, 'TipAngle', _toolValue(tool, 'CuttingEdgeAngle', 118.0))
+        return vbitProfile(radius, angle)
+    if shape in ['v-bit', 'chamfer', 'chamfermill', 'engraver']:
+        return vbitProfile(radius, _toolValue(tool, 'CuttingEdgeAngle', 90.0), flatRadius)
+    if shape == 'cornerround':
+        return bullnoseProfile(radius, radius - _toolValue(tool, 'CornerRadius'))
+    return ToolProfile(radius)
+
+
+class HeightMap(object):
+    '''HeightMap(boundBox, resolution, tileSize=TileSize) ... box shaped stock as a grid of
+    cells of size resolution, each holding the Z value of the top of the material.
+    The triangles of the surface are cached per tile of tileSize x tileSize cells, only
+    tiles with changed cells are triangulated again.'''
+
+    def __init__(self, boundBox, resolution, tileSize=TileSize):
+        self.xmin, self.ymin, self.zmin = boundBox.XMin, boundBox.YMin, boundBox.ZMin
+        self.xmax, self.ymax, self.zmax = boundBox.XMax, boundBox.YMax, boundBox.ZMax
+        self.resolution = resolution
+        self.nx = max(1, int(math.ceil(boundBox.XLength / resolution)))
+        self.ny = max(1, int(math.ceil(boundBox.YLength / resolution)))
+        self.z = numpy.full((self.nx, self.ny), float(self.zmax))
+        # the mesh vertices are at the cell centers, except for the border ones
+        # which are moved onto the faces of the stock
+        self.vx = numpy.clip(self.xmin + (numpy.arange(self.nx) + 0.5) * resolution, self.xmin, self.xmax)
+        self.vy = numpy.clip(self.ymin + (numpy.arange(self.ny) + 0.5) * resolution, self.ymin, self.ymax)
+        self.vx[0], self.vx[-1] = self.xmin, self.xmax
+        self.vy[0], self.vy[-1] = self.ymin, self.ymax
+        self.tileSize = tileSize
+        self.tiles = {}
+        self.dirty = numpy.ones(((self.nx - 1) // tileSize + 1, (self.ny - 1) // tileSize + 1), dtype=bool)
+
+    def cellIndex(self, x, y):
+        '''cellIndex(x, y) ... returns the indices of the cell at x, y.'''
+        i = min(max(int((x - self.xmin) / self.resolution), 0), self.nx - 1)
+        j = min(max(int((y - self.ymin) / self.resolution), 0), self.ny - 1)
+        return (i, j)
+
+    def heightAt(self, x, y):
+        '''heightAt(x, y) ... returns the height of the material at x, y.'''
+        return float(self.z[self.cellIndex(x, y)])
+
+    def removedVolume(self):
+        '''removedVolume() ... returns the volume of the material removed so far.'''
+        return float((self.zmax - self.z).sum()) * self.resolution * self.resolution
+
+    def applySegments(self, segments, profile):
+        '''applySegments(segments, profile) ... removes the material swept by the tool along
+        the linear moves in segments, an array of shape (N, 2, 3) holding start and end
+        point of each move. Returns a boolean array, True for the moves which removed
+        material.'''
+        segments = numpy.asarray(segments, dtype=float).reshape(-1, 2, 3)
+        result = numpy.zeros(len(segments), dtype=bool)
+        origin = numpy.arange(len(segments))
+        if not profile.isFlat:
+            (segments, origin) = _splitSteep(segments, self.resolution / 4.0)
+        if not len(segments):
+            return result
+        r = profile.radius
+        res = self.resolution
+        lo = segments.min(axis=1)
+        hi = segments.max(axis=1)
+        # range of cell centers within the tool radius of each move
+        i0 = numpy.maximum(numpy.ceil((lo[:, 0] - r - self.xmin) / res - 0.5), 0).astype(int)
+        i1 = numpy.minimum(numpy.floor((hi[:, 0] + r - self.xmin) / res - 0.5), self.nx - 1).astype(int)
+        j0 = numpy.maximum(numpy.ceil((lo[:, 1] - r - self.ymin) / res - 0.5), 0).astype(int)
+        j1 = numpy.minimum(numpy.floor((hi[:, 1] + r - self.ymin) / res - 0.5), self.ny - 1).astype(int)
+        # moves above the stock or outside of it don't remove anything
+        active = (i1 >= i0) & (j1 >= j0) & (lo[:, 2] < self.zmax)
+        if not active.any():
+            return result
+        segments, i0, i1, j0, j1 = segments[active], i0[active], i1[active], j0[active], j1[active]
+        origin = origin[active]
+        counts = (i1 - i0 + 1) * (j1 - j0 + 1)
+
+        cutting = numpy.zeros(len(segments), dtype=bool)
+        start = 0
+        ends = numpy.cumsum(counts)
+        while start < len(segments):
+            base = ends[start - 1] if start else 0
+            end = max(start + 1, int(numpy.searchsorted(ends, base + CellBudget, side='right')))
+            batch = slice(start, end)
+            cutting[batch] = self._applyBatch(segments[batch], i0[batch], j0[batch],
+                                              (j1 - j0 + 1)[batch], counts[batch], profile)
+            start = end
+        self._markDirty(i0[cutting], i1[cutting], j0[cutting], j1[cutting])
+        result[origin[cutting]] = True
+        return result
+
+    def _applyBatch(self, segments, i0, j0, ny, counts, profile):
+        # one entry per cell and move, seg is the index of the move
+        total = int(counts.sum())
+        seg = numpy.repeat(numpy.arange(len(segments)), counts)
+        k = numpy.arange(total) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        ci = i0[seg] + k // ny[seg]
+        cj = j0[seg] + k % ny[seg]
+        qx = self.xmin + (ci + 0.5) * self.resolution - segments[seg, 0, 0]
+        qy = self.ymin + (cj + 0.5) * self.resolution - segments[seg, 0, 1]
+
+        d = segments[:, 1] - segments[:, 0]
+        l2 = d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1]
+        moving = l2 > 0.0
+        safe = numpy.where(moving, l2, 1.0)[seg]
+        dx, dy = d[seg, 0], d[seg, 1]
+        tp = (qx * dx + qy * dy) / safe
+        # the tool covers the cell for t in [tp - w, tp + w], plunges cover it all the time
+        perp2 = qx * qx + qy * qy - tp * tp * safe
+        r2 = profile.radius * profile.radius
+        w = numpy.sqrt(numpy.maximum(r2 - perp2, 0.0) / safe)
+        w[~moving[seg]] = 1.0
+        inside = (perp2 <= r2) & (tp - w <= 1.0) & (tp + w >= 0.0)
+        seg, qx, qy, dx, dy, tp, w = seg[inside], qx[inside], qy[inside], dx[inside], dy[inside], tp[inside], w[inside]
+        idx = (ci * self.ny + cj)[inside]
+
+        z0 = segments[seg, 0, 2]
+        dz = d[seg, 2]
+        # the lowest point of a flat tool is at either end of the covered interval,
+        # curved tools are evaluated at the point of the move closest to the cell too
+        params = [tp - w, tp + w]
+        if not profile.isFlat:
+            params.append(tp)
+        zc = None
+        for t in params:
+            t = numpy.clip(t, 0.0, 1.0)
+            z = z0 + t * dz
+            if not profile.isFlat:
+                ex = qx - t * dx
+                ey = qy - t * dy
+                z += profile.heightAt(numpy.sqrt(ex * ex + ey * ey))
+            zc = z if zc is None else numpy.minimum(zc, z)
+
+        flat = self.z.reshape(-1)
+        zc = numpy.maximum(zc, self.zmin)
+        lower = zc < flat[idx]
+        if not lower.any():
+            return numpy.zeros(len(segments), dtype=bool)
+        # The moves are in order, a move only cuts a cell if it goes below all moves
+        # before it, otherwise eg the retract after a plunge would count as cutting.
+        # A stable sort keeps that order within the entries of each cell.
+        order = numpy.argsort(idx[lower], kind='stable')
+        idx, zc, seg = idx[lower][order], zc[lower][order], seg[lower][order]
+        first = numpy.ones(len(idx), dtype=bool)
+        first[1:] = idx[1:] != idx[:-1]
+        # running minimum per cell, the offset separates the cells
+        shifted = zc - (zc.max() - zc.min() + 1.0) * numpy.cumsum(first)
+        running = numpy.minimum.accumulate(shifted)
+        cuts = first.copy()
+        cuts[1:] |= shifted[1:] < running[:-1]
+        starts = numpy.flatnonzero(first)
+        flat[idx[starts]] = numpy.minimum.reduceat(zc, starts)
+        return numpy.bincount(seg[cuts], minlength=len(segments)) > 0
+
+    def _markDirty(self, i0, i1, j0, j1):
+        # a cell on the first row or column of a tile is also a vertex of the tile before
+        t = self.tileSize
+        ti0, ti1 = numpy.maximum(i0 - 1, 0) // t, i1 // t
+        tj0, tj1 = numpy.maximum(j0 - 1, 0) // t, j1 // t
+        small = (ti1 - ti0 <= 1) & (tj1 - tj0 <= 1)
+        for ti in (ti0[small], ti1[small]):
+            for tj in (tj0[small], tj1[small]):
+                self.dirty[ti, tj] = True
+        for (a, b, c, d) in zip(ti0[~small], ti1[~small], tj0[~small], tj1[~small]):
+            self.dirty[a:b + 1, c:d + 1] = True
+
+    def _tileTriangles(self, ti, tj):
+        t = self.tileSize
+        i0, i1 = ti * t, min((ti + 1) * t, self.nx - 1)
+        j0, j1 = tj * t, min((tj + 1) * t, self.ny - 1)
+        if i1 <= i0 or j1 <= j0:
+            return numpy.empty((0, 3, 3))
+        z = numpy.maximum(self.z[i0:i1 + 1, j0:j1 + 1], self.zmin)
+        x, y = numpy.meshgrid(self.vx[i0:i1 + 1], self.vy[j0:j1 + 1], indexing='ij')
+        v = numpy.stack((x, y, z), axis=-1)
+        p00, p10, p11, p01 = v[:-1, :-1], v[1:, :-1], v[1:, 1:], v[:-1, 1:]
+        tris = numpy.concatenate((numpy.stack((p00, p10, p11), axis=-2).reshape(-1, 3, 3),
+                                  numpy.stack((p00, p11, p01), axis=-2).reshape(-1, 3, 3)))
+        return tris
+
+    def _wall(self, u, z, fixed, axis, outward):
+        # vertical wall along one face of the stock from the surface down to zmin
+        n = len(u)
+        top = numpy.empty((n, 3))
+        bot = numpy.empty((n, 3))
+        top[:, axis], bot[:, axis] = u, u
+        top[:, 1 - axis], bot[:, 1 - axis] = fixed, fixed
+        top[:, 2] = numpy.maximum(z, self.zmin)
+        bot[:, 2] = self.zmin
+        a, b, c, d = bot[:-1], bot[1:], top[1:], top[:-1]
+        if outward:
+            first, second = numpy.stack((a, b, c), axis=1), numpy.stack((a, c, d), axis=1)
+        else:
+            first, second = numpy.stack((a, c, b), axis=1), numpy.stack((a, d, c), axis=1)
+        return numpy.concatenate((first, second))
+
+    def triangles(self):
+        '''triangles() ... returns the surface of the stock as array of shape (N, 3, 3).'''
+        for (ti, tj) in zip(*numpy.nonzero(self.dirty)):
+            self.tiles[(ti, tj)] = self._tileTriangles(ti, tj)
+        self.dirty[:] = False
+        parts = [self.tiles[key] for key in sorted(self.tiles)]
+        parts.append(self._wall(self.vx, self.z[:, 0], self.ymin, 0, True))
+        parts.append(self._wall(self.vx, self.z[:, -1], self.ymax, 0, False))
+        parts.append(self._wall(self.vy, self.z[0, :], self.xmin, 1, False))
+        parts.append(self._wall(self.vy, self.z[-1, :], self.xmax, 1, True))
+        (x0, y0, x1, y1, z) = (self.xmin, self.ymin, self.xmax, self.ymax, self.zmin)
+        parts.append(numpy.array([[(x0, y0, z), (x1, y1, z), (x1, y0, z)],
+                                  [(x0, y0, z), (x0, y1, z), (x1, y1, z)]]))
+        return numpy.concatenate(parts)
+
+    def mesh(self):
+        '''mesh() ... returns the surface of the stock as Mesh.Mesh.'''
+        return Mesh.Mesh(self.triangles().reshape(-1, 3).tolist())
+
+
+def _splitSteep(segments, step):
+    # For tools with a curved bottom the lowest point over a cell is only evaluated at
+    # the point of the move closest to the cell, which is exact for horizontal moves.
+    # Ramps are split so the error stays below the Z step of the pieces.
+    # Returns the pieces and the index of the segment each piece belongs to.
+    dz = numpy.abs(segments[:, 1, 2] - segments[:, 0, 2])
+    pieces = numpy.maximum(numpy.ceil(dz / step), 1).astype(int)
+    if (pieces == 1).all():
+        return (segments, numpy.arange(len(segments)))
+    seg = numpy.repeat(numpy.arange(len(segments)), pieces)
+    k = numpy.arange(len(seg)) - numpy.repeat(numpy.cumsum(pieces) - pieces, pieces)
+    start = segments[seg, 0]
+    d = (segments[seg, 1] - start) / pieces[seg][:, None]
+    return (numpy.stack((start + k[:, None] * d, start + (k[:, None] + 1) * d), axis=1), seg)
+
+
+def _arcPoints(start, end, center, ccw, tolerance):
+    # points along a G2/G3 arc in the XY plane, Z changes linearly (helix)
+    radius = math.hypot(start[0] - center[0], start[1] - center[1])
+    a0 = math.atan2(start[1] - center[1], start[0] - center[0])
+    a1 = math.atan2(end[1] - center[1], end[0] - center[0])
+    sweep = a1 - a0
+    if ccw and sweep <= 0.0:
+        sweep += 2 * math.pi
+    elif not ccw and sweep >= 0.0:
+        sweep -= 2 * math.pi
+    if radius > tolerance:
+        maxAngle = 2 * math.acos(max(1.0 - tolerance / radius, -1.0))
+        count = max(int(math.ceil(abs(sweep) / maxAngle)), 1)
+    else:
+        count = 1
+    a = a0 + sweep * numpy.arange(1, count + 1) / count
+    pts = numpy.empty((count, 3))
+    pts[:, 0] = center[0] + radius * numpy.cos(a)
+    pts[:, 1] = center[1] + radius * numpy.sin(a)
+    pts[:, 2] = start[2] + (end[2] - start[2]) * numpy.arange(1, count + 1) / count
+    pts[-1] = end
+    return pts
+
+
+def commandSegments(commands, position, tolerance):
+    '''commandSegments(commands, position, tolerance) ... returns the positions of the tool
+    for the given commands, starting at position, as array of shape (N, 3). Arcs are
+    split into lines deviating at most tolerance from the arc, drill cycles are expanded
+    like the simulator does. For each of the N - 1 moves between the positions the index
+    of its command and whether it is a rapid move are returned as second and third array.'''
+    pts = [tuple(position)]
+    owner = []
+    rapid = []
+    (x, y, z) = pts[0]
+    firstDrill = True
+    for (i, cmd) in enumerate(commands):
+        name = cmd.Name
+        count = len(pts)
+        if name in ['G0', 'G00', 'G1', 'G01', 'G2', 'G02', 'G3', 'G03']:
+            firstDrill = True
+            params = cmd.Parameters
+            end = (params.get('X', x), params.get('Y', y), params.get('Z', z))
+            if name in ['G2', 'G02', 'G3', 'G03']:
+                center = (x + params.get('I', 0.0), y + params.get('J', 0.0))
+                pts.extend(map(tuple, _arcPoints((x, y, z), end, center, name in ['G3', 'G03'], tolerance)))
+            else:
+                pts.append(end)
+            rapid.extend([name in ['G0', 'G00']] * (len(pts) - count))
+            (x, y, z) = end
+        elif name == 'G80':
+            firstDrill = True
+        elif name in ['G81', 'G82', 'G83']:
+            params = cmd.Parameters
+            hx, hy = params.get('X', x), params.get('Y', y)
+            r = params.get('R', z)
+            if firstDrill:
+                pts.append((x, y, r))
+                rapid.append(True)
+                firstDrill = False
+            pts.append((hx, hy, r))
+            pts.append((hx, hy, params.get('Z', z)))
+            pts.append((hx, hy, r))
+            rapid.extend([True, False, True])
+            (x, y, z) = (hx, hy, r)
+        owner.extend([i] * (len(pts) - count))
+    return (numpy.array(pts, dtype=float), numpy.array(owner, dtype=int), numpy.array(rapid, dtype=bool))
+
+
+def commandPoints(commands, position, tolerance):
+    '''commandPoints(commands, position, tolerance) ... returns the positions of the tool
+    for the given commands, see commandSegments.'''
+    return commandSegments(commands, position, tolerance)[0]
+
+
+class Simulation(object):
+    '''Simulation(boundBox, resolution, position=None) ... simulates the material removal
+    of Path commands on a box shaped stock. The initial tool position defaults to the
+    origin at the height of the top of the stock, (0, 0, ZMax), like in the simulator.'''
+
+    def __init__(self, boundBox, resolution, position=None):
+        self.stock = HeightMap(boundBox, resolution)
+        self.tolerance = resolution / 4.0
+        if position is None:
+            position = (0.0, 0.0, boundBox.ZMax)
+        self.position = tuple(position)
+        self.profile = None
+
+    def setTool(self, tool):
+        '''setTool(tool) ... sets the tool used for the following commands, a ToolBit,
+        legacy tool or ToolProfile.'''
+        if not isinstance(tool, ToolProfile):
+            tool = toolProfile(tool)
+        self.profile = tool
+
+    def applyCommands(self, commands):
+        '''applyCommands(commands) ... applies all commands at once and returns the new tool
+        position. Rapid moves cut the stock just like feed moves.'''
+        if self.profile is None:
+            raise ValueError('No tool set for the simulation')
+        pts = commandPoints(commands, self.position, self.tolerance)
+        if len(pts) > 1:
+            self.stock.applySegments(numpy.stack((pts[:-1], pts[1:]), axis=1), self.profile)
+        self.position = tuple(pts[-1])
+        return FreeCAD.Vector(*self.position)
+
+    def applyOperation(self, op, batchSize=None):
+        '''applyOperation(op, batchSize=None) ... applies the commands of op with the tool of
+        its tool controller, in batches of batchSize commands if given.'''
+        tc = PathUtil.toolControllerForOp(op)
+        if tc is None or not hasattr(tc, 'Tool'):
+            PathLog.warning('{} has no tool, skipped'.format(op.Label))
+            return FreeCAD.Vector(*self.position)
+        self.setTool(tc.Tool)
+        commands = op.Path.Commands
+        if not batchSize:
+            batchSize = max(len(commands), 1)
+        for i in range(0, len(commands), batchSize):
+            self.applyCommands(commands[i:i + batchSize])
+        return FreeCAD.Vector(*self.position)
+
+    def simulateJob(self, job):
+        '''simulateJob(job) ... applies all active operations of job.'''
+        for op in job.Operations.Group:
+            if PathUtil.opProperty(op, 'Active') is not False and hasattr(op, 'Path'):
+                self.applyOperation(op)
+        return self.stock
+
+    def mesh(self):
+        '''mesh() ... returns the simulated stock as Mesh.Mesh.'''
+        return self.stock.mesh()
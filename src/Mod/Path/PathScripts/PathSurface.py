@@ -47,9 +47,12 @@ import Path
 import PathScripts.PathLog as PathLog
 import PathScripts.PathUtils as PathUtils
 import PathScripts.PathOp as PathOp
+import PathScripts.PathPreferences as PathPreferences
+import PathScripts.PathSimplify as PathSimplify
 import PathScripts.PathSurfaceSupport as PathSurfaceSupport
 import time
 import math
+import numpy
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -779,6 +782,9 @@ class ObjectSurface(PathOp.ObjectOp):
         # Prepare PathDropCutter objects with STL data
         pdc = self._planarGetPDC(self.modelSTLs[mdlIdx], depthparams[lenDP - 1], obj.SampleInterval.Value, self.cutter)
         safePDC = self._planarGetPDC(self.safeSTLs[mdlIdx], depthparams[lenDP - 1], obj.SampleInterval.Value, self.cutter)
+        scanner = PathSurfaceSupport.DropCutScanner(ocl, self.modelSTLs[mdlIdx], self.cutter,
+                                                    depthparams[lenDP - 1], obj.SampleInterval.Value,
+                                                    PathPreferences.oclScanThreads())
 
         profScan = list()
         if obj.ProfileEdges != 'None':
@@ -794,7 +800,7 @@ class ObjectSurface(PathOp.ObjectOp):
                 msg = translate('PathSurface', 'No profile path geometry returned.')
                 PathLog.error(msg)
                 return list()
-            profScan = [self._planarPerformOclScan(obj, pdc, pathOffsetGeom, True)]
+            profScan = [self._planarPerformOclScan(obj, scanner, pathOffsetGeom, True)]
 
         geoScan = list()
         if obj.ProfileEdges != 'Only':
@@ -815,9 +821,9 @@ class ObjectSurface(PathOp.ObjectOp):
                     msg = translate('PathSurface', 'No clearing path geometry returned.')
                     PathLog.error(msg)
                     return list()
-                geoScan = [self._planarPerformOclScan(obj, pdc, useGeom, True)]
+                geoScan = [self._planarPerformOclScan(obj, scanner, useGeom, True)]
             else:
-                geoScan = self._planarPerformOclScan(obj, pdc, pathGeom, False)
+                geoScan = self._planarPerformOclScan(obj, scanner, pathGeom, False)
 
         if obj.ProfileEdges == 'Only':  # ['None', 'Only', 'First', 'Last']
             SCANDATA.extend(profScan)
@@ -892,16 +898,23 @@ class ObjectSurface(PathOp.ObjectOp):
 
         return offsetLists
 
-    def _planarPerformOclScan(self, obj, pdc, pathGeom, offsetPoints=False):
-        '''_planarPerformOclScan(obj, pdc, pathGeom, offsetPoints=False)...
+    def _planarPerformOclScan(self, obj, scanner, pathGeom, offsetPoints=False):
+        '''_planarPerformOclScan(obj, scanner, pathGeom, offsetPoints=False)...
         Switching function for calling the appropriate path-geometry to OCL points conversion function
-        for the various cut patterns.'''
+        for the various cut patterns. All lines, or all arcs of one direction, are scanned in one batch.'''
         PathLog.debug('_planarPerformOclScan()')
         SCANS = list()
 
+        def scanLines(LINES):
+            # LINES is a list of step overs containing 'BRK' and line tuples (p1, p2)
+            lines = [LN for STEP in LINES for LN in STEP if LN != 'BRK']
+            scans = iter(scanner.scanLines(lines))
+            return [[LN if LN == 'BRK' else self._scanToVectors(next(scans)) for LN in STEP]
+                    for STEP in LINES]
+
         if offsetPoints or obj.CutPattern == 'Offset':
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
-            for D in PNTSET:
+            for D in scanLines(PNTSET):
                 stpOvr = list()
                 ofst = list()
                 for I in D:
@@ -910,14 +923,11 @@ class ObjectSurface(PathOp.ObjectOp):
                         stpOvr.append(I)
                         ofst = list()
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.extend(I)
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
         elif obj.CutPattern in ['Line', 'Spiral', 'ZigZag']:
-            stpOvr = list()
             if obj.CutPattern == 'Line':
                 # PNTSET = PathSurfaceSupport.pathGeomToLinesPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps)
                 PNTSET = PathSurfaceSupport.pathGeomToLinesPointSet(self, obj, pathGeom)
@@ -927,50 +937,39 @@ class ObjectSurface(PathOp.ObjectOp):
             elif obj.CutPattern == 'Spiral':
                 PNTSET = PathSurfaceSupport.pathGeomToSpiralPointSet(obj, pathGeom)
 
-            for STEP in PNTSET:
-                for LN in STEP:
-                    if LN == 'BRK':
-                        stpOvr.append(LN)
-                    else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
-                SCANS.append(stpOvr)
-                stpOvr = list()
+            SCANS.extend(scanLines(PNTSET))
         elif obj.CutPattern in ['Circular', 'CircularZigZag']:
             # PNTSET is list, by stepover.
             # Each stepover is a list containing arc/loop descriptions, (sp, ep, cp)
             # PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps, self.tmpCOM)
             PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(self, obj, pathGeom)
 
-            for so in range(0, len(PNTSET)):
-                stpOvr = list()
-                erFlg = False
-                (aTyp, dirFlg, ARCS) = PNTSET[so]
-
-                if dirFlg == 1:  # 1
-                    cMode = True
-                else:
-                    cMode = False
+            # Scan the arcs of both directions, dirFlg 1 is counter clockwise
+            scans = dict()
+            for cMode in [True, False]:
+                arcs = [Arc for (aTyp, dirFlg, ARCS) in PNTSET if (dirFlg == 1) is cMode
+                        for Arc in ARCS if Arc != 'BRK']
+                scans[cMode] = iter(scanner.scanArcs(arcs, cMode))
 
-                for a in range(0, len(ARCS)):
-                    Arc = ARCS[a]
+            for (aTyp, dirFlg, ARCS) in PNTSET:
+                stpOvr = list()
+                cMode = dirFlg == 1
+                for Arc in ARCS:
                     if Arc == 'BRK':
                         stpOvr.append('BRK')
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
-                        if scan is False:
-                            erFlg = True
-                        else:
-                            if aTyp == 'L':
-                                scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
-                            stpOvr.append(scan)
-                if erFlg is False:
-                    SCANS.append(stpOvr)
+                        scan = self._scanToVectors(next(scans[cMode]))
+                        if aTyp == 'L':
+                            scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
+                        stpOvr.append(scan)
+                SCANS.append(stpOvr)
         # Eif
 
         return SCANS
 
+    def _scanToVectors(self, points):
+        return [FreeCAD.Vector(x, y, z) for (x, y, z) in points.tolist()]
+
     def _planarDropCutScan(self, pdc, A, B):
         (x1, y1) = A
         (x2, y2) = B
@@ -985,23 +984,6 @@ class ObjectSurface(PathOp.ObjectOp):
         PNTS = [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
         return PNTS  # pdc.getCLPoints()
 
-    def _planarCircularDropCutScan(self, pdc, Arc, cMode):
-        path = ocl.Path()  # create an empty path object
-        (sp, ep, cp) = Arc
-
-        # process list of segment tuples (vect, vect)
-        p1 = ocl.Point(sp[0], sp[1], 0)   # start point of arc
-        p2 = ocl.Point(ep[0], ep[1], 0)   # end point of arc
-        C = ocl.Point(cp[0], cp[1], 0)   # center point of arc
-        ao = ocl.Arc(p1, p2, C, cMode)     # arc object
-        path.append(ao)        # add the arc to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-
-        # Convert OCL object data to FreeCAD vectors
-        return [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
-
     # Main planar scan functions
     def _planarDropCutSingle(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
         PathLog.debug('_planarDropCutSingle()')
@@ -1072,7 +1054,7 @@ class ObjectSurface(PathOp.ObjectOp):
                         if rtnVal:
                             cmds.extend(gcode)
                         else:
-                            cmds.extend(self._planarSinglepassProcess(obj, prt))
+                            cmds.extend(self._planarSinglepassProcess(obj, prt, fitArcs=True))
                     else:
                         cmds.extend(self._planarSinglepassProcess(obj, prt))
             cmds.append(Path.Command('N (End of step {}.)'.format(so), {}))
@@ -1087,20 +1069,34 @@ class ObjectSurface(PathOp.ObjectOp):
 
         return GCODE
 
-    def _planarSinglepassProcess(self, obj, points):
+    def _planarSinglepassProcess(self, obj, points, fitArcs=False):
+        '''_planarSinglepassProcess(obj, points, fitArcs=False) ...
+        Convert ocl points to G1 commands. With fitArcs runs of points lying on an arc,
+        within LinearDeflection, are converted to G2/G3 commands.'''
+        pnts = PathSimplify.asArray(points)
         if obj.OptimizeLinearPaths:
-            points = PathUtils.simplify3dLine(points,
-                    tolerance=obj.LinearDeflection.Value)
+            pnts = PathSimplify.rdp(pnts, obj.LinearDeflection.Value)
         # Begin processing ocl points list into gcode
         commands = []
-        for pnt in points:
-            commands.append(
-                Path.Command('G1', {
-                    'X': pnt.x,
-                    'Y': pnt.y,
-                    'Z': pnt.z,
-                    'F': self.horizFeed
-                }))
+        if len(pnts) == 0:
+            return commands
+        if not fitArcs:
+            for (x, y, z) in pnts.tolist():
+                commands.append(Path.Command('G1', {'X': x, 'Y': y, 'Z': z, 'F': self.horizFeed}))
+            return commands
+
+        (x, y, z) = pnts[0].tolist()
+        commands.append(Path.Command('G1', {'X': x, 'Y': y, 'Z': z, 'F': self.horizFeed}))
+        for move in PathSimplify.fitArcs(pnts, obj.LinearDeflection.Value):
+            (ex, ey, ez) = move[1]
+            if move[0] == 'G1':
+                commands.append(Path.Command('G1', {'X': ex, 'Y': ey, 'Z': ez, 'F': self.horizFeed}))
+            else:
+                (cx, cy) = move[2]
+                commands.append(Path.Command(move[0], {'X': ex, 'Y': ey, 'Z': ez,
+                                                       'I': cx - x, 'J': cy - y,
+                                                       'F': self.horizFeed}))
+            (x, y, z) = (ex, ey, ez)
         return commands
 
     def _planarDropCutMulti(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
@@ -1215,7 +1211,7 @@ class ObjectSurface(PathOp.ObjectOp):
                                 if rtnVal is True:
                                     segCmds = gcode
                                 else:
-                                    segCmds = self._planarSinglepassProcess(obj, prt)
+                                    segCmds = self._planarSinglepassProcess(obj, prt, fitArcs=True)
                             else:
                                 segCmds = self._planarSinglepassProcess(obj, prt)
 
@@ -1493,10 +1489,9 @@ class ObjectSurface(PathOp.ObjectOp):
                                                 'F': self.horizFeed}))
             cmds.append(Path.Command('G1', {'X': strtPnt.x, 'Y': strtPnt.y, 'Z': strtPnt.z, 'F': self.horizFeed}))
         else:
-            for pt in LN:
-                if abs(pt.z - strtHght) > tolrnc:  # test for horizontal coplanar
-                    coPlanar = False
-                    break
+            # test for horizontal coplanar
+            if numpy.abs(PathSimplify.asArray(LN)[:, 2] - strtHght).max() > tolrnc:
+                coPlanar = False
             if coPlanar is True:
                 # ijk = self.tmpCOM - strtPnt
                 ijk = self.tmpCOM.sub(strtPnt)  # vector from start to center
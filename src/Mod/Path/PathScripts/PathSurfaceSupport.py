@@ -34,7 +34,12 @@ import Path
 import PathScripts.PathLog as PathLog
 import PathScripts.PathUtils as PathUtils
 import PathScripts.PathOpTools as PathOpTools
+import collections
+import concurrent.futures
+import hashlib
 import math
+import numpy
+import os
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -1139,14 +1144,85 @@ def getSliceFromEnvelope(env):
 
 
 
+class ModelSTLCache:
+    '''ModelSTLCache() ... Cache of the OCL STL objects built for the models of a Job,
+    shared by all 3D operations of the Job, see getModelSTLCache(JOB). Every entry is
+    stored by model name and the settings it was built with, together with the model
+    signature. The first item of the settings is the kind of STL, for example 'model' or
+    'safe'. All entries of a model and kind are dropped as soon as the signature changes.'''
+
+    # Maximum number of STL objects kept, the least recently used is dropped first
+    maxEntries = 8
+
+    def __init__(self):
+        self.entries = collections.OrderedDict()
+
+    def get(self, name, signature, key, make):
+        '''get(name, signature, key, make) ... returns the cached STL of the model
+        name built with the settings in key, make() builds it if there is none.'''
+        entry = self.entries.get((name, key))
+        if entry is not None and entry[0] == signature:
+            PathLog.debug('ModelSTLCache: reusing STL of {}'.format(name))
+            self.entries.move_to_end((name, key))
+            return entry[1]
+
+        for k in [k for k, e in self.entries.items()
+                  if k[0] == name and k[1][0] == key[0] and e[0] != signature]:
+            del self.entries[k]
+        stl = make()
+        self.entries[(name, key)] = (signature, stl)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+        return stl
+
+    def clear(self):
+        self.entries.clear()
+
+
+def getModelSTLCache(JOB):
+    '''getModelSTLCache(JOB) ... returns the ModelSTLCache of the Job.
+    The cache is kept by the Job proxy and is not saved with the document.'''
+    cache = getattr(JOB.Proxy, 'modelSTLCache', None)
+    if cache is None:
+        cache = ModelSTLCache()
+        JOB.Proxy.modelSTLCache = cache
+    return cache
+
+
+def _shapeSignature(shape):
+    return hashlib.sha1(shape.exportBrepToString().encode('utf-8')).hexdigest()
+
+
+def _modelSignature(model, model_type):
+    if model_type == 'M':
+        mesh = model.Mesh
+        bb = mesh.BoundBox
+        return (mesh.CountPoints, mesh.CountFacets, mesh.Area, mesh.Volume,
+                bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax,
+                tuple(mesh.Placement.toMatrix().A))
+    return _shapeSignature(model.Shape)
+
+
 def _prepareModelSTLs(self, JOB, obj, m, ocl):
     """Tessellate model shapes or copy existing meshes into ocl.STLSurf
-    objects"""
+    objects. The STL objects are shared with the other operations of the Job,
+    except for rotational scans which rotate the STL."""
     PathLog.debug('_prepareModelSTLs()')
     if self.modelSTLs[m] is True:
         model = JOB.Model.Group[m]
-        if self.modelSTLs[m] is True:
-            self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m])
+        model_type = self.modelTypes[m]
+
+        def make():
+            return _makeSTL(model, obj, ocl, model_type)
+
+        if getattr(obj, 'ScanType', 'Planar') == 'Rotational':
+            self.modelSTLs[m] = make()
+        else:
+            key = ('model', model_type)
+            if model_type != 'M':
+                key += (obj.LinearDeflection.Value,)
+            self.modelSTLs[m] = getModelSTLCache(JOB).get(
+                model.Name, _modelSignature(model, model_type), key, make)
 
 
 def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
@@ -1156,6 +1232,31 @@ def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
     STL object to determine minimum travel height to clear stock and model.'''
     PathLog.debug('_makeSafeSTL()')
 
+    if self.showDebugObjects:
+        self.safeSTLs[mdlIdx] = _buildSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl)
+        return
+
+    # The safe STL depends on the model, the stock, the selected faces and
+    # voids and the settings used to combine them
+    Mdl = JOB.Model.Group[mdlIdx]
+    key = ('safe', obj.BoundBox, obj.LinearDeflection.Value, _shapeSignature(JOB.Stock.Shape))
+    if voidShapes:
+        key += (_shapeSignature(Part.makeCompound(voidShapes)), tuple(self.depthParams))
+    if obj.BoundBox == 'BaseBoundBox':
+        key += (obj.BoundaryAdjustment.Value,)
+        if obj.BoundaryAdjustment > 0.0:
+            key += (_shapeSignature(Part.makeCompound(faceShapes)), tuple(self.depthParams))
+    else:
+        key += (self.cutter.getDiameter(),)
+
+    def make():
+        return _buildSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl)
+
+    self.safeSTLs[mdlIdx] = getModelSTLCache(JOB).get(
+        Mdl.Name, _modelSignature(Mdl, 'S'), key, make)
+
+
+def _buildSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
     fuseShapes = list()
     Mdl = JOB.Model.Group[mdlIdx]
     mBB = Mdl.Shape.BoundBox
@@ -1224,7 +1325,7 @@ def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
         T.purgeTouched()
         self.tempGroup.addObject(T)
 
-    self.safeSTLs[mdlIdx] = _makeSTL(fused, obj, ocl)
+    return _makeSTL(fused, obj, ocl)
 
 
 def _makeSTL(model, obj, ocl, model_type=None):
@@ -1252,6 +1353,107 @@ def _makeSTL(model, obj, ocl, model_type=None):
     return stl
 
 
+class DropCutScanner:
+    '''DropCutScanner(ocl, stl, cutter, minZ, sampleInterval, threads=0) ...
+    Drops the cutter onto the STL along scan lines and arcs. The scans are split into
+    chunks, every chunk is run as one OCL path on a PathDropCutter of its own, and the
+    chunks are distributed to a pool of worker threads. The CL points of every scan
+    are returned as numpy array of shape (n, 3). threads=0 uses all processors.'''
+
+    # Maximum number of scan lines or arcs run as one OCL path
+    chunkSize = 64
+
+    def __init__(self, ocl, stl, cutter, minZ, sampleInterval, threads=0):
+        self.ocl = ocl
+        self.stl = stl
+        self.cutter = cutter
+        self.minZ = minZ
+        self.sampleInterval = sampleInterval
+        self.threads = threads if threads > 0 else (os.cpu_count() or 1)
+        self.idlePDCs = list()
+
+    def scanLines(self, lines):
+        '''scanLines(lines) ... lines is a list of ((x1, y1), (x2, y2)) tuples.
+        Returns a list with the CL points of every line.'''
+        return self._scan(lines, self._scanLineChunk)
+
+    def scanArcs(self, arcs, ccw):
+        '''scanArcs(arcs, ccw) ... arcs is a list of (start, end, center) tuples,
+        all in the same direction. Returns a list with the CL points of every arc.'''
+        return self._scan(arcs, lambda pdc, chunk: self._scanArcChunk(pdc, chunk, ccw))
+
+    def _scan(self, spans, scanChunk):
+        if not spans:
+            return list()
+        # at least four chunks per thread to balance the load
+        size = max(1, min(self.chunkSize, int(math.ceil(len(spans) / (4.0 * self.threads)))))
+        chunks = [spans[i:i + size] for i in range(0, len(spans), size)]
+        workers = min(self.threads, len(chunks))
+
+        def run(chunk):
+            try:
+                pdc = self.idlePDCs.pop()
+            except IndexError:
+                pdc = self._makePDC()
+            try:
+                return scanChunk(pdc, chunk)
+            finally:
+                self.idlePDCs.append(pdc)
+
+        if workers == 1:
+            results = [run(chunk) for chunk in chunks]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                results = list(executor.map(run, chunks))
+        return [scan for result in results for scan in result]
+
+    def _makePDC(self):
+        pdc = self.ocl.PathDropCutter()
+        pdc.setSTL(self.stl)
+        pdc.setCutter(self.cutter)
+        pdc.setZ(self.minZ)
+        pdc.setSampling(self.sampleInterval)
+        return pdc
+
+    def _runPath(self, pdc, path):
+        pdc.setPath(path)
+        pdc.run()
+        CLP = pdc.getCLPoints()
+        return numpy.array([(p.x, p.y, p.z) for p in CLP], dtype=float).reshape(-1, 3)
+
+    def _scanLineChunk(self, pdc, lines):
+        path = self.ocl.Path()
+        counts = list()
+        for ((x1, y1), (x2, y2)) in lines:
+            path.append(self.ocl.Line(self.ocl.Point(x1, y1, 0), self.ocl.Point(x2, y2, 0)))
+            # PathDropCutter samples a line in int(length / sampling + 1) steps
+            dx = x2 - x1
+            dy = y2 - y1
+            counts.append(int(math.sqrt(dx * dx + dy * dy) / self.sampleInterval + 1) + 1)
+        points = self._runPath(pdc, path)
+        if len(lines) == 1:
+            return [points]
+
+        # The first CL point of every line has the exact start point coordinates,
+        # split the points of the path into the lines if the counts match them.
+        starts = numpy.cumsum([0] + counts[:-1])
+        if len(points) == sum(counts) and \
+                numpy.array_equal(points[starts, :2], numpy.array([ln[0] for ln in lines])):
+            return numpy.split(points, starts[1:])
+        PathLog.debug('DropCutScanner: unexpected sampling, scanning lines one by one')
+        return [self._scanLineChunk(pdc, [line])[0] for line in lines]
+
+    def _scanArcChunk(self, pdc, arcs, ccw):
+        scans = list()
+        for (sp, ep, cp) in arcs:
+            path = self.ocl.Path()
+            path.append(self.ocl.Arc(self.ocl.Point(sp[0], sp[1], 0),
+                                     self.ocl.Point(ep[0], ep[1], 0),
+                                     self.ocl.Point(cp[0], cp[1], 0), ccw))
+            scans.append(self._runPath(pdc, path))
+        return scans
+
+
 # Functions to convert path geometry into line/arc segments for OCL input or directly to g-code
 def pathGeomToLinesPointSet(self, obj, compGeoShp):
     '''pathGeomToLinesPointSet(self, obj, compGeoShp)...
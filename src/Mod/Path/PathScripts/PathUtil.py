@@ -30,6 +30,7 @@ So if you add to this file and think about importing anything from PathScripts
 other than PathLog, then it probably doesn't belong here.
 '''
 
+import hashlib
 import six
 import PathScripts.PathLog as PathLog
 import PySide
@@ -150,3 +151,21 @@ def isString(string):
 def keyValueIter(dictionary):
     '''keyValueIter(dict) ... return iterable object over dictionary's (key,value) tuples.'''
     return six.iteritems(dictionary)
+
+def pathDigest(path):
+    '''pathDigest(path) ... return a digest of the commands of path, equal for paths with the same commands.'''
+    return hashlib.sha1(path.toGCode().encode('utf-8')).hexdigest()
+
+def propertyKey(value):
+    '''propertyKey(value) ... return a hashable representation of a property value, without the rounding of its UserString.'''
+    if hasattr(value, 'Value'):
+        return value.Value
+    if hasattr(value, 'x') and hasattr(value, 'y') and hasattr(value, 'z'):
+        return (value.x, value.y, value.z)
+    if isinstance(value, (list, tuple)):
+        return tuple(propertyKey(v) for v in value)
+    if hasattr(value, 'Name'):
+        return value.Name
+    if value is None or isinstance(value, (bool, int, float)) or isString(value):
+        return value
+    return str(value)
@@ -25,9 +25,12 @@ import Path
 # import PathScripts
 import PathScripts.PathJob as PathJob
 import PathScripts.PathGeom as PathGeom
+import PathScripts.PathSimplify as PathSimplify
 import math
 import numpy
+import time
 
+from collections import defaultdict
 from FreeCAD import Vector
 from PathScripts import PathLog
 from PySide import QtCore
@@ -655,19 +658,149 @@ def rampPlunge(edge, rampangle, destZ, startZ):
     return rampCmds
 
 
-def sort_jobs(locations, keys, attractors=None):
+class _JobGrid(object):
+    """Buckets job locations into square grid cells for nearest neighbour queries.
+    Only occupied cells are stored, removed locations are taken out of their cell."""
+
+    def __init__(self, points):
+        self.points = points
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self.x0 = min(xs)
+        self.y0 = min(ys)
+        width = max(xs) - self.x0
+        height = max(ys) - self.y0
+        # about four locations per cell
+        if width > 0 and height > 0:
+            self.size = 2 * math.sqrt(width * height / len(points))
+        else:
+            self.size = 4 * max(width, height) / len(points)
+        if self.size <= 0:
+            self.size = 1.0
+        self.cells = {}
+        for i, (x, y) in enumerate(points):
+            self.cells.setdefault(self.cell(x, y), []).append(i)
+
+    def cell(self, x, y):
+        return (int((x - self.x0) // self.size), int((y - self.y0) // self.size))
+
+    def remove(self, i):
+        c = self.cell(*self.points[i])
+        indices = self.cells[c]
+        indices.remove(i)
+        if not indices:
+            del self.cells[c]
+
+    def cellDistance(self, x, y, c):
+        """cellDistance(x, y, c) ... square distance of (x, y) to cell c"""
+        xmin = self.x0 + c[0] * self.size
+        ymin = self.y0 + c[1] * self.size
+        dx = max(xmin - x, 0, x - xmin - self.size)
+        dy = max(ymin - y, 0, y - ymin - self.size)
+        return dx * dx + dy * dy
+
+    def ringDistance(self, x, y, c, r):
+        """ringDistance(x, y, c, r) ... distance of (x, y) in cell c to all cells
+        outside of the square of cells with the radius r around c"""
+        xmin = self.x0 + (c[0] - r) * self.size
+        ymin = self.y0 + (c[1] - r) * self.size
+        xmax = self.x0 + (c[0] + r + 1) * self.size
+        ymax = self.y0 + (c[1] + r + 1) * self.size
+        return max(0, min(x - xmin, xmax - x, y - ymin, ymax - y))
+
+    def ring(self, c, r):
+        if r == 0:
+            yield c
+            return
+        for i in range(c[0] - r, c[0] + r + 1):
+            yield (i, c[1] - r)
+            yield (i, c[1] + r)
+        for j in range(c[1] - r + 1, c[1] + r):
+            yield (c[0] - r, j)
+            yield (c[0] + r, j)
+
+    def cellWeight(self, c, weights):
+        """cellWeight(c, weights) ... lowest weighted sum of the absolute coordinates
+        in cell c, weights gives the factors for x and y"""
+        w = 0
+        for i, start in enumerate((self.x0, self.y0)):
+            if weights[i]:
+                vmin = start + c[i] * self.size
+                w += weights[i] * max(vmin, 0, -vmin - self.size)
+        return w
+
+    def closest(self, x, y, score, weights=(0, 0)):
+        """closest(x, y, score, weights=(0, 0)) ... returns the location index i with the
+        lowest (score(i), i). score(i) must not be smaller than the square distance of
+        location i to (x, y) plus its absolute coordinates times weights, see cellWeight."""
+        c = self.cell(x, y)
+        # the weight of a location at the distance d is at least weight - slope * d
+        weight = weights[0] * abs(x) + weights[1] * abs(y)
+        slope = weights[0] + weights[1]
+        best = None
+        r = 0
+        while True:
+            full = (2 * r + 1) ** 2 > 2 * len(self.cells)
+            # if the rings got bigger than the grid the remaining cells are checked directly
+            for cell in list(self.cells) if full else self.ring(c, r):
+                indices = self.cells.get(cell)
+                if not indices:
+                    continue
+                if best is not None:
+                    bound = self.cellDistance(x, y, cell) + self.cellWeight(cell, weights)
+                    if bound > best[0]:
+                        continue
+                for i in indices:
+                    s = score(i)
+                    if best is None or (s, i) < best:
+                        best = (s, i)
+            if full:
+                return best[1]
+            if best is not None:
+                d = self.ringDistance(x, y, c, r)
+                if d * d > best[0] or (2 * d >= slope and d * d - slope * d + weight > best[0]):
+                    return best[1]
+            r += 1
+
+    def nearest(self, x, y, count, exclude=None):
+        """nearest(x, y, count, exclude=None) ... returns the indices of the
+        count nearest locations to (x, y)"""
+        c = self.cell(x, y)
+        found = []
+        r = 0
+        while True:
+            full = (2 * r + 1) ** 2 > 2 * len(self.cells)
+            if full:
+                # the rings got bigger than the grid, check all cells
+                found = []
+            for cell in self.cells if full else self.ring(c, r):
+                for i in self.cells.get(cell, ()):
+                    if i != exclude:
+                        px, py = self.points[i]
+                        found.append(((px - x) ** 2 + (py - y) ** 2, i))
+            if full:
+                break
+            if len(found) >= count:
+                found.sort()
+                d = self.ringDistance(x, y, c, r)
+                if d * d > found[count - 1][0]:
+                    break
+            r += 1
+        found.sort()
+        return [i for d, i in found[:count]]
+
+
+def sort_jobs(locations, keys, attractors=None, optimize_time=0):
     """ sort holes by the nearest neighbor method
         keys: two-element list of keys for X and Y coordinates. for example ['x','y']
-        originally written by m0n5t3r for PathHelix
+        attractors: keys whose absolute value is added to the square distance,
+            defaults to the first key, thus locations close to X=0 come first
+        optimize_time: seconds for shortening the rapid moves with optimize_jobs afterwards
+        originally written by m0n5t3r for PathHelix, the locations are bucketed in a grid,
+        the result is the same as searching all remaining locations
     """
-    if attractors is None:
-        attractors = []
-    try:
-        from queue import PriorityQueue
-    except ImportError:
-        from Queue import PriorityQueue
-    from collections import defaultdict
-
+    if not locations:
+        return []
     attractors = attractors or [keys[0]]
 
     def sqdist(a, b):
@@ -686,29 +819,99 @@ def sort_jobs(locations, keys, attractors=None):
 
         return w
 
-    def find_closest(location_list, location, dist):
-        q = PriorityQueue()
-
-        for i, j in enumerate(location_list):
-            # prevent dictionary comparison by inserting the index
-            q.put((dist(j, location) + weight(j), i, j))
-
-        prio, i, result = q.get()  # pylint: disable=unused-variable
-
-        return result
+    weights = [weight(location) for location in locations]
+    gridWeights = (attractors.count(keys[0]), attractors.count(keys[1]))
+    grid = _JobGrid([(location[keys[0]], location[keys[1]]) for location in locations])
 
     out = []
-    zero = defaultdict(lambda: 0)
+    last = defaultdict(lambda: 0)
+    while grid.cells:
+        i = grid.closest(
+            last[keys[0]],
+            last[keys[1]],
+            lambda j: sqdist(locations[j], last) + weights[j],
+            gridWeights
+        )
+        grid.remove(i)
+        last = locations[i]
+        out.append(last)
+
+    if optimize_time > 0:
+        out = optimize_jobs(out, keys, optimize_time)
+    return out
 
-    out.append(find_closest(locations, zero, sqdist))
-    locations.remove(out[-1])
 
-    while locations:
-        closest = find_closest(locations, out[-1], sqdist)
-        out.append(closest)
-        locations.remove(closest)
-
-    return out
+def jobs_travel_distance(locations, keys):
+    """jobs_travel_distance(locations, keys) ... length of the rapid moves from the
+    origin to all locations in the given order, only the keys are used"""
+    distance = 0
+    last = (0, 0)
+    for location in locations:
+        current = (location[keys[0]], location[keys[1]])
+        distance += math.hypot(current[0] - last[0], current[1] - last[1])
+        last = current
+    return distance
+
+
+def optimize_jobs(locations, keys, time_budget, neighbours=8):
+    """optimize_jobs(locations, keys, time_budget, neighbours=8) ... shortens the
+    rapid moves between the locations with 2-opt moves, see jobs_travel_distance.
+    The path starts at the origin and is open at the end. Only the moves to the
+    given number of nearest neighbours are tried. Stops if no move shortens the
+    path anymore or after time_budget seconds, the locations are returned in the
+    new order."""
+    count = len(locations)
+    if count < 3:
+        return list(locations)
+    deadline = time.time() + time_budget
+    points = [(location[keys[0]], location[keys[1]]) for location in locations]
+    grid = _JobGrid(points)
+    # the origin is an additional point at the start which is never moved
+    start = count
+    points.append((0.0, 0.0))
+    near = [grid.nearest(x, y, neighbours, i) for i, (x, y) in enumerate(points[:count])]
+    near.append(grid.nearest(0.0, 0.0, neighbours))
+
+    def dist(a, b):
+        if b is None:
+            return 0
+        return math.hypot(points[a][0] - points[b][0], points[a][1] - points[b][1])
+
+    tour = [start] + list(range(count))
+    pos = list(range(1, count + 1)) + [0]
+
+    def successor(p):
+        return tour[p + 1] if p + 1 <= count else None
+
+    improved = True
+    steps = 0
+    while improved:
+        improved = False
+        for a in tour:
+            steps += 1
+            if steps % 256 == 0 and time.time() > deadline:
+                return [locations[i] for i in tour[1:]]
+            for c in near[a]:
+                pa = pos[a]
+                pc = pos[c]
+                if pc > pa + 1:
+                    # new edge a - c, reverse everything between
+                    first, last = pa, pc
+                elif pc < pa - 1:
+                    first, last = pc, pa
+                else:
+                    continue
+                b = tour[first + 1]
+                e = successor(last)
+                p = tour[first]
+                q = tour[last]
+                gain = dist(p, b) + dist(q, e) - dist(p, q) - dist(b, e)
+                if gain > 1e-9:
+                    tour[first + 1:last + 1] = tour[last:first:-1]
+                    for k in range(first + 1, last + 1):
+                        pos[tour[k]] = k
+                    improved = True
+    return [locations[i] for i in tour[1:]]
 
 
 def guessDepths(objshape, subs=None):
@@ -933,38 +1136,9 @@ def simplify3dLine(line, tolerance=1e-4):
     """Simplify a line defined by a list of App.Vectors, while keeping the
     maximum deviation from the original line within the defined tolerance.
     Implementation of
-    https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm"""
-    stack = [(0, len(line) - 1)]
-    results = []
-
-    def processRange(start, end):
-        """Internal worker. Process a range of Vector indices within the
-        line."""
-        if end - start < 2:
-            results.extend(line[start:end])
-            return
-        # Find point with maximum distance
-        maxIndex, maxDistance = 0, 0.0
-        startPoint, endPoint = (line[start], line[end])
-        for i in range(start + 1, end):
-            v = line[i]
-            distance = v.distanceToLineSegment(startPoint, endPoint).Length
-            if distance > maxDistance:
-                maxDistance = distance
-                maxIndex = i
-        if maxDistance > tolerance:
-            # Push second branch first, to be executed last
-            stack.append((maxIndex, end))
-            stack.append((start, maxIndex))
-        else:
-            results.append(line[start])
-
-    while len(stack):
-        processRange(*stack.pop())
-    # Each segment only appended its start point to the final result, so fill in
-    # the last point.
-    results.append(line[-1])
-    return results
+    https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm
+    The distances are computed on numpy arrays, see PathSimplify.rdpIndices."""
+    return [line[i] for i in PathSimplify.rdpIndices(line, tolerance)]
 
 
 def RtoIJ(startpoint, command):
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import numpy
+import sys
+
+import PathScripts.PathLog as PathLog
+import PathScripts.PathPreferences as PathPreferences
+import PathScripts.PathStockSim as PathStockSim
+import PathScripts.PathUtil as PathUtil
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+PathJob = LazyLoader('PathScripts.PathJob', globals(), 'PathScripts.PathJob')
+
+__title__ = "PathVerify - headless verification of Jobs"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+__doc__ = "Replays the operations of a Job on the stock and reports gouges into the model, leftover stock and air cutting."
+
+# The verification runs without the GUI, eg in a CI job:
+#
+#   FreeCADCmd -c "import PathScripts.PathVerify as V; V.main(['part.FCStd'])"
+#
+# verifyDocument prints the report and returns False if any operation gouges
+# the model; main verifies all given files and exits with 1 if any of them
+# gouges, which fails the CI job. The stock is simulated as height map over
+# the bound box of the Job's stock, see PathStockSim; the model is compared
+# by the top of its surface, which is what a 3 axis machine can reach.
+
+PathLog.setLevel(PathLog.Level.INFO, PathLog.thisModule())
+# PathLog.trackModule(PathLog.thisModule())
+
+# Default number of cells along the longer side of the stock
+DefaultCells = 400
+
+
+def shapeTriangles(shape, tolerance):
+    '''shapeTriangles(shape, tolerance) ... returns the tessellation of shape as array of
+    shape (N, 3, 3).'''
+    (points, facets) = shape.tessellate(tolerance)
+    if not facets:
+        return numpy.empty((0, 3, 3))
+    pts = numpy.array([(p.x, p.y, p.z) for p in points], dtype=float)
+    return pts[numpy.array(facets, dtype=int)]
+
+
+def surfaceHeights(stock, triangles):
+    '''surfaceHeights(stock, triangles) ... returns the highest Z of the triangles at the
+    center of each cell of the stock HeightMap, -inf where there is none.'''
+    heights = numpy.full((stock.nx, stock.ny), -numpy.inf)
+    triangles = numpy.asarray(triangles, dtype=float).reshape(-1, 3, 3)
+    res = stock.resolution
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    # signed double area in XY, vertical triangles don't cover any cell center
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])
+    lo = triangles.min(axis=1)
+    hi = triangles.max(axis=1)
+    i0 = numpy.maximum(numpy.ceil((lo[:, 0] - stock.xmin) / res - 0.5), 0).astype(int)
+    i1 = numpy.minimum(numpy.floor((hi[:, 0] - stock.xmin) / res - 0.5), stock.nx - 1).astype(int)
+    j0 = numpy.maximum(numpy.ceil((lo[:, 1] - stock.ymin) / res - 0.5), 0).astype(int)
+    j1 = numpy.minimum(numpy.floor((hi[:, 1] - stock.ymin) / res - 0.5), stock.ny - 1).astype(int)
+    active = (numpy.abs(area) > 1e-12) & (i1 >= i0) & (j1 >= j0)
+    if not active.any():
+        return heights
+    a, b, c, area = a[active], b[active], c[active], area[active]
+    ny = (j1 - j0 + 1)[active]
+    counts = (i1 - i0 + 1)[active] * ny
+    i0, j0 = i0[active], j0[active]
+
+    flat = heights.reshape(-1)
+    start = 0
+    ends = numpy.cumsum(counts)
+    while start < len(counts):
+        base = ends[start - 1] if start else 0
+        end = max(start + 1, int(numpy.searchsorted(ends, base + PathStockSim.CellBudget, side='right')))
+        cnt = counts[start:end]
+        tri = numpy.repeat(numpy.arange(start, end), cnt)
+        k = numpy.arange(int(cnt.sum())) - numpy.repeat(numpy.cumsum(cnt) - cnt, cnt)
+        ci = i0[tri] + k // ny[tri]
+        cj = j0[tri] + k % ny[tri]
+        px = stock.xmin + (ci + 0.5) * res
+        py = stock.ymin + (cj + 0.5) * res
+        ta, tb, tc = a[tri], b[tri], c[tri]
+        # barycentric coordinates of the cell center
+        u = ((tb[:, 0] - px) * (tc[:, 1] - py) - (tc[:, 0] - px) * (tb[:, 1] - py)) / area[tri]
+        v = ((tc[:, 0] - px) * (ta[:, 1] - py) - (ta[:, 0] - px) * (tc[:, 1] - py)) / area[tri]
+        w = 1.0 - u - v
+        eps = -1e-9
+        inside = (u >= eps) & (v >= eps) & (w >= eps)
+        # relative to the first corner, which keeps horizontal faces exact
+        z = (ta[:, 2] + v * (tb[:, 2] - ta[:, 2]) + w * (tc[:, 2] - ta[:, 2]))[inside]
+        numpy.maximum.at(flat, (ci * stock.ny + cj)[inside], z)
+        start = end
+    return heights
+
+
+class OperationReport(object):
+    '''OperationReport(name) ... result of the verification of one operation. Volumes are
+    in mm^3, lengths in mm and times in seconds.'''
+
+    def __init__(self, name):
+        self.name = name
+        self.skipped = False        # no tool to simulate the operation with
+        self.gouges = 0             # number of cells cut into the model
+        self.maxGouge = 0.0         # depth of the deepest gouge
+        self.gougeAt = None         # (x, y) of the deepest gouge
+        self.rapidCuts = 0          # number of rapid moves removing material
+        self.removedVolume = 0.0
+        self.leftoverVolume = 0.0   # stock above the model after the operation
+        self.cutTime = 0.0          # time of all feed moves
+        self.airCutTime = 0.0       # time of feed moves not removing material
+        self.airCutLength = 0.0
+
+    def isOk(self):
+        return self.gouges == 0
+
+    def __str__(self):
+        if self.skipped:
+            return '{}: skipped, no tool'.format(self.name)
+        text = '{}: removed {:.1f} mm^3, leftover {:.1f} mm^3, air cut {:.1f} s of {:.1f} s ({:.1f} mm)'.format(
+            self.name, self.removedVolume, self.leftoverVolume, self.airCutTime, self.cutTime, self.airCutLength)
+        if self.rapidCuts:
+            text += ', {} rapid moves cutting'.format(self.rapidCuts)
+        if self.gouges:
+            text += ', {} gouges up to {:.3f} mm at ({:.2f}, {:.2f})'.format(
+                self.gouges, self.maxGouge, self.gougeAt[0], self.gougeAt[1])
+        return text
+
+
+class JobVerifier(object):
+    '''JobVerifier(job, resolution=None, tolerance=None) ... replays the operations of
+    job on a height map of its stock. resolution is the cell size, by default the longer
+    side of the stock is split into DefaultCells. Cuts deeper than tolerance into the
+    model are reported as gouges, tolerance defaults to the Job's GeometryTolerance.'''
+
+    def __init__(self, job, resolution=None, tolerance=None):
+        self.job = job
+        bb = job.Stock.Shape.BoundBox
+        if resolution is None:
+            resolution = max(bb.XLength, bb.YLength) / DefaultCells
+        if tolerance is None and hasattr(job, 'GeometryTolerance'):
+            tolerance = float(job.GeometryTolerance)
+        if tolerance is None:
+            tolerance = PathPreferences.defaultGeometryTolerance()
+        self.tolerance = tolerance
+        self.sim = PathStockSim.Simulation(bb, resolution)
+        triangles = [shapeTriangles(obj.Shape, tolerance / 2.0) for obj in job.Model.Group if hasattr(obj, 'Shape')]
+        if triangles:
+            self.model = surfaceHeights(self.sim.stock, numpy.concatenate(triangles))
+        else:
+            self.model = numpy.full(self.sim.stock.z.shape, -numpy.inf)
+
+    def setModel(self, heights):
+        '''setModel(heights) ... replaces the model by the given surface heights.'''
+        self.model = heights
+
+    def depth(self):
+        '''depth() ... returns how deep the stock is cut into the model at each cell.'''
+        return self.model - self.sim.stock.z
+
+    def leftoverVolume(self):
+        stock = self.sim.stock
+        floor = numpy.maximum(self.model, stock.zmin)
+        return float(numpy.maximum(stock.z - floor, 0.0).sum()) * stock.resolution * stock.resolution
+
+    def verifyCommands(self, name, commands, tool):
+        '''verifyCommands(name, commands, tool) ... applies commands with tool and returns
+        the OperationReport.'''
+        report = OperationReport(name)
+        stock = self.sim.stock
+        if tool is None:
+            report.skipped = True
+            return report
+        self.sim.setTool(tool)
+        before = self.depth()
+        removed = stock.removedVolume()
+
+        (pts, owner, rapid) = PathStockSim.commandSegments(commands, self.sim.position, self.sim.tolerance)
+        if len(owner):
+            cutting = stock.applySegments(numpy.stack((pts[:-1], pts[1:]), axis=1), self.sim.profile)
+            self.sim.position = tuple(pts[-1])
+            feed = 0.0
+            feeds = numpy.empty(len(commands))
+            for (i, cmd) in enumerate(commands):
+                feed = cmd.Parameters.get('F', feed)
+                feeds[i] = feed
+            lengths = numpy.sqrt(((pts[1:] - pts[:-1]) ** 2).sum(axis=1))
+            rate = feeds[owner]
+            times = numpy.where(rate > 0.0, lengths / numpy.where(rate > 0.0, rate, 1.0), 0.0)
+            feedMoves = ~rapid
+            air = feedMoves & ~cutting
+            report.cutTime = float(times[feedMoves].sum())
+            report.airCutTime = float(times[air].sum())
+            report.airCutLength = float(lengths[air].sum())
+            report.rapidCuts = len(numpy.unique(owner[rapid & cutting]))
+
+        after = self.depth()
+        gouged = (after > self.tolerance) & (after > before)
+        report.gouges = int(numpy.count_nonzero(gouged))
+        if report.gouges:
+            worst = numpy.unravel_index(numpy.argmax(numpy.where(gouged, after, -numpy.inf)), after.shape)
+            report.maxGouge = float(after[worst])
+            report.gougeAt = (float(stock.vx[worst[0]]), float(stock.vy[worst[1]]))
+        report.removedVolume = stock.removedVolume() - removed
+        report.leftoverVolume = self.leftoverVolume()
+        return report
+
+    def verifyOperation(self, op):
+        '''verifyOperation(op) ... applies op with the tool of its tool controller.'''
+        tc = PathUtil.toolControllerForOp(op)
+        tool = getattr(tc, 'Tool', None) if tc else None
+        return self.verifyCommands(op.Label, op.Path.Commands, tool)
+
+    def verify(self):
+        '''verify() ... applies all active operations and returns their reports.'''
+        reports = []
+        for op in self.job.Operations.Group:
+            if PathUtil.opProperty(op, 'Active') is not False and hasattr(op, 'Path'):
+                reports.append(self.verifyOperation(op))
+        return reports
+
+
+def verifyJob(job, resolution=None, tolerance=None):
+    '''verifyJob(job, resolution=None, tolerance=None) ... returns the OperationReport of
+    each active operation of job, see JobVerifier.'''
+    return JobVerifier(job, resolution, tolerance).verify()
+
+
+def verifyDocument(doc=None, resolution=None, tolerance=None):
+    '''verifyDocument(doc=None, resolution=None, tolerance=None) ... verifies all Jobs of doc,
+    a document or file name, by default the active document. Prints the reports and returns
+    True if no operation gouges the model. A document opened from a file name is closed again.'''
+    opened = None
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    elif not hasattr(doc, 'Objects'):
+        doc = opened = FreeCAD.openDocument(doc)
+    try:
+        FreeCAD.setActiveDocument(doc.Name)
+        ok = True
+        for job in PathJob.Instances():
+            FreeCAD.Console.PrintMessage('{}:\n'.format(job.Label))
+            for report in verifyJob(job, resolution, tolerance):
+                FreeCAD.Console.PrintMessage('  {}\n'.format(report))
+                ok = ok and report.isOk()
+        return ok
+    finally:
+        if opened is not None:
+            FreeCAD.closeDocument(opened.Name)
+
+
+def main(files):
+    '''main(files) ... verifies the documents with the given file names and exits with 0 if
+    none of them gouges the model, 1 otherwise.'''
+    ok = True
+    for path in files:
+        FreeCAD.Console.PrintMessage('{}\n'.format(path))
+        ok = verifyDocument(path) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
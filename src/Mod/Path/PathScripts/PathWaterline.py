@@ -47,9 +47,12 @@ import Path
 import PathScripts.PathLog as PathLog
 import PathScripts.PathUtils as PathUtils
 import PathScripts.PathOp as PathOp
+import PathScripts.PathPreferences as PathPreferences
+import PathScripts.PathSimplify as PathSimplify
 import PathScripts.PathSurfaceSupport as PathSurfaceSupport
 import time
 import math
+import numpy
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -912,21 +915,9 @@ class ObjectWaterline(PathOp.ObjectOp):
         lenDP = len(depthparams)
 
         # Scan the piece to depth at smplInt
-        oclScan = []
-        oclScan = self._waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, depthparams[lenDP - 1], numScanLines)
-        oclScan = [FreeCAD.Vector(P.x, P.y, P.z + depOfst) for P in oclScan]
-        lenOS = len(oclScan)
-        ptPrLn = int(lenOS / numScanLines)
-
-        # Convert oclScan list of points to multi-dimensional list
-        scanLines = []
-        for L in range(0, numScanLines):
-            scanLines.append([])
-            for P in range(0, ptPrLn):
-                pi = L * ptPrLn + P
-                scanLines[L].append(oclScan[pi])
-        lenSL = len(scanLines)
-        pntsPerLine = len(scanLines[0])
+        scanLines = self._waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, depthparams[lenDP - 1], numScanLines)
+        scanLines[:, :, 2] += depOfst
+        (lenSL, pntsPerLine) = scanLines.shape[:2]
         msg = "--OCL scan: " + str(lenSL * pntsPerLine) + " points, with "
         msg += str(numScanLines) + " lines and " + str(pntsPerLine) + " pts/line"
         PathLog.debug(msg)
@@ -945,26 +936,16 @@ class ObjectWaterline(PathOp.ObjectOp):
 
     def _waterlineDropCutScan(self, stl, smplInt, xmin, xmax, ymin, fd, numScanLines):
         '''_waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, fd, numScanLines) ...
-        Perform OCL scan for waterline purpose.'''
-        pdc = ocl.PathDropCutter()   # create a pdc
-        pdc.setSTL(stl)
-        pdc.setCutter(self.cutter)
-        pdc.setZ(fd)  # set minimumZ (final / target depth value)
-        pdc.setSampling(smplInt)
-
-        # Create line object as path
-        path = ocl.Path()                   # create an empty path object
+        Perform OCL scan for waterline purpose. Returns the CL points as array of shape
+        (numScanLines, points per line, 3).'''
+        scanner = PathSurfaceSupport.DropCutScanner(ocl, stl, self.cutter, fd, smplInt,
+                                                    PathPreferences.oclScanThreads())
+        lines = list()
         for nSL in range(0, numScanLines):
             yVal = ymin + (nSL * smplInt)
-            p1 = ocl.Point(xmin, yVal, fd)   # start-point of line
-            p2 = ocl.Point(xmax, yVal, fd)   # end-point of line
-            path.append(ocl.Line(p1, p2))
-            # path.append(l)        # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run drop-cutter on the path
-
-        # return the list of points
-        return pdc.getCLPoints()
+            lines.append(((xmin, yVal), (xmax, yVal)))
+        # all scan lines have the same length and number of points
+        return numpy.array(scanner.scanLines(lines))
 
     def _getWaterline(self, obj, scanLines, layDep, lyr, lenSL, pntsPerLine):
         '''_getWaterline(obj, scanLines, layDep, lyr, lenSL, pntsPerLine) ... Get waterline.'''
@@ -988,15 +969,7 @@ class ObjectWaterline(PathOp.ObjectOp):
 
     def _createTopoMap(self, scanLines, layDep, lenSL, pntsPerLine):
         '''_createTopoMap(scanLines, layDep, lenSL, pntsPerLine) ... Create topo map version of OCL scan data.'''
-        topoMap = []
-        for L in range(0, lenSL):
-            topoMap.append([])
-            for P in range(0, pntsPerLine):
-                if scanLines[L][P].z > layDep:
-                    topoMap[L].append(2)
-                else:
-                    topoMap[L].append(0)
-        return topoMap
+        return numpy.where(scanLines[:lenSL, :pntsPerLine, 2] > layDep, 2, 0).tolist()
 
     def _bufferTopoMap(self, lenSL, pntsPerLine):
         '''_bufferTopoMap(lenSL, pntsPerLine) ... Add buffer boarder of zeros to all sides to topoMap data.'''
@@ -1184,37 +1157,29 @@ class ObjectWaterline(PathOp.ObjectOp):
         return [cl, cp, num]
 
     def _loopToGcode(self, obj, layDep, loop):
-        '''_loopToGcode(obj, layDep, loop) ... Convert set of loop points to Gcode.'''
+        '''_loopToGcode(obj, layDep, loop) ... Convert set of loop points to Gcode.
+        With OptimizeLinearPaths collinear points, within LinearDeflection, are removed.'''
         # generate the path commands
         output = []
 
-        # prev = FreeCAD.Vector(2135984513.165, -58351896873.17455, 13838638431.861)
-        nxt = FreeCAD.Vector(0.0, 0.0, 0.0)
-
-        # Create first point
-        pnt = FreeCAD.Vector(loop[0].x, loop[0].y, layDep)
+        pnts = PathSimplify.asArray(loop).copy()
+        pnts[:, 2] = layDep
+        if obj.OptimizeLinearPaths:
+            pnts = PathSimplify.rdp(pnts, obj.LinearDeflection.Value)
+        pnts = pnts.tolist()
 
         # Position cutter to begin loop
+        (x, y, z) = pnts[0]
         output.append(Path.Command('G0', {'Z': obj.ClearanceHeight.Value, 'F': self.vertRapid}))
-        output.append(Path.Command('G0', {'X': pnt.x, 'Y': pnt.y, 'F': self.horizRapid}))
-        output.append(Path.Command('G1', {'Z': pnt.z, 'F': self.vertFeed}))
+        output.append(Path.Command('G0', {'X': x, 'Y': y, 'F': self.horizRapid}))
+        output.append(Path.Command('G1', {'Z': layDep, 'F': self.vertFeed}))
 
-        lenCLP = len(loop)
-        lastIdx = lenCLP - 1
         # Cycle through each point on loop
-        for i in range(0, lenCLP):
-            if i < lastIdx:
-                nxt.x = loop[i + 1].x
-                nxt.y = loop[i + 1].y
-                nxt.z = layDep
-
-            output.append(Path.Command('G1', {'X': pnt.x, 'Y': pnt.y, 'F': self.horizFeed}))
-
-            # Rotate point data
-            pnt = nxt
+        for (x, y, z) in pnts:
+            output.append(Path.Command('G1', {'X': x, 'Y': y, 'F': self.horizFeed}))
 
         # Save layer end point for use in transitioning to next layer
-        self.layerEndPnt = pnt
+        self.layerEndPnt = FreeCAD.Vector(x, y, layDep)
 
         return output
 
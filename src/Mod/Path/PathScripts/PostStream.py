@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import os
+
+from FreeCAD import Units
+
+__title__ = "PostStream - streaming output for post processors"
+__author__ = "agent"
+__url__ = "https://www.freecadweb.org"
+__doc__ = "Buffered G-code output and cached unit formatting shared by the post processors."
+
+# Unlike PostUtils this module does not depend on the GUI, post processors
+# use it as follows:
+#
+#   with PostStream.GCodeOutput(filename) as output:
+#       fmt = PostStream.unitFormat(UNIT_FORMAT, UNIT_SPEED_FORMAT, PRECISION)
+#       output.write('G1 X' + fmt.length(x) + '\n')
+#       gcode = output.close()
+#
+# The G-code is written to a temporary file, which only replaces filename
+# when the output is closed. If an exception leaves the with block the
+# temporary file is removed and filename is left untouched.
+
+ChunkSize = 1 << 16
+
+
+class GCodeOutput(object):
+    '''GCodeOutput(filename=None, keepText=True, chunkSize=ChunkSize) ... collects the
+    generated G-code and writes it in chunks of about chunkSize characters to a temporary
+    file, which is renamed to filename by close(). Without filename the text is only
+    collected. With keepText the complete text is returned by getText() and close(), which
+    the post processors need for their return value and the editor dialog.'''
+
+    def __init__(self, filename=None, keepText=True, chunkSize=ChunkSize):
+        self.filename = filename
+        self.tempname = filename + '.tmp' if filename else None
+        self.file = open(self.tempname, 'w') if filename else None
+        self.keepText = keepText or self.file is None
+        self.chunkSize = chunkSize
+        self.chunks = []
+        self.pending = []
+        self.pendingSize = 0
+
+    def write(self, text):
+        '''write(text) ... appends text to the output.'''
+        self.pending.append(text)
+        self.pendingSize += len(text)
+        if self.pendingSize >= self.chunkSize:
+            self.flush()
+
+    def writeLines(self, lines, prefix=None):
+        '''writeLines(lines, prefix=None) ... appends each line of the multi line string
+        lines, prefix is a function called for every line, eg linenumber.'''
+        for line in lines.splitlines(True):
+            if prefix is None:
+                self.write(line)
+            else:
+                self.write(prefix() + line)
+
+    def flush(self):
+        '''flush() ... writes the pending text to the file.'''
+        if self.pending:
+            chunk = ''.join(self.pending)
+            self.pending = []
+            self.pendingSize = 0
+            if self.file:
+                self.file.write(chunk)
+            if self.keepText:
+                self.chunks.append(chunk)
+
+    def getText(self):
+        '''getText() ... returns all text written so far, None if the text is not kept.'''
+        self.flush()
+        if not self.keepText:
+            return None
+        if len(self.chunks) > 1:
+            self.chunks = [''.join(self.chunks)]
+        return self.chunks[0] if self.chunks else ''
+
+    def close(self):
+        '''close() ... flushes and closes the file, moves it to filename and returns getText().'''
+        self.flush()
+        if self.file:
+            self.file.close()
+            self.file = None
+            os.replace(self.tempname, self.filename)
+        return self.getText()
+
+    def discard(self):
+        '''discard() ... closes and removes the temporary file, filename is not written.'''
+        self.pending = []
+        self.pendingSize = 0
+        if self.file:
+            self.file.close()
+            self.file = None
+            try:
+                os.remove(self.tempname)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+
+class UnitFormat(object):
+    '''UnitFormat(unitFormat, speedFormat, precision, speedPrecision=None) ... formats
+    lengths and feed rates, given in mm and mm/s, in the output units of a post
+    processor. The conversion factors and format strings are computed once, the
+    results are identical to Units.Quantity(value, unit).getValueAs(unitFormat).'''
+
+    def __init__(self, unitFormat, speedFormat, precision, speedPrecision=None):
+        if speedPrecision is None:
+            speedPrecision = precision
+        # getValueAs divides by the value of the target unit, so do we
+        self.lengthDivisor = Units.Quantity(unitFormat).Value
+        self.speedDivisor = Units.Quantity(speedFormat).Value
+        self.lengthFormat = '%.' + str(precision) + 'f'
+        self.speedFormat = '%.' + str(speedPrecision) + 'f'
+
+    def lengthValue(self, value):
+        return value / self.lengthDivisor
+
+    def speedValue(self, value):
+        return value / self.speedDivisor
+
+    def length(self, value):
+        return self.lengthFormat % (value / self.lengthDivisor)
+
+    def speed(self, value):
+        return self.speedFormat % (value / self.speedDivisor)
+
+
+_unitFormats = {}
+
+
+def unitFormat(unitFormat, speedFormat, precision, speedPrecision=None):
+    '''unitFormat(unitFormat, speedFormat, precision, speedPrecision=None) ... returns
+    a shared UnitFormat for the given units and precision.'''
+    key = (unitFormat, speedFormat, str(precision), str(speedPrecision))
+    fmt = _unitFormats.get(key)
+    if fmt is None:
+        fmt = UnitFormat(unitFormat, speedFormat, precision, speedPrecision)
+        _unitFormats[key] = fmt
+    return fmt
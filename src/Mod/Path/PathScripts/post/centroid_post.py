@@ -25,10 +25,10 @@
 
 from __future__ import print_function
 import FreeCAD
-from FreeCAD import Units
 import datetime
 import PathScripts
 import PathScripts.PostUtils as PostUtils
+import PathScripts.PostStream as PostStream
 
 TOOLTIP = '''
 This is a postprocessor file for the Path workbench. It is used to
@@ -170,65 +170,58 @@ def export(objectslist, filename, argstring):
     global UNIT_SPEED_FORMAT
 
     print("postprocessing...")
-    gcode = ""
+    showEditor = SHOW_EDITOR
+    with PostStream.GCodeOutput(None if showEditor or filename == '-' else filename) as gcode:
+        # write header
+        if OUTPUT_HEADER:
+            gcode.write(HEADER)
 
-    # write header
-    if OUTPUT_HEADER:
-        gcode += HEADER
+        gcode.write(SAFETYBLOCK)
 
-    gcode += SAFETYBLOCK
+        # Write the preamble
+        if OUTPUT_COMMENTS:
+            for item in objectslist:
+                if hasattr(item, "Proxy") and isinstance(item.Proxy, PathScripts.PathToolController.ToolController):
+                    gcode.write(";T{}={}\n".format(item.ToolNumber, item.Name))
+            gcode.write(linenumber() + ";begin preamble\n")
+        gcode.writeLines(PREAMBLE, linenumber)
 
-    # Write the preamble
-    if OUTPUT_COMMENTS:
-        for item in objectslist:
-            if hasattr(item, "Proxy") and isinstance(item.Proxy, PathScripts.PathToolController.ToolController):
-                gcode += ";T{}={}\n".format(item.ToolNumber, item.Name)
-        gcode += linenumber() + ";begin preamble\n"
-    for line in PREAMBLE.splitlines(True):
-        gcode += linenumber() + line
+        gcode.write(linenumber() + UNITS + "\n")
 
-    gcode += linenumber() + UNITS + "\n"
+        for obj in objectslist:
+            # do the pre_op
+            if OUTPUT_COMMENTS:
+                gcode.write(linenumber() + ";begin operation\n")
+            gcode.writeLines(PRE_OPERATION, linenumber)
 
-    for obj in objectslist:
-        # do the pre_op
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + ";begin operation\n"
-        for line in PRE_OPERATION.splitlines(True):
-            gcode += linenumber() + line
+            parse(obj, gcode)
+
+            # do the post_op
+            if OUTPUT_COMMENTS:
+                gcode.write(linenumber() + ";end operation: %s\n" % obj.Label)
+            gcode.writeLines(POST_OPERATION, linenumber)
 
-        gcode += parse(obj)
+        # do the post_amble
 
-        # do the post_op
         if OUTPUT_COMMENTS:
-            gcode += linenumber() + ";end operation: %s\n" % obj.Label
-        for line in POST_OPERATION.splitlines(True):
-            gcode += linenumber() + line
-
-    # do the post_amble
-
-    if OUTPUT_COMMENTS:
-        gcode += ";begin postamble\n"
-    for line in TOOLRETURN.splitlines(True):
-        gcode += linenumber() + line
-    for line in SAFETYBLOCK.splitlines(True):
-        gcode += linenumber() + line
-    for line in POSTAMBLE.splitlines(True):
-        gcode += linenumber() + line
-
-    if SHOW_EDITOR:
+            gcode.write(";begin postamble\n")
+        gcode.writeLines(TOOLRETURN, linenumber)
+        gcode.writeLines(SAFETYBLOCK, linenumber)
+        gcode.writeLines(POSTAMBLE, linenumber)
+
+        # without editor the output is already written to the file
+        final = gcode.close()
+
+    if showEditor:
         dia = PostUtils.GCodeEditorDialog()
-        dia.editor.setText(gcode)
+        dia.editor.setText(final)
         result = dia.exec_()
         if result:
             final = dia.editor.toPlainText()
-        else:
-            final = gcode
-    else:
-        final = gcode
 
     print("done postprocessing.")
 
-    if not filename == '-':
+    if showEditor and not filename == '-':
         gfile = pythonopen(filename, "w")
         gfile.write(final)
         gfile.close()
@@ -245,11 +238,14 @@ def linenumber():
     return ""
 
 
-def parse(pathobj):
-    out = ""
+def parse(pathobj, output=None):
+    if output is None:
+        output = PostStream.GCodeOutput()
+        parse(pathobj, output)
+        return output.close()
+
     lastcommand = None
-    axis_precision_string = '.' + str(AXIS_PRECISION) + 'f'
-    feed_precision_string = '.' + str(FEED_PRECISION) + 'f'
+    fmt = PostStream.unitFormat(UNIT_FORMAT, UNIT_SPEED_FORMAT, AXIS_PRECISION, FEED_PRECISION)
     # params = ['X','Y','Z','A','B','I','J','K','F','S'] #This list control
     # the order of parameters
     # centroid doesn't want K properties on XY plane  Arcs need work.
@@ -257,18 +253,18 @@ def parse(pathobj):
 
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(compound: " + pathobj.Label + ")\n"
+        #     output.write(linenumber() + "(compound: " + pathobj.Label + ")\n")
         for p in pathobj.Group:
-            out += parse(p)
-        return out
+            parse(p, output)
+        return None
     else:  # parsing simple path
 
         # groups might contain non-path things like stock.
         if not hasattr(pathobj, "Path"):
-            return out
+            return None
 
         # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(" + pathobj.Label + ")\n"
+        #     output.write(linenumber() + "(" + pathobj.Label + ")\n")
 
         for c in pathobj.Path.Commands:
             commandlist = []  # list of elements in the command, code and params.
@@ -285,28 +281,20 @@ def parse(pathobj):
                     commandlist.pop(0)
 
             # Now add the remaining parameters in order
+            parameters = c.Parameters
             for param in params:
-                if param in c.Parameters:
+                if param in parameters:
                     if param == 'F':
                         if c.Name not in ["G0", "G00"]:  # centroid doesn't use rapid speeds
-                            speed = Units.Quantity(c.Parameters['F'], FreeCAD.Units.Velocity)
-                            commandlist.append(
-                                param + format(float(speed.getValueAs(UNIT_SPEED_FORMAT)), feed_precision_string))
+                            commandlist.append(param + fmt.speed(parameters['F']))
                     elif param == 'H':
-                        commandlist.append(param + str(int(c.Parameters['H'])))
+                        commandlist.append(param + str(int(parameters['H'])))
                     elif param == 'S':
-                        commandlist.append(param + PostUtils.fmt(c.Parameters['S'], SPINDLE_DECIMALS, "G21"))
+                        commandlist.append(param + PostUtils.fmt(parameters['S'], SPINDLE_DECIMALS, "G21"))
                     elif param == 'T':
-                        commandlist.append(param + str(int(c.Parameters['T'])))
+                        commandlist.append(param + str(int(parameters['T'])))
                     else:
-                        pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                        commandlist.append(
-                            param + format(float(pos.getValueAs(UNIT_FORMAT)), axis_precision_string))
-            outstr = str(commandlist)
-            outstr = outstr.replace('[', '')
-            outstr = outstr.replace(']', '')
-            outstr = outstr.replace("'", '')
-            outstr = outstr.replace(",", '')
+                        commandlist.append(param + fmt.length(parameters[param]))
 
             # store the latest command
             lastcommand = command
@@ -314,13 +302,12 @@ def parse(pathobj):
             # Check for Tool Change:
             if command == 'M6':
                 # if OUTPUT_COMMENTS:
-                #     out += linenumber() + "(begin toolchange)\n"
-                for line in TOOL_CHANGE.splitlines(True):
-                    out += linenumber() + line
+                #     output.write(linenumber() + "(begin toolchange)\n")
+                output.writeLines(TOOL_CHANGE, linenumber)
 
             # if command == "message":
             #     if OUTPUT_COMMENTS is False:
-            #         out = []
+            #         continue
             #     else:
             #         commandlist.pop(0)  # remove the command
 
@@ -329,12 +316,11 @@ def parse(pathobj):
                 if OUTPUT_LINE_NUMBERS:
                     commandlist.insert(0, (linenumber()))
 
-                # append the line to the final output
-                for w in commandlist:
-                    out += w + COMMAND_SPACE
-                out = out.strip() + "\n"
+                # append the line to the final output, stripping each line
+                # instead of the whole output keeps this linear
+                output.write((COMMAND_SPACE.join(commandlist)).strip() + "\n")
 
-        return out
+        return None
 
 
 print(__name__ + " gcode postprocessor loaded.")
@@ -30,6 +30,7 @@ import datetime
 import shlex
 import os.path
 from PathScripts import PostUtils
+from PathScripts import PostStream
 
 TOOLTIP = '''
 This is a postprocessor file for the Path workbench. It is used to
@@ -177,94 +178,90 @@ def export(objectslist, filename, argstring):
             return None
 
     print("postprocessing...")
-    gcode = ""
-
-    # write header
-    if OUTPUT_HEADER:
-        gcode += "%\n"
-        gcode += ";\n"
-        gcode += os.path.split(filename)[-1]+" ("+"FREECAD-FILENAME-GOES-HERE" + ", " + "JOB-NAME-GOES-HERE"+")\n"
-        gcode += linenumber() + "("+filename.upper()+",EXPORTED BY FREECAD!)\n"
-        gcode += linenumber() + "(POST PROCESSOR: " + __name__.upper() + ")\n"
-        gcode += linenumber() + "(OUTPUT TIME:" + str(now).upper() + ")\n"
-
-    # Write the preamble
-    if OUTPUT_COMMENTS:
-        gcode += linenumber() + "(BEGIN PREAMBLE)\n"
-    for line in PREAMBLE.splitlines(False):
-        gcode += linenumber() + line + "\n"
-    gcode += linenumber() + UNITS + "\n"
-
-    for obj in objectslist:
+    showEditor = FreeCAD.GuiUp and SHOW_EDITOR
+    with PostStream.GCodeOutput(None if showEditor or filename == '-' else filename) as gcode:
+        # write header
+        if OUTPUT_HEADER:
+            gcode.write("%\n")
+            gcode.write(";\n")
+            gcode.write(os.path.split(filename)[-1]+" ("+"FREECAD-FILENAME-GOES-HERE" + ", " + "JOB-NAME-GOES-HERE"+")\n")
+            gcode.write(linenumber() + "("+filename.upper()+",EXPORTED BY FREECAD!)\n")
+            gcode.write(linenumber() + "(POST PROCESSOR: " + __name__.upper() + ")\n")
+            gcode.write(linenumber() + "(OUTPUT TIME:" + str(now).upper() + ")\n")
+
+        # Write the preamble
+        if OUTPUT_COMMENTS:
+            gcode.write(linenumber() + "(BEGIN PREAMBLE)\n")
+        for line in PREAMBLE.splitlines(False):
+            gcode.write(linenumber() + line + "\n")
+        gcode.write(linenumber() + UNITS + "\n")
 
-        # Skip inactive operations
-        if hasattr(obj, 'Active'):
-            if not obj.Active:
-                continue
-        if hasattr(obj, 'Base') and hasattr(obj.Base, 'Active'):
-            if not obj.Base.Active:
-                continue
+        for obj in objectslist:
 
-        # do the pre_op
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + "(BEGIN OPERATION: %s)\n" % obj.Label.upper()
-            gcode += linenumber() + "(MACHINE UNITS: %s)\n" % (UNIT_SPEED_FORMAT.upper())
-        for line in PRE_OPERATION.splitlines(True):
-            gcode += linenumber() + line
-
-        # get coolant mode
-        coolantMode = 'None'
-        if hasattr(obj, "CoolantMode") or hasattr(obj, 'Base') and  hasattr(obj.Base, "CoolantMode"):
-            if hasattr(obj, "CoolantMode"):
-                coolantMode = obj.CoolantMode
-            else:
-                coolantMode = obj.Base.CoolantMode
+            # Skip inactive operations
+            if hasattr(obj, 'Active'):
+                if not obj.Active:
+                    continue
+            if hasattr(obj, 'Base') and hasattr(obj.Base, 'Active'):
+                if not obj.Base.Active:
+                    continue
 
-        # turn coolant on if required
-        if OUTPUT_COMMENTS:
-            if not coolantMode == 'None':
-                gcode += linenumber() + '(COOLANT ON:' + coolantMode.upper() + ')\n'
-        if coolantMode == 'Flood':
-            gcode  += linenumber() + 'M8' + '\n'
-        if coolantMode == 'Mist':
-            gcode += linenumber() + 'M7' + '\n'
+            # do the pre_op
+            if OUTPUT_COMMENTS:
+                gcode.write(linenumber() + "(BEGIN OPERATION: %s)\n" % obj.Label.upper())
+                gcode.write(linenumber() + "(MACHINE UNITS: %s)\n" % (UNIT_SPEED_FORMAT.upper()))
+            gcode.writeLines(PRE_OPERATION, linenumber)
+
+            # get coolant mode
+            coolantMode = 'None'
+            if hasattr(obj, "CoolantMode") or hasattr(obj, 'Base') and  hasattr(obj.Base, "CoolantMode"):
+                if hasattr(obj, "CoolantMode"):
+                    coolantMode = obj.CoolantMode
+                else:
+                    coolantMode = obj.Base.CoolantMode
 
-        # process the operation gcode
-        gcode += parse(obj)
+            # turn coolant on if required
+            if OUTPUT_COMMENTS:
+                if not coolantMode == 'None':
+                    gcode.write(linenumber() + '(COOLANT ON:' + coolantMode.upper() + ')\n')
+            if coolantMode == 'Flood':
+                gcode.write(linenumber() + 'M8' + '\n')
+            if coolantMode == 'Mist':
+                gcode.write(linenumber() + 'M7' + '\n')
 
-        # do the post_op
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + "(FINISH OPERATION: %s)\n" % obj.Label.upper()
-        for line in POST_OPERATION.splitlines(True):
-            gcode += linenumber() + line
+            # process the operation gcode
+            parse(obj, gcode)
 
-        # turn coolant off if required
-        if not coolantMode == 'None':
+            # do the post_op
             if OUTPUT_COMMENTS:
-                gcode += linenumber() + '(COOLANT OFF:' + coolantMode.upper() + ')\n'
-            gcode  += linenumber() +'M9' + '\n'
+                gcode.write(linenumber() + "(FINISH OPERATION: %s)\n" % obj.Label.upper())
+            gcode.writeLines(POST_OPERATION, linenumber)
+
+            # turn coolant off if required
+            if not coolantMode == 'None':
+                if OUTPUT_COMMENTS:
+                    gcode.write(linenumber() + '(COOLANT OFF:' + coolantMode.upper() + ')\n')
+                gcode.write(linenumber() +'M9' + '\n')
+
+        # do the post_amble
+        if OUTPUT_COMMENTS:
+            gcode.write("(BEGIN POSTAMBLE)\n")
+        gcode.writeLines(POSTAMBLE, linenumber)
+        gcode.write("%\n")
 
-    # do the post_amble
-    if OUTPUT_COMMENTS:
-        gcode += "(BEGIN POSTAMBLE)\n"
-    for line in POSTAMBLE.splitlines(True):
-        gcode += linenumber() + line
-    gcode += "%\n"
+        # without editor the output is already written to the file
+        final = gcode.close()
 
-    if FreeCAD.GuiUp and SHOW_EDITOR:
+    if showEditor:
         dia = PostUtils.GCodeEditorDialog()
-        dia.editor.setText(gcode)
+        dia.editor.setText(final)
         result = dia.exec_()
         if result:
             final = dia.editor.toPlainText()
-        else:
-            final = gcode
-    else:
-        final = gcode
 
     print("done postprocessing.")
 
-    if not filename == '-':
+    if showEditor and not filename == '-':
         gfile = pythonopen(filename, "w")
         gfile.write(final)
         gfile.close()
@@ -281,7 +278,7 @@ def linenumber():
     return ""
 
 
-def parse(pathobj):
+def parse(pathobj, output=None):
     # pylint: disable=global-statement
     global PRECISION
     global MODAL
@@ -290,9 +287,13 @@ def parse(pathobj):
     global UNIT_SPEED_FORMAT
     global tapSpeed
 
-    out = ""
+    if output is None:
+        output = PostStream.GCodeOutput()
+        parse(pathobj, output)
+        return output.close()
+
     lastcommand = None
-    precision_string = '.' + str(PRECISION) + 'f'
+    fmt = PostStream.unitFormat(UNIT_FORMAT, UNIT_SPEED_FORMAT, PRECISION)
     currLocation = {}  # keep track for no doubles
     print("Startup!")
 
@@ -305,18 +306,18 @@ def parse(pathobj):
 
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(compound: " + pathobj.Label + ")\n"
+        #     output.write(linenumber() + "(compound: " + pathobj.Label + ")\n")
         for p in pathobj.Group:
-            out += parse(p)
-        return out
+            parse(p, output)
+        return None
     else:  # parsing simple path
 
         # groups might contain non-path things like stock.
         if not hasattr(pathobj, "Path"):
-            return out
+            return None
 
         # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(" + pathobj.Label + ")\n"
+        #     output.write(linenumber() + "(" + pathobj.Label + ")\n")
 
         adaptiveOp = False
         opHorizRapid = 0
@@ -335,14 +336,17 @@ def parse(pathobj):
                 else:
                     FreeCAD.Console.PrintWarning('Tool Controller Vertical Rapid Values are unset'+ '\n')
 
-        for index,c in enumerate(pathobj.Path.Commands):
+        # Path.Commands creates all command objects on each access
+        commands = pathobj.Path.Commands
+        for index,c in enumerate(commands):
 
             outstring = []
             command = c.Name
-            if index+1 == len(pathobj.Path.Commands):
+            parameters = c.Parameters
+            if index+1 == len(commands):
               nextcommand = ""
             else:
-              nextcommand = pathobj.Path.Commands[index+1].Name
+              nextcommand = commands[index+1].Name
 
             if adaptiveOp and c.Name in ["G0", "G00"]:
                 if opHorizRapid and opVertRapid:
@@ -365,40 +369,37 @@ def parse(pathobj):
             if command == "G81" or command == "G83":
                 if hasattr(pathobj, 'ToolController') and pathobj.ToolController.Tool.ToolType == "Tap":
                     command = "G84"
-                    out += linenumber() + "G95\n"
+                    output.write(linenumber() + "G95\n")
                     paramstring = ""
                     for param in [ "X", "Y" ]:
-                        if param in c.Parameters:
-                            if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == c.Parameters[param]):
+                        if param in parameters:
+                            if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == parameters[param]):
                                 continue
                             else:
-                                pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                                paramstring += " " + param + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string)
+                                paramstring += " " + param + fmt.length(parameters[param])
                     if paramstring != "":
-                        out += linenumber() + "G00"+paramstring+"\n"
+                        output.write(linenumber() + "G00"+paramstring+"\n")
 
-                    if "S" in c.Parameters:
-                        tapSpeed = int(c.Parameters['S'])
-                    out += "M29 S"+str(tapSpeed)+"\n"
+                    if "S" in parameters:
+                        tapSpeed = int(parameters['S'])
+                    output.write("M29 S"+str(tapSpeed)+"\n")
 
                     for param in [ "Z", "R" ]:
-                        if param in c.Parameters:
-                            if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == c.Parameters[param]):
+                        if param in parameters:
+                            if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == parameters[param]):
                                 continue
                             else:
-                                pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                                paramstring += " " + param + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string)
+                                paramstring += " " + param + fmt.length(parameters[param])
                     # in this mode, F is the distance per revolution of the thread (pitch)
                     # P is the dwell time in seconds at the bottom of the thread
                     # Q is the peck depth of the threading operation
                     for param in [ "F", "P", "Q" ]:
-                        if param in c.Parameters:
-                            value = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                            paramstring += " " + param + format(float(value.getValueAs(UNIT_FORMAT)), precision_string) 
+                        if param in parameters:
+                            paramstring += " " + param + fmt.length(parameters[param])
 
-                    out += linenumber() + "G84" + paramstring + "\n"
-                    out += linenumber() + "G80\n"
-                    out += linenumber() + "G94\n"
+                    output.write(linenumber() + "G84" + paramstring + "\n")
+                    output.write(linenumber() + "G80\n")
+                    output.write(linenumber() + "G94\n")
                     continue
 
 
@@ -418,56 +419,52 @@ def parse(pathobj):
 
             # Now add the remaining parameters in order
             for param in params:
-                if param in c.Parameters:
-                    if param == 'F' and (currLocation[param] != c.Parameters[param] or OUTPUT_DOUBLES):
+                if param in parameters:
+                    if param == 'F' and (currLocation[param] != parameters[param] or OUTPUT_DOUBLES):
                         if c.Name not in ["G0", "G00"]:  # fanuc doesn't use rapid speeds
-                            speed = Units.Quantity(c.Parameters['F'], FreeCAD.Units.Velocity)
-                            if speed.getValueAs(UNIT_SPEED_FORMAT) > 0.0:
-                                outstring.append(param + format(float(speed.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+                            if fmt.speedValue(parameters['F']) > 0.0:
+                                outstring.append(param + fmt.speed(parameters['F']))
                             else:
                                 continue
                     elif param == 'T':
-                        outstring.append(param + str(int(c.Parameters['T'])))
+                        outstring.append(param + str(int(parameters['T'])))
                     elif param == 'H':
-                        outstring.append(param + str(int(c.Parameters['H'])))
+                        outstring.append(param + str(int(parameters['H'])))
                     elif param == 'D':
-                        outstring.append(param + str(int(c.Parameters['D'])))
+                        outstring.append(param + str(int(parameters['D'])))
                     elif param == 'S':
-                        outstring.append(param + str(int(c.Parameters['S'])))
+                        outstring.append(param + str(int(parameters['S'])))
                     else:
-                        if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == c.Parameters[param]):
+                        if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == parameters[param]):
                             continue
                         else:
-                            pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                            outstring.append(
-                                param + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string))
+                            outstring.append(param + fmt.length(parameters[param]))
 
             if adaptiveOp and c.Name in ["G0", "G00"]:
                 if opHorizRapid and opVertRapid:
-                    if 'Z' not in c.Parameters:
-                        outstring.append('F' + format(float(opHorizRapid.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+                    if 'Z' not in parameters:
+                        outstring.append('F' + fmt.speed(opHorizRapid.Value))
                     else:
-                        outstring.append('F' + format(float(opVertRapid.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+                        outstring.append('F' + fmt.speed(opVertRapid.Value))
 
             # store the latest command
             lastcommand = command
-            currLocation.update(c.Parameters)
+            currLocation.update(parameters)
 
             # Check for Tool Change:
             if command == 'M6':
                 # stop the spindle
-                out += linenumber() + "M5\n"
-                for line in TOOL_CHANGE.splitlines(True):
-                    out += linenumber() + line
+                output.write(linenumber() + "M5\n")
+                output.writeLines(TOOL_CHANGE, linenumber)
 
                 # add height offset
                 if USE_TLO:
-                    tool_height = '\nG43 H' + str(int(c.Parameters['T']))
+                    tool_height = '\nG43 H' + str(int(parameters['T']))
                     outstring.append(tool_height)
 
             if command == "message":
                 if OUTPUT_COMMENTS is False:
-                    out = []
+                    continue
                 else:
                     outstring.pop(0)  # remove the command
 
@@ -476,11 +473,10 @@ def parse(pathobj):
                 if OUTPUT_LINE_NUMBERS:
                     outstring.insert(0, (linenumber()))
 
-                # append the line to the final output
-                for w in outstring:
-                    out += w.upper() + COMMAND_SPACE
-                out = out.strip() + "\n"
+                # append the line to the final output, stripping each line
+                # instead of the whole output keeps this linear
+                output.write((COMMAND_SPACE.join(outstring)).upper().strip() + "\n")
 
-        return out
+        return None
 
 # print(__name__ + " gcode postprocessor loaded.")
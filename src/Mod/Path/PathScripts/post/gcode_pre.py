@@ -33,7 +33,11 @@ preserved. It is up to the user to create and assign appropriate tool
 controllers.
 
 Only gcodes that are supported by Path are imported. Thus things like G43
-are suppressed.
+are suppressed. Modal moves without G-code and canned cycles without the
+retained Z, R, Q and P words are completed from the modal state.
+
+The file is read in blocks, large programs can be cancelled through the
+progress indicator.
 
 Importing gcode is inherently dangerous because context cannot be safely
 assumed. The user should carefully examine the resulting gcode!
@@ -48,9 +52,6 @@ import PathScripts.PathUtils as PathUtils
 import PathScripts.PathLog as PathLog
 import re
 import PathScripts.PathCustom as PathCustom
-import PathScripts.PathCustomGui as PathCustomGui
-import PathScripts.PathOpGui as PathOpGui
-from PySide import QtCore
 
 # LEVEL = PathLog.Level.DEBUG
 LEVEL = PathLog.Level.INFO
@@ -64,6 +65,22 @@ if LEVEL == PathLog.Level.DEBUG:
 if open.__module__ in ['__builtin__', 'io']:
     pythonopen = open
 
+# Number of characters read from the file at once
+BlockSize = 1 << 20
+
+# comments in parentheses, an unterminated one ends with the line, and after a semicolon
+Comment = re.compile(r'\([^)\n]*\)?|;[^\n]*')
+# a G-code word, letter followed by a number
+Word = re.compile(r'([A-Z])\s*([-+]?(?:\d+\.?\d*|\.\d+))')
+
+MotionCommands = ['G0', 'G1', 'G2', 'G3']
+CycleCommands = ['G81', 'G82', 'G83']
+# modal commands Path supports, they are imported as commands of their own
+ModeCommands = ['G90', 'G91', 'G20', 'G21']
+# words of a canned cycle which are retained until the cycle is cancelled
+CycleWords = ['Z', 'R', 'Q', 'P']
+Axis = ["X", "Y", "Z", "A", "B", "C", "U", "V", "W"]
+
 
 def open(filename):
     "called when freecad opens a file."
@@ -82,33 +99,163 @@ def matchToolController(op, toolnumber):
     return toolcontrollers[0]
 
 
-def insert(filename, docname):
-    "called when freecad imports a file"
-    PathLog.track(filename)
-    gfile = pythonopen(filename)
-    gcode = gfile.read()
-    gfile.close()
+class GCodeParser(object):
+    '''GCodeParser() ... tokenizes G-code and collects the commands supported by Path.
+    The modal state is kept between calls of parse, so a program can be passed in
+    blocks of complete lines. The commands are split into sections on tool changes,
+    each section is a tuple (toolnumber, commands) and commands a list of strings
+    with one command each.'''
+
+    def __init__(self):
+        self.motion = None
+        self.cycle = {}
+        self.feed = None
+        self.tool = 0
+        self.modes = {}
+        self.names = {}
+        self.sections = [(0, [])]
+
+    def commandName(self, letter, number):
+        # G00 and G0 are the same command
+        name = self.names.get(letter + number)
+        if name is None:
+            value = float(number)
+            if value == int(value):
+                name = letter + str(int(value))
+            else:
+                name = letter + number
+            self.names[letter + number] = name
+        return name
+
+    def parse(self, text):
+        '''parse(text) ... adds the commands of text, which must end with a complete line.'''
+        commands = self.sections[-1][1]
+        for line in Comment.sub('', text.upper()).splitlines():
+            words = Word.findall(line)
+            if not words:
+                continue
 
-    # Regular expression to match tool changes in the format 'M6 Tn'
-    p = re.compile('[mM]+?\s?0?6\s?T\d*\s')
+            motion = None
+            modes = []
+            params = []
+            toolchange = False
+            cancel = False
+            unsupported = False
+            for (letter, number) in words:
+                if letter == 'G':
+                    name = self.commandName(letter, number)
+                    if name in MotionCommands or name in CycleCommands:
+                        motion = name
+                    elif name in ModeCommands:
+                        modes.append(name)
+                        # G20/G21 and G90/G91 replace each other
+                        self.modes[name[:2]] = name
+                    elif name == 'G80':
+                        cancel = True
+                    else:
+                        unsupported = True
+                elif letter == 'M':
+                    if self.commandName(letter, number) == 'M6':
+                        toolchange = True
+                elif letter == 'T':
+                    self.tool = int(float(number))
+                elif letter not in ['N', 'O']:
+                    params.append((letter, number))
+
+            if toolchange:
+                # each section starts in the current units and distance mode
+                commands = [self.modes[mode] for mode in sorted(self.modes)]
+                self.sections.append((self.tool, commands))
+            if cancel:
+                self.motion = None
+                self.cycle = {}
+            commands.extend(modes)
+
+            # modal moves have axis words but no G-code, the axis words of
+            # other G-codes, like G28 or G92, are not moves
+            if motion is None and self.motion and not unsupported:
+                for (letter, number) in params:
+                    if letter in Axis:
+                        motion = self.motion
+                        break
+
+            if motion is None:
+                # a feed rate on its own applies to the next move
+                for (letter, number) in params:
+                    if letter == 'F':
+                        self.feed = number
+                continue
+
+            if motion in CycleCommands:
+                given = [letter for (letter, number) in params]
+                for (letter, number) in params:
+                    if letter in CycleWords:
+                        self.cycle[letter] = number
+                for letter in CycleWords:
+                    if letter not in given and letter in self.cycle:
+                        params.append((letter, self.cycle[letter]))
+            else:
+                self.cycle = {}
+            self.motion = motion
+
+            if self.feed is not None:
+                if not any(letter == 'F' for (letter, number) in params):
+                    params.append(('F', self.feed))
+                self.feed = None
+
+            commands.append(' '.join([motion] + [letter + number for (letter, number) in params]))
+
+    def commands(self):
+        '''commands() ... returns the commands of all sections.'''
+        result = []
+        for (toolnumber, commands) in self.sections:
+            result.extend(commands)
+        return result
+
+
+def read(filename, parser, blockSize=BlockSize):
+    '''read(filename, parser, blockSize=BlockSize) ... passes the file in blocks to the parser.
+    Returns False if the user cancelled the import.'''
+    progress = FreeCAD.Base.ProgressIndicator()
+    progress.start("Importing G-code...", int(os.path.getsize(filename) / blockSize) + 1)
+    try:
+        with pythonopen(filename) as gfile:
+            rest = ''
+            block = gfile.read(blockSize)
+            while block:
+                block = rest + block
+                end = block.rfind('\n') + 1
+                parser.parse(block[:end])
+                rest = block[end:]
+                try:
+                    progress.next(True)
+                except RuntimeError:
+                    PathLog.info("Import of {} cancelled".format(filename))
+                    return False
+                block = gfile.read(blockSize)
+            parser.parse(rest)
+    finally:
+        progress.stop()
+    return True
 
-    # split the gcode on tool changes
-    paths = re.split('([mM]+?\s?0?6\s?T\d*\s)', gcode)
 
-    # iterate the gcode sections and add customs for each
-    toolnumber = 0
+def insert(filename, docname):
+    "called when freecad imports a file"
+    # the Gui modules are only needed here, GCodeParser can be used without Gui
+    import PathScripts.PathCustomGui as PathCustomGui
+    import PathScripts.PathOpGui as PathOpGui
+    from PySide import QtCore
 
-    for path in paths:
+    PathLog.track(filename)
+    parser = GCodeParser()
+    if not read(filename, parser):
+        return
 
-        # if the section is a tool change, extract the tool number
-        m = p.match(path)
-        if m:
-            toolnumber = int(m.group().split('T')[-1])
-            continue
+    # iterate the gcode sections and add customs for each
+    for (toolnumber, gcode) in parser.sections:
 
-        # Parse the gcode and throw away any empty lists
-        gcode = parse(path)
-        if len(gcode) == 0:
+        # throw away any sections without moves
+        if all(command in ModeCommands for command in gcode):
             continue
 
         # Create a custom and viewobject
@@ -127,59 +274,14 @@ def insert(filename, docname):
     FreeCAD.ActiveDocument.recompute()
 
 
-
 def parse(inputstring):
     "parse(inputstring): returns a parsed output string"
-
-    supported = ['G0', 'G00',
-                 'G1', 'G01',
-                 'G2', 'G02',
-                 'G3', 'G03',
-                 'G81', 'G82', 'G83',
-                 'G90', 'G91']
-
-    axis = ["X", "Y", "Z", "A", "B", "C", "U", "V", "W"]
-
     print("preprocessing...")
     PathLog.track(inputstring)
-    # split the input by line
-    lines = inputstring.splitlines()
-    output = []
-    lastcommand = None
-
-    for lin in lines:
-        # remove any leftover trailing and preceding spaces
-        lin = lin.strip()
-
-        # discard empty lines
-        if not lin:
-            continue
-
-        # remove line numbers
-        if lin[0].upper() in ["N"]:
-            lin = lin.split(" ", 1)
-            if len(lin) >= 1:
-                lin = lin[1].strip()
-            else:
-                continue
-
-        # Anything else not a G/M code or an axis move is ignored.
-        if lin[0] not in ["G", "M", "X", "Y", "Z", "A", "B", "C", "U", "V", "W"]:
-            continue
-
-        # if the remaining line is supported, store it
-        currcommand = lin.split()[0]
-
-        if currcommand in supported:
-            output.append(lin)
-            lastcommand = currcommand
-
-        # modal commands have no G or M but have axis moves. append those too.
-        elif currcommand[0] in axis and lastcommand:
-            output.append(lastcommand + " " + lin)
-
+    parser = GCodeParser()
+    parser.parse(inputstring)
     print("done preprocessing.")
-    return output
+    return parser.commands()
 
 
 print(__name__ + " gcode preprocessor loaded.")
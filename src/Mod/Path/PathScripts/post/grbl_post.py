@@ -27,6 +27,7 @@
 import FreeCAD
 from FreeCAD import Units
 import PathScripts.PostUtils as PostUtils
+import PathScripts.PostStream as PostStream
 import argparse
 import datetime
 import shlex
@@ -211,131 +212,128 @@ def export(objectslist, filename, argstring):
   global MOTION_MODE
   global SUPPRESS_COMMANDS
 
-  print("Post Processor: " + __name__ + " postprocessing...")
-  gcode = ""
-
-  # write header
-  if OUTPUT_HEADER:
-    gcode += linenumber() + "(Exported by FreeCAD)\n"
-    gcode += linenumber() + "(Post Processor: " + __name__ + ")\n"
-    gcode += linenumber() + "(Output Time:" + str(datetime.datetime.now()) + ")\n"
-
-  # Check canned cycles for drilling
-  if TRANSLATE_DRILL_CYCLES:
-    if len(SUPPRESS_COMMANDS) == 0:
-      SUPPRESS_COMMANDS = ['G99', 'G98', 'G80']
-    else:
-      SUPPRESS_COMMANDS += ['G99', 'G98', 'G80']
-
-  # Write the preamble
-  if OUTPUT_COMMENTS:
-    gcode += linenumber() + "(Begin preamble)\n"
-  for line in PREAMBLE.splitlines(True):
-    gcode += linenumber() + line
-  # verify if PREAMBLE have changed MOTION_MODE or UNITS
-  if 'G90' in PREAMBLE:
-    MOTION_MODE = 'G90'
-  elif 'G91' in PREAMBLE:
-    MOTION_MODE = 'G91'
-  else:
-    gcode += linenumber() + MOTION_MODE + "\n"
-  if 'G21' in PREAMBLE:
-    UNITS = 'G21'
-    UNIT_FORMAT = 'mm'
-    UNIT_SPEED_FORMAT = 'mm/min'
-  elif 'G20' in PREAMBLE:
-    UNITS = 'G20'
-    UNIT_FORMAT = 'in'
-    UNIT_SPEED_FORMAT = 'in/min'
-  else:
-    gcode += linenumber() + UNITS + "\n"
-
   for obj in objectslist:
-    # Debug...
-    # print("\n" + "*"*70)
-    # dump(obj)
-    # print("*"*70 + "\n")
     if not hasattr(obj, "Path"):
       print("The object " + obj.Name + " is not a path. Please select only path and Compounds.")
       return
 
-    # Skip inactive operations
-    if PathUtil.opProperty(obj, 'Active') is False:
-        continue
-
-    # do the pre_op
-    if OUTPUT_BCNC:
-      gcode += linenumber() + "(Block-name: " + obj.Label + ")\n"
-      gcode += linenumber() + "(Block-expand: 0)\n"
-      gcode += linenumber() + "(Block-enable: 1)\n"
-    if OUTPUT_COMMENTS:
-      gcode += linenumber() + "(Begin operation: " + obj.Label + ")\n"
-    for line in PRE_OPERATION.splitlines(True):
-      gcode += linenumber() + line
-
-    # get coolant mode
-    coolantMode = 'None'
-    if hasattr(obj, "CoolantMode") or hasattr(obj, 'Base') and  hasattr(obj.Base, "CoolantMode"):
-        if hasattr(obj, "CoolantMode"):
-            coolantMode = obj.CoolantMode
-        else:
-            coolantMode = obj.Base.CoolantMode
-
-    # turn coolant on if required
+  print("Post Processor: " + __name__ + " postprocessing...")
+  showEditor = FreeCAD.GuiUp and SHOW_EDITOR
+  with PostStream.GCodeOutput(None if showEditor else filename, keepText=showEditor) as gcode:
+    # write header
+    if OUTPUT_HEADER:
+      gcode.write(linenumber() + "(Exported by FreeCAD)\n")
+      gcode.write(linenumber() + "(Post Processor: " + __name__ + ")\n")
+      gcode.write(linenumber() + "(Output Time:" + str(datetime.datetime.now()) + ")\n")
+
+    # Check canned cycles for drilling
+    if TRANSLATE_DRILL_CYCLES:
+      if len(SUPPRESS_COMMANDS) == 0:
+        SUPPRESS_COMMANDS = ['G99', 'G98', 'G80']
+      else:
+        SUPPRESS_COMMANDS += ['G99', 'G98', 'G80']
+
+    # Write the preamble
     if OUTPUT_COMMENTS:
-        if not coolantMode == 'None':
-            gcode += linenumber() + '(Coolant On:' + coolantMode + ')\n'
-    if coolantMode == 'Flood':
-        gcode  += linenumber() + 'M8' + '\n'
-    if coolantMode == 'Mist':
-        gcode += linenumber() + 'M7' + '\n'
-
-    # Parse the op
-    gcode += parse(obj)
-
-    # do the post_op
+      gcode.write(linenumber() + "(Begin preamble)\n")
+    gcode.writeLines(PREAMBLE, linenumber)
+    # verify if PREAMBLE have changed MOTION_MODE or UNITS
+    if 'G90' in PREAMBLE:
+      MOTION_MODE = 'G90'
+    elif 'G91' in PREAMBLE:
+      MOTION_MODE = 'G91'
+    else:
+      gcode.write(linenumber() + MOTION_MODE + "\n")
+    if 'G21' in PREAMBLE:
+      UNITS = 'G21'
+      UNIT_FORMAT = 'mm'
+      UNIT_SPEED_FORMAT = 'mm/min'
+    elif 'G20' in PREAMBLE:
+      UNITS = 'G20'
+      UNIT_FORMAT = 'in'
+      UNIT_SPEED_FORMAT = 'in/min'
+    else:
+      gcode.write(linenumber() + UNITS + "\n")
+
+    for obj in objectslist:
+      # Debug...
+      # print("\n" + "*"*70)
+      # dump(obj)
+      # print("*"*70 + "\n")
+      # Skip inactive operations
+      if PathUtil.opProperty(obj, 'Active') is False:
+          continue
+
+      # do the pre_op
+      if OUTPUT_BCNC:
+        gcode.write(linenumber() + "(Block-name: " + obj.Label + ")\n")
+        gcode.write(linenumber() + "(Block-expand: 0)\n")
+        gcode.write(linenumber() + "(Block-enable: 1)\n")
+      if OUTPUT_COMMENTS:
+        gcode.write(linenumber() + "(Begin operation: " + obj.Label + ")\n")
+      gcode.writeLines(PRE_OPERATION, linenumber)
+
+      # get coolant mode
+      coolantMode = 'None'
+      if hasattr(obj, "CoolantMode") or hasattr(obj, 'Base') and  hasattr(obj.Base, "CoolantMode"):
+          if hasattr(obj, "CoolantMode"):
+              coolantMode = obj.CoolantMode
+          else:
+              coolantMode = obj.Base.CoolantMode
+
+      # turn coolant on if required
+      if OUTPUT_COMMENTS:
+          if not coolantMode == 'None':
+              gcode.write(linenumber() + '(Coolant On:' + coolantMode + ')\n')
+      if coolantMode == 'Flood':
+          gcode.write(linenumber() + 'M8' + '\n')
+      if coolantMode == 'Mist':
+          gcode.write(linenumber() + 'M7' + '\n')
+
+      # Parse the op
+      parse(obj, gcode)
+
+      # do the post_op
+      if OUTPUT_COMMENTS:
+        gcode.write(linenumber() + "(Finish operation: " + obj.Label + ")\n")
+      gcode.writeLines(POST_OPERATION, linenumber)
+
+      # turn coolant off if required
+      if not coolantMode == 'None':
+          if OUTPUT_COMMENTS:
+              gcode.write(linenumber() + '(Coolant Off:' + coolantMode + ')\n')
+          gcode.write(linenumber() +'M9' + '\n')
+
+    if RETURN_TO:
+      gcode.write(linenumber() + "G0 X%s Y%s\n" % tuple(RETURN_TO))
+
+    # do the post_amble
+    if OUTPUT_BCNC:
+      gcode.write(linenumber() + "(Block-name: post_amble)\n")
+      gcode.write(linenumber() + "(Block-expand: 0)\n")
+      gcode.write(linenumber() + "(Block-enable: 1)\n")
     if OUTPUT_COMMENTS:
-      gcode += linenumber() + "(Finish operation: " + obj.Label + ")\n"
-    for line in POST_OPERATION.splitlines(True):
-      gcode += linenumber() + line
+      gcode.write(linenumber() + "(Begin postamble)\n")
+    gcode.writeLines(POSTAMBLE, linenumber)
 
-    # turn coolant off if required
-    if not coolantMode == 'None':
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + '(Coolant Off:' + coolantMode + ')\n'
-        gcode += linenumber() +'M9' + '\n'
-
-  if RETURN_TO:
-    gcode += linenumber() + "G0 X%s Y%s\n" % tuple(RETURN_TO)
-
-  # do the post_amble
-  if OUTPUT_BCNC:
-    gcode += linenumber() + "(Block-name: post_amble)\n"
-    gcode += linenumber() + "(Block-expand: 0)\n"
-    gcode += linenumber() + "(Block-enable: 1)\n"
-  if OUTPUT_COMMENTS:
-    gcode += linenumber() + "(Begin postamble)\n"
-  for line in POSTAMBLE.splitlines(True):
-    gcode += linenumber() + line
+    # without editor the output is already written to the file
+    final = gcode.close()
 
   # show the gCode result dialog
-  if FreeCAD.GuiUp and SHOW_EDITOR:
+  if showEditor:
     dia = PostUtils.GCodeEditorDialog()
-    dia.editor.setText(gcode)
+    dia.editor.setText(final)
     result = dia.exec_()
     if result:
       final = dia.editor.toPlainText()
-    else:
-      final = gcode
-  else:
-    final = gcode
 
   print("Done postprocessing.")
 
   # write the file
-  gfile = pythonopen(filename, "w")
-  gfile.write(final)
-  gfile.close()
+  if showEditor:
+    gfile = pythonopen(filename, "w")
+    gfile.write(final)
+    gfile.close()
 
 
 def linenumber():
@@ -358,7 +356,7 @@ def format_outstring(strTable):
   return s
 
 
-def parse(pathobj):
+def parse(pathobj, output=None):
 
   global DRILL_RETRACT_MODE
   global MOTION_MODE
@@ -366,25 +364,30 @@ def parse(pathobj):
   global CURRENT_Y
   global CURRENT_Z
 
-  out = ""
+  if output is None:
+    output = PostStream.GCodeOutput()
+    parse(pathobj, output)
+    return output.close()
+
   lastcommand = None
+  fmt = PostStream.unitFormat(UNIT_FORMAT, UNIT_SPEED_FORMAT, PRECISION)
   precision_string = '.' + str(PRECISION) + 'f'
 
   params = ['X', 'Y', 'Z', 'A', 'B', 'C', 'U', 'V', 'W', 'I', 'J', 'K', 'F', 'S', 'T', 'Q', 'R', 'L', 'P']
 
   if hasattr(pathobj, "Group"):  # We have a compound or project.
     if OUTPUT_COMMENTS:
-      out += linenumber() + "(Compound: " + pathobj.Label + ")\n"
+      output.write(linenumber() + "(Compound: " + pathobj.Label + ")\n")
     for p in pathobj.Group:
-      out += parse(p)
-    return out
+      parse(p, output)
+    return None
 
   else:  # parsing simple path
     if not hasattr(pathobj, "Path"):  # groups might contain non-path things like stock.
-      return out
+      return None
 
     if OUTPUT_COMMENTS:
-      out += linenumber() + "(Path: " + pathobj.Label + ")\n"
+      output.write(linenumber() + "(Path: " + pathobj.Label + ")\n")
 
     for c in pathobj.Path.Commands:
       outstring = []
@@ -398,32 +401,31 @@ def parse(pathobj):
           outstring.pop(0)
 
       # Now add the remaining parameters in order
+      parameters = c.Parameters
       for param in params:
-        if param in c.Parameters:
+        if param in parameters:
           if param == 'F':
             if command not in RAPID_MOVES:
-              speed = Units.Quantity(c.Parameters['F'], FreeCAD.Units.Velocity)
-              if speed.getValueAs(UNIT_SPEED_FORMAT) > 0.0:
-                outstring.append(param + format(float(speed.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+              if fmt.speedValue(parameters['F']) > 0.0:
+                outstring.append(param + fmt.speed(parameters['F']))
           elif param in ['T', 'H', 'D', 'S', 'P', 'L']:
-            outstring.append(param + str(c.Parameters[param]))
+            outstring.append(param + str(parameters[param]))
           elif param in ['A', 'B', 'C']:
-            outstring.append(param + format(c.Parameters[param], precision_string))
+            outstring.append(param + format(parameters[param], precision_string))
           else:  # [X, Y, Z, U, V, W, I, J, K, R, Q] (Conversion eventuelle mm/inches)
-            pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-            outstring.append(param + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string))
+            outstring.append(param + fmt.length(parameters[param]))
 
       # store the latest command
       lastcommand = command
 
       # Memorizes the current position for calculating the related movements and the withdrawal plan
       if command in MOTION_COMMANDS:
-        if 'X' in c.Parameters:
-          CURRENT_X = Units.Quantity(c.Parameters['X'], FreeCAD.Units.Length)
-        if 'Y' in c.Parameters:
-          CURRENT_Y = Units.Quantity(c.Parameters['Y'], FreeCAD.Units.Length)
-        if 'Z' in c.Parameters:
-          CURRENT_Z = Units.Quantity(c.Parameters['Z'], FreeCAD.Units.Length)
+        if 'X' in parameters:
+          CURRENT_X = Units.Quantity(parameters['X'], FreeCAD.Units.Length)
+        if 'Y' in parameters:
+          CURRENT_Y = Units.Quantity(parameters['Y'], FreeCAD.Units.Length)
+        if 'Z' in parameters:
+          CURRENT_Z = Units.Quantity(parameters['Z'], FreeCAD.Units.Length)
 
       if command in ('G98', 'G99'):
         DRILL_RETRACT_MODE = command
@@ -434,30 +436,29 @@ def parse(pathobj):
 
       if TRANSLATE_DRILL_CYCLES:
         if command in ('G81', 'G82', 'G83'):
-          out += drill_translate(outstring, command, c.Parameters)
+          output.write(drill_translate(outstring, command, parameters))
           # Erase the line we just translated
           outstring = []
 
       if SPINDLE_WAIT > 0:
         if command in ('M3', 'M03', 'M4', 'M04'):
-          out += linenumber() + format_outstring(outstring) + "\n"
-          out += linenumber() + format_outstring(['G4', 'P%s' % SPINDLE_WAIT]) + "\n"
+          output.write(linenumber() + format_outstring(outstring) + "\n")
+          output.write(linenumber() + format_outstring(['G4', 'P%s' % SPINDLE_WAIT]) + "\n")
           outstring = []
 
       # Check for Tool Change:
       if command in ('M6', 'M06'):
         if OUTPUT_COMMENTS:
-          out += linenumber() + "(Begin toolchange)\n"
+          output.write(linenumber() + "(Begin toolchange)\n")
         if not OUTPUT_TOOL_CHANGE:
           outstring.insert(0, "(" )
           outstring.append( ")" )
         else:
-          for line in TOOL_CHANGE.splitlines(True):
-            out += linenumber() + line
+          output.writeLines(TOOL_CHANGE, linenumber)
 
       if command == "message":
         if OUTPUT_COMMENTS is False:
-          out = []
+          continue
         else:
           outstring.pop(0)  # remove the command
 
@@ -467,9 +468,9 @@ def parse(pathobj):
 
       # prepend a line number and append a newline
       if len(outstring) >= 1:
-          out += linenumber() + format_outstring(outstring) + "\n"
+          output.write(linenumber() + format_outstring(outstring) + "\n")
 
-  return out
+  return None
 
 
 def drill_translate(outstring, cmd, params):
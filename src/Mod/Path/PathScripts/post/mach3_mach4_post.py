@@ -28,6 +28,7 @@ import argparse
 import datetime
 import shlex
 from PathScripts import PostUtils
+from PathScripts import PostStream
 
 TOOLTIP = '''
 This is a postprocessor file for the Path workbench. It is used to
@@ -167,90 +168,86 @@ def export(objectslist, filename, argstring):
             return None
 
     print("postprocessing...")
-    gcode = ""
+    showEditor = FreeCAD.GuiUp and SHOW_EDITOR
+    with PostStream.GCodeOutput(None if showEditor or filename == '-' else filename) as gcode:
+        # write header
+        if OUTPUT_HEADER:
+            gcode.write(linenumber() + "(Exported by FreeCAD)\n")
+            gcode.write(linenumber() + "(Post Processor: " + __name__ + ")\n")
+            gcode.write(linenumber() + "(Output Time:" + str(now) + ")\n")
+
+        # Write the preamble
+        if OUTPUT_COMMENTS:
+            gcode.write(linenumber() + "(begin preamble)\n")
+        for line in PREAMBLE.splitlines(False):
+            gcode.write(linenumber() + line + "\n")
+        gcode.write(linenumber() + UNITS + "\n")
+
+        for obj in objectslist:
+
+            # Skip inactive operations
+            if hasattr(obj, 'Active'):
+                if not obj.Active:
+                    continue
+            if hasattr(obj, 'Base') and hasattr(obj.Base, 'Active'):
+                if not obj.Base.Active:
+                    continue
+
+            # do the pre_op
+            if OUTPUT_COMMENTS:
+                gcode.write(linenumber() + "(begin operation: %s)\n" % obj.Label)
+                gcode.write(linenumber() + "(machine: %s, %s)\n" % (MACHINE_NAME, UNIT_SPEED_FORMAT))
+            gcode.writeLines(PRE_OPERATION, linenumber)
+
+            # get coolant mode
+            coolantMode = 'None'
+            if hasattr(obj, "CoolantMode") or hasattr(obj, 'Base') and  hasattr(obj.Base, "CoolantMode"):
+                if hasattr(obj, "CoolantMode"):
+                    coolantMode = obj.CoolantMode
+                else:
+                    coolantMode = obj.Base.CoolantMode
 
-    # write header
-    if OUTPUT_HEADER:
-        gcode += linenumber() + "(Exported by FreeCAD)\n"
-        gcode += linenumber() + "(Post Processor: " + __name__ + ")\n"
-        gcode += linenumber() + "(Output Time:" + str(now) + ")\n"
+            # turn coolant on if required
+            if OUTPUT_COMMENTS:
+                if not coolantMode == 'None':
+                    gcode.write(linenumber() + '(Coolant On:' + coolantMode + ')\n')
+            if coolantMode == 'Flood':
+                gcode.write(linenumber() + 'M8' + '\n')
+            if coolantMode == 'Mist':
+                gcode.write(linenumber() + 'M7' + '\n')
 
-    # Write the preamble
-    if OUTPUT_COMMENTS:
-        gcode += linenumber() + "(begin preamble)\n"
-    for line in PREAMBLE.splitlines(False):
-        gcode += linenumber() + line + "\n"
-    gcode += linenumber() + UNITS + "\n"
+            # process the operation gcode
+            parse(obj, gcode)
 
-    for obj in objectslist:
-
-        # Skip inactive operations
-        if hasattr(obj, 'Active'):
-            if not obj.Active:
-                continue
-        if hasattr(obj, 'Base') and hasattr(obj.Base, 'Active'):
-            if not obj.Base.Active:
-                continue
+            # do the post_op
+            if OUTPUT_COMMENTS:
+                gcode.write(linenumber() + "(finish operation: %s)\n" % obj.Label)
+            gcode.writeLines(POST_OPERATION, linenumber)
 
-        # do the pre_op
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + "(begin operation: %s)\n" % obj.Label
-            gcode += linenumber() + "(machine: %s, %s)\n" % (MACHINE_NAME, UNIT_SPEED_FORMAT)
-        for line in PRE_OPERATION.splitlines(True):
-            gcode += linenumber() + line
-
-        # get coolant mode
-        coolantMode = 'None'
-        if hasattr(obj, "CoolantMode") or hasattr(obj, 'Base') and  hasattr(obj.Base, "CoolantMode"):
-            if hasattr(obj, "CoolantMode"):
-                coolantMode = obj.CoolantMode
-            else:
-                coolantMode = obj.Base.CoolantMode
-
-        # turn coolant on if required
-        if OUTPUT_COMMENTS:
+            # turn coolant off if required
             if not coolantMode == 'None':
-                gcode += linenumber() + '(Coolant On:' + coolantMode + ')\n'
-        if coolantMode == 'Flood':
-            gcode  += linenumber() + 'M8' + '\n'
-        if coolantMode == 'Mist':
-            gcode += linenumber() + 'M7' + '\n'
-
-        # process the operation gcode
-        gcode += parse(obj)
+                if OUTPUT_COMMENTS:
+                    gcode.write(linenumber() + '(Coolant Off:' + coolantMode + ')\n')
+                gcode.write(linenumber() +'M9' + '\n')
 
-        # do the post_op
+        # do the post_amble
         if OUTPUT_COMMENTS:
-            gcode += linenumber() + "(finish operation: %s)\n" % obj.Label
-        for line in POST_OPERATION.splitlines(True):
-            gcode += linenumber() + line
-
-        # turn coolant off if required
-        if not coolantMode == 'None':
-            if OUTPUT_COMMENTS:
-                gcode += linenumber() + '(Coolant Off:' + coolantMode + ')\n'
-            gcode  += linenumber() +'M9' + '\n'
+            gcode.write("(begin postamble)\n")
+        gcode.writeLines(POSTAMBLE, linenumber)
 
-    # do the post_amble
-    if OUTPUT_COMMENTS:
-        gcode += "(begin postamble)\n"
-    for line in POSTAMBLE.splitlines(True):
-        gcode += linenumber() + line
+        # without editor the output is already written to the file
+        final = gcode.close()
 
-    if FreeCAD.GuiUp and SHOW_EDITOR:
+    if showEditor:
         dia = PostUtils.GCodeEditorDialog()
-        dia.editor.setText(gcode)
+        dia.editor.setText(final)
         result = dia.exec_()
         if result:
             final = dia.editor.toPlainText()
-        else:
-            final = gcode
-    else:
-        final = gcode
 
     print("done postprocessing.")
 
-    if not filename == '-':
+    if showEditor and not filename == '-':
         gfile = pythonopen(filename, "w")
         gfile.write(final)
         gfile.close()
@@ -267,7 +264,7 @@ def linenumber():
     return ""
 
 
-def parse(pathobj):
+def parse(pathobj, output=None):
     # pylint: disable=global-statement
     global PRECISION
     global MODAL
@@ -275,9 +272,13 @@ def parse(pathobj):
     global UNIT_FORMAT
     global UNIT_SPEED_FORMAT
 
-    out = ""
+    if output is None:
+        output = PostStream.GCodeOutput()
+        parse(pathobj, output)
+        return output.close()
+
     lastcommand = None
-    precision_string = '.' + str(PRECISION) + 'f'
+    fmt = PostStream.unitFormat(UNIT_FORMAT, UNIT_SPEED_FORMAT, PRECISION)
     currLocation = {}  # keep track for no doubles
 
     # the order of parameters
@@ -288,18 +289,18 @@ def parse(pathobj):
 
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(compound: " + pathobj.Label + ")\n"
+        #     output.write(linenumber() + "(compound: " + pathobj.Label + ")\n")
         for p in pathobj.Group:
-            out += parse(p)
-        return out
+            parse(p, output)
+        return None
     else:  # parsing simple path
 
         # groups might contain non-path things like stock.
         if not hasattr(pathobj, "Path"):
-            return out
+            return None
 
         # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(" + pathobj.Label + ")\n"
+        #     output.write(linenumber() + "(" + pathobj.Label + ")\n")
 
         adaptiveOp = False
         opHorizRapid = 0
@@ -341,57 +342,54 @@ def parse(pathobj):
                 continue
 
             # Now add the remaining parameters in order
+            parameters = c.Parameters
             for param in params:
-                if param in c.Parameters:
-                    if param == 'F' and (currLocation[param] != c.Parameters[param] or OUTPUT_DOUBLES):
+                if param in parameters:
+                    if param == 'F' and (currLocation[param] != parameters[param] or OUTPUT_DOUBLES):
                         if c.Name not in ["G0", "G00"]:  # mach3_4 doesn't use rapid speeds
-                            speed = Units.Quantity(c.Parameters['F'], FreeCAD.Units.Velocity)
-                            if speed.getValueAs(UNIT_SPEED_FORMAT) > 0.0:
-                                outstring.append(param + format(float(speed.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+                            if fmt.speedValue(parameters['F']) > 0.0:
+                                outstring.append(param + fmt.speed(parameters['F']))
                             else:
                                 continue
                     elif param == 'T':
-                        outstring.append(param + str(int(c.Parameters['T'])))
+                        outstring.append(param + str(int(parameters['T'])))
                     elif param == 'H':
-                        outstring.append(param + str(int(c.Parameters['H'])))
+                        outstring.append(param + str(int(parameters['H'])))
                     elif param == 'D':
-                        outstring.append(param + str(int(c.Parameters['D'])))
+                        outstring.append(param + str(int(parameters['D'])))
                     elif param == 'S':
-                        outstring.append(param + str(int(c.Parameters['S'])))
+                        outstring.append(param + str(int(parameters['S'])))
                     else:
-                        if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == c.Parameters[param]):
+                        if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == parameters[param]):
                             continue
                         else:
-                            pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                            outstring.append(
-                                param + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string))
+                            outstring.append(param + fmt.length(parameters[param]))
 
             if adaptiveOp and c.Name in ["G0", "G00"]:
                 if opHorizRapid and opVertRapid:
-                    if 'Z' not in c.Parameters:
-                        outstring.append('F' + format(float(opHorizRapid.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+                    if 'Z' not in parameters:
+                        outstring.append('F' + fmt.speed(opHorizRapid.Value))
                     else:
-                        outstring.append('F' + format(float(opVertRapid.getValueAs(UNIT_SPEED_FORMAT)), precision_string))
+                        outstring.append('F' + fmt.speed(opVertRapid.Value))
 
             # store the latest command
             lastcommand = command
-            currLocation.update(c.Parameters)
+            currLocation.update(parameters)
 
             # Check for Tool Change:
             if command == 'M6':
                 # stop the spindle
-                out += linenumber() + "M5\n"
-                for line in TOOL_CHANGE.splitlines(True):
-                    out += linenumber() + line
+                output.write(linenumber() + "M5\n")
+                output.writeLines(TOOL_CHANGE, linenumber)
 
                 # add height offset
                 if USE_TLO:
-                    tool_height = '\nG43 H' + str(int(c.Parameters['T']))
+                    tool_height = '\nG43 H' + str(int(parameters['T']))
                     outstring.append(tool_height)
 
             if command == "message":
                 if OUTPUT_COMMENTS is False:
-                    out = []
+                    continue
                 else:
                     outstring.pop(0)  # remove the command
 
@@ -400,11 +398,10 @@ def parse(pathobj):
                 if OUTPUT_LINE_NUMBERS:
                     outstring.insert(0, (linenumber()))
 
-                # append the line to the final output
-                for w in outstring:
-                    out += w + COMMAND_SPACE
-                out = out.strip() + "\n"
+                # append the line to the final output, stripping each line
+                # instead of the whole output keeps this linear
+                output.write((COMMAND_SPACE.join(outstring)).strip() + "\n")
 
-        return out
+        return None
 
 # print(__name__ + " gcode postprocessor loaded.")
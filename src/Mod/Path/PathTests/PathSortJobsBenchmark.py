@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Benchmark of the hole ordering in PathUtils.sort_jobs.
+
+Compares the former implementation, which searched all remaining locations for
+every step, with the grid based search and with the additional 2-opt pass.
+Run it from the FreeCAD python console or FreeCADCmd:
+
+    import PathTests.PathSortJobsBenchmark as PathSortJobsBenchmark
+    PathSortJobsBenchmark.run()
+"""
+
+import random
+import time
+
+import PathScripts.PathUtils as PathUtils
+
+from collections import defaultdict
+
+
+def legacy_sort_jobs(locations, keys, attractors=None):
+    """legacy_sort_jobs(locations, keys, attractors=None) ... the former
+    implementation of PathUtils.sort_jobs, quadratic in the number of locations."""
+    from queue import PriorityQueue
+
+    attractors = attractors or [keys[0]]
+    locations = list(locations)
+
+    def sqdist(a, b):
+        d = 0
+        for k in keys:
+            d += (a[k] - b[k]) ** 2
+        return d
+
+    def weight(location):
+        w = 0
+        for k in attractors:
+            w += abs(location[k])
+        return w
+
+    def find_closest(location_list, location):
+        q = PriorityQueue()
+        for i, j in enumerate(location_list):
+            # prevent dictionary comparison by inserting the index
+            q.put((sqdist(j, location) + weight(j), i, j))
+        return q.get()[2]
+
+    out = []
+    last = defaultdict(lambda: 0)
+    while locations:
+        last = find_closest(locations, last)
+        out.append(last)
+        locations.remove(last)
+    return out
+
+
+def perforated_panel(count, pitch=5.0, jitter=0.0, seed=0):
+    """perforated_panel(count, pitch=5.0, jitter=0.0, seed=0) ... returns count hole
+    locations on a square grid in random order, optionally moved by up to jitter."""
+    rnd = random.Random(seed)
+    columns = int(count ** 0.5) + 1
+    holes = []
+    for i in range(count):
+        holes.append(
+            {
+                "x": (i % columns) * pitch + rnd.uniform(-jitter, jitter),
+                "y": (i // columns) * pitch + rnd.uniform(-jitter, jitter),
+                "r": 0,
+            }
+        )
+    rnd.shuffle(holes)
+    return holes
+
+
+def run(counts=(1000, 5000, 20000, 100000), optimize_time=5.0, legacy_limit=5000, jitter=1.0):
+    """run(counts, optimize_time=5.0, legacy_limit=5000, jitter=1.0) ... prints runtime
+    and rapid travel distance for each hole count. The former implementation is only
+    run up to legacy_limit holes. Returns the results as list of dicts."""
+    keys = ["x", "y"]
+    results = []
+    print("{:>8} {:>22} {:>22} {:>22}".format("holes", "former", "grid", "grid + 2-opt"))
+    for count in counts:
+        holes = perforated_panel(count, jitter=jitter)
+        result = {"count": count}
+
+        if count <= legacy_limit:
+            start = time.time()
+            ordered = legacy_sort_jobs(holes, keys)
+            result["legacy"] = (time.time() - start, PathUtils.jobs_travel_distance(ordered, keys))
+
+        start = time.time()
+        ordered = PathUtils.sort_jobs(holes, keys)
+        result["grid"] = (time.time() - start, PathUtils.jobs_travel_distance(ordered, keys))
+
+        start = time.time()
+        ordered = PathUtils.optimize_jobs(ordered, keys, optimize_time)
+        result["optimized"] = (
+            result["grid"][0] + time.time() - start,
+            PathUtils.jobs_travel_distance(ordered, keys),
+        )
+
+        columns = []
+        for name in ("legacy", "grid", "optimized"):
+            if name in result:
+                columns.append("{:8.2f}s {:10.0f}mm".format(*result[name]))
+            else:
+                columns.append("{:>22}".format("-"))
+        print("{:>8} {} {} {}".format(count, *columns))
+        results.append(result)
+    return results
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import Path
+import math
+
+import PathScripts.PathCycleTime as PathCycleTime
+import PathTests.PathTestUtils as PathTestUtils
+
+
+class TestPathCycleTime(PathTestUtils.PathTestBase):
+
+    def test00(self):
+        '''Verify moves take their length divided by the feed rate without machine limits.'''
+        commands = [Path.Command('G0', {'X': 30, 'Y': 40}),
+                    Path.Command('G0', {'Z': -10}),
+                    Path.Command('G1', {'X': 60, 'Y': 0}),
+                    Path.Command('G1', {'Z': -20}),
+                    Path.Command('G1', {'X': 80, 'F': 4})]
+        estimate = PathCycleTime.cycleTime(commands, 10, 2, 25, 5)
+        self.assertRoughly(estimate.rapidTime, 50 / 25 + 10 / 5)
+        self.assertRoughly(estimate.feedTime, 50 / 10 + 10 / 2 + 20 / 4)
+        self.assertRoughly(estimate.seconds, 19)
+        self.assertRoughly(estimate.rapidLength, 60)
+        self.assertRoughly(estimate.feedLength, 80)
+        self.assertEqual([round(t, 3) for t in estimate.commandTimes], [2, 2, 5, 5, 5])
+
+        # without rapid rates rapid moves use the feed rates
+        self.assertRoughly(PathCycleTime.cycleTime(commands, 10, 2, 0, 0).rapidTime, 50 / 10 + 10 / 2)
+
+    def test01(self):
+        '''Verify acceleration and jerk limits slow down a straight move.'''
+        commands = [Path.Command('G1', {'X': 100, 'F': 10})]
+        # 1s to accelerate over 5mm, 90mm at full speed, 1s to stop
+        limits = PathCycleTime.MachineLimits(10, 10)
+        self.assertRoughly(PathCycleTime.cycleTime(commands, 10, 10, 0, 0, limits).seconds, 11)
+        # too short to reach the feed rate, accelerate over 2mm and stop
+        commands = [Path.Command('G1', {'X': 4, 'F': 10})]
+        self.assertRoughly(PathCycleTime.cycleTime(commands, 10, 10, 0, 0, limits).seconds, 2 * math.sqrt(2 * 2 / 10))
+        # the same with a Z axis limit of 0 is not limited
+        commands = [Path.Command('G1', {'Z': 100, 'F': 10})]
+        limits = PathCycleTime.MachineLimits(10, 0)
+        self.assertRoughly(PathCycleTime.cycleTime(commands, 10, 10, 0, 0, limits).seconds, 10)
+
+        # jerk adds a/j to each full acceleration phase, covering 5.5mm each
+        commands = [Path.Command('G1', {'X': 100, 'F': 10})]
+        limits = PathCycleTime.MachineLimits(10, 10, 100, 100)
+        self.assertRoughly(PathCycleTime.cycleTime(commands, 10, 10, 0, 0, limits).seconds, 2 * 1.1 + 89 / 10)
+
+    def test02(self):
+        '''Verify the junction deviation limits the speed at corners.'''
+        straight = [Path.Command('G1', {'X': x, 'F': 10}) for x in range(5, 105, 5)]
+        corner = [Path.Command('G1', {'X': 50, 'F': 10}), Path.Command('G1', {'X': 50, 'Y': 50})]
+        for deviation in [0, 0.01, 1]:
+            limits = PathCycleTime.MachineLimits(10, 10, 0, 0, deviation)
+            # collinear moves never slow down
+            self.assertRoughly(PathCycleTime.cycleTime(straight, 10, 10, 0, 0, limits).seconds, 11)
+            t = PathCycleTime.cycleTime(corner, 10, 10, 0, 0, limits).seconds
+            if deviation == 0:
+                # a deviation of 0 doesn't limit the speed at the corner
+                self.assertRoughly(t, 11)
+            else:
+                self.assertTrue(11 < t < 12)
+        # the corner speed grows with the deviation
+        fast = PathCycleTime.cycleTime(corner, 10, 10, 0, 0, PathCycleTime.MachineLimits(10, 10, 0, 0, 1)).seconds
+        slow = PathCycleTime.cycleTime(corner, 10, 10, 0, 0, PathCycleTime.MachineLimits(10, 10, 0, 0, 0.01)).seconds
+        self.assertTrue(fast < slow)
+
+    def test03(self):
+        '''Verify arcs are estimated by their length and the estimates are cached.'''
+        commands = [Path.Command('G0', {'X': 10}),
+                    Path.Command('G2', {'X': -10, 'I': -10, 'J': 0, 'F': 5})]
+        path = Path.Path(commands)
+        estimate = PathCycleTime.pathCycleTime(path, 5, 5, 10, 10)
+        self.assertRoughly(estimate.feedTime, math.pi * 10 / 5, 0.01)
+        self.assertRoughly(estimate.rapidTime, 1)
+
+        self.assertTrue(PathCycleTime.pathCycleTime(Path.Path(commands), 5, 5, 10, 10) is estimate)
+        self.assertFalse(PathCycleTime.pathCycleTime(path, 5, 5, 20, 10) is estimate)
+        limits = PathCycleTime.MachineLimits(100, 100, 0, 0, 0.01)
+        self.assertTrue(PathCycleTime.pathCycleTime(path, 5, 5, 10, 10, limits).seconds > estimate.seconds)
+
+    def test04(self):
+        '''Verify the chords of an arc are limited by the centripetal acceleration, not the junction deviation.'''
+        circle = [Path.Command('G2', {'X': 10, 'I': -10, 'J': 0, 'F': 50})]
+        # a line of the same length accelerates over 2.5mm, moves at 50mm/s and stops
+        expected = 0.2 + (2 * math.pi * 10 - 5) / 50
+        for deviation in [0, 0.01]:
+            limits = PathCycleTime.MachineLimits(500, 500, 0, 0, deviation)
+            t = PathCycleTime.cycleTime(circle, 50, 50, 0, 0, limits, (10, 0, 0)).seconds
+            self.assertRoughly(t, expected, 0.01)
+
+        # on a radius of 1mm 500mm/s^2 only allow for about 22mm/s
+        circle = [Path.Command('G2', {'X': 1, 'I': -1, 'J': 0, 'F': 50})]
+        limits = PathCycleTime.MachineLimits(500, 500, 0, 0, 0.01)
+        t = PathCycleTime.cycleTime(circle, 50, 50, 0, 0, limits, (1, 0, 0)).seconds
+        self.assertTrue(2 * math.pi / math.sqrt(500 * math.sqrt(2)) < t < 2 * math.pi / math.sqrt(500) + 0.1)
@@ -20,6 +20,8 @@
 # *                                                                         *
 # ***************************************************************************
 
+import Part
+import PathScripts.PathDressupHoldingTags as PathDressupHoldingTags
 import PathTests.PathTestUtils as PathTestUtils
 import math
 
@@ -68,3 +70,19 @@ class TestHoldingTags(PathTestUtils.PathTestBase):
         print(h)
         self.assertConeAt(tag.solid, Vector(0,0,-h * 0.01), 2.5, 0, h)
 
+    def test05(self):
+        """Verify only the edges near a tag are candidates for its intersection."""
+        pts = [Vector(0, 0, 0), Vector(100, 0, 0), Vector(100, 50, 0), Vector(0, 50, 0), Vector(0, 0, 0)]
+        edges = [Part.Edge(Part.LineSegment(p0, p1)) for p0, p1 in zip(pts, pts[1:])]
+        edges.append(Part.Edge(Part.LineSegment(Vector(0, 0, 0), Vector(100, 50, 0))))
+        index = PathDressupHoldingTags._EdgeIndex(edges)
+
+        tag = Tag(0, 50, 0, 4, 5, 90, 0, True)
+        tag.createSolidsAt(0, 1)
+        self.assertEqual(index.edgesNear(tag.solid.BoundBox), set([0, 4]))
+        tag = Tag(0, 100, 25, 4, 5, 90, 0, True)
+        tag.createSolidsAt(0, 1)
+        self.assertEqual(index.edgesNear(tag.solid.BoundBox), set([1, 4]))
+        tag = Tag(0, 0, 0, 4, 5, 90, 0, True)
+        tag.createSolidsAt(0, 1)
+        self.assertEqual(index.edgesNear(tag.solid.BoundBox), set([0, 3, 4]))
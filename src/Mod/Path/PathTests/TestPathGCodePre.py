@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import Path
+
+import PathScripts.post.gcode_pre as gcode_pre
+import PathTests.PathTestUtils as PathTestUtils
+
+
+class TestPathGCodePre(PathTestUtils.PathTestBase):
+
+    def test00(self):
+        '''Verify moves without G-code repeat the active motion and a feed rate on its own applies to the next move.'''
+        parser = gcode_pre.GCodeParser()
+        parser.parse('G00 X0 Y0 Z5\nG01 Z-1\nF100\nX10 (first side)\nY10 ; second side\nG0 Z5\n')
+        self.assertEqual(parser.commands(), ['G0 X0 Y0 Z5', 'G1 Z-1', 'G1 X10 F100', 'G1 Y10', 'G0 Z5'])
+
+        # the modal state is kept between blocks
+        parser.parse('X20\n')
+        self.assertEqual(parser.commands()[-1], 'G0 X20')
+
+    def test01(self):
+        '''Verify lines of unsupported G-codes are dropped and do not become moves.'''
+        parser = gcode_pre.GCodeParser()
+        parser.parse('G1 X1 F100\nG28 X0 Y0\nG92 X5\nX2\n')
+        self.assertEqual(parser.commands(), ['G1 X1 F100', 'G1 X2'])
+
+    def test02(self):
+        '''Verify canned cycles retain their Z, R and Q words on every hole until G80.'''
+        parser = gcode_pre.GCodeParser()
+        parser.parse('G81 X1 Y1 Z-2 R1 F50\nX2\nY3\nG80\nX5\n')
+        self.assertEqual(parser.commands(), ['G81 X1 Y1 Z-2 R1 F50', 'G81 X2 Z-2 R1', 'G81 Y3 Z-2 R1'])
+
+        parser = gcode_pre.GCodeParser()
+        parser.parse('G83 X1 Y1 Z-3 R2 Q0.5\nX4 Q1\nX6\nG0 Z10\nX0\n')
+        self.assertEqual(parser.commands(), ['G83 X1 Y1 Z-3 R2 Q0.5',
+                                             'G83 X4 Q1 Z-3 R2',
+                                             'G83 X6 Z-3 R2 Q1',
+                                             'G0 Z10',
+                                             'G0 X0'])
+
+        # the cycle commands are expanded to the retained words by Path
+        path = Path.Path('\n'.join(parser.commands()))
+        self.assertRoughly(path.Commands[2].Parameters['Q'], 1)
+        self.assertRoughly(path.Commands[2].Parameters['Z'], -3)
+        self.assertRoughly(path.Commands[2].Parameters['R'], 2)
+
+    def test03(self):
+        '''Verify tool changes split the program and every section starts in the active units and distance mode.'''
+        parser = gcode_pre.GCodeParser()
+        parser.parse('G21 G90\nG0 X1\nT2 M6\nG20\nG1 X1 Y2 F10\nT3\nM6\nG0 X3\n')
+        self.assertEqual([toolnumber for (toolnumber, commands) in parser.sections], [0, 2, 3])
+        self.assertEqual(parser.sections[0][1], ['G21', 'G90', 'G0 X1'])
+        self.assertEqual(parser.sections[1][1], ['G21', 'G90', 'G20', 'G1 X1 Y2 F10'])
+        self.assertEqual(parser.sections[2][1], ['G20', 'G90', 'G0 X3'])
+
+    def test04(self):
+        '''Verify G20 scales the following coordinates of a section to mm and G21 does not.'''
+        parser = gcode_pre.GCodeParser()
+        parser.parse('G21\nG0 X1\nT2 M6\nG20\nG1 X1 Y2 F10\nT3 M6\nG0 X3\n')
+
+        path = Path.Path('\n'.join(parser.sections[0][1]))
+        self.assertEqual(len(path.Commands), 1)
+        self.assertRoughly(path.Commands[0].Parameters['X'], 1)
+
+        path = Path.Path('\n'.join(parser.sections[1][1]))
+        self.assertEqual(len(path.Commands), 1)
+        self.assertRoughly(path.Commands[0].Parameters['X'], 25.4)
+        self.assertRoughly(path.Commands[0].Parameters['Y'], 50.8)
+        self.assertRoughly(path.Commands[0].Parameters['F'], 254)
+
+        # the section after the next tool change is still in inches
+        path = Path.Path('\n'.join(parser.sections[2][1]))
+        self.assertRoughly(path.Commands[0].Parameters['X'], 76.2)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import os
+import tempfile
+
+import PathScripts.PostStream as PostStream
+import PathTests.PathTestUtils as PathTestUtils
+
+from FreeCAD import Units
+
+
+class TestPathPostStream(PathTestUtils.PathTestBase):
+
+    def test00(self):
+        '''Verify UnitFormat gives the same result as converting through Units.Quantity.'''
+        values = [0.0, -0.0004, 0.0005, 1.0, -12.3456789, 25.4, 1234.56789, 1e-9, 98765.4321]
+        for (unit, speed, precision) in (('mm', 'mm/min', 3), ('in', 'in/min', 4), ('mm', 'mm/s', 2)):
+            fmt = PostStream.unitFormat(unit, speed, precision)
+            precisionString = '.' + str(precision) + 'f'
+            for v in values:
+                pos = Units.Quantity(v, Units.Length)
+                self.assertEqual(fmt.length(v), format(float(pos.getValueAs(unit)), precisionString))
+                vel = Units.Quantity(v, Units.Velocity)
+                self.assertEqual(fmt.speed(v), format(float(vel.getValueAs(speed)), precisionString))
+
+    def test01(self):
+        '''Verify unitFormat shares the formatters and honours the feed precision.'''
+        fmt = PostStream.unitFormat('mm', 'mm/min', '3', 1)
+        self.assertTrue(fmt is PostStream.unitFormat('mm', 'mm/min', '3', 1))
+        self.assertFalse(fmt is PostStream.unitFormat('mm', 'mm/min', '3'))
+        self.assertEqual(fmt.length(1), '1.000')
+        self.assertEqual(fmt.speed(1), '60.0')
+
+    def test10(self):
+        '''Verify GCodeOutput writes all chunks to the file and returns the text.'''
+        lines = ['G1 X%d Y%d\n' % (i, -i) for i in range(1000)]
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            output = PostStream.GCodeOutput(filename, chunkSize=100)
+            for line in lines:
+                output.write(line)
+            output.writeLines('M5\nM2\n', lambda: 'N1 ')
+            text = output.close()
+            with open(filename, 'r') as fp:
+                self.assertEqual(fp.read(), text)
+        finally:
+            os.unlink(filename)
+        self.assertEqual(text, ''.join(lines) + 'N1 M5\nN1 M2\n')
+
+    def test11(self):
+        '''Verify GCodeOutput does not keep the text if not requested.'''
+        output = PostStream.GCodeOutput(keepText=False)
+        output.write('G0 Z5\n')
+        self.assertEqual(output.close(), 'G0 Z5\n')
+
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            output = PostStream.GCodeOutput(filename, keepText=False)
+            output.write('G0 Z5\n')
+            self.assertIsNone(output.close())
+            with open(filename, 'r') as fp:
+                self.assertEqual(fp.read(), 'G0 Z5\n')
+        finally:
+            os.unlink(filename)
+
+    def test12(self):
+        '''Verify GCodeOutput only replaces the file when closed and leaves it untouched on errors.'''
+        fd, filename = tempfile.mkstemp()
+        os.write(fd, b'G0 X1\n')
+        os.close(fd)
+        try:
+            with PostStream.GCodeOutput(filename, chunkSize=1) as output:
+                output.write('G0 Z5\n')
+                with open(filename, 'r') as fp:
+                    self.assertEqual(fp.read(), 'G0 X1\n')
+            with open(filename, 'r') as fp:
+                self.assertEqual(fp.read(), 'G0 Z5\n')
+
+            with self.assertRaises(ValueError):
+                with PostStream.GCodeOutput(filename, chunkSize=1) as output:
+                    output.write('G1 X2\n')
+                    raise ValueError()
+            with open(filename, 'r') as fp:
+                self.assertEqual(fp.read(), 'G0 Z5\n')
+            self.assertFalse(os.path.exists(filename + '.tmp'))
+        finally:
+            os.unlink(filename)
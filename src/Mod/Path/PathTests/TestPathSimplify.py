@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import numpy
+
+import PathScripts.PathSimplify as PathSimplify
+import PathScripts.PathUtils as PathUtils
+import PathTests.PathTestUtils as PathTestUtils
+
+from FreeCAD import Vector
+
+
+def legacySimplify3dLine(line, tolerance):
+    '''Former pure python implementation of PathUtils.simplify3dLine.'''
+    stack = [(0, len(line) - 1)]
+    results = []
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            results.extend(line[start:end])
+            continue
+        maxIndex, maxDistance = 0, 0.0
+        for i in range(start + 1, end):
+            distance = line[i].distanceToLineSegment(line[start], line[end]).Length
+            if distance > maxDistance:
+                maxDistance = distance
+                maxIndex = i
+        if maxDistance > tolerance:
+            stack.append((maxIndex, end))
+            stack.append((start, maxIndex))
+        else:
+            results.append(line[start])
+    results.append(line[-1])
+    return results
+
+
+def arcPoints(center, radius, start, sweep, count, z0=0.0, z1=0.0):
+    return numpy.array([(center[0] + radius * math.cos(start + sweep * i / (count - 1)),
+                         center[1] + radius * math.sin(start + sweep * i / (count - 1)),
+                         z0 + (z1 - z0) * i / (count - 1)) for i in range(count)])
+
+
+class TestPathSimplify(PathTestUtils.PathTestBase):
+
+    def test00(self):
+        '''Verify simplify3dLine gives the same result as the former implementation.'''
+        line = [Vector(0.1 * i, math.sin(0.1 * i), 0.02 * math.cos(0.3 * i)) for i in range(500)]
+        for tolerance in (1e-4, 1e-2, 0.3):
+            self.assertEqual(PathUtils.simplify3dLine(line, tolerance),
+                             legacySimplify3dLine(line, tolerance))
+
+    def test01(self):
+        '''Verify rdp removes collinear points and keeps the corners.'''
+        pts = [(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0), (3, 1, 0), (3, 2, 0), (3, 2, 1)]
+        self.assertEqual(PathSimplify.rdpIndices(pts, 1e-6).tolist(), [0, 3, 5, 6])
+        self.assertEqual(PathSimplify.rdp(pts[:2], 1e-6).tolist(), [[0, 0, 0], [1, 0, 0]])
+
+    def test02(self):
+        '''Verify mergeCollinear only removes points on the segment between their neighbours.'''
+        pts = [(0, 0, 0), (1, 0, 0), (1, 0, 0), (2, 0, 0), (1.5, 0, 0), (2, 1, 0)]
+        self.assertEqual(PathSimplify.mergeCollinear(pts).tolist(),
+                         [[0, 0, 0], [2, 0, 0], [1.5, 0, 0], [2, 1, 0]])
+
+    def test10(self):
+        '''Verify fitArcs replaces points on an arc by a G3 or G2 move.'''
+        pts = arcPoints((5, 5), 10, 0, math.pi / 2, 50)
+        moves = PathSimplify.fitArcs(pts, 1e-6)
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0][0], 'G3')
+        self.assertRoughly(moves[0][1][0], 5)
+        self.assertRoughly(moves[0][1][1], 15)
+        self.assertRoughly(moves[0][2][0], 5)
+        self.assertRoughly(moves[0][2][1], 5)
+
+        moves = PathSimplify.fitArcs(pts[::-1], 1e-6)
+        self.assertEqual([m[0] for m in moves], ['G2'])
+
+    def test11(self):
+        '''Verify fitArcs fits helical arcs and keeps lines between arcs.'''
+        arc = arcPoints((0, 0), 4, math.pi, -math.pi, 40, 0.0, -2.0)
+        line = numpy.array([(4, -0.5 * i, -2.0) for i in range(1, 4)])
+        moves = PathSimplify.fitArcs(numpy.concatenate((arc, line)), 1e-6)
+        self.assertEqual([m[0] for m in moves], ['G2', 'G1', 'G1', 'G1'])
+        self.assertRoughly(moves[0][1][2], -2.0)
+
+    def test12(self):
+        '''Verify fitArcs does not fit points off the arc.'''
+        pts = arcPoints((0, 0), 4, 0, math.pi, 40)
+        pts[20, 1] += 0.01
+        moves = PathSimplify.fitArcs(pts, 1e-3)
+        self.assertTrue(len(moves) > 1)
+        self.assertTrue(any(m[1] == tuple(pts[20]) for m in moves))
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import random
+
+import PathScripts.PathUtils as PathUtils
+import PathTests.PathSortJobsBenchmark as PathSortJobsBenchmark
+import PathTests.PathTestUtils as PathTestUtils
+
+
+class TestPathSortJobs(PathTestUtils.PathTestBase):
+    def test00(self):
+        """Verify sort_jobs handles no and a single location."""
+        self.assertEqual(PathUtils.sort_jobs([], ["x", "y"]), [])
+        self.assertEqual(PathUtils.sort_jobs([{"x": 3, "y": 4}], ["x", "y"]), [{"x": 3, "y": 4}])
+
+    def test01(self):
+        """Verify sort_jobs gives the same order as searching all locations."""
+        rnd = random.Random(7)
+        holes = [{"x": rnd.uniform(-50, 50), "y": rnd.uniform(0, 80), "r": i} for i in range(300)]
+        self.assertEqual(
+            PathUtils.sort_jobs(holes, ["x", "y"]),
+            PathSortJobsBenchmark.legacy_sort_jobs(holes, ["x", "y"]),
+        )
+        self.assertEqual(
+            PathUtils.sort_jobs(holes, ["x", "y"], ["x", "y"]),
+            PathSortJobsBenchmark.legacy_sort_jobs(holes, ["x", "y"], ["x", "y"]),
+        )
+
+    def test02(self):
+        """Verify sort_jobs on a regular grid with duplicate locations."""
+        holes = PathSortJobsBenchmark.perforated_panel(400, pitch=2.0)
+        holes += PathSortJobsBenchmark.perforated_panel(20, pitch=2.0, seed=1)
+        self.assertEqual(
+            PathUtils.sort_jobs(holes, ["x", "y"]),
+            PathSortJobsBenchmark.legacy_sort_jobs(holes, ["x", "y"]),
+        )
+
+    def test10(self):
+        """Verify optimize_jobs removes crossing rapid moves."""
+        holes = [
+            {"x": 10, "y": 0},
+            {"x": 30, "y": 0},
+            {"x": 20, "y": 0},
+            {"x": 40, "y": 0},
+        ]
+        optimized = PathUtils.optimize_jobs(holes, ["x", "y"], 10)
+        self.assertEqual(optimized, [holes[0], holes[2], holes[1], holes[3]])
+        self.assertRoughly(PathUtils.jobs_travel_distance(optimized, ["x", "y"]), 40)
+
+    def test11(self):
+        """Verify optimize_jobs keeps all locations and does not lengthen the rapid moves."""
+        holes = PathSortJobsBenchmark.perforated_panel(2000, jitter=1.0)
+        ordered = PathUtils.sort_jobs(holes, ["x", "y"])
+        optimized = PathUtils.sort_jobs(holes, ["x", "y"], optimize_time=10)
+        self.assertEqual(sorted(map(id, optimized)), sorted(map(id, holes)))
+        self.assertLess(
+            PathUtils.jobs_travel_distance(optimized, ["x", "y"]),
+            PathUtils.jobs_travel_distance(ordered, ["x", "y"]),
+        )
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import math
+import numpy
+
+import PathScripts.PathStockSim as PathStockSim
+import PathTests.PathTestUtils as PathTestUtils
+
+
+def meshVolume(triangles):
+    return numpy.einsum('ij,ij->i', triangles[:, 0], numpy.cross(triangles[:, 1], triangles[:, 2])).sum() / 6.0
+
+
+class TestPathStockSim(PathTestUtils.PathTestBase):
+
+    def setUp(self):
+        self.bb = FreeCAD.BoundBox(0, 0, 0, 50, 40, 10)
+
+    def test00(self):
+        '''Verify a flat end mill cuts a slot of the tool's width and depth.'''
+        sim = PathStockSim.Simulation(self.bb, 0.25)
+        sim.setTool(PathStockSim.ToolProfile(3.0))
+        pos = sim.applyCommands([Path.Command('G0', {'X': 5, 'Y': 10, 'Z': 12}),
+                                 Path.Command('G1', {'Z': 8}),
+                                 Path.Command('G1', {'X': 45})])
+        self.assertRoughly(pos.x, 45)
+        self.assertRoughly(pos.z, 8)
+        stock = sim.stock
+        self.assertRoughly(stock.heightAt(20, 10), 8)
+        self.assertRoughly(stock.heightAt(20, 12.9), 8)
+        self.assertRoughly(stock.heightAt(20, 13.2), 10)
+        self.assertRoughly(stock.heightAt(1.9, 10), 10)
+        self.assertRoughly(stock.removedVolume(), 2 * (40 * 6 + math.pi * 9), 10)
+
+    def test01(self):
+        '''Verify a ball end mill leaves the round bottom of its profile.'''
+        sim = PathStockSim.Simulation(self.bb, 0.25)
+        sim.setTool(PathStockSim.ballProfile(3.0))
+        sim.applyCommands([Path.Command('G0', {'X': 5, 'Y': 10, 'Z': 8}),
+                           Path.Command('G1', {'X': 45})])
+        for y in [10.125, 11.125, 12.625]:
+            d = y - 10
+            self.assertRoughly(sim.stock.heightAt(20, y), 8 + 3 - math.sqrt(9 - d * d), 0.001)
+
+    def test02(self):
+        '''Verify arcs and drill cycles are applied.'''
+        sim = PathStockSim.Simulation(self.bb, 0.25)
+        sim.setTool(PathStockSim.ToolProfile(1.0))
+        sim.applyCommands([Path.Command('G0', {'X': 35, 'Y': 20, 'Z': 5}),
+                           Path.Command('G2', {'X': 35, 'Y': 20, 'I': -10, 'J': 0})])
+        self.assertRoughly(sim.stock.heightAt(25, 10), 5)
+        self.assertRoughly(sim.stock.heightAt(25, 30.9), 5)
+        self.assertRoughly(sim.stock.heightAt(25, 31.2), 10)
+        self.assertRoughly(sim.stock.heightAt(25, 20), 10)
+
+        sim.setTool(PathStockSim.ToolProfile(2.0))
+        pos = sim.applyCommands([Path.Command('G81', {'X': 45, 'Y': 35, 'Z': 2, 'R': 11}),
+                                 Path.Command('G81', {'X': 5, 'Y': 35, 'Z': 3, 'R': 11}),
+                                 Path.Command('G80')])
+        self.assertRoughly(sim.stock.heightAt(45, 35), 2)
+        self.assertRoughly(sim.stock.heightAt(5, 35), 3)
+        self.assertRoughly(pos.z, 11)
+
+    def test03(self):
+        '''Verify ramps of curved tools are close to a dense sampling of the move.'''
+        profile = PathStockSim.bullnoseProfile(2.0, 1.0)
+        stock = PathStockSim.HeightMap(FreeCAD.BoundBox(0, 0, 0, 20, 20, 10), 0.5)
+        stock.applySegments([[(2, 3, 9), (17, 15, 4)]], profile)
+        cx = (numpy.arange(stock.nx) + 0.5) * 0.5
+        x, y = numpy.meshgrid(cx, cx, indexing='ij')
+        expected = numpy.full(x.shape, 10.0)
+        for t in numpy.linspace(0, 1, 2000):
+            (px, py, pz) = (2 + 15 * t, 3 + 12 * t, 9 - 5 * t)
+            d = numpy.hypot(x - px, y - py)
+            expected = numpy.minimum(expected, numpy.where(d <= 2.0, pz + profile.heightAt(d), numpy.inf))
+        self.assertTrue(abs(stock.z - expected).max() < 0.1)
+
+    def test04(self):
+        '''Verify applySegments reports the moves removing material in the order of the moves.'''
+        stock = PathStockSim.HeightMap(self.bb, 0.25)
+        segments = [[(5, 10, 12), (5, 10, 9)],      # plunge
+                    [(5, 10, 9), (45, 10, 9)],      # first pass
+                    [(45, 10, 9), (45, 10, 12)],    # retract in the cut
+                    [(5, 10, 12), (5, 10, 8)],      # plunge in the cut and below
+                    [(5, 10, 8), (45, 10, 8)],      # second pass
+                    [(45, 10, 8), (5, 10, 8)]]      # air cut
+        cutting = stock.applySegments(segments, PathStockSim.ToolProfile(2.0))
+        self.assertEqual(cutting.tolist(), [True, True, False, True, True, False])
+        self.assertRoughly(stock.heightAt(20, 10), 8)
+
+    def test10(self):
+        '''Verify the mesh is only updated where the stock changed and encloses the stock.'''
+        sim = PathStockSim.Simulation(self.bb, 0.25)
+        self.assertRoughly(meshVolume(sim.stock.triangles()), 20000)
+        sim.setTool(PathStockSim.ballProfile(3.0))
+        sim.applyCommands([Path.Command('G0', {'X': 5, 'Y': 10, 'Z': 8}),
+                           Path.Command('G1', {'X': 45})])
+        self.assertTrue(sim.stock.dirty.any())
+        self.assertFalse(sim.stock.dirty.all())
+        triangles = sim.stock.triangles()
+        self.assertFalse(sim.stock.dirty.any())
+
+        full = PathStockSim.HeightMap(self.bb, 0.25)
+        full.z = sim.stock.z.copy()
+        self.assertTrue(numpy.array_equal(numpy.sort(triangles.reshape(-1, 9), axis=0),
+                                          numpy.sort(full.triangles().reshape(-1, 9), axis=0)))
+        self.assertTrue(abs(meshVolume(triangles) - (20000 - sim.stock.removedVolume())) < 20)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 agent <agent@local>                                *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Part
+import Path
+import numpy
+
+import PathScripts.PathJob as PathJob
+import PathScripts.PathStockSim as PathStockSim
+import PathScripts.PathVerify as PathVerify
+import PathTests.PathTestUtils as PathTestUtils
+
+
+class TestPathVerify(PathTestUtils.PathTestBase):
+
+    def setUp(self):
+        self.doc = FreeCAD.newDocument('TestPathVerify')
+        self.box = self.doc.addObject('Part::Box', 'Box')
+        self.box.Length = 40
+        self.box.Width = 30
+        self.box.Height = 10
+        self.doc.recompute()
+        self.job = PathJob.Create('Job', [self.box])
+        self.doc.recompute()
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.doc.Name)
+
+    def test00(self):
+        '''Verify surfaceHeights returns the top of the model at the cell centers.'''
+        stock = PathStockSim.HeightMap(FreeCAD.BoundBox(0, 0, 0, 20, 20, 10), 0.5)
+        shape = Part.makeBox(10, 10, 5, FreeCAD.Vector(5, 5, 0)).fuse(Part.makeBox(2, 2, 3, FreeCAD.Vector(2, 2, 0)))
+        heights = PathVerify.surfaceHeights(stock, PathVerify.shapeTriangles(shape, 0.01))
+        self.assertRoughly(heights[stock.cellIndex(10, 10)], 5)
+        self.assertRoughly(heights[stock.cellIndex(3, 3)], 3)
+        self.assertEqual(heights[stock.cellIndex(18, 18)], -numpy.inf)
+        self.assertEqual(numpy.count_nonzero(heights == 5), 400)
+
+    def test01(self):
+        '''Verify cuts above the model are not reported as gouges.'''
+        bb = self.job.Stock.Shape.BoundBox
+        verifier = PathVerify.JobVerifier(self.job, 0.25)
+        commands = [Path.Command('G0', {'X': bb.XMin - 2, 'Y': 15, 'Z': bb.ZMax + 5}),
+                    Path.Command('G1', {'Z': 10.5, 'F': 10}),
+                    Path.Command('G1', {'X': bb.XMax + 2}),
+                    Path.Command('G1', {'Z': bb.ZMax + 5})]
+        report = verifier.verifyCommands('Face', commands, PathStockSim.ToolProfile(2.0))
+        self.assertTrue(report.isOk())
+        self.assertEqual(report.gouges, 0)
+        self.assertEqual(report.rapidCuts, 0)
+        self.assertTrue(report.removedVolume > 0)
+        self.assertRoughly(report.cutTime, (bb.ZMax + 5 - 10.5) * 2 / 10 + (bb.XLength + 4) / 10)
+        self.assertTrue(report.airCutTime > 0)
+        self.assertTrue(report.airCutTime < report.cutTime)
+
+    def test02(self):
+        '''Verify cuts into the model and rapid moves through the stock are reported.'''
+        verifier = PathVerify.JobVerifier(self.job, 0.25)
+        commands = [Path.Command('G0', {'X': 10, 'Y': 15, 'Z': 20}),
+                    Path.Command('G1', {'Z': 9, 'F': 10}),
+                    Path.Command('G1', {'X': 20}),
+                    Path.Command('G0', {'Z': 20}),
+                    Path.Command('G0', {'X': 30, 'Y': 5, 'Z': 10.5}),
+                    Path.Command('G0', {'Z': 20})]
+        report = verifier.verifyCommands('Pocket', commands, PathStockSim.ToolProfile(2.0))
+        self.assertFalse(report.isOk())
+        self.assertTrue(report.gouges > 0)
+        self.assertRoughly(report.maxGouge, 1.0)
+        self.assertTrue(8 <= report.gougeAt[0] <= 22)
+        self.assertEqual(report.rapidCuts, 1)
+
+        # the same gouge is not reported again
+        report = verifier.verifyCommands('Again', commands[:3], PathStockSim.ToolProfile(2.0))
+        self.assertEqual(report.gouges, 0)
@@ -24,20 +24,26 @@ import TestApp
 
 from PathTests.TestPathAdaptive import TestPathAdaptive
 from PathTests.TestPathCore import TestPathCore
+from PathTests.TestPathCycleTime import TestPathCycleTime
 from PathTests.TestPathDeburr import TestPathDeburr
 from PathTests.TestPathDepthParams import depthTestCases
 from PathTests.TestPathDressupDogbone import TestDressupDogbone
 from PathTests.TestPathDressupHoldingTags import TestHoldingTags
 from PathTests.TestPathDrillGenerator import TestPathDrillGenerator
+from PathTests.TestPathGCodePre import TestPathGCodePre
 from PathTests.TestPathGeom import TestPathGeom
 # from PathTests.TestPathHelix import TestPathHelix
 from PathTests.TestPathLog import TestPathLog
 from PathTests.TestPathOpTools import TestPathOpTools
 # from PathTests.TestPathPost import PathPostTestCases
+from PathTests.TestPathPostStream import TestPathPostStream
 from PathTests.TestPathPreferences import TestPathPreferences
 from PathTests.TestPathPropertyBag import TestPathPropertyBag
 from PathTests.TestPathSetupSheet import TestPathSetupSheet
+from PathTests.TestPathSimplify import TestPathSimplify
+from PathTests.TestPathSortJobs import TestPathSortJobs
 from PathTests.TestPathStock import TestPathStock
+from PathTests.TestPathStockSim import TestPathStockSim
 from PathTests.TestPathThreadMilling import TestPathThreadMilling
 from PathTests.TestPathTool import TestPathTool
 from PathTests.TestPathToolBit import TestPathToolBit
@@ -45,6 +51,7 @@ from PathTests.TestPathToolController import TestPathToolController
 from PathTests.TestPathTooltable import TestPathTooltable
 from PathTests.TestPathUtil import TestPathUtil
 from PathTests.TestPathVcarve import TestPathVcarve
+from PathTests.TestPathVerify import TestPathVerify
 from PathTests.TestPathVoronoi import TestPathVoronoi
 
 # dummy usage to get flake8 and lgtm quiet
@@ -54,15 +61,21 @@ False if TestDressupDogbone.__name__ else True
 False if TestHoldingTags.__name__ else True
 False if TestPathAdaptive.__name__ else True
 False if TestPathCore.__name__ else True
+False if TestPathCycleTime.__name__ else True
 False if TestPathDeburr.__name__ else True
+False if TestPathGCodePre.__name__ else True
 False if TestPathGeom.__name__ else True
 # False if TestPathHelix.__name__ else True
 False if TestPathLog.__name__ else True
 False if TestPathOpTools.__name__ else True
+False if TestPathPostStream.__name__ else True
 False if TestPathPreferences.__name__ else True
 False if TestPathPropertyBag.__name__ else True
 False if TestPathSetupSheet.__name__ else True
+False if TestPathSimplify.__name__ else True
+False if TestPathSortJobs.__name__ else True
 False if TestPathStock.__name__ else True
+False if TestPathStockSim.__name__ else True
 False if TestPathThreadMilling.__name__ else True
 False if TestPathTool.__name__ else True
 False if TestPathToolBit.__name__ else True
@@ -70,5 +83,6 @@ False if TestPathToolController.__name__ else True
 False if TestPathTooltable.__name__ else True
 False if TestPathUtil.__name__ else True
 False if TestPathVcarve.__name__ else True
+False if TestPathVerify.__name__ else True
 False if TestPathVoronoi.__name__ else True
 False if TestPathDrillGenerator.__name__ else True